@@ -113,16 +113,14 @@ def spares_definition():
     if not cont:
         exit_with_error("Cancelled")
 
-    # Now set the spares definition with a progress bar
+    # Now set the spares definition
     console.print("Updating catalogue items...")
-    with create_progress_bar() as progress:
-        try:
-            setting_service.set_spares_definition(
-                SparesDefinitionIn(system_type_ids=[selected_type.id for selected_type in selected_types]),
-                tracker=progress.track,
-            )
-        except InvalidActionError as exc:
-            exit_with_error(str(exc))
+    try:
+        setting_service.set_spares_definition(
+            SparesDefinitionIn(system_type_ids=[selected_type.id for selected_type in selected_types])
+        )
+    except InvalidActionError as exc:
+        exit_with_error(str(exc))
 
     console.print("Success! :party_popper:")
 
@@ -174,3 +172,38 @@ def in_use_definition():
         exit_with_error(str(exc))
 
     console.print("Success! :party_popper:")
+
+
+@app.command()
+def recalculate_item_counts():
+    """Recalculates the item counts and number of spares of all catalogue items from scratch."""
+
+    # Acquire the required services
+    database = get_database()
+    setting_service = SettingService(
+        SettingRepo(database), SystemTypeRepo(database), CatalogueItemRepo(database), ItemRepo(database)
+    )
+
+    # Display a warning message explaining the consequences of continuing and requesting that the user check no one else
+    # is using the system to avoid issues
+    display_warning_message(
+        [
+            "This operation will recalculate the 'item_counts_by_system_type' and 'number_of_spares' fields of all "
+            "existing catalogue items!",
+            "Please ensure no one else is using ims-api to avoid any miscalculations.",
+            "Should an error occur at any point during this process no changes will be made.",
+        ]
+    )
+
+    cont = typer.confirm("Are you sure you want to recalculate the item counts?")
+    console.print()
+
+    if not cont:
+        exit_with_error("Cancelled")
+
+    # Now recalculate with a progress bar
+    console.print("Updating catalogue items...")
+    with create_progress_bar() as progress:
+        setting_service.recalculate_item_counts(tracker=progress.track)
+
+    console.print("Success! :party_popper:")
@@ -0,0 +1,101 @@
+"""Module for providing a subcommand that manages the database indexes required by IMS."""
+
+from typing import Annotated
+
+import typer
+from pymongo import IndexModel
+from rich.table import Table
+
+from inventory_management_system_api.cli.core import console, exit_with_error
+from inventory_management_system_api.core.database import get_database
+from inventory_management_system_api.repositories.indexes import (
+    diff_indexes,
+    find_unique_indexes_to_drop,
+    get_declared_indexes,
+    sync_indexes,
+)
+
+app = typer.Typer()
+
+
+def display_index_differences(
+    indexes_to_create: dict[str, list[IndexModel]],
+    indexes_to_drop: dict[str, list[str]],
+    unique_indexes_to_drop: dict[str, list[str]],
+):
+    """Displays a table of the indexes that need to be created and dropped to match those declared."""
+
+    table = Table("Action", "Collection", "Name", "Keys", "Unique")
+    for collection_name, index_names in indexes_to_drop.items():
+        for index_name in index_names:
+            table.add_row(
+                "[red]Drop[/]",
+                collection_name,
+                index_name,
+                "",
+                str(index_name in unique_indexes_to_drop.get(collection_name, [])),
+            )
+    for collection_name, indexes in indexes_to_create.items():
+        for index in indexes:
+            table.add_row(
+                "[green]Create[/]",
+                collection_name,
+                index.document["name"],
+                ", ".join(f"{key}: {direction}" for key, direction in index.document["key"].items()),
+                str(index.document.get("unique", False)),
+            )
+
+    console.print(table)
+    console.print()
+
+
+@app.command()
+def status():
+    """Display the differences between the indexes declared by IMS and those in the database."""
+
+    database = get_database()
+    indexes_to_create, indexes_to_drop = diff_indexes(database, get_declared_indexes())
+
+    if not indexes_to_create and not indexes_to_drop:
+        console.print("The database indexes are up to date :thumbs_up:")
+        return
+
+    display_index_differences(
+        indexes_to_create, indexes_to_drop, find_unique_indexes_to_drop(database, indexes_to_drop)
+    )
+
+
+@app.command()
+def sync(
+    yes: Annotated[bool, typer.Option("--yes", "-y", help="Specify to skip the are you sure prompt.")] = False,
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force",
+            help="Specify to allow unique indexes to be dropped, during which their uniqueness is not enforced.",
+        ),
+    ] = False,
+):
+    """Creates and drops database indexes so that they match those declared by IMS."""
+
+    database = get_database()
+    indexes_to_create, indexes_to_drop = diff_indexes(database, get_declared_indexes())
+
+    if not indexes_to_create and not indexes_to_drop:
+        console.print("The database indexes are already up to date :thumbs_up:")
+        return
+
+    unique_indexes_to_drop = find_unique_indexes_to_drop(database, indexes_to_drop)
+
+    console.print("This operation will make the following changes to the database indexes:")
+    display_index_differences(indexes_to_create, indexes_to_drop, unique_indexes_to_drop)
+
+    if unique_indexes_to_drop and not force:
+        exit_with_error(
+            "Unique indexes would be dropped, allowing duplicates to be written until any replacements are built. "
+            "Please ensure IMS is not in use and then rerun with --force."
+        )
+
+    if yes or typer.confirm("Are you sure you wish to proceed? "):
+        sync_indexes(database, indexes_to_create, indexes_to_drop)
+        console.print("Success! :party_popper:")
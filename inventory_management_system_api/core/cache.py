@@ -0,0 +1,149 @@
+"""
+Module for providing a simple in-process cache for data that is read far more often than it is modified.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Any, Callable, Optional
+
+
+class VersionedCache:
+    """
+    Thread safe in-process cache whose entries are discarded when invalidated or after an optional time to live.
+
+    Every invalidation increments the version of the cache. Values loaded via `get_or_load` or `get_many_or_load` are
+    only stored when the version is unchanged after loading, so that a value read from the database before a
+    concurrent modification (and its invalidation) can never be stored after it.
+
+    The number of entries may also be bounded, in which case the least recently used entry is evicted whenever a new
+    one would exceed the limit.
+    """
+
+    # pylint:disable=too-many-instance-attributes
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_size: Optional[int] = None) -> None:
+        """
+        Initialise the `VersionedCache`.
+
+        :param ttl_seconds: Number of seconds after which entries expire, or `None` if they should only be discarded
+                            when invalidated.
+        :param max_size: Maximum number of entries to store, or `None` if unbounded.
+        """
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[Optional[float], Any]] = OrderedDict()
+        self._version = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Obtains the current version of the cache.
+
+        :return: Number of times the cache has been invalidated.
+        """
+        with self._lock:
+            return self._version
+
+    def get_statistics(self) -> dict:
+        """
+        Obtains a snapshot of the statistics of the cache.
+
+        :return: Dictionary containing the number of entries, hits, misses and invalidations.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._version,
+            }
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Obtains a value from the cache, loading and storing it if it isn't present or has expired.
+
+        :param key: Key of the value to obtain.
+        :param loader: Function to call to load the value when it isn't in the cache. `None` is a valid value and will
+                       also be cached.
+        :return: The cached or loaded value.
+        """
+        return self.get_many_or_load([key], lambda _: {key: loader()})[key]
+
+    def get_many_or_load(
+        self, keys: Iterable[Hashable], loader: Callable[[list[Hashable]], dict[Hashable, Any]]
+    ) -> dict[Hashable, Any]:
+        """
+        Obtains multiple values from the cache, loading and storing any that aren't present or have expired using a
+        single call to the loader.
+
+        :param keys: Keys of the values to obtain.
+        :param loader: Function to call with the keys of the values that aren't in the cache to load them. Should return
+                       a dictionary of the loaded values with their keys. Any keys that are omitted are loaded (and
+                       cached) as `None`.
+        :return: Dictionary of the cached or loaded values with their keys.
+        """
+        values = {}
+        missing_keys = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                entry = self._entries.get(key)
+                if entry is not None and (entry[0] is None or entry[0] > time.monotonic()):
+                    self._hits += 1
+                    self._entries.move_to_end(key)
+                    values[key] = entry[1]
+                else:
+                    self._misses += 1
+                    missing_keys.append(key)
+            version = self._version
+
+        if not missing_keys:
+            return values
+
+        loaded_values = loader(missing_keys)
+
+        with self._lock:
+            store = version == self._version
+            expiry_time = None if self._ttl_seconds is None else time.monotonic() + self._ttl_seconds
+            for key in missing_keys:
+                values[key] = loaded_values.get(key)
+                if store:
+                    self._entries[key] = (expiry_time, values[key])
+                    self._entries.move_to_end(key)
+                    if self._max_size is not None and len(self._entries) > self._max_size:
+                        self._entries.popitem(last=False)
+        return values
+
+    def invalidate(self, keys: Optional[Iterable[Hashable]] = None) -> None:
+        """
+        Discards entries in the cache.
+
+        The version is incremented even when only some keys are given, as any value being loaded concurrently could be
+        one of them.
+
+        :param keys: Keys of the entries to discard, or `None` if all of them should be.
+        """
+        with self._lock:
+            if keys is None:
+                self._entries.clear()
+            else:
+                for key in keys:
+                    self._entries.pop(key, None)
+            self._version += 1
+
+    def invalidate_where(self, predicate: Callable[[Hashable, Any], bool]) -> None:
+        """
+        Discards the entries in the cache matching a predicate.
+
+        As with `invalidate`, the version is always incremented.
+
+        :param predicate: Function given the key and value of each entry that returns whether it should be discarded.
+        """
+        with self._lock:
+            for key in [key for key, (_, value) in self._entries.items() if predicate(key, value)]:
+                del self._entries[key]
+            self._version += 1
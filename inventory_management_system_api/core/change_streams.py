@@ -0,0 +1,161 @@
+"""
+Module for watching MongoDB change streams so that in-process caches can be invalidated when the collections they are
+populated from are modified, including by other processes such as other API workers or the CLI.
+"""
+
+import logging
+import threading
+from typing import Callable, Iterable, Optional
+
+from pymongo.database import Database
+from pymongo.errors import OperationFailure, PyMongoError
+
+logger = logging.getLogger()
+
+# Error code returned by MongoDB when change streams are not supported e.g. on a standalone server
+CHANGE_STREAMS_NOT_SUPPORTED_ERROR_CODE = 40573
+
+# Maximum time to wait for a change before checking whether the watcher has been stopped
+CHANGE_STREAM_MAX_AWAIT_TIME_MS = 1000
+
+# Time to wait before reopening a change stream after it fails
+CHANGE_STREAM_RETRY_DELAY_SECONDS = 5
+
+
+class ChangeStreamWatcher:
+    """
+    Watches a change stream on a database in a background thread and calls registered callbacks whenever any of the
+    collections they were registered for are modified.
+
+    Callbacks registered using `register_change_callback` are also given the change event itself, so that they can
+    discard only the data affected by it.
+
+    Changes can be missed while the stream is not open (e.g. before it is started or while reconnecting), so all of the
+    callbacks are called whenever it is (re)opened. Callers should still not rely on the watcher alone as it will stop
+    if change streams are not supported by the database.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise the `ChangeStreamWatcher` with no callbacks registered and without starting to watch.
+
+        Takes no parameters as the database to watch is only given when `start` is called.
+        """
+        self._lock = threading.Lock()
+        self._callbacks: dict[str, list[Callable[[], None]]] = {}
+        self._change_callbacks: dict[str, list[Callable[[Optional[dict]], None]]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def register(self, collection_names: Iterable[str], callback: Callable[[], None]) -> None:
+        """
+        Registers a callback to be called whenever any of the given collections are modified.
+
+        :param collection_names: Names of the collections to watch.
+        :param callback: Callback to call, e.g. a function invalidating a cache.
+        """
+        with self._lock:
+            for collection_name in collection_names:
+                self._callbacks.setdefault(collection_name, []).append(callback)
+
+    def register_change_callback(
+        self, collection_names: Iterable[str], callback: Callable[[Optional[dict]], None]
+    ) -> None:
+        """
+        Registers a callback to be called with the change event whenever any of the given collections are modified.
+
+        :param collection_names: Names of the collections to watch.
+        :param callback: Callback to call, e.g. a function invalidating the entries of a cache affected by the change.
+                         Is given `None` instead of a change event when any of the data may have been modified.
+        """
+        with self._lock:
+            for collection_name in collection_names:
+                self._change_callbacks.setdefault(collection_name, []).append(callback)
+
+    def notify(self, collection_names: Optional[Iterable[str]] = None, change: Optional[dict] = None) -> None:
+        """
+        Calls the callbacks registered for the given collections.
+
+        :param collection_names: Names of the collections that have been modified, or `None` to call all of the
+                                 registered callbacks.
+        :param change: The change event that modified the collections (if known), which is passed to the callbacks
+                       registered using `register_change_callback`.
+        """
+        with self._lock:
+            if collection_names is None:
+                collection_names = self._get_collection_names()
+            callbacks = {
+                callback
+                for collection_name in collection_names
+                for callback in self._callbacks.get(collection_name, [])
+            }
+            change_callbacks = {
+                callback
+                for collection_name in collection_names
+                for callback in self._change_callbacks.get(collection_name, [])
+            }
+        for callback in callbacks:
+            callback()
+        for change_callback in change_callbacks:
+            change_callback(change)
+
+    def _get_collection_names(self) -> list[str]:
+        """
+        Obtains the names of all of the collections any callbacks have been registered for.
+
+        :return: List of the collection names in the order they were first registered in.
+        """
+        return list(dict.fromkeys([*self._callbacks, *self._change_callbacks]))
+
+    def start(self, database: Database) -> None:
+        """
+        Starts watching for changes in a background thread.
+
+        :param database: Database to watch.
+        """
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._watch, args=(database,), name="change-stream-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops watching for changes, waiting for the background thread to finish."""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _watch(self, database: Database) -> None:
+        """
+        Watches for changes until stopped, reopening the change stream should it fail.
+
+        :param database: Database to watch.
+        """
+        with self._lock:
+            pipeline = [{"$match": {"ns.coll": {"$in": self._get_collection_names()}}}]
+
+        while not self._stop_event.is_set():
+            try:
+                with database.watch(pipeline, max_await_time_ms=CHANGE_STREAM_MAX_AWAIT_TIME_MS) as stream:
+                    logger.info("Watching for changes to the collections %s", pipeline[0]["$match"]["ns.coll"]["$in"])
+                    self.notify()
+                    while stream.alive and not self._stop_event.is_set():
+                        change = stream.try_next()
+                        if change is not None:
+                            self.notify([change["ns"]["coll"]], change)
+            except OperationFailure as exc:
+                if exc.code == CHANGE_STREAMS_NOT_SUPPORTED_ERROR_CODE:
+                    logger.warning("Change streams are not supported by the database, caches will rely on expiry only")
+                    return
+                logger.exception("Error while watching for changes")
+            except PyMongoError:
+                logger.exception("Error while watching for changes")
+
+            self._stop_event.wait(CHANGE_STREAM_RETRY_DELAY_SECONDS)
+
+
+change_stream_watcher = ChangeStreamWatcher()
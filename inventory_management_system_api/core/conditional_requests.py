@@ -0,0 +1,95 @@
+"""
+Module for providing functions for handling conditional GET requests, which allow clients to avoid downloading a
+response again when they already hold the current version of it.
+"""
+
+import hashlib
+from typing import Any, Iterable, Tuple
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from inventory_management_system_api.core.consts import ETAG_HEADER
+
+# OpenAPI documentation of the additional response that conditional GET endpoints may respond with
+NOT_MODIFIED_RESPONSES = {
+    304: {"description": "Not modified since the version identified by the ETag given in the `If-None-Match` header"}
+}
+
+
+def create_etag(schema: type[BaseModel], *values: Any) -> str:
+    """
+    Creates a weak ETag identifying the version of some data returned using a schema.
+
+    The ETag is derived from the names of the fields of the schema, so that it changes whenever the schema does (e.g.
+    after a migration adding a field without updating the `modified_time`), along with the given values. These should
+    be cheap to obtain without serialising the data while still changing whenever it does e.g. its `modified_time`.
+
+    :param schema: Schema model the data is returned using.
+    :param values: Values identifying the version of the data and anything else the response depends on, such as the
+                   requested fields. Each must have a stable `repr`.
+    :return: The weak ETag.
+    """
+    digest = hashlib.sha256(repr((list(schema.model_fields), values)).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def compute_list_version(entities: Iterable[Tuple[Any, ...]]) -> str:
+    """
+    Computes the version of a list of entities from the ID and `modified_time` of each of them, in order.
+
+    As every entity in the list contributes to it, the version changes whenever any of them are created, modified or
+    deleted, and also whenever a different entity takes the place of another (e.g. when the next one slides into a page
+    of a paginated list after one in it is deleted) even though the number of entities stays the same.
+
+    :param entities: ID and `modified_time` of each of the entities in the order they are listed in, optionally
+                     followed by the values of any fields that may change without the `modified_time` being updated
+                     (e.g. computed counts). The IDs may be given either as strings or as `ObjectId`'s, and any other
+                     values must have a stable `repr`.
+    :return: Digest identifying the version of the list.
+    """
+    digest = hashlib.sha256()
+    for entity_id, modified_time, *values in entities:
+        other_values = "".join(f":{value!r}" for value in values)
+        digest.update(f"{entity_id}:{modified_time.timestamp()}{other_values}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def has_if_none_match(request: Request) -> bool:
+    """
+    Determines whether a request is conditional i.e. whether the client gave an `If-None-Match` header.
+
+    :param request: The request to check.
+    :return: `True` if the request has an `If-None-Match` header, `False` otherwise.
+    """
+    return "if-none-match" in request.headers
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Determines whether the client already holds the version of the data identified by an ETag via the `If-None-Match`
+    header of the request.
+
+    :param request: The request to check.
+    :param etag: ETag of the current version of the data.
+    :return: `True` if any of the ETags given in the `If-None-Match` header match (using the weak comparison), `False`
+             otherwise.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
+
+
+def create_not_modified_response(etag: str) -> Response:
+    """
+    Creates an empty response informing the client that the version of the data it holds is still current.
+
+    :param etag: ETag of the current version of the data.
+    :return: The 304 (Not Modified) response.
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag})
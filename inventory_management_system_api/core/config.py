@@ -2,7 +2,7 @@
 Module for the overall configuration for the application.
 """
 
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, SecretStr, field_validator
 from pydantic_core.core_schema import ValidationInfo
@@ -20,6 +20,9 @@ class APIConfig(BaseModel):
     allowed_cors_headers: List[str]
     allowed_cors_origins: List[str]
     allowed_cors_methods: List[str]
+    # Maximum number of worker threads used to run the (sync) route handlers and so the maximum number of requests that
+    # may be processed concurrently. Uses AnyIO's default (40) when not given.
+    thread_pool_size: Optional[int] = Field(default=None, ge=1)
 
 
 class AuthenticationConfig(BaseModel):
@@ -60,6 +63,14 @@ class DatabaseConfig(BaseModel):
     password: SecretStr
     host_and_options: SecretStr
     name: SecretStr
+    # Connection pool and compression options, when not given the driver defaults (or any set in `host_and_options`) are
+    # used instead. Only `zlib` is allowed as a compressor as `snappy` and `zstd` require optional packages that are not
+    # installed, without which the driver silently disables compression.
+    max_pool_size: Optional[int] = Field(default=None, ge=0)
+    min_pool_size: Optional[int] = Field(default=None, ge=0)
+    max_idle_time_ms: Optional[int] = Field(default=None, ge=0)
+    wait_queue_timeout_ms: Optional[int] = Field(default=None, ge=0)
+    compressors: Optional[List[Literal["zlib"]]] = None
 
     model_config = ConfigDict(hide_input_in_errors=True)
 
@@ -97,6 +108,7 @@ class BulkConfig(BaseModel):
     """
 
     max_catalogue_items: int
+    max_items: int
 
 
 class Config(BaseSettings):
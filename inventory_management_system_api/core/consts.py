@@ -11,8 +11,44 @@ from inventory_management_system_api.core.config import config
 # e.g. a value of 5 means the trail goes back to at most the last 4
 # parents
 BREADCRUMBS_TRAIL_MAX_LENGTH: int = 5
+
+# Maximum number of entities whose breadcrumbs may be requested at once from the batch breadcrumbs POST endpoints
+BREADCRUMBS_BATCH_MAX_IDS: int = 100
 PUBLIC_KEY = None
 
+# Name of the response header used to return the cursor for the next page of paginated list GET endpoints
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Name of the response header used to return the ETag identifying the version of the data returned by conditional GET
+# endpoints
+ETAG_HEADER = "ETag"
+
+# Number of documents to retrieve from the database in each batch when streaming list GET endpoint responses
+STREAM_BATCH_SIZE = 500
+
+# Maximum number of write operations to send to the database in each `bulk_write` call when performing mass updates
+BULK_WRITE_BATCH_SIZE = 1000
+
+# Number of seconds after which cached settings expire, in case changes to them cannot be watched for
+SETTINGS_CACHE_TTL_SECONDS = 60
+
+# Number of seconds after which the cached table of rules expires, in case changes to them cannot be watched for
+RULES_CACHE_TTL_SECONDS = 60
+
+# Number of seconds after which cached units, usage statuses, system types and manufacturers expire, in case changes to
+# them cannot be watched for
+REFERENCE_DATA_CACHE_TTL_SECONDS = 60
+
+# Maximum number of units, usage statuses, system types or manufacturers to cache (each)
+REFERENCE_DATA_CACHE_MAX_SIZE = 1000
+
+# Number of seconds after which cached breadcrumbs of systems and catalogue categories expire, in case changes to them
+# cannot be watched for
+BREADCRUMBS_CACHE_TTL_SECONDS = 60
+
+# Maximum number of system or catalogue category breadcrumbs to cache (each)
+BREADCRUMBS_CACHE_MAX_SIZE = 10000
+
 # Detail to return in the 500 (Internal Server Error) responses
 HTTP_500_INTERNAL_SERVER_ERROR_DETAIL = "Something went wrong"
 
@@ -3,7 +3,7 @@ Module for connecting to a MongoDB database.
 """
 
 from contextlib import contextmanager
-from typing import Annotated, Generator
+from typing import Annotated, Callable, Generator, Optional
 
 from fastapi import Depends
 from pymongo import MongoClient
@@ -11,15 +11,40 @@ from pymongo.client_session import ClientSession
 from pymongo.database import Database
 from pymongo.errors import OperationFailure
 
-from inventory_management_system_api.core.config import config
+from inventory_management_system_api.core.config import DatabaseConfig, config
+from inventory_management_system_api.core.database_metrics import ConnectionPoolMetrics
 from inventory_management_system_api.core.exceptions import WriteConflictError
 
+
+def get_client_options(database_config: DatabaseConfig) -> dict:
+    """
+    Obtains the connection pool and compression options to create a `MongoClient` with.
+
+    Only options that have been configured are returned, so that the driver defaults (or any given in
+    `host_and_options`) are used otherwise.
+
+    :param database_config: The database configuration.
+    :return: Dictionary of the keyword arguments to pass to the `MongoClient`.
+    """
+    options = {
+        "maxPoolSize": database_config.max_pool_size,
+        "minPoolSize": database_config.min_pool_size,
+        "maxIdleTimeMS": database_config.max_idle_time_ms,
+        "waitQueueTimeoutMS": database_config.wait_queue_timeout_ms,
+        "compressors": database_config.compressors,
+    }
+    return {key: value for key, value in options.items() if value is not None}
+
+
 db_config = config.ims_database
+connection_pool_metrics = ConnectionPoolMetrics()
 mongodb_client = MongoClient(
     f"{db_config.protocol.get_secret_value()}://"
     f"{db_config.username.get_secret_value()}:{db_config.password.get_secret_value()}@"
     f"{db_config.host_and_options.get_secret_value()}",
     tz_aware=True,
+    event_listeners=[connection_pool_metrics],
+    **get_client_options(db_config),
 )
 
 
@@ -32,12 +57,17 @@ def get_database() -> Database:
     return mongodb_client[db_config.name.get_secret_value()]
 
 
+# Callbacks to run once the transaction started on each session by `start_session_transaction` has been committed
+_after_commit_callbacks: dict[ClientSession, list[Callable[[], None]]] = {}
+
+
 @contextmanager
 def start_session_transaction(action_description: str) -> Generator[ClientSession, None, None]:
     """
     Starts a MongoDB session followed by a transaction and returns the session to use.
 
-    Also handles write conflicts.
+    Also handles write conflicts and runs any callbacks registered using `run_after_commit` once the transaction has
+    been committed.
 
     :param action_description: Description of what the transaction is doing so it can be used in any raised errors.
     :raises WriteConflictError: If there a write conflict during the transaction.
@@ -45,15 +75,43 @@ def start_session_transaction(action_description: str) -> Generator[ClientSessio
     """
 
     with mongodb_client.start_session() as session:
-        with session.start_transaction():
-            try:
-                yield session
-            except OperationFailure as exc:
-                if "write conflict" in str(exc).lower():
-                    raise WriteConflictError(
-                        f"Write conflict while {action_description}. Please try again later."
-                    ) from exc
-                raise exc
+        _after_commit_callbacks[session] = []
+        # The callbacks are run in the `else` so that nothing follows the yield outside of the exception handling, as
+        # otherwise the generators using this one would not be guaranteed to clean it up
+        try:  # pylint:disable=no-else-raise
+            with session.start_transaction():
+                try:
+                    yield session
+                except OperationFailure as exc:
+                    if "write conflict" in str(exc).lower():
+                        raise WriteConflictError(
+                            f"Write conflict while {action_description}. Please try again later."
+                        ) from exc
+                    raise exc
+        except BaseException:
+            del _after_commit_callbacks[session]
+            raise
+        else:
+            for callback in _after_commit_callbacks.pop(session):
+                callback()
+
+
+def run_after_commit(session: Optional[ClientSession], callback: Callable[[], None]) -> None:
+    """
+    Runs a callback once the transaction the given session is part of has been committed, so that e.g. caches are not
+    invalidated while other requests can still only read the data from before the transaction and so reload the stale
+    values into them.
+
+    The callback is not run at all if the transaction is aborted. When there is no session, or it was not started by
+    `start_session_transaction`, the callback is run immediately instead.
+
+    :param session: PyMongo ClientSession the transaction is using.
+    :param callback: Callback to run.
+    """
+    if session is not None and session in _after_commit_callbacks:
+        _after_commit_callbacks[session].append(callback)
+    else:
+        callback()
 
 
 DatabaseDep = Annotated[Database, Depends(get_database)]
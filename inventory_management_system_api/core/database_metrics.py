@@ -0,0 +1,105 @@
+"""
+Module for recording statistics about the MongoDB connection pool so that pool starvation can be distinguished from slow
+queries.
+"""
+
+import threading
+
+from pymongo import monitoring
+
+
+class ConnectionPoolMetrics(monitoring.ConnectionPoolListener):
+    """
+    Connection pool listener that records statistics about the connection pools of a `MongoClient`.
+
+    The statistics are aggregated across the pools of all servers the client is connected to. Events may be published
+    from any thread, so all updates are performed while holding a lock.
+    """
+
+    # pylint:disable=too-many-instance-attributes
+
+    def __init__(self) -> None:
+        """
+        Initialise the `ConnectionPoolMetrics` with no connections or events recorded yet.
+
+        Takes no parameters as it is registered with the `MongoClient` before any events are received.
+        """
+        self._lock = threading.Lock()
+        self._connections = 0
+        self._connections_checked_out = 0
+        self._checkouts = 0
+        self._checkout_failures: dict[str, int] = {}
+        self._checkout_wait_time_total = 0.0
+        self._checkout_wait_time_max = 0.0
+        self._pool_clears = 0
+
+    def get_statistics(self) -> dict:
+        """
+        Obtains a snapshot of the recorded statistics.
+
+        :return: Dictionary containing the recorded statistics.
+        """
+        with self._lock:
+            return {
+                "connections": self._connections,
+                "connections_checked_out": self._connections_checked_out,
+                "checkouts": self._checkouts,
+                "checkout_failures": dict(self._checkout_failures),
+                "checkout_wait_time_total_seconds": self._checkout_wait_time_total,
+                "checkout_wait_time_max_seconds": self._checkout_wait_time_max,
+                "pool_clears": self._pool_clears,
+            }
+
+    def _record_checkout_wait_time(self, duration: float | None) -> None:
+        """
+        Records the time spent waiting to check out a connection. Must be called while holding the lock.
+
+        :param duration: Time in seconds spent waiting to check out a connection (if known).
+        """
+        if duration is not None:
+            self._checkout_wait_time_total += duration
+            self._checkout_wait_time_max = max(self._checkout_wait_time_max, duration)
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        with self._lock:
+            self._connections_checked_out += 1
+            self._checkouts += 1
+            self._record_checkout_wait_time(event.duration)
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            self._checkout_failures[event.reason] = self._checkout_failures.get(event.reason, 0) + 1
+            self._record_checkout_wait_time(event.duration)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._connections_checked_out -= 1
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self._connections += 1
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self._lock:
+            self._connections -= 1
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        with self._lock:
+            self._pool_clears += 1
+
+    # The remaining events are not needed for any of the recorded statistics
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        pass
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
@@ -128,3 +128,27 @@ class ObjectStorageAPIServerError(ObjectStorageAPIError):
     """
     Exception raised when server errors occur while communicating with the Object Storage API.
     """
+
+
+class InvalidCursorError(Exception):
+    """
+    The provided pagination cursor is malformed.
+    """
+
+
+class InvalidFieldsError(Exception):
+    """
+    The requested sparse fieldset contains fields that do not exist.
+    """
+
+
+class InvalidFilterError(Exception):
+    """
+    The requested filters are malformed or filter on fields or with operators that are not allowed.
+    """
+
+
+class InvalidSortError(Exception):
+    """
+    The requested sort is on a field that is not allowed to be sorted on.
+    """
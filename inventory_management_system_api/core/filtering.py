@@ -0,0 +1,220 @@
+"""
+Module for providing functions for parsing the filters and sort order requested by clients of list endpoints.
+
+Filters are given as `field:operator:value` (with the values for the `in` operator separated by commas) and the sort
+order as the name of the field to sort by, prefixed with `-` to sort in descending order. Only the fields, operators
+and sort keys allowed for each entity may be used so that every query can be supported by an index.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from functools import cache
+from typing import Any, Mapping, Optional
+
+from pydantic import TypeAdapter
+
+from inventory_management_system_api.core.exceptions import InvalidFilterError, InvalidObjectIdError, InvalidSortError
+
+
+class FilterOperator(str, Enum):
+    """
+    Enumeration for the operators that can be used in a filter.
+    """
+
+    EQ = "eq"
+    NE = "ne"
+    GT = "gt"
+    GTE = "gte"
+    LT = "lt"
+    LTE = "lte"
+    IN = "in"
+
+
+# Operators that can be used for fields only compared by equality (e.g. IDs) and those that can also be given a range
+EQUALITY_OPERATORS = frozenset({FilterOperator.EQ, FilterOperator.NE, FilterOperator.IN})
+RANGE_OPERATORS = frozenset(
+    {FilterOperator.EQ, FilterOperator.GT, FilterOperator.GTE, FilterOperator.LT, FilterOperator.LTE}
+)
+
+
+@dataclass(frozen=True)
+class FilterField:
+    """
+    Definition of a field of an entity that clients are allowed to filter and/or sort by.
+
+    :param value_type: Type of the field's values, used to validate the values given in filters and convert them to
+                       those stored in the database (e.g. `CustomObjectIdField` for IDs).
+    :param operators: Operators allowed when filtering by the field.
+    :param sortable: Whether the entities are also allowed to be sorted by the field.
+    """
+
+    value_type: Any
+    operators: frozenset[FilterOperator]
+    sortable: bool = False
+
+
+@dataclass(frozen=True)
+class Filter:
+    """
+    A parsed filter.
+
+    :param field: Name of the field to filter by.
+    :param operator: Operator to compare the field's values with.
+    :param value: Value to compare against, or list of them for the `in` operator.
+    """
+
+    field: str
+    operator: FilterOperator
+    value: Any
+
+
+@dataclass(frozen=True)
+class Sort:
+    """
+    A parsed sort order.
+
+    :param field: Name of the field to sort by.
+    :param descending: Whether to sort in descending rather than ascending order.
+    """
+
+    field: str
+    descending: bool = False
+
+
+@cache
+def _get_type_adapter(value_type: Any) -> TypeAdapter:
+    """
+    Obtains a type adapter for validating filter values of the given type.
+
+    :param value_type: Type of the values.
+    :return: The type adapter.
+    """
+    return TypeAdapter(value_type)
+
+
+def _parse_value(field_name: str, filter_field: FilterField, value: str) -> Any:
+    """
+    Validates a value given in a filter and converts it to the field's type.
+
+    :param field_name: Name of the field being filtered by.
+    :param filter_field: Definition of the field being filtered by.
+    :param value: Value to parse.
+    :return: The parsed value.
+    :raises InvalidFilterError: If the value isn't valid for the field.
+    """
+    try:
+        return _get_type_adapter(filter_field.value_type).validate_strings(value)
+    except (ValueError, InvalidObjectIdError) as exc:
+        raise InvalidFilterError(f"Invalid value '{value}' for filter on '{field_name}'") from exc
+
+
+def parse_filters(filters: Optional[list[str]], filter_fields: Mapping[str, FilterField]) -> list[Filter]:
+    """
+    Parses the filters requested by a client.
+
+    :param filters: List of the filters in the form `field:operator:value`, or `None` if there are none.
+    :param filter_fields: Definitions of the fields that are allowed to be filtered by for the entity, with their names
+                          as keys.
+    :return: List of the parsed filters.
+    :raises InvalidFilterError: If any of the filters are malformed, are on fields or use operators that aren't allowed,
+                                have invalid values, or are duplicates.
+    """
+    parsed_filters = []
+    for requested_filter in filters or []:
+        parts = requested_filter.split(":", 2)
+        if len(parts) != 3:
+            raise InvalidFilterError(f"Invalid filter '{requested_filter}', expected 'field:operator:value'")
+        field_name, operator, value = parts
+
+        filter_field = filter_fields.get(field_name)
+        if filter_field is None:
+            raise InvalidFilterError(f"Filtering on '{field_name}' is not supported")
+        if operator not in {allowed_operator.value for allowed_operator in filter_field.operators}:
+            raise InvalidFilterError(f"Operator '{operator}' is not supported when filtering on '{field_name}'")
+        operator = FilterOperator(operator)
+
+        if any(other.field == field_name and other.operator == operator for other in parsed_filters):
+            raise InvalidFilterError(f"Duplicate '{operator.value}' filter on '{field_name}'")
+
+        parsed_filters.append(
+            Filter(
+                field=field_name,
+                operator=operator,
+                value=(
+                    [_parse_value(field_name, filter_field, element) for element in value.split(",")]
+                    if operator == FilterOperator.IN
+                    else _parse_value(field_name, filter_field, value)
+                ),
+            )
+        )
+    return parsed_filters
+
+
+def parse_sort(sort: Optional[str], filter_fields: Mapping[str, FilterField]) -> Optional[Sort]:
+    """
+    Parses the sort order requested by a client.
+
+    :param sort: Name of the field to sort by, prefixed with `-` to sort in descending order, or `None` to use the
+                 default order.
+    :param filter_fields: Definitions of the fields that are allowed to be filtered and sorted by for the entity, with
+                          their names as keys.
+    :return: The parsed sort order, or `None` if the default order should be used.
+    :raises InvalidSortError: If sorting by the field isn't allowed.
+    """
+    if sort is None:
+        return None
+
+    field_name = sort.removeprefix("-")
+    filter_field = filter_fields.get(field_name)
+    if filter_field is None or not filter_field.sortable:
+        raise InvalidSortError(f"Sorting by '{field_name}' is not supported")
+    return Sort(field=field_name, descending=sort.startswith("-"))
+
+
+def get_fields_for_sort(fields: Optional[list[str]], sort: Optional[Sort]) -> Optional[list[str]]:
+    """
+    Obtains the fields that need to be retrieved for a sparse fieldset when sorting, which must include the field being
+    sorted by so that it is available to create the cursor for the next page from.
+
+    :param fields: List of the requested fields, or `None` if all fields were requested.
+    :param sort: Sort order requested by the client, or `None` if the default order is being used.
+    :return: List of the fields to retrieve, or `None` if all fields should be retrieved.
+    """
+    if fields is None or sort is None or sort.field in fields:
+        return fields
+    return [*fields, sort.field]
+
+
+def create_filter_description(filter_fields: Mapping[str, FilterField]) -> str:
+    """
+    Creates the OpenAPI description of the query parameter used to give filters for an entity.
+
+    :param filter_fields: Definitions of the fields that are allowed to be filtered by for the entity, with their names
+                          as keys.
+    :return: The description.
+    """
+    allowed_filters = "; ".join(
+        f"{field_name} ({', '.join(sorted(operator.value for operator in filter_field.operators))})"
+        for field_name, filter_field in filter_fields.items()
+    )
+    return (
+        "Filter to apply in the form 'field:operator:value', which may be given multiple times (values for the 'in' "
+        f"operator are comma separated). Supported fields (and operators): {allowed_filters}"
+    )
+
+
+def create_sort_description(filter_fields: Mapping[str, FilterField]) -> str:
+    """
+    Creates the OpenAPI description of the query parameter used to give the sort order for an entity.
+
+    :param filter_fields: Definitions of the fields that are allowed to be filtered and sorted by for the entity, with
+                          their names as keys.
+    :return: The description.
+    """
+    sortable_fields = ", ".join(
+        field_name for field_name, filter_field in filter_fields.items() if filter_field.sortable
+    )
+    return (
+        "Field to sort by, prefixed with '-' to sort in descending order (by default results are sorted by ID when "
+        f"paginating and otherwise in no specific order). Supported fields: {sortable_fields}"
+    )
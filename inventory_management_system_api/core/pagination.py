@@ -0,0 +1,103 @@
+"""
+Module for providing functions for handling keyset (cursor) pagination of list endpoints.
+"""
+
+import base64
+import binascii
+from typing import Any, Optional, Sequence, Tuple
+
+from bson import ObjectId, json_util
+from bson.errors import BSONError
+
+from inventory_management_system_api.core.exceptions import InvalidCursorError
+from inventory_management_system_api.core.filtering import Sort
+
+
+def encode_cursor(last_id: str, sort: Optional[Sort] = None, sort_value: Any = None) -> str:
+    """
+    Encodes an opaque cursor pointing just after the given document ID.
+
+    :param last_id: ID of the last document returned in the current page.
+    :param sort: Sort order of the documents, or `None` if they are sorted by ID only.
+    :param sort_value: Value of the field the documents are sorted by for the last document returned in the current
+                       page.
+    :return: URL safe cursor string that can be used to obtain the next page.
+    """
+    cursor = {"_id": ObjectId(last_id)}
+    if sort is not None:
+        cursor["sort"] = {"field": sort.field, "descending": sort.descending, "value": sort_value}
+    return base64.urlsafe_b64encode(json_util.dumps(cursor).encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> dict:
+    """
+    Decodes an opaque cursor previously created by `encode_cursor` into its contents.
+
+    :param cursor: Cursor string to decode.
+    :return: Contents of the cursor.
+    :raises InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        decoded_cursor = json_util.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, BSONError, TypeError, ValueError) as exc:
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'") from exc
+
+    if not isinstance(decoded_cursor, dict) or not isinstance(decoded_cursor.get("_id"), ObjectId):
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'")
+    return decoded_cursor
+
+
+def decode_cursor(cursor: str) -> ObjectId:
+    """
+    Decodes an opaque cursor previously created by `encode_cursor` for documents sorted by ID only.
+
+    :param cursor: Cursor string to decode.
+    :return: ID of the last document returned in the previous page.
+    :raises InvalidCursorError: If the cursor is malformed or was created for documents sorted by another field.
+    """
+    decoded_cursor = _decode_cursor(cursor)
+    if "sort" in decoded_cursor:
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'")
+    return decoded_cursor["_id"]
+
+
+def decode_sorted_cursor(cursor: str, sort: Sort) -> Tuple[ObjectId, Any]:
+    """
+    Decodes an opaque cursor previously created by `encode_cursor` for documents in the given sort order.
+
+    :param cursor: Cursor string to decode.
+    :param sort: Sort order of the documents.
+    :return: Tuple containing the ID and the value of the sorted field of the last document returned in the previous
+             page.
+    :raises InvalidCursorError: If the cursor is malformed or was created for documents sorted differently.
+    """
+    decoded_cursor = _decode_cursor(cursor)
+    cursor_sort = decoded_cursor.get("sort")
+    if (
+        not isinstance(cursor_sort, dict)
+        or cursor_sort.get("field") != sort.field
+        or cursor_sort.get("descending") is not sort.descending
+        or "value" not in cursor_sort
+    ):
+        raise InvalidCursorError(f"Invalid cursor '{cursor}'")
+    return decoded_cursor["_id"], cursor_sort["value"]
+
+
+def get_next_cursor(results: Sequence, limit: Optional[int], sort: Optional[Sort] = None) -> Optional[str]:
+    """
+    Obtains the cursor for the page following the given results.
+
+    A cursor is only returned when the page is full, so the final page may be empty when the number of results is an
+    exact multiple of the limit.
+
+    :param results: Results of the current page. Each must have an `id` attribute, along with an attribute for the
+                    field they are sorted by if any.
+    :param limit: Maximum number of results that were requested for the page, or `None` if not paginating.
+    :param sort: Sort order of the results, or `None` if they are sorted by ID only.
+    :return: Cursor for the next page or `None` if there are no further results.
+    """
+    if limit is None or len(results) < limit:
+        return None
+    if sort is None:
+        return encode_cursor(results[-1].id)
+    return encode_cursor(results[-1].id, sort, getattr(results[-1], sort.field))
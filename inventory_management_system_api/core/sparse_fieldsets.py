@@ -0,0 +1,168 @@
+"""
+Module for providing functions for handling sparse fieldsets, which allow clients to request that only a subset of the
+fields of an entity are returned.
+"""
+
+from copy import copy
+from enum import Enum
+from functools import cache
+from types import NoneType, UnionType
+from typing import Any, Callable, Iterable, Mapping, Optional, TypeVar, Union, get_args, get_origin
+
+from fastapi import Response
+from pydantic import BaseModel, create_model
+
+from inventory_management_system_api.core.exceptions import InvalidFieldsError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def parse_fields(fields: Optional[str], schema: type[BaseModel]) -> Optional[list[str]]:
+    """
+    Parses a comma separated list of the fields requested by a client.
+
+    The `id` field is always included as it is required to identify the returned entities (and to paginate them).
+
+    :param fields: Comma separated list of field names, or `None` if all fields were requested.
+    :param schema: Schema model of the entity the fields were requested for.
+    :return: List of the requested field names, or `None` if all fields were requested.
+    :raises InvalidFieldsError: If any of the requested fields don't exist in the given schema.
+    """
+    if fields is None:
+        return None
+
+    requested_fields = list(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    invalid_fields = [field for field in requested_fields if field not in schema.model_fields]
+    if invalid_fields:
+        raise InvalidFieldsError(f"Invalid field(s) requested: {', '.join(invalid_fields)}")
+
+    return ["id"] + [field for field in requested_fields if field != "id"]
+
+
+@cache
+def create_partial_model(model: type[ModelT]) -> type[ModelT]:
+    """
+    Creates a subclass of the given model in which every field is optional.
+
+    Instances of the returned model can be validated using only a subset of the fields of the original model, and can
+    be serialised back to that subset using `exclude_unset`.
+
+    :param model: Model to create the partial model from.
+    :return: The partial model.
+    """
+    fields: dict[str, Any] = {}
+    for field_name, field_info in model.model_fields.items():
+        partial_field_info = copy(field_info)
+        partial_field_info.default = None
+        partial_field_info.default_factory = None
+        fields[field_name] = (Optional[field_info.annotation], partial_field_info)
+
+    return create_model(f"Partial{model.__name__}", __base__=model, **fields)
+
+
+def get_model_for_fields(model: type[ModelT], fields: Optional[list[str]]) -> type[ModelT]:
+    """
+    Obtains the model to use to validate data containing only the given fields.
+
+    :param model: Model containing all fields.
+    :param fields: List of the fields the data will contain, or `None` if it will contain all of them.
+    :return: The given model if all fields are present, otherwise its partial equivalent.
+    """
+    return model if fields is None else create_partial_model(model)
+
+
+def _create_converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Creates a function for converting dumped data of the given type back into the type itself without validating it.
+
+    Only nested models and enums need converting, as dumping leaves all other types used by the schemas unchanged.
+
+    :param annotation: Type annotation of the field the data is for.
+    :return: The converter, or `None` if the data can be used as is.
+    """
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        types = [arg for arg in get_args(annotation) if arg is not NoneType]
+        converter = _create_converter(types[0]) if len(types) == 1 else None
+        return None if converter is None else lambda value: None if value is None else converter(value)
+    if origin is list:
+        converter = _create_converter(get_args(annotation)[0])
+        return None if converter is None else lambda value: [converter(element) for element in value]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lambda value: _construct_model(annotation, value)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation
+    return None
+
+
+@cache
+def _get_field_converters(model: type[BaseModel]) -> dict[str, Optional[Callable[[Any], Any]]]:
+    """
+    Obtains the converters for each of the fields of the given model.
+
+    :param model: Model to obtain the converters for.
+    :return: Dictionary of the converters (or `None` where not required) with the field names as keys.
+    """
+    return {
+        field_name: _create_converter(field_info.annotation) for field_name, field_info in model.model_fields.items()
+    }
+
+
+def _construct_model(model: type[ModelT], data: Mapping[str, Any]) -> ModelT:
+    """
+    Constructs an instance of the given model from dumped data without validating it.
+
+    The data must have already been validated (e.g. by a database model containing the same fields), as it is trusted
+    to be of the correct types. Any keys that aren't fields of the model are ignored.
+
+    :param model: Model to construct an instance of.
+    :param data: Data to use.
+    :return: The model instance, in which only the fields present in the data are considered set.
+    """
+    converters = _get_field_converters(model)
+    values = {}
+    for field_name, value in data.items():
+        if field_name in converters:
+            converter = converters[field_name]
+            values[field_name] = value if converter is None else converter(value)
+    return model.model_construct(**values)
+
+
+def create_schema(schema: type[ModelT], data: BaseModel, fields: Optional[list[str]]) -> ModelT:
+    """
+    Creates a schema model instance containing the given fields of some data.
+
+    As the data has already been validated when it was obtained, the schema model instance is constructed without
+    validating it again.
+
+    :param schema: Schema model to create an instance of.
+    :param data: Model containing the data to use.
+    :param fields: List of the fields to include, or `None` to include all of them.
+    :return: The schema model instance, which will be a partial instance if only specific fields were requested.
+    """
+    if fields is None:
+        return _construct_model(schema, data.model_dump())
+    return _construct_model(create_partial_model(schema), data.model_dump(include=set(fields)))
+
+
+def create_json_response(
+    content: BaseModel | Iterable[BaseModel], exclude_unset: bool = False, headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """
+    Creates a JSON response containing the given schema model instance(s).
+
+    The models are serialised directly, avoiding FastAPI validating them against the route's response model again when
+    returned (so they should be created using `create_schema`).
+
+    :param content: Schema model instance or list of them to return.
+    :param exclude_unset: Whether to exclude fields that were not explicitly set on the models (e.g. when returning
+                          partial models containing only a sparse fieldset).
+    :param headers: Any headers to include in the response (as a returned response is used as is, any headers set on
+                    the route's injected `Response` must be passed through here).
+    :return: The JSON response.
+    """
+    if isinstance(content, BaseModel):
+        body = content.model_dump_json(exclude_unset=exclude_unset)
+    else:
+        body = "[" + ",".join(model.model_dump_json(exclude_unset=exclude_unset) for model in content) + "]"
+    return Response(content=body, media_type="application/json", headers=headers)
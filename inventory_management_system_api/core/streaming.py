@@ -0,0 +1,57 @@
+"""
+Module for providing functions for streaming list GET endpoint responses as newline delimited JSON (NDJSON).
+"""
+
+from typing import Iterable, Iterator, Mapping, Optional
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+# Media type clients may request via the `Accept` header to receive a streamed NDJSON response
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# OpenAPI documentation of the additional media type that streaming list GET endpoints may respond with
+NDJSON_RESPONSES = {200: {"content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}}}}
+
+
+def accepts_ndjson(request: Request) -> bool:
+    """
+    Determines whether the client has requested an NDJSON response via the `Accept` header of the request.
+
+    :param request: The request to check.
+    :return: `True` if an NDJSON response was requested, `False` otherwise.
+    """
+    accept = request.headers.get("accept", "")
+    return any(media_range.split(";")[0].strip() == NDJSON_MEDIA_TYPE for media_range in accept.split(","))
+
+
+def _serialise_ndjson(models: Iterable[BaseModel], exclude_unset: bool) -> Iterator[str]:
+    """
+    Serialises each of the given models to JSON as it is obtained, yielding one line per model.
+
+    :param models: Models to serialise.
+    :param exclude_unset: Whether to exclude fields that were not explicitly set on the models.
+    :return: Iterator of the serialised lines.
+    """
+    for model in models:
+        yield model.model_dump_json(exclude_unset=exclude_unset) + "\n"
+
+
+def create_ndjson_response(
+    models: Iterable[BaseModel], exclude_unset: bool = False, headers: Optional[Mapping[str, str]] = None
+) -> StreamingResponse:
+    """
+    Creates a response that streams the given models as NDJSON.
+
+    The models are only serialised as the response body is sent, so when given a lazily evaluated iterable (e.g. one
+    backed by a PyMongo cursor) the whole list is never held in memory at once.
+
+    :param models: Models to stream.
+    :param exclude_unset: Whether to exclude fields that were not explicitly set on the models (e.g. when streaming
+                          partial models containing only a sparse fieldset).
+    :param headers: Any headers to include in the response (as a returned response is used as is, any headers set on
+                    the route's injected `Response` must be passed through here).
+    :return: The streaming response.
+    """
+    return StreamingResponse(_serialise_ndjson(models, exclude_unset), media_type=NDJSON_MEDIA_TYPE, headers=headers)
@@ -3,21 +3,30 @@ Main module contains the API entrypoint.
 """
 
 import logging
+from contextlib import asynccontextmanager
 
+from anyio import to_thread
 from fastapi import Depends, FastAPI, Request, status
 from fastapi.exception_handlers import request_validation_exception_handler
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from inventory_management_system_api.core.change_streams import change_stream_watcher
 from inventory_management_system_api.core.config import config
-from inventory_management_system_api.core.consts import HTTP_500_INTERNAL_SERVER_ERROR_DETAIL
+from inventory_management_system_api.core.consts import (
+    ETAG_HEADER,
+    HTTP_500_INTERNAL_SERVER_ERROR_DETAIL,
+    NEXT_CURSOR_HEADER,
+)
+from inventory_management_system_api.core.database import get_database
 from inventory_management_system_api.core.logger_setup import setup_logger
 from inventory_management_system_api.routers.v1 import (
     catalogue_category,
     catalogue_item,
     item,
     manufacturer,
+    metrics,
     rule,
     setting,
     system,
@@ -26,13 +35,39 @@ from inventory_management_system_api.routers.v1 import (
     usage_status,
 )
 
-app = FastAPI(title=config.api.title, description=config.api.description, root_path=config.api.root_path)
-
 setup_logger()
 logger = logging.getLogger()
 logger.info("Logging now setup")
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """
+    Lifespan of the API, used to configure the event loop the API runs in and start any background tasks before any
+    requests are handled.
+
+    :param _: Unused
+    """
+    # Sync route handlers are run in AnyIO's worker thread pool so its size limits the number of requests that can be
+    # processed concurrently (including any that are waiting to retry a transaction)
+    if config.api.thread_pool_size is not None:
+        logger.info("Setting the worker thread pool size to %s", config.api.thread_pool_size)
+        to_thread.current_default_thread_limiter().total_tokens = config.api.thread_pool_size
+
+    # Invalidate any in-process caches whenever the data they hold is modified (including by other processes)
+    change_stream_watcher.start(get_database())
+    yield
+    change_stream_watcher.stop()
+
+
+app = FastAPI(
+    title=config.api.title,
+    description=config.api.description,
+    root_path=config.api.root_path,
+    lifespan=lifespan,
+)
+
+
 @app.exception_handler(Exception)
 async def custom_general_exception_handler(_: Request, exc: Exception) -> JSONResponse:
     """
@@ -87,6 +122,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=config.api.allowed_cors_methods,
     allow_headers=config.api.allowed_cors_headers,
+    expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER],
 )
 
 router_dependencies = get_router_dependencies()
@@ -95,6 +131,7 @@ app.include_router(catalogue_category.router, dependencies=router_dependencies)
 app.include_router(catalogue_item.router, dependencies=router_dependencies)
 app.include_router(item.router, dependencies=router_dependencies)
 app.include_router(manufacturer.router, dependencies=router_dependencies)
+app.include_router(metrics.router, dependencies=router_dependencies)
 app.include_router(system.router, dependencies=router_dependencies)
 app.include_router(system_type.router, dependencies=router_dependencies)
 app.include_router(unit.router, dependencies=router_dependencies)
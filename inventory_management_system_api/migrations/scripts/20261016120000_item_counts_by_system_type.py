@@ -0,0 +1,66 @@
+"""
+Module providing a migration that adds item_counts_by_system_type to catalogue items.
+"""
+
+# Expect some duplicate code inside migrations as models can be duplicated
+# pylint: disable=invalid-name
+# pylint: disable=duplicate-code
+
+from pymongo import UpdateOne
+from pymongo.client_session import ClientSession
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+from inventory_management_system_api.migrations.base import BaseMigration
+
+
+class Migration(BaseMigration):
+    """Migration that adds item_counts_by_system_type to catalogue items."""
+
+    description = "Adds item_counts_by_system_type to catalogue items"
+
+    def __init__(self, database: Database):
+        self._catalogue_items_collection: Collection = database.catalogue_items
+        self._items_collection: Collection = database.items
+
+    def forward(self, session: ClientSession):
+        """Applies database changes."""
+
+        # Count the items in each catalogue item by the types of the systems they are in
+        result = self._items_collection.aggregate(
+            [
+                {"$lookup": {"from": "systems", "localField": "system_id", "foreignField": "_id", "as": "system"}},
+                {"$unwind": "$system"},
+                {
+                    "$group": {
+                        "_id": {"catalogue_item_id": "$catalogue_item_id", "system_type_id": "$system.type_id"},
+                        "count": {"$sum": 1},
+                    }
+                },
+            ],
+            session=session,
+        )
+        item_counts = {}
+        for document in result:
+            item_counts.setdefault(document["_id"]["catalogue_item_id"], {})[str(document["_id"]["system_type_id"])] = (
+                document["count"]
+            )
+
+        # Catalogue items without any items still need the field
+        self._catalogue_items_collection.update_many({}, {"$set": {"item_counts_by_system_type": {}}}, session=session)
+        if item_counts:
+            self._catalogue_items_collection.bulk_write(
+                [
+                    UpdateOne({"_id": catalogue_item_id}, {"$set": {"item_counts_by_system_type": counts}})
+                    for catalogue_item_id, counts in item_counts.items()
+                ],
+                ordered=False,
+                session=session,
+            )
+
+    def backward(self, session: ClientSession):
+        """Reverses database changes."""
+
+        self._catalogue_items_collection.update_many(
+            {}, {"$unset": {"item_counts_by_system_type": ""}}, session=session
+        )
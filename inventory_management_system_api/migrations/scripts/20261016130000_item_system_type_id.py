@@ -0,0 +1,38 @@
+"""
+Module providing a migration that adds system_type_id to items.
+"""
+
+# Expect some duplicate code inside migrations as models can be duplicated
+# pylint: disable=invalid-name
+# pylint: disable=duplicate-code
+
+from pymongo.client_session import ClientSession
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+from inventory_management_system_api.migrations.base import BaseMigration
+
+
+class Migration(BaseMigration):
+    """Migration that adds system_type_id to items."""
+
+    description = "Adds system_type_id to items"
+
+    def __init__(self, database: Database):
+        self._items_collection: Collection = database.items
+        self._systems_collection: Collection = database.systems
+
+    def forward(self, session: ClientSession):
+        """Applies database changes."""
+
+        systems = self._systems_collection.find({}, {"type_id": True}, session=session)
+
+        for system in systems:
+            self._items_collection.update_many(
+                {"system_id": system["_id"]}, {"$set": {"system_type_id": system["type_id"]}}, session=session
+            )
+
+    def backward(self, session: ClientSession):
+        """Reverses database changes."""
+
+        self._items_collection.update_many({}, {"$unset": {"system_type_id": ""}}, session=session)
@@ -0,0 +1,54 @@
+"""
+Module providing a migration that adds ancestor_ids to systems and catalogue categories.
+"""
+
+# Expect some duplicate code inside migrations as models can be duplicated
+# pylint: disable=invalid-name
+# pylint: disable=duplicate-code
+
+from pymongo import UpdateOne
+from pymongo.client_session import ClientSession
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+from inventory_management_system_api.migrations.base import BaseMigration
+
+
+class Migration(BaseMigration):
+    """Migration that adds ancestor_ids to systems and catalogue categories."""
+
+    description = "Adds ancestor_ids to systems and catalogue categories"
+
+    def __init__(self, database: Database):
+        self._collections: list[Collection] = [database.systems, database.catalogue_categories]
+
+    def forward(self, session: ClientSession):
+        """Applies database changes."""
+
+        for collection in self._collections:
+            parent_ids = {
+                document["_id"]: document["parent_id"]
+                for document in collection.find({}, {"parent_id": True}, session=session)
+            }
+            if not parent_ids:
+                continue
+
+            updates = []
+            for entity_id in parent_ids:
+                # Walk up the tree, then reverse to obtain the ancestors in order from the top level down
+                ancestor_ids = []
+                parent_id = parent_ids[entity_id]
+                while parent_id is not None:
+                    ancestor_ids.append(parent_id)
+                    parent_id = parent_ids.get(parent_id)
+                ancestor_ids.reverse()
+
+                updates.append(UpdateOne({"_id": entity_id}, {"$set": {"ancestor_ids": ancestor_ids}}))
+
+            collection.bulk_write(updates, ordered=False, session=session)
+
+    def backward(self, session: ClientSession):
+        """Reverses database changes."""
+
+        for collection in self._collections:
+            collection.update_many({}, {"$unset": {"ancestor_ids": ""}}, session=session)
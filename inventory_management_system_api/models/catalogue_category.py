@@ -90,6 +90,8 @@ class CatalogueCategoryBase(BaseModel):
 
     # Computed
     is_flagged: Optional[bool] = None
+    # IDs of all of the parent catalogue categories above this one in order from the top level down
+    ancestor_ids: List[CustomObjectIdField] = []
 
     @field_validator("properties", mode="before")
     @classmethod
@@ -125,5 +127,6 @@ class CatalogueCategoryOut(CreatedModifiedTimeOutMixin, CatalogueCategoryBase):
     id: StringObjectIdField = Field(alias="_id")
     parent_id: Optional[StringObjectIdField] = None
     properties: List[CatalogueCategoryPropertyOut] = []
+    ancestor_ids: List[StringObjectIdField] = []
 
     model_config = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
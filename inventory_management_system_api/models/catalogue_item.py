@@ -58,6 +58,7 @@ class CatalogueItemBase(BaseModel):
     properties: List[PropertyIn] = []
 
     # Computed
+    item_counts_by_system_type: dict[str, int] = {}
     number_of_spares: Optional[int] = None
     number_of_spares_required: Optional[float] = None
     criticality: Optional[float] = None
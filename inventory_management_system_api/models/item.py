@@ -20,6 +20,8 @@ class ItemBase(BaseModel):
 
     catalogue_item_id: CustomObjectIdField
     system_id: CustomObjectIdField
+    # Denormalised from the system so that items can be counted by system type without joining the systems
+    system_type_id: CustomObjectIdField
     purchase_order_number: Optional[str] = None
     is_defective: bool
     usage_status_id: CustomObjectIdField
@@ -63,6 +65,7 @@ class ItemOut(CreatedModifiedTimeOutMixin, ItemBase):
     id: StringObjectIdField = Field(alias="_id")
     catalogue_item_id: StringObjectIdField
     system_id: Optional[StringObjectIdField] = None
+    system_type_id: Optional[StringObjectIdField] = None
     usage_status_id: StringObjectIdField
     properties: List[PropertyOut] = []
 
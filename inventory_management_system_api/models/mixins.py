@@ -9,6 +9,17 @@ from typing import Optional
 from pydantic import AwareDatetime, BaseModel, Field, model_validator
 
 
+def _current_time() -> datetime:
+    """
+    Obtains the current time truncated to the millisecond precision that MongoDB stores, so that models built from the
+    data that was inserted match those read back from the database.
+
+    :return: The current time.
+    """
+    now = datetime.now(timezone.utc)
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
 class CreatedModifiedTimeInMixin(BaseModel):
     """
     Input model mixin that provides creation and modified time fields
@@ -20,7 +31,7 @@ class CreatedModifiedTimeInMixin(BaseModel):
     database entry.
     """
 
-    created_time: AwareDatetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_time: AwareDatetime = Field(default_factory=_current_time)
     modified_time: Optional[AwareDatetime] = None
 
     @model_validator(mode="after")
@@ -35,7 +46,7 @@ class CreatedModifiedTimeInMixin(BaseModel):
         if self.modified_time is None:
             self.modified_time = self.created_time
         else:
-            self.modified_time = datetime.now(timezone.utc)
+            self.modified_time = _current_time()
         return self
 
 
@@ -2,7 +2,7 @@
 Module for defining the database models for representing systems.
 """
 
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -28,6 +28,8 @@ class SystemBase(BaseModel):
 
     # Computed
     is_flagged: Optional[bool] = None
+    # IDs of all of the parent systems above this one in order from the top level down
+    ancestor_ids: List[CustomObjectIdField] = []
 
 
 class SystemIn(CreatedModifiedTimeInMixin, SystemBase):
@@ -44,5 +46,6 @@ class SystemOut(CreatedModifiedTimeOutMixin, SystemBase):
     id: StringObjectIdField = Field(alias="_id")
     parent_id: Optional[StringObjectIdField] = None
     type_id: StringObjectIdField
+    ancestor_ids: List[StringObjectIdField] = []
 
     model_config = ConfigDict(populate_by_name=True)
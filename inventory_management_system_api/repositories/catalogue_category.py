@@ -4,14 +4,20 @@ Module for providing a repository for managing catalogue categories in a MongoDB
 
 import logging
 from datetime import datetime, timezone
+from functools import partial
 from typing import List, Optional
 
+from pymongo import ASCENDING, IndexModel
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 from pymongo.errors import DuplicateKeyError
 
+from inventory_management_system_api.core.cache import VersionedCache
+from inventory_management_system_api.core.change_streams import change_stream_watcher
+from inventory_management_system_api.core.conditional_requests import compute_list_version
+from inventory_management_system_api.core.consts import BREADCRUMBS_CACHE_MAX_SIZE, BREADCRUMBS_CACHE_TTL_SECONDS
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
-from inventory_management_system_api.core.database import DatabaseDep
+from inventory_management_system_api.core.database import DatabaseDep, run_after_commit
 from inventory_management_system_api.core.exceptions import (
     ChildElementsExistError,
     DuplicateRecordError,
@@ -29,12 +35,32 @@ from inventory_management_system_api.schemas.breadcrumbs import BreadcrumbsGetSc
 
 logger = logging.getLogger()
 
+# Cache of the breadcrumbs of catalogue categories by ID, discarded for a catalogue category and its descendants
+# whenever it is renamed or moved
+catalogue_category_breadcrumbs_cache = VersionedCache(
+    ttl_seconds=BREADCRUMBS_CACHE_TTL_SECONDS, max_size=BREADCRUMBS_CACHE_MAX_SIZE
+)
+change_stream_watcher.register_change_callback(
+    ["catalogue_categories"], partial(utils.invalidate_breadcrumbs_for_change, catalogue_category_breadcrumbs_cache)
+)
+
 
 class CatalogueCategoryRepo:
     """
     Repository for managing catalogue categories in a MongoDB database.
     """
 
+    INDEXES = {
+        "catalogue_categories": [
+            IndexModel(
+                [("parent_id", ASCENDING), ("code", ASCENDING)],
+                name="catalogue_categories_name_uniqueness_index",
+                unique=True,
+            ),
+            IndexModel([("ancestor_ids", ASCENDING)], name="catalogue_categories_ancestor_ids_index"),
+        ]
+    }
+
     def __init__(self, database: DatabaseDep) -> None:
         """
         Initialize the `CatalogueCategoryRepo` with a MongoDB database instance.
@@ -61,13 +87,20 @@ class CatalogueCategoryRepo:
         :raises DuplicateRecordError: If a duplicate catalogue category is found within the parent catalogue category.
         """
         parent_id = str(catalogue_category.parent_id) if catalogue_category.parent_id else None
-        if parent_id and not self.get(parent_id, session=session):
+        parent_catalogue_category = self.get(parent_id, session=session) if parent_id else None
+        if parent_id and not parent_catalogue_category:
             raise MissingRecordError(f"No parent catalogue category found with ID '{parent_id}'")
 
+        ancestor_ids = (
+            utils.compute_ancestor_ids(parent_id, parent_catalogue_category.ancestor_ids)
+            if parent_catalogue_category
+            else []
+        )
+
         logger.info("Inserting the new catalogue category into the database")
         try:
             result = self._catalogue_categories_collection.insert_one(
-                catalogue_category.model_dump(by_alias=True), session=session
+                {**catalogue_category.model_dump(by_alias=True), "ancestor_ids": ancestor_ids}, session=session
             )
         except DuplicateKeyError as exc:
             raise DuplicateRecordError(
@@ -95,6 +128,25 @@ class CatalogueCategoryRepo:
             return CatalogueCategoryOut(**catalogue_category)
         return None
 
+    def get_many(
+        self, catalogue_category_ids: List[str], session: Optional[ClientSession] = None
+    ) -> dict[str, CatalogueCategoryOut]:
+        """
+        Retrieve multiple catalogue categories by their IDs from a MongoDB database using a single query.
+
+        :param catalogue_category_ids: The IDs of the catalogue categories to retrieve.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: Dictionary of the retrieved catalogue categories with their IDs as keys.
+                 Any that were not found are omitted.
+        """
+        catalogue_categories = [
+            CatalogueCategoryOut(**catalogue_category)
+            for catalogue_category in self._catalogue_categories_collection.find(
+                utils.ids_query(catalogue_category_ids, "catalogue categories"), session=session
+            )
+        ]
+        return {catalogue_category.id: catalogue_category for catalogue_category in catalogue_categories}
+
     def get_breadcrumbs(
         self, catalogue_category_id: str, session: Optional[ClientSession] = None
     ) -> BreadcrumbsGetSchema:
@@ -106,19 +158,76 @@ class CatalogueCategoryRepo:
         :return: Breadcrumbs
         """
         logger.info("Querying breadcrumbs for catalogue category with id '%s'", catalogue_category_id)
-        return utils.compute_breadcrumbs(
+
+        def load_breadcrumbs() -> BreadcrumbsGetSchema:
+            return utils.compute_breadcrumbs(
+                list(
+                    self._catalogue_categories_collection.aggregate(
+                        utils.create_breadcrumbs_aggregation_pipeline(
+                            entity_id=catalogue_category_id, collection_name="catalogue_categories"
+                        ),
+                        session=session,
+                    )
+                ),
+                entity_id=catalogue_category_id,
+                collection_name="catalogue_categories",
+            )
+
+        # Within a session the breadcrumbs may depend on uncommitted changes so they must be obtained from the database
+        if session is not None:
+            return load_breadcrumbs()
+        return catalogue_category_breadcrumbs_cache.get_or_load(CustomObjectId(catalogue_category_id), load_breadcrumbs)
+
+    def get_many_breadcrumbs(
+        self, catalogue_category_ids: List[str], session: Optional[ClientSession] = None
+    ) -> dict[str, BreadcrumbsGetSchema]:
+        """
+        Retrieve the breadcrumbs for multiple catalogue categories using a single query
+
+        :param catalogue_category_ids: IDs of the catalogue categories to retrieve breadcrumbs for
+        :param session: PyMongo ClientSession to use for database operations
+        :return: Dictionary of the breadcrumbs with the IDs of the catalogue categories as keys. Any that were not found
+                 are omitted.
+        """
+        logger.info("Querying breadcrumbs for %s catalogue categories", len(catalogue_category_ids))
+        return utils.compute_many_breadcrumbs(
             list(
                 self._catalogue_categories_collection.aggregate(
-                    utils.create_breadcrumbs_aggregation_pipeline(
-                        entity_id=catalogue_category_id, collection_name="catalogue_categories"
+                    utils.create_many_breadcrumbs_aggregation_pipeline(
+                        entity_ids=catalogue_category_ids, collection_name="catalogue_categories"
                     ),
                     session=session,
                 )
             ),
-            entity_id=catalogue_category_id,
             collection_name="catalogue_categories",
         )
 
+    def get_tree(
+        self, catalogue_category_id: str, max_depth: Optional[int] = None, session: Optional[ClientSession] = None
+    ) -> List[CatalogueCategoryOut]:
+        """
+        Retrieve a catalogue category along with all of its descendants from a MongoDB database using a single query.
+
+        :param catalogue_category_id: ID of the catalogue category at the top of the tree.
+        :param max_depth: Maximum depth of the descendants to retrieve relative to the catalogue category, or `None` to
+                          retrieve all of them.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: List containing the catalogue category followed by its descendants, ordered from the top of the tree
+                 down.
+        :raises MissingRecordError: If the catalogue category doesn't exist.
+        """
+        logger.info("Retrieving tree for catalogue category with ID '%s' from the database", catalogue_category_id)
+        catalogue_categories = [
+            CatalogueCategoryOut(**catalogue_category)
+            for catalogue_category in self._catalogue_categories_collection.find(
+                utils.create_subtree_query(catalogue_category_id, max_depth), session=session
+            )
+        ]
+        if not any(catalogue_category.id == catalogue_category_id for catalogue_category in catalogue_categories):
+            raise MissingRecordError(f"No catalogue category found with ID '{catalogue_category_id}'")
+
+        return sorted(catalogue_categories, key=lambda catalogue_category: len(catalogue_category.ancestor_ids))
+
     def list(self, parent_id: Optional[str], session: Optional[ClientSession] = None) -> List[CatalogueCategoryOut]:
         """
         Retrieve catalogue categories from a MongoDB database based on the provided filters.
@@ -133,6 +242,26 @@ class CatalogueCategoryRepo:
         catalogue_categories = self._catalogue_categories_collection.find(query, session=session)
         return [CatalogueCategoryOut(**catalogue_category) for catalogue_category in catalogue_categories]
 
+    def get_list_version(self, parent_id: Optional[str], session: Optional[ClientSession] = None) -> str:
+        """
+        Retrieve the version of the list of catalogue categories that `list` would return given the same filters,
+        retrieving only the ID and `modified_time` of each of them.
+
+        :param parent_id: The parent_id to filter catalogue categories by.
+        :param session: PyMongo ClientSession to use for database operations
+        :return: Version of the list of catalogue categories (as returned by `compute_list_version`), which changes
+                 whenever any of the catalogue categories in it are created, modified or deleted.
+        """
+        query = utils.list_query({"parent_id": parent_id}, "catalogue categories")
+
+        catalogue_categories = self._catalogue_categories_collection.find(
+            query, session=session, **utils.create_projection(["id", "modified_time"])
+        )
+        return compute_list_version(
+            (catalogue_category["_id"], catalogue_category["modified_time"])
+            for catalogue_category in catalogue_categories
+        )
+
     def update(
         self,
         catalogue_category_id: str,
@@ -158,38 +287,53 @@ class CatalogueCategoryRepo:
         catalogue_category_id = CustomObjectId(catalogue_category_id)
 
         parent_id = str(catalogue_category.parent_id) if catalogue_category.parent_id else None
-        if parent_id and not self.get(parent_id, session=session):
+        parent_catalogue_category = self.get(parent_id, session=session) if parent_id else None
+        if parent_id and not parent_catalogue_category:
             raise MissingRecordError(f"No parent catalogue category found with ID '{parent_id}'")
 
         stored_catalogue_category = self.get(str(catalogue_category_id), session=session)
         moving_catalogue_category = parent_id != stored_catalogue_category.parent_id
+        renaming_catalogue_category = catalogue_category.name != stored_catalogue_category.name
+
+        # The ancestors are only ever modified when moving (below)
+        update_data = catalogue_category.model_dump(by_alias=True, exclude={"ancestor_ids"})
 
-        # Prevent a catalogue category from being moved to one of its own children
         if moving_catalogue_category:
-            if parent_id is not None and not utils.is_valid_move_result(
-                list(
-                    self._catalogue_categories_collection.aggregate(
-                        utils.create_move_check_aggregation_pipeline(
-                            entity_id=str(catalogue_category_id),
-                            destination_id=parent_id,
-                            collection_name="catalogue_categories",
-                        ),
-                        session=session,
-                    )
-                )
+            # Prevent a catalogue category from being moved to one of its own children
+            if parent_catalogue_category and not utils.is_valid_move(
+                str(catalogue_category_id), parent_id, parent_catalogue_category.ancestor_ids
             ):
                 raise InvalidActionError("Cannot move a catalogue category to one of its own children")
 
+            update_data["ancestor_ids"] = (
+                utils.compute_ancestor_ids(parent_id, parent_catalogue_category.ancestor_ids)
+                if parent_catalogue_category
+                else []
+            )
+
         logger.info("Updating catalogue category with ID '%s' in the database", catalogue_category_id)
         try:
             self._catalogue_categories_collection.update_one(
-                {"_id": catalogue_category_id}, {"$set": catalogue_category.model_dump(by_alias=True)}, session=session
+                {"_id": catalogue_category_id}, {"$set": update_data}, session=session
             )
         except DuplicateKeyError as exc:
             raise DuplicateRecordError(
                 "Duplicate catalogue category found within the parent catalogue category"
             ) from exc
 
+        # Ensure the ancestors of all of the descendants are also updated
+        if moving_catalogue_category:
+            self._catalogue_categories_collection.update_many(
+                {"ancestor_ids": catalogue_category_id},
+                utils.create_move_descendants_update(catalogue_category_id, update_data["ancestor_ids"]),
+                session=session,
+            )
+
+        # The breadcrumbs of the catalogue category and all of its descendants include its name and are affected by
+        # moving it
+        if moving_catalogue_category or renaming_catalogue_category:
+            self._invalidate_breadcrumbs(catalogue_category_id, session=session)
+
         return self.get(str(catalogue_category_id), session=session)
 
     def delete(self, catalogue_category_id: str, session: Optional[ClientSession] = None) -> None:
@@ -210,11 +354,32 @@ class CatalogueCategoryRepo:
             )
 
         logger.info("Deleting catalogue category with ID '%s' from the database", catalogue_category_id)
-        result = self._catalogue_categories_collection.delete_one(
-            {"_id": CustomObjectId(catalogue_category_id)}, session=session
-        )
+        catalogue_category_id = CustomObjectId(catalogue_category_id)
+        result = self._catalogue_categories_collection.delete_one({"_id": catalogue_category_id}, session=session)
         if result.deleted_count == 0:
             raise MissingRecordError(f"No catalogue category found with ID '{catalogue_category_id}'")
+        run_after_commit(session, partial(catalogue_category_breadcrumbs_cache.invalidate, [catalogue_category_id]))
+
+    def _invalidate_breadcrumbs(
+        self, catalogue_category_id: CustomObjectId, session: Optional[ClientSession] = None
+    ) -> None:
+        """
+        Discard the cached breadcrumbs of a catalogue category and all of its descendants once any transaction the
+        session is part of has been committed
+
+        :param catalogue_category_id: ID of the catalogue category to discard the breadcrumbs of
+        :param session: PyMongo ClientSession to use for database operations
+        """
+        descendants = self._catalogue_categories_collection.find(
+            {"ancestor_ids": catalogue_category_id}, {"_id": 1}, session=session
+        )
+        run_after_commit(
+            session,
+            partial(
+                catalogue_category_breadcrumbs_cache.invalidate,
+                [catalogue_category_id, *(descendant["_id"] for descendant in descendants)],
+            ),
+        )
 
     def has_child_elements(self, catalogue_category_id: str, session: Optional[ClientSession] = None) -> bool:
         """
@@ -4,25 +4,45 @@ Module for providing a repository for managing catalogue items in a MongoDB data
 
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from bson import ObjectId
+from pymongo import ASCENDING, IndexModel, UpdateOne
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 
+from inventory_management_system_api.core.conditional_requests import compute_list_version
+from inventory_management_system_api.core.consts import STREAM_BATCH_SIZE
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.database import DatabaseDep
 from inventory_management_system_api.core.exceptions import MissingRecordError
+from inventory_management_system_api.core.filtering import Filter, Sort
+from inventory_management_system_api.core.sparse_fieldsets import get_model_for_fields
 from inventory_management_system_api.models.catalogue_item import CatalogueItemIn, CatalogueItemOut, PropertyIn
+from inventory_management_system_api.repositories import utils
 
 logger = logging.getLogger()
 
 
-class CatalogueItemRepo:
+class CatalogueItemRepo:  # pylint:disable=too-many-public-methods
     """
     Repository for managing catalogue items in a MongoDB database.
     """
 
+    INDEXES = {
+        "catalogue_items": [
+            IndexModel([("catalogue_category_id", ASCENDING)], name="catalogue_items_catalogue_category_id_index"),
+            # Also supports sorting by name when listing catalogue items, with the ID breaking any ties
+            IndexModel([("name", ASCENDING), ("_id", ASCENDING)], name="catalogue_items_name_index"),
+            IndexModel([("manufacturer_id", ASCENDING)], name="catalogue_items_manufacturer_id_index"),
+            IndexModel(
+                [("obsolete_replacement_catalogue_item_id", ASCENDING)],
+                name="catalogue_items_obsolete_replacement_catalogue_item_id_index",
+            ),
+            IndexModel([("properties._id", ASCENDING)], name="catalogue_items_properties_id_index"),
+        ]
+    }
+
     def __init__(self, database: DatabaseDep) -> None:
         """
         Initialize the `CatalogueItemRepo` with a MongoDB database instance.
@@ -46,31 +66,203 @@ class CatalogueItemRepo:
         catalogue_item = self.get(str(result.inserted_id), session=session)
         return catalogue_item
 
-    def get(self, catalogue_item_id: str, session: Optional[ClientSession] = None) -> Optional[CatalogueItemOut]:
+    def create_many(
+        self, catalogue_items: List[CatalogueItemIn], session: Optional[ClientSession] = None
+    ) -> List[CatalogueItemOut]:
+        """
+        Create multiple new catalogue items in a MongoDB database using a single ordered insert.
+
+        The created catalogue items are built from the inserted data rather than being read back from the database.
+
+        :param catalogue_items: The catalogue items to be created.
+        :param session: PyMongo ClientSession to use for database operations
+        :return: List of the created catalogue items in the same order as they were given.
+        """
+        # PyMongo refuses to insert an empty list of documents
+        if not catalogue_items:
+            return []
+
+        logger.info("Inserting %s new catalogue items into the database", len(catalogue_items))
+        documents = [catalogue_item.model_dump(by_alias=True) for catalogue_item in catalogue_items]
+        result = self._catalogue_items_collection.insert_many(documents, ordered=True, session=session)
+        return [
+            CatalogueItemOut(**{**document, "_id": inserted_id})
+            for document, inserted_id in zip(documents, result.inserted_ids)
+        ]
+
+    def get(
+        self, catalogue_item_id: str, session: Optional[ClientSession] = None, fields: Optional[List[str]] = None
+    ) -> Optional[CatalogueItemOut]:
         """
         Retrieve a catalogue item by its ID from a MongoDB database.
 
         :param catalogue_item_id: The ID of the catalogue item to retrieve.
         :param session: PyMongo ClientSession to use for database operations
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them. When given the catalogue item
+                       is returned as a partial `CatalogueItemOut` containing only these fields.
         :return: The retrieved catalogue item, or `None` if not found.
         """
         catalogue_item_id = CustomObjectId(catalogue_item_id)
         logger.info("Retrieving catalogue item with ID '%s' from the database", catalogue_item_id)
-        catalogue_item = self._catalogue_items_collection.find_one({"_id": catalogue_item_id}, session=session)
+        catalogue_item = self._catalogue_items_collection.find_one(
+            {"_id": catalogue_item_id}, session=session, **utils.create_projection(fields)
+        )
         if catalogue_item:
-            return CatalogueItemOut(**catalogue_item)
+            return get_model_for_fields(CatalogueItemOut, fields)(**catalogue_item)
         return None
 
+    def get_many(
+        self, catalogue_item_ids: List[str], session: Optional[ClientSession] = None
+    ) -> dict[str, CatalogueItemOut]:
+        """
+        Retrieve multiple catalogue items by their IDs from a MongoDB database using a single query.
+
+        :param catalogue_item_ids: The IDs of the catalogue items to retrieve.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: Dictionary of the retrieved catalogue items with their IDs as keys.
+                 Any that were not found are omitted.
+        """
+        catalogue_items = [
+            CatalogueItemOut(**catalogue_item)
+            for catalogue_item in self._catalogue_items_collection.find(
+                utils.ids_query(catalogue_item_ids, "catalogue items"), session=session
+            )
+        ]
+        return {catalogue_item.id: catalogue_item for catalogue_item in catalogue_items}
+
+    # pylint:disable=too-many-arguments
+    # pylint:disable=too-many-positional-arguments
     def list(
-        self, catalogue_category_id: Optional[str], session: Optional[ClientSession] = None
+        self,
+        catalogue_category_id: Optional[str],
+        session: Optional[ClientSession] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
     ) -> List[CatalogueItemOut]:
         """
         Retrieve all catalogue items from a MongoDB database.
 
+        When a `limit` or `cursor` is given the catalogue items are paginated using their IDs (after the field they are
+        sorted by if any).
+
         :param catalogue_category_id: The ID of the catalogue category to filter catalogue items by.
         :param session: PyMongo ClientSession to use for database operations
+        :param limit: Maximum number of catalogue items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of catalogue items, or `None` to start from the first
+                       page.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them. When given the catalogue
+                       items are returned as partial `CatalogueItemOut`'s containing only these fields.
+        :param filters: Any additional filters to apply (as returned by `parse_filters`).
+        :param sort: Order to sort the catalogue items in (as returned by `parse_sort`), or `None` to use the default
+                     order.
+        :raises InvalidCursorError: If the given cursor is malformed.
         :return: A list of catalogue items, or an empty list if no catalogue items are returned by the database.
         """
+        query, options = self._create_list_query(catalogue_category_id, limit, cursor, filters, sort)
+        catalogue_items = self._catalogue_items_collection.find(
+            query, session=session, **options, **utils.create_projection(fields)
+        )
+        catalogue_item_model = get_model_for_fields(CatalogueItemOut, fields)
+        return [catalogue_item_model(**catalogue_item) for catalogue_item in catalogue_items]
+
+    def stream(
+        self,
+        catalogue_category_id: Optional[str],
+        session: Optional[ClientSession] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> Iterator[CatalogueItemOut]:
+        """
+        Lazily retrieve all catalogue items from a MongoDB database, retrieving them from the database in batches as
+        they are iterated over.
+
+        Takes the same filters as `list`. Any errors with the filters are raised immediately rather than once iteration
+        begins.
+
+        :param catalogue_category_id: The ID of the catalogue category to filter catalogue items by.
+        :param session: PyMongo ClientSession to use for database operations
+        :param limit: Maximum number of catalogue items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of catalogue items, or `None` to start from the first
+                       page.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them. When given the catalogue
+                       items are returned as partial `CatalogueItemOut`'s containing only these fields.
+        :param filters: Any additional filters to apply (as returned by `parse_filters`).
+        :param sort: Order to sort the catalogue items in (as returned by `parse_sort`), or `None` to use the default
+                     order.
+        :raises InvalidCursorError: If the given cursor is malformed.
+        :return: Iterator of catalogue items.
+        """
+        query, options = self._create_list_query(catalogue_category_id, limit, cursor, filters, sort)
+        catalogue_items = self._catalogue_items_collection.find(
+            query, session=session, batch_size=STREAM_BATCH_SIZE, **options, **utils.create_projection(fields)
+        )
+        catalogue_item_model = get_model_for_fields(CatalogueItemOut, fields)
+        return (catalogue_item_model(**catalogue_item) for catalogue_item in catalogue_items)
+
+    def get_list_version(
+        self,
+        catalogue_category_id: Optional[str],
+        session: Optional[ClientSession] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> str:
+        """
+        Retrieve the version of the list of catalogue items that `list` would return given the same filters, retrieving
+        only the ID, `modified_time` and `number_of_spares` of each of them.
+
+        The `number_of_spares` is included as it is maintained atomically as items are created, moved and deleted
+        without updating the `modified_time`.
+
+        :param catalogue_category_id: The ID of the catalogue category to filter catalogue items by.
+        :param session: PyMongo ClientSession to use for database operations
+        :param limit: Maximum number of catalogue items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of catalogue items, or `None` to start from the first
+                       page.
+        :param filters: Any additional filters to apply (as returned by `parse_filters`).
+        :param sort: Order to sort the catalogue items in (as returned by `parse_sort`), or `None` to use the default
+                     order.
+        :raises InvalidCursorError: If the given cursor is malformed.
+        :return: Version of the list of catalogue items (as returned by `compute_list_version`), which changes whenever
+                 any of the catalogue items in it are created, modified, deleted or replaced by another.
+        """
+        query, options = self._create_list_query(catalogue_category_id, limit, cursor, filters, sort)
+        catalogue_items = self._catalogue_items_collection.find(
+            query, session=session, **options, **utils.create_projection(["id", "modified_time", "number_of_spares"])
+        )
+        return compute_list_version(
+            (catalogue_item["_id"], catalogue_item["modified_time"], catalogue_item.get("number_of_spares"))
+            for catalogue_item in catalogue_items
+        )
+
+    def _create_list_query(
+        self,
+        catalogue_category_id: Optional[str],
+        limit: Optional[int],
+        cursor: Optional[str],
+        filters: Optional[List[Filter]],
+        sort: Optional[Sort],
+    ) -> Tuple[dict, dict]:
+        """
+        Creates the query and find options used to retrieve a filtered, sorted and optionally paginated list of
+        catalogue items.
+
+        :param catalogue_category_id: The ID of the catalogue category to filter catalogue items by.
+        :param limit: Maximum number of catalogue items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of catalogue items, or `None` to start from the first
+                       page.
+        :param filters: Any additional filters to apply, or `None`.
+        :param sort: Order to sort the catalogue items in, or `None` to use the default order.
+        :raises InvalidCursorError: If the given cursor is malformed.
+        :return: Tuple containing the query and any additional keyword arguments to pass to `find`.
+        """
         query = {}
         if catalogue_category_id:
             catalogue_category_id = CustomObjectId(catalogue_category_id)
@@ -82,9 +274,14 @@ class CatalogueItemRepo:
         else:
             logger.info("%s matching the provided catalogue category ID filter", message)
             logger.debug("Provided catalogue category ID filter '%s'", catalogue_category_id)
+        if filters:
+            logger.debug("Provided filters %s", filters)
+            query = {**query, **utils.create_filter_query(filters)}
+
+        return utils.paginate_query(query, limit, cursor, sort)
 
-        catalogue_items = self._catalogue_items_collection.find(query, session=session)
-        return [CatalogueItemOut(**catalogue_item) for catalogue_item in catalogue_items]
+    # pylint:enable=too-many-arguments
+    # pylint:enable=too-many-positional-arguments
 
     def update(
         self, catalogue_item_id: str, catalogue_item: CatalogueItemIn, session: Optional[ClientSession] = None
@@ -101,7 +298,14 @@ class CatalogueItemRepo:
 
         logger.info("Updating catalogue item with ID '%s' in the database", catalogue_item_id)
         self._catalogue_items_collection.update_one(
-            {"_id": catalogue_item_id}, {"$set": catalogue_item.model_dump(by_alias=True)}, session=session
+            {"_id": catalogue_item_id},
+            # The computed counts are maintained atomically elsewhere, so avoid overwriting them with stale values
+            {
+                "$set": catalogue_item.model_dump(
+                    by_alias=True, exclude={"item_counts_by_system_type", "number_of_spares"}
+                )
+            },
+            session=session,
         )
         catalogue_item = self.get(str(catalogue_item_id), session=session)
         return catalogue_item
@@ -257,25 +461,99 @@ class CatalogueItemRepo:
             session=session,
         )
 
-    def update_number_of_spares(
+    def increment_item_counts(
         self,
         catalogue_item_id: ObjectId,
-        number_of_spares: Optional[int],
+        item_counts_changes: dict[str, int],
+        number_of_spares_change: Optional[int] = None,
         session: Optional[ClientSession] = None,
     ) -> None:
         """
-        Updates the `number_of_spares` field using a given catalogue item id filter.
+        Atomically increments the per system type item counts, and optionally the `number_of_spares` field, of a
+        catalogue item.
+
+        When used within a transaction this also write locks the catalogue item until the transaction finishes.
 
         :param catalogue_item_id: The ID of the catalogue item to update.
-        :param number_of_spares: New number of spares to update to. A value of `None` can be used to write lock the
-                                 document when updating within a transaction as the actual value will be assigned later
-                                 but the document should be write locked immediately.
+        :param item_counts_changes: Dictionary of the amounts to change the item counts by (may be negative) with the
+                                    IDs of the system types as keys.
+        :param number_of_spares_change: Amount to change the number of spares by (may be negative) or `None` if it
+                                        should not be changed.
         :param session: PyMongo ClientSession to use for database operations.
         """
 
-        self._catalogue_items_collection.update_one(
-            {"_id": catalogue_item_id},
-            {"$set": {"number_of_spares": number_of_spares}},
+        increments = {
+            f"item_counts_by_system_type.{system_type_id}": change
+            for system_type_id, change in item_counts_changes.items()
+        }
+        if number_of_spares_change is not None:
+            increments["number_of_spares"] = number_of_spares_change
+
+        self._catalogue_items_collection.update_one({"_id": catalogue_item_id}, {"$inc": increments}, session=session)
+
+    def update_all_number_of_spares_from_item_counts(
+        self, system_type_ids: List[ObjectId], session: Optional[ClientSession] = None
+    ) -> None:
+        """
+        Updates the `number_of_spares` field of all catalogue items to the sum of their item counts for the given system
+        types using a single pipeline update.
+
+        :param system_type_ids: IDs of the system types that define a spare.
+        :param session: PyMongo ClientSession to use for database operations.
+        """
+
+        logger.info("Updating the number of spares of all catalogue items from their item counts")
+        self._catalogue_items_collection.update_many(
+            {},
+            [
+                {
+                    "$set": {
+                        "number_of_spares": {
+                            "$add": [
+                                {"$ifNull": [f"$item_counts_by_system_type.{system_type_id}", 0]}
+                                for system_type_id in system_type_ids
+                            ]
+                        }
+                    }
+                }
+            ],
+            session=session,
+        )
+
+    def update_all_item_counts(self, item_counts: dict[str, int], session: Optional[ClientSession] = None) -> None:
+        """
+        Updates the per system type item counts of all catalogue items to the same value.
+
+        :param item_counts: New item counts to update to with the IDs of the system types as keys.
+        :param session: PyMongo ClientSession to use for database operations.
+        """
+
+        logger.info("Updating the item counts of all catalogue items")
+        self._catalogue_items_collection.update_many(
+            {}, {"$set": {"item_counts_by_system_type": item_counts}}, session=session
+        )
+
+    def update_many_item_counts(
+        self, item_counts: dict[ObjectId, dict[str, int]], session: Optional[ClientSession] = None
+    ) -> None:
+        """
+        Updates the per system type item counts of multiple catalogue items using a single `bulk_write`.
+
+        :param item_counts: Dictionary of the new item counts to update to (themselves keyed by the IDs of the system
+                            types) with the IDs of the catalogue items to update as keys.
+        :param session: PyMongo ClientSession to use for database operations.
+        """
+
+        if not item_counts:
+            return
+
+        logger.info("Updating the item counts of %s catalogue items", len(item_counts))
+        self._catalogue_items_collection.bulk_write(
+            [
+                UpdateOne({"_id": catalogue_item_id}, {"$set": {"item_counts_by_system_type": counts}})
+                for catalogue_item_id, counts in item_counts.items()
+            ],
+            ordered=False,
             session=session,
         )
 
@@ -290,3 +568,14 @@ class CatalogueItemRepo:
         logger.info("Checking if catalogue item with name '%s' already exists", name)
         catalogue_item = self._catalogue_items_collection.find_one({"name": name}, session=session)
         return catalogue_item is not None
+
+    def get_duplicate_names(self, names: List[str], session: Optional[ClientSession] = None) -> set[str]:
+        """
+        Obtain which of the given names are already used by existing catalogue items using a single query.
+
+        :param names: Names of the catalogue items to check for duplicates.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: Set of the given names that are already used by at least one catalogue item.
+        """
+        logger.info("Checking which of %s catalogue item names already exist", len(names))
+        return set(self._catalogue_items_collection.distinct("name", {"name": {"$in": names}}, session=session))
@@ -0,0 +1,200 @@
+"""
+Module for providing a registry of the indexes declared by each of the repositories, along with functions for comparing
+them against and synchronising them with those in a MongoDB database.
+"""
+
+import logging
+from typing import Tuple
+
+from pymongo import IndexModel
+from pymongo.database import Database
+
+from inventory_management_system_api.core.filtering import FilterField
+from inventory_management_system_api.repositories.catalogue_category import CatalogueCategoryRepo
+from inventory_management_system_api.repositories.catalogue_item import CatalogueItemRepo
+from inventory_management_system_api.repositories.item import ItemRepo
+from inventory_management_system_api.repositories.manufacturer import ManufacturerRepo
+from inventory_management_system_api.repositories.rule import RuleRepo
+from inventory_management_system_api.repositories.system import SystemRepo
+from inventory_management_system_api.repositories.unit import UnitRepo
+from inventory_management_system_api.repositories.usage_status import UsageStatusRepo
+from inventory_management_system_api.schemas.catalogue_item import CATALOGUE_ITEM_FILTER_FIELDS
+from inventory_management_system_api.schemas.item import ITEM_FILTER_FIELDS
+
+logger = logging.getLogger()
+
+# Repositories whose declared `INDEXES` should exist in the database
+INDEXED_REPOSITORIES = [
+    CatalogueCategoryRepo,
+    CatalogueItemRepo,
+    ItemRepo,
+    ManufacturerRepo,
+    RuleRepo,
+    SystemRepo,
+    UnitRepo,
+    UsageStatusRepo,
+]
+
+# Fields that the documents in each collection can be filtered and sorted by when listed, which must be covered by the
+# declared indexes
+FILTER_FIELDS = {"catalogue_items": CATALOGUE_ITEM_FILTER_FIELDS, "items": ITEM_FILTER_FIELDS}
+
+# Name of the index MongoDB creates automatically on `_id` which should never be dropped
+ID_INDEX_NAME = "_id_"
+
+# Index options that are either added automatically by MongoDB or are ignored by it, and so should not be compared
+IGNORED_INDEX_OPTIONS = {"key", "name", "v", "ns", "background"}
+
+
+def get_declared_indexes() -> dict[str, list[IndexModel]]:
+    """
+    Obtains the indexes declared by all of the repositories.
+
+    :return: Dictionary of the declared indexes for each collection name.
+    """
+    declared_indexes: dict[str, list[IndexModel]] = {}
+    for repository in INDEXED_REPOSITORIES:
+        for collection_name, indexes in repository.INDEXES.items():
+            declared_indexes.setdefault(collection_name, []).extend(indexes)
+    return declared_indexes
+
+
+def find_unindexed_filter_fields(
+    declared_indexes: dict[str, list[IndexModel]], filter_fields: dict[str, dict[str, FilterField]]
+) -> dict[str, list[str]]:
+    """
+    Finds any fields that documents are allowed to be filtered or sorted by that aren't covered by the declared indexes.
+
+    Filtering by a field requires an index whose first key is the field. Sorting by a field additionally requires the
+    second key to be `_id`, as it is used to break ties.
+
+    :param declared_indexes: Dictionary of the declared indexes for each collection name.
+    :param filter_fields: Dictionary of the definitions of the fields that can be filtered and sorted by for each
+                          collection name.
+    :return: Dictionary of the names of the fields that aren't covered for each collection name. Collections where all
+             fields are covered are omitted.
+    """
+    unindexed_filter_fields: dict[str, list[str]] = {}
+    for collection_name, fields in filter_fields.items():
+        index_keys = [list(index.document["key"]) for index in declared_indexes.get(collection_name, [])]
+        unindexed_fields = [
+            field_name
+            for field_name, filter_field in fields.items()
+            if not any(
+                keys[0] == field_name and (not filter_field.sortable or keys[1:2] == ["_id"]) for keys in index_keys
+            )
+        ]
+        if unindexed_fields:
+            unindexed_filter_fields[collection_name] = unindexed_fields
+    return unindexed_filter_fields
+
+
+def _is_same_index(declared_index: IndexModel, live_index: dict) -> bool:
+    """
+    Determines whether a declared index matches an index that exists in the database.
+
+    :param declared_index: The declared index.
+    :param live_index: Information about the index in the database as returned by `Collection.index_information`.
+    :return: Whether the indexes have the same keys and options.
+    """
+    declared_document = declared_index.document
+    if list(declared_document["key"].items()) != [tuple(key) for key in live_index["key"]]:
+        return False
+
+    declared_options = {key: value for key, value in declared_document.items() if key not in IGNORED_INDEX_OPTIONS}
+    live_options = {key: value for key, value in live_index.items() if key not in IGNORED_INDEX_OPTIONS}
+    return declared_options == live_options
+
+
+def diff_indexes(
+    database: Database, declared_indexes: dict[str, list[IndexModel]]
+) -> Tuple[dict[str, list[IndexModel]], dict[str, list[str]]]:
+    """
+    Compares the declared indexes against those that exist in the database.
+
+    Only collections that have declared indexes are compared. Any index that exists under the same name as a declared
+    one but with different keys or options is both dropped and created so that it is rebuilt as declared.
+
+    :param database: Database to compare against.
+    :param declared_indexes: Dictionary of the declared indexes for each collection name.
+    :return: Tuple containing a dictionary of the indexes to create and a dictionary of the names of the indexes to
+             drop for each collection name. Collections without any differences are omitted.
+    """
+    indexes_to_create: dict[str, list[IndexModel]] = {}
+    indexes_to_drop: dict[str, list[str]] = {}
+
+    for collection_name, indexes in declared_indexes.items():
+        live_indexes = database[collection_name].index_information()
+        declared_index_names = {index.document["name"] for index in indexes}
+
+        to_create = [
+            index
+            for index in indexes
+            if index.document["name"] not in live_indexes
+            or not _is_same_index(index, live_indexes[index.document["name"]])
+        ]
+        to_drop = [
+            index_name
+            for index_name in live_indexes
+            if index_name != ID_INDEX_NAME
+            and (
+                index_name not in declared_index_names
+                or any(index.document["name"] == index_name for index in to_create)
+            )
+        ]
+
+        if to_create:
+            indexes_to_create[collection_name] = to_create
+        if to_drop:
+            indexes_to_drop[collection_name] = to_drop
+
+    return indexes_to_create, indexes_to_drop
+
+
+def find_unique_indexes_to_drop(database: Database, indexes_to_drop: dict[str, list[str]]) -> dict[str, list[str]]:
+    """
+    Finds the unique indexes among those that are to be dropped.
+
+    Between a unique index being dropped and any replacement for it being built, duplicate values can be written to the
+    collection which would then cause the build to fail.
+
+    :param database: Database containing the indexes.
+    :param indexes_to_drop: Dictionary of the names of the indexes to drop for each collection name.
+    :return: Dictionary of the names of the unique indexes to drop for each collection name. Collections without any
+             are omitted.
+    """
+    unique_indexes_to_drop: dict[str, list[str]] = {}
+    for collection_name, index_names in indexes_to_drop.items():
+        live_indexes = database[collection_name].index_information()
+        unique_index_names = [
+            index_name for index_name in index_names if live_indexes.get(index_name, {}).get("unique", False)
+        ]
+        if unique_index_names:
+            unique_indexes_to_drop[collection_name] = unique_index_names
+    return unique_indexes_to_drop
+
+
+def sync_indexes(
+    database: Database, indexes_to_create: dict[str, list[IndexModel]], indexes_to_drop: dict[str, list[str]]
+) -> None:
+    """
+    Applies the differences found by `diff_indexes` to the database.
+
+    Indexes are dropped before any are created so that changed indexes can be recreated under the same name (MongoDB
+    has no way of renaming an index, and refuses to build one with the same keys and options as an existing one under a
+    different name). Any uniqueness constraint is therefore not enforced while a changed unique index is rebuilt, see
+    `find_unique_indexes_to_drop`. MongoDB builds indexes without holding an exclusive lock on the collection for the
+    duration of the build, so this may be performed while the API is in use.
+
+    :param database: Database to apply the differences to.
+    :param indexes_to_create: Dictionary of the indexes to create for each collection name.
+    :param indexes_to_drop: Dictionary of the names of the indexes to drop for each collection name.
+    """
+    for collection_name, index_names in indexes_to_drop.items():
+        for index_name in index_names:
+            logger.info("Dropping index '%s' from the '%s' collection", index_name, collection_name)
+            database[collection_name].drop_index(index_name)
+
+    for collection_name, indexes in indexes_to_create.items():
+        logger.info("Creating %s index(es) in the '%s' collection", len(indexes), collection_name)
+        database[collection_name].create_indexes(indexes)
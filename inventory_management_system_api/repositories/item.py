@@ -4,17 +4,23 @@ Module for providing a repository for managing items in a MongoDB database.
 
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from bson import ObjectId
+from pymongo import ASCENDING, IndexModel
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 
+from inventory_management_system_api.core.conditional_requests import compute_list_version
+from inventory_management_system_api.core.consts import STREAM_BATCH_SIZE
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.database import DatabaseDep
 from inventory_management_system_api.core.exceptions import MissingRecordError
+from inventory_management_system_api.core.filtering import Filter, Sort
+from inventory_management_system_api.core.sparse_fieldsets import get_model_for_fields
 from inventory_management_system_api.models.catalogue_item import PropertyIn
 from inventory_management_system_api.models.item import ItemIn, ItemOut
+from inventory_management_system_api.repositories import utils
 
 logger = logging.getLogger()
 
@@ -24,6 +30,22 @@ class ItemRepo:
     Repository for managing items in a MongoDB database.
     """
 
+    INDEXES = {
+        "items": [
+            IndexModel(
+                [("catalogue_item_id", ASCENDING), ("system_type_id", ASCENDING)],
+                name="items_catalogue_item_id_system_type_id_index",
+            ),
+            IndexModel([("system_id", ASCENDING)], name="items_system_id_index"),
+            IndexModel([("properties._id", ASCENDING)], name="items_properties_id_index"),
+            # Support filtering and sorting when listing items (see `ITEM_FILTER_FIELDS`)
+            IndexModel([("usage_status_id", ASCENDING)], name="items_usage_status_id_index"),
+            IndexModel([("is_defective", ASCENDING)], name="items_is_defective_index"),
+            IndexModel([("delivered_date", ASCENDING), ("_id", ASCENDING)], name="items_delivered_date_index"),
+            IndexModel([("warranty_end_date", ASCENDING), ("_id", ASCENDING)], name="items_warranty_end_date_index"),
+        ]
+    }
+
     def __init__(self, database: DatabaseDep) -> None:
         """
         Initialize the `ItemRepo` with a MongoDB database instance.
@@ -48,32 +70,184 @@ class ItemRepo:
         item = self.get(str(result.inserted_id), session=session)
         return item
 
-    def get(self, item_id: str, session: Optional[ClientSession] = None) -> Optional[ItemOut]:
+    def create_many(self, items: List[ItemIn], session: Optional[ClientSession] = None) -> List[ItemOut]:
+        """
+        Create multiple new items in a MongoDB database using a single ordered insert.
+
+        The created items are built from the inserted data rather than being read back from the database.
+
+        :param items: The items to be created.
+        :param session: PyMongo ClientSession to use for database operations
+        :return: List of the created items in the same order as they were given.
+        """
+        # PyMongo refuses to insert an empty list of documents
+        if not items:
+            return []
+
+        logger.info("Inserting %s new items into the database", len(items))
+        documents = [item.model_dump(by_alias=True) for item in items]
+        result = self._items_collection.insert_many(documents, ordered=True, session=session)
+        return [
+            ItemOut(**{**document, "_id": inserted_id}) for document, inserted_id in zip(documents, result.inserted_ids)
+        ]
+
+    def get(
+        self, item_id: str, session: Optional[ClientSession] = None, fields: Optional[List[str]] = None
+    ) -> Optional[ItemOut]:
         """
         Retrieve an item by its ID from a MongoDB database.
 
         :param item_id: The ID of the item to retrieve
         :param session: PyMongo ClientSession to use for database operations
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them. When given the item is
+                       returned as a partial `ItemOut` containing only these fields.
         :return: The retrieved item, or `None` if not found.
         """
         item_id = CustomObjectId(item_id)
         logger.info("Retrieving item with ID '%s' from the database", item_id)
-        item = self._items_collection.find_one({"_id": item_id}, session=session)
+        item = self._items_collection.find_one({"_id": item_id}, session=session, **utils.create_projection(fields))
         if item:
-            return ItemOut(**item)
+            return get_model_for_fields(ItemOut, fields)(**item)
         return None
 
+    def get_many(self, item_ids: List[str], session: Optional[ClientSession] = None) -> dict[str, ItemOut]:
+        """
+        Retrieve multiple items by their IDs from a MongoDB database using a single query.
+
+        :param item_ids: The IDs of the items to retrieve.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: Dictionary of the retrieved items with their IDs as keys. Any that were not found are omitted.
+        """
+        items = [
+            ItemOut(**item) for item in self._items_collection.find(utils.ids_query(item_ids, "items"), session=session)
+        ]
+        return {item.id: item for item in items}
+
+    # pylint:disable=too-many-arguments
+    # pylint:disable=too-many-positional-arguments
     def list(
-        self, system_id: Optional[str], catalogue_item_id: Optional[str], session: Optional[ClientSession] = None
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        session: Optional[ClientSession] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
     ) -> List[ItemOut]:
         """
         Get all items from the MongoDB database
 
+        When a `limit` or `cursor` is given the items are paginated using their IDs (after the field they are sorted by
+        if any).
+
         :param system_id: The ID of the system to filter items by.
         :param catalogue_item_id: The ID of the catalogue item to filter by.
         :param session: PyMongo ClientSession to use for database operations
+        :param limit: Maximum number of items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of items, or `None` to start from the first page.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them. When given the items are
+                       returned as partial `ItemOut`'s containing only these fields.
+        :param filters: Any additional filters to apply (as returned by `parse_filters`).
+        :param sort: Order to sort the items in (as returned by `parse_sort`), or `None` to use the default order.
+        :raises InvalidCursorError: If the given cursor is malformed.
         :return List of items, or empty list if there are no items
         """
+        query, options = self._create_list_query(system_id, catalogue_item_id, limit, cursor, filters, sort)
+        items = self._items_collection.find(query, session=session, **options, **utils.create_projection(fields))
+        item_model = get_model_for_fields(ItemOut, fields)
+        return [item_model(**item) for item in items]
+
+    def stream(
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        session: Optional[ClientSession] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> Iterator[ItemOut]:
+        """
+        Lazily get all items from the MongoDB database, retrieving them from the database in batches as they are
+        iterated over.
+
+        Takes the same filters as `list`. Any errors with the filters are raised immediately rather than once iteration
+        begins.
+
+        :param system_id: The ID of the system to filter items by.
+        :param catalogue_item_id: The ID of the catalogue item to filter by.
+        :param session: PyMongo ClientSession to use for database operations
+        :param limit: Maximum number of items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of items, or `None` to start from the first page.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them. When given the items are
+                       returned as partial `ItemOut`'s containing only these fields.
+        :param filters: Any additional filters to apply (as returned by `parse_filters`).
+        :param sort: Order to sort the items in (as returned by `parse_sort`), or `None` to use the default order.
+        :raises InvalidCursorError: If the given cursor is malformed.
+        :return: Iterator of items.
+        """
+        query, options = self._create_list_query(system_id, catalogue_item_id, limit, cursor, filters, sort)
+        items = self._items_collection.find(
+            query, session=session, batch_size=STREAM_BATCH_SIZE, **options, **utils.create_projection(fields)
+        )
+        item_model = get_model_for_fields(ItemOut, fields)
+        return (item_model(**item) for item in items)
+
+    def get_list_version(
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        session: Optional[ClientSession] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> str:
+        """
+        Get the version of the list of items that `list` would return given the same filters, retrieving only the ID and
+        `modified_time` of each of them.
+
+        :param system_id: The ID of the system to filter items by.
+        :param catalogue_item_id: The ID of the catalogue item to filter by.
+        :param session: PyMongo ClientSession to use for database operations
+        :param limit: Maximum number of items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of items, or `None` to start from the first page.
+        :param filters: Any additional filters to apply (as returned by `parse_filters`).
+        :param sort: Order to sort the items in (as returned by `parse_sort`), or `None` to use the default order.
+        :raises InvalidCursorError: If the given cursor is malformed.
+        :return: Version of the list of items (as returned by `compute_list_version`), which changes whenever any of
+                 the items in it are created, modified, deleted or replaced by another.
+        """
+        query, options = self._create_list_query(system_id, catalogue_item_id, limit, cursor, filters, sort)
+        items = self._items_collection.find(
+            query, session=session, **options, **utils.create_projection(["id", "modified_time"])
+        )
+        return compute_list_version((item["_id"], item["modified_time"]) for item in items)
+
+    def _create_list_query(
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        limit: Optional[int],
+        cursor: Optional[str],
+        filters: Optional[List[Filter]],
+        sort: Optional[Sort],
+    ) -> Tuple[dict, dict]:
+        """
+        Creates the query and find options used to get a filtered, sorted and optionally paginated list of items.
+
+        :param system_id: The ID of the system to filter items by.
+        :param catalogue_item_id: The ID of the catalogue item to filter by.
+        :param limit: Maximum number of items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of items, or `None` to start from the first page.
+        :param filters: Any additional filters to apply, or `None`.
+        :param sort: Order to sort the items in, or `None` to use the default order.
+        :raises InvalidCursorError: If the given cursor is malformed.
+        :return: Tuple containing the query and any additional keyword arguments to pass to `find`.
+        """
         query = {}
         if system_id:
             query["system_id"] = CustomObjectId(system_id)
@@ -91,22 +265,40 @@ class ItemRepo:
                 logger.debug("Provided system ID filter '%s'", system_id)
             if catalogue_item_id:
                 logger.debug("Provided catalogue item ID filter '%s'", catalogue_item_id)
+        if filters:
+            logger.debug("Provided filters %s", filters)
+            query = {**query, **utils.create_filter_query(filters)}
 
-        items = self._items_collection.find(query, session=session)
-        return [ItemOut(**item) for item in items]
+        return utils.paginate_query(query, limit, cursor, sort)
 
-    def update(self, item_id: str, item: ItemIn, session: Optional[ClientSession] = None) -> ItemOut:
+    # pylint:enable=too-many-arguments
+    # pylint:enable=too-many-positional-arguments
+
+    def update(
+        self, item_id: str, item: ItemIn, update_system: bool = True, session: Optional[ClientSession] = None
+    ) -> ItemOut:
         """
         Update an item by its ID in a MongoDB database.
 
         :param item_id: The ID of the item to update.
         :param item: The item containing the update data.
+        :param update_system: Whether to update the `system_id` and `system_type_id` of the item. Should be `False`
+                              unless the item is being moved within a transaction that also updates the item counts, so
+                              that the stale values are not written back over those of a concurrent move.
         :param session: PyMongo ClientSession to use for database operations
         :return: The updated item.
         """
         item_id = CustomObjectId(item_id)
         logger.info("Updating item with ID '%s' in the database", item_id)
-        self._items_collection.update_one({"_id": item_id}, {"$set": item.model_dump(by_alias=True)}, session=session)
+        self._items_collection.update_one(
+            {"_id": item_id},
+            {
+                "$set": item.model_dump(
+                    by_alias=True, exclude=None if update_system else {"system_id", "system_type_id"}
+                )
+            },
+            session=session,
+        )
         item = self.get(str(item_id), session=session)
         return item
 
@@ -200,38 +392,39 @@ class ItemRepo:
             session=session,
         )
 
-    def count_in_catalogue_item_with_system_type_one_of(
-        self,
-        catalogue_item_id: ObjectId,
-        system_type_ids: List[ObjectId],
-        session: Optional[ClientSession] = None,
-    ) -> int:
+    def count_by_catalogue_item_and_system_type(
+        self, session: Optional[ClientSession] = None
+    ) -> dict[ObjectId, dict[str, int]]:
         """
-        Counts the number of items within a catalogue item that are also in systems with one of the given system type
-        IDs.
+        Counts the number of items within each catalogue item that are in systems of each system type using a single
+        aggregation.
+
+        Only the denormalised `system_type_id` of the items is used so the aggregation can be covered by the compound
+        `catalogue_item_id` and `system_type_id` index without having to look up any systems.
 
-        :param catalogue_item_id: ID of the catalogue item for which items should be counted.
-        :param system_type_ids: List of system type IDs which should be included in the count.
         :param session: PyMongo ClientSession to use for database operations.
-        :return: Number of items counted.
+        :return: Dictionary of the number of items counted (themselves keyed by the IDs of the system types) with the
+                 catalogue item IDs as keys. Catalogue items without any items are not included.
         """
+        logger.info("Counting the items in each catalogue item by the types of the systems they are in")
         result = self._items_collection.aggregate(
             [
-                # Obtain a list of items with the same catalogue item ID
-                {"$match": {"catalogue_item_id": catalogue_item_id}},
-                # Obtain the system the item is in (will be stored as a list but will only be one)
-                {"$lookup": {"from": "systems", "localField": "system_id", "foreignField": "_id", "as": "system"}},
-                # Can unwind so the `system` list becomes just a single field instead of a list, but as we can only
-                # have one system there is no need here (The following line will just match on any of the (one) systems)
-                # {"$unwind": "$system"},
-                # Obtain a list of only those matching the given system types
-                {"$match": {"system.type_id": {"$in": system_type_ids}}},
-                # Obtain the number of matching documents
-                {"$count": "matching_items"},
+                # Sorting on the index keys allows the index to be scanned instead of the whole collection
+                {"$sort": {"catalogue_item_id": ASCENDING, "system_type_id": ASCENDING}},
+                # Obtain the number of items for each combination of catalogue item and system type
+                {
+                    "$group": {
+                        "_id": {"catalogue_item_id": "$catalogue_item_id", "system_type_id": "$system_type_id"},
+                        "count": {"$sum": 1},
+                    }
+                },
             ],
             session=session,
         )
-        result = list(result)
-        if len(result) > 0:
-            return result[0]["matching_items"]
-        return 0
+
+        item_counts: dict[ObjectId, dict[str, int]] = {}
+        for document in result:
+            item_counts.setdefault(document["_id"]["catalogue_item_id"], {})[str(document["_id"]["system_type_id"])] = (
+                document["count"]
+            )
+        return item_counts
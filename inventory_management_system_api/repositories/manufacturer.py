@@ -5,25 +5,40 @@ Module for providing a repository for managing manufacturers in a MongoDB databa
 import logging
 from typing import List, Optional
 
+from pymongo import ASCENDING, IndexModel
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 from pymongo.errors import DuplicateKeyError
 
+from inventory_management_system_api.core.cache import VersionedCache
+from inventory_management_system_api.core.change_streams import change_stream_watcher
+from inventory_management_system_api.core.consts import REFERENCE_DATA_CACHE_MAX_SIZE, REFERENCE_DATA_CACHE_TTL_SECONDS
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
-from inventory_management_system_api.core.database import DatabaseDep
+from inventory_management_system_api.core.database import DatabaseDep, run_after_commit
 from inventory_management_system_api.core.exceptions import (
     DuplicateRecordError,
     MissingRecordError,
     PartOfCatalogueItemError,
 )
 from inventory_management_system_api.models.manufacturer import ManufacturerIn, ManufacturerOut
+from inventory_management_system_api.repositories import utils
 
 logger = logging.getLogger()
 
+# Cache of manufacturer documents by ID, discarded whenever any are modified
+manufacturers_cache = VersionedCache(
+    ttl_seconds=REFERENCE_DATA_CACHE_TTL_SECONDS, max_size=REFERENCE_DATA_CACHE_MAX_SIZE
+)
+change_stream_watcher.register(["manufacturers"], manufacturers_cache.invalidate)
+
 
 class ManufacturerRepo:
     """Repository for managing manufacturers in a MongoDb database."""
 
+    INDEXES = {
+        "manufacturers": [IndexModel([("code", ASCENDING)], name="manufacturers_name_uniqueness_index", unique=True)]
+    }
+
     def __init__(self, database: DatabaseDep) -> None:
         """
         Initialise the `ManufacturerRepo` with a MongoDB database instance.
@@ -48,6 +63,7 @@ class ManufacturerRepo:
             result = self._manufacturers_collection.insert_one(manufacturer.model_dump(), session=session)
         except DuplicateKeyError as exc:
             raise DuplicateRecordError("Duplicate manufacturer found") from exc
+        run_after_commit(session, manufacturers_cache.invalidate)
 
         return self.get(str(result.inserted_id), session=session)
 
@@ -61,11 +77,34 @@ class ManufacturerRepo:
         """
         manufacturer_id = CustomObjectId(manufacturer_id)
         logger.info("Retrieving manufacturer with ID '%s' from database", manufacturer_id)
-        manufacturer = self._manufacturers_collection.find_one({"_id": manufacturer_id}, session=session)
+        if session is None:
+            manufacturer = manufacturers_cache.get_or_load(
+                manufacturer_id, lambda: self._manufacturers_collection.find_one({"_id": manufacturer_id}, session=None)
+            )
+        else:
+            manufacturer = self._manufacturers_collection.find_one({"_id": manufacturer_id}, session=session)
         if manufacturer:
             return ManufacturerOut(**manufacturer)
         return None
 
+    def get_many(
+        self, manufacturer_ids: List[str], session: Optional[ClientSession] = None
+    ) -> dict[str, ManufacturerOut]:
+        """
+        Retrieve multiple manufacturers by their IDs from a MongoDB database using a single query.
+
+        :param manufacturer_ids: The IDs of the manufacturers to retrieve.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: Dictionary of the retrieved manufacturers with their IDs as keys. Any that were not found are omitted.
+        """
+        manufacturers = [
+            ManufacturerOut(**manufacturer)
+            for manufacturer in utils.find_many_by_ids(
+                self._manufacturers_collection, manufacturer_ids, "manufacturers", manufacturers_cache, session=session
+            )
+        ]
+        return {manufacturer.id: manufacturer for manufacturer in manufacturers}
+
     def list(self, session: Optional[ClientSession] = None) -> List[ManufacturerOut]:
         """
         Retrieve all manufacturers from a MongoDB database.
@@ -98,6 +137,7 @@ class ManufacturerRepo:
             )
         except DuplicateKeyError as exc:
             raise DuplicateRecordError("Duplicate manufacturer found") from exc
+        run_after_commit(session, manufacturers_cache.invalidate)
 
         return self.get(str(manufacturer_id), session=session)
 
@@ -119,6 +159,7 @@ class ManufacturerRepo:
 
         logger.info("Deleting manufacturer with ID '%s' from the database", manufacturer_id)
         result = self._manufacturers_collection.delete_one({"_id": manufacturer_id}, session=session)
+        run_after_commit(session, manufacturers_cache.invalidate)
         if result.deleted_count == 0:
             raise MissingRecordError(f"No manufacturer found with ID '{manufacturer_id}'")
 
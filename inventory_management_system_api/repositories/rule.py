@@ -4,9 +4,13 @@ Module for providing a repository for managing rules in a MongoDB database.
 
 from typing import List, Optional
 
+from pymongo import ASCENDING, IndexModel
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 
+from inventory_management_system_api.core.cache import VersionedCache
+from inventory_management_system_api.core.change_streams import change_stream_watcher
+from inventory_management_system_api.core.consts import RULES_CACHE_TTL_SECONDS
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.database import DatabaseDep
 from inventory_management_system_api.models.rule import RuleOut
@@ -46,12 +50,36 @@ RULES_GET_AGGREGATION_PIPELINE_ENTITY_INSERT_STAGES = [
     {"$unwind": {"path": "$dst_usage_status", "preserveNullAndEmptyArrays": True}},
 ]
 
+# Key of the rule table inside the rules cache
+RULE_TABLE_CACHE_KEY = "rule_table"
+
+# Rules are checked on every unauthorised create, move and delete of an item but are only ever modified via the CLI, so
+# keep a table of all of them in memory and discard it whenever they change
+rules_cache = VersionedCache(ttl_seconds=RULES_CACHE_TTL_SECONDS)
+change_stream_watcher.register(["rules"], rules_cache.invalidate)
+
+# Type of the entries in the rule table i.e. (src_system_type_id, dst_system_type_id, dst_usage_status_id)
+RuleTableEntry = tuple[Optional[str], Optional[str], Optional[str]]
+
 
 class RuleRepo:
     """
     Repository for managing rules in a MongoDB database.
     """
 
+    INDEXES = {
+        "rules": [
+            IndexModel(
+                [
+                    ("src_system_type_id", ASCENDING),
+                    ("dst_system_type_id", ASCENDING),
+                    ("dst_usage_status_id", ASCENDING),
+                ],
+                name="rules_system_types_and_usage_status_index",
+            )
+        ]
+    }
+
     def __init__(self, database: DatabaseDep) -> None:
         """
         Initialise the `RulesRepo` with a MongoDB database instance.
@@ -102,12 +130,20 @@ class RuleRepo:
         Checks whether a rule with the given system type and usage status IDs exists, for checking if an operation is
         valid or not.
 
+        Checks without a session are performed against an in-memory table of all rules that is only reloaded once the
+        rules are modified. Those with a session always query the database so that they are consistent with any
+        transaction in progress.
+
         :param src_system_type_id: ID of the source system type to query by.
         :param dst_system_type_id: ID of the destination system type to query by.
         :param dst_usage_status_id: ID of the destination usage status to query by.
         :param session: PyMongo ClientSession to use for database operations.
         :return: Whether at least one rule with the given parameters was found or not.
         """
+        if session is None:
+            rule_table = rules_cache.get_or_load(RULE_TABLE_CACHE_KEY, self._load_rule_table)
+            return (src_system_type_id or None, dst_system_type_id or None, dst_usage_status_id or None) in rule_table
+
         rule = self._rules_collection.find_one(
             {
                 "src_system_type_id": CustomObjectId(src_system_type_id) if src_system_type_id else None,
@@ -117,3 +153,21 @@ class RuleRepo:
             session=session,
         )
         return rule is not None
+
+    def _load_rule_table(self) -> frozenset[RuleTableEntry]:
+        """
+        Loads all rules from a MongoDB database into a table that can be used to check whether a rule exists.
+
+        :return: Set of tuples containing the `src_system_type_id`, `dst_system_type_id` and `dst_usage_status_id` of
+                 each rule (as strings or `None`).
+        """
+        rules = self._rules_collection.find(
+            {}, {"src_system_type_id": True, "dst_system_type_id": True, "dst_usage_status_id": True}
+        )
+        return frozenset(
+            tuple(
+                str(rule[field]) if rule.get(field) is not None else None
+                for field in ("src_system_type_id", "dst_system_type_id", "dst_usage_status_id")
+            )
+            for rule in rules
+        )
@@ -8,7 +8,10 @@ from typing import Optional, Type, TypeVar
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 
-from inventory_management_system_api.core.database import DatabaseDep
+from inventory_management_system_api.core.cache import VersionedCache
+from inventory_management_system_api.core.change_streams import change_stream_watcher
+from inventory_management_system_api.core.consts import SETTINGS_CACHE_TTL_SECONDS
+from inventory_management_system_api.core.database import DatabaseDep, run_after_commit
 from inventory_management_system_api.models.setting import (
     InUseDefinitionOut,
     SettingInBase,
@@ -41,6 +44,11 @@ def construct_definition_with_system_types_aggregation_pipeline(setting_id: str)
     ]
 
 
+# Settings are read on almost every write request but very rarely modified, so cache the documents (including any looked
+# up system types) and discard them whenever either collection changes
+settings_cache = VersionedCache(ttl_seconds=SETTINGS_CACHE_TTL_SECONDS)
+change_stream_watcher.register(["settings", "system_types"], settings_cache.invalidate)
+
 # Template type for models inheriting from SettingIn/OutBase so this repo can be used generically for multiple settings
 SettingInBaseT = TypeVar("SettingInBaseT", bound=SettingInBase)
 SettingOutBaseT = TypeVar("SettingOutBaseT", bound=SettingOutBase)
@@ -66,6 +74,9 @@ class SettingRepo:
         """
         Update or insert a setting in a MongoDB database depending on whether it already exists.
 
+        The cached settings are only invalidated once any transaction the session is part of has been committed, as
+        until then other requests would just load the previous setting back into the cache.
+
         :param setting: Setting containing the fields to be updated. Also contains the ID for lookup.
         :param out_model_type: Output type of the setting's model.
         :param session: PyMongo ClientSession to use for database operations.
@@ -76,6 +87,7 @@ class SettingRepo:
         self._settings_collection.update_one(
             {"_id": setting.SETTING_ID}, {"$set": setting.model_dump()}, upsert=True, session=session
         )
+        run_after_commit(session, settings_cache.invalidate)
         return self.get(out_model_type, session=session)
 
     def get(
@@ -84,11 +96,37 @@ class SettingRepo:
         """
         Retrieve a setting from a MongoDB database.
 
+        Settings retrieved without a session are cached in-process until either the settings or system types are
+        modified. Those retrieved with a session always query the database so that they are consistent with any
+        transaction in progress.
+
         :param out_model_type: Output type of the setting's model. Also contains the ID for the lookup.
         :param session: PyMongo ClientSession to use for database operations.
         :return: Retrieved setting or `None` if not found.
         """
 
+        if session is None:
+            setting = settings_cache.get_or_load(
+                out_model_type.SETTING_ID, lambda: self._find_setting(out_model_type, session=None)
+            )
+        else:
+            setting = self._find_setting(out_model_type, session=session)
+
+        if setting:
+            return out_model_type(**setting)
+        return None
+
+    def _find_setting(
+        self, out_model_type: Type[SettingOutBaseT], session: Optional[ClientSession] = None
+    ) -> Optional[dict]:
+        """
+        Retrieve the document of a setting from a MongoDB database.
+
+        :param out_model_type: Output type of the setting's model. Also contains the ID for the lookup.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: Retrieved setting document or `None` if not found.
+        """
+
         setting = None
         logger.info("Retrieving setting with ID '%s' from the database", out_model_type.SETTING_ID)
 
@@ -105,6 +143,4 @@ class SettingRepo:
         else:
             setting = self._settings_collection.find_one({"_id": out_model_type.SETTING_ID}, session=session)
 
-        if setting:
-            return out_model_type(**setting)
-        return None
+        return setting
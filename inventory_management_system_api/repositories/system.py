@@ -3,27 +3,55 @@ Module for providing a repository for managing systems in a MongoDB database.
 """
 
 import logging
-from typing import List, Optional
+from functools import partial
+from typing import Iterator, List, Optional
 
+from pymongo import ASCENDING, IndexModel
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 from pymongo.errors import DuplicateKeyError
 
+from inventory_management_system_api.core.cache import VersionedCache
+from inventory_management_system_api.core.change_streams import change_stream_watcher
+from inventory_management_system_api.core.conditional_requests import compute_list_version
+from inventory_management_system_api.core.consts import (
+    BREADCRUMBS_CACHE_MAX_SIZE,
+    BREADCRUMBS_CACHE_TTL_SECONDS,
+    STREAM_BATCH_SIZE,
+)
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
-from inventory_management_system_api.core.database import DatabaseDep
+from inventory_management_system_api.core.database import DatabaseDep, run_after_commit
 from inventory_management_system_api.core.exceptions import DuplicateRecordError, InvalidActionError, MissingRecordError
+from inventory_management_system_api.core.sparse_fieldsets import get_model_for_fields
 from inventory_management_system_api.models.system import SystemIn, SystemOut
 from inventory_management_system_api.repositories import utils
 from inventory_management_system_api.schemas.breadcrumbs import BreadcrumbsGetSchema
 
 logger = logging.getLogger()
 
+# Cache of the breadcrumbs of systems by ID, discarded for a system and its descendants whenever it is renamed or moved
+system_breadcrumbs_cache = VersionedCache(
+    ttl_seconds=BREADCRUMBS_CACHE_TTL_SECONDS, max_size=BREADCRUMBS_CACHE_MAX_SIZE
+)
+change_stream_watcher.register_change_callback(
+    ["systems"], partial(utils.invalidate_breadcrumbs_for_change, system_breadcrumbs_cache)
+)
+
 
 class SystemRepo:
     """
     Repository for managing systems in a MongoDB database.
     """
 
+    INDEXES = {
+        "systems": [
+            IndexModel(
+                [("parent_id", ASCENDING), ("code", ASCENDING)], name="systems_name_uniqueness_index", unique=True
+            ),
+            IndexModel([("ancestor_ids", ASCENDING)], name="systems_ancestor_ids_index"),
+        ]
+    }
+
     def __init__(self, database: DatabaseDep) -> None:
         """
         Initialise the `SystemRepo` with a MongoDB database instance.
@@ -48,32 +76,57 @@ class SystemRepo:
         :raises DuplicateRecordError: If a duplicate system is found within the parent system.
         """
         parent_id = str(system.parent_id) if system.parent_id else None
-        if parent_id and not self.get(parent_id, session=session):
+        parent_system = self.get(parent_id, session=session) if parent_id else None
+        if parent_id and not parent_system:
             raise MissingRecordError(f"No parent system found with ID '{parent_id}'")
 
+        ancestor_ids = utils.compute_ancestor_ids(parent_id, parent_system.ancestor_ids) if parent_system else []
+
         logger.info("Inserting the new system into the database")
         try:
-            result = self._systems_collection.insert_one(system.model_dump(), session=session)
+            result = self._systems_collection.insert_one(
+                {**system.model_dump(), "ancestor_ids": ancestor_ids}, session=session
+            )
         except DuplicateKeyError as exc:
             raise DuplicateRecordError("Duplicate system found within the parent system") from exc
 
         return self.get(str(result.inserted_id), session=session)
 
-    def get(self, system_id: str, session: Optional[ClientSession] = None) -> Optional[SystemOut]:
+    def get(
+        self, system_id: str, session: Optional[ClientSession] = None, fields: Optional[List[str]] = None
+    ) -> Optional[SystemOut]:
         """
         Retrieve a system by its ID from a MongoDB database.
 
         :param system_id: ID of the system to retrieve.
         :param session: PyMongo ClientSession to use for database operations.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them. When given the system is
+                       returned as a partial `SystemOut` containing only these fields.
         :return: Retrieved system or `None` if not found.
         """
         system_id = CustomObjectId(system_id)
         logger.info("Retrieving system with ID '%s' from the database", system_id)
-        system = self._systems_collection.find_one({"_id": system_id}, session=session)
+        system = self._systems_collection.find_one(
+            {"_id": system_id}, session=session, **utils.create_projection(fields)
+        )
         if system:
-            return SystemOut(**system)
+            return get_model_for_fields(SystemOut, fields)(**system)
         return None
 
+    def get_many(self, system_ids: List[str], session: Optional[ClientSession] = None) -> dict[str, SystemOut]:
+        """
+        Retrieve multiple systems by their IDs from a MongoDB database using a single query.
+
+        :param system_ids: The IDs of the systems to retrieve.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: Dictionary of the retrieved systems with their IDs as keys. Any that were not found are omitted.
+        """
+        systems = [
+            SystemOut(**system)
+            for system in self._systems_collection.find(utils.ids_query(system_ids, "systems"), session=session)
+        ]
+        return {system.id: system for system in systems}
+
     def get_breadcrumbs(self, system_id: str, session: Optional[ClientSession] = None) -> BreadcrumbsGetSchema:
         """
         Retrieve the breadcrumbs for a specific system.
@@ -83,29 +136,129 @@ class SystemRepo:
         :return: Breadcrumbs.
         """
         logger.info("Querying breadcrumbs for system with id '%s'", system_id)
-        return utils.compute_breadcrumbs(
+
+        def load_breadcrumbs() -> BreadcrumbsGetSchema:
+            return utils.compute_breadcrumbs(
+                list(
+                    self._systems_collection.aggregate(
+                        utils.create_breadcrumbs_aggregation_pipeline(entity_id=system_id, collection_name="systems"),
+                        session=session,
+                    )
+                ),
+                entity_id=system_id,
+                collection_name="systems",
+            )
+
+        # Within a session the breadcrumbs may depend on uncommitted changes so they must be obtained from the database
+        if session is not None:
+            return load_breadcrumbs()
+        return system_breadcrumbs_cache.get_or_load(CustomObjectId(system_id), load_breadcrumbs)
+
+    def get_many_breadcrumbs(
+        self, system_ids: List[str], session: Optional[ClientSession] = None
+    ) -> dict[str, BreadcrumbsGetSchema]:
+        """
+        Retrieve the breadcrumbs for multiple systems using a single query.
+
+        :param system_ids: IDs of the systems to retrieve breadcrumbs for.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: Dictionary of the breadcrumbs with the IDs of the systems as keys. Any that were not found are omitted.
+        """
+        logger.info("Querying breadcrumbs for %s systems", len(system_ids))
+        return utils.compute_many_breadcrumbs(
             list(
                 self._systems_collection.aggregate(
-                    utils.create_breadcrumbs_aggregation_pipeline(entity_id=system_id, collection_name="systems"),
+                    utils.create_many_breadcrumbs_aggregation_pipeline(
+                        entity_ids=system_ids, collection_name="systems"
+                    ),
                     session=session,
                 )
             ),
-            entity_id=system_id,
             collection_name="systems",
         )
 
-    def list(self, parent_id: Optional[str], session: Optional[ClientSession] = None) -> List[SystemOut]:
+    def get_tree(
+        self, system_id: str, max_depth: Optional[int] = None, session: Optional[ClientSession] = None
+    ) -> List[SystemOut]:
+        """
+        Retrieve a system along with all of its descendants from a MongoDB database using a single query.
+
+        :param system_id: ID of the system at the top of the tree.
+        :param max_depth: Maximum depth of the descendants to retrieve relative to the system, or `None` to retrieve all
+                          of them.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: List containing the system followed by its descendants, ordered from the top of the tree down.
+        :raises MissingRecordError: If the system doesn't exist.
+        """
+        logger.info("Retrieving tree for system with ID '%s' from the database", system_id)
+        systems = [
+            SystemOut(**system)
+            for system in self._systems_collection.find(
+                utils.create_subtree_query(system_id, max_depth), session=session
+            )
+        ]
+        if not any(system.id == system_id for system in systems):
+            raise MissingRecordError(f"No system found with ID '{system_id}'")
+
+        return sorted(systems, key=lambda system: len(system.ancestor_ids))
+
+    def list(
+        self, parent_id: Optional[str], session: Optional[ClientSession] = None, fields: Optional[List[str]] = None
+    ) -> List[SystemOut]:
         """
         Retrieve systems from a MongoDB database based on the provided filters.
 
         :param parent_id: ID of the parent system to query by, or `None`.
         :param session: PyMongo ClientSession to use for database operations.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them. When given the systems are
+                       returned as partial `SystemOut`'s containing only these fields.
         :return: List of systems or an empty list if no systems are retrieved.
         """
         query = utils.list_query({"parent_id": parent_id}, "systems")
 
-        systems = self._systems_collection.find(query, session=session)
-        return [SystemOut(**system) for system in systems]
+        systems = self._systems_collection.find(query, session=session, **utils.create_projection(fields))
+        system_model = get_model_for_fields(SystemOut, fields)
+        return [system_model(**system) for system in systems]
+
+    def stream(
+        self, parent_id: Optional[str], session: Optional[ClientSession] = None, fields: Optional[List[str]] = None
+    ) -> Iterator[SystemOut]:
+        """
+        Lazily retrieve systems from a MongoDB database based on the provided filters, retrieving them from the
+        database in batches as they are iterated over.
+
+        Any errors with the filters are raised immediately rather than once iteration begins.
+
+        :param parent_id: ID of the parent system to query by, or `None`.
+        :param session: PyMongo ClientSession to use for database operations.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them. When given the systems are
+                       returned as partial `SystemOut`'s containing only these fields.
+        :return: Iterator of systems.
+        """
+        query = utils.list_query({"parent_id": parent_id}, "systems")
+
+        systems = self._systems_collection.find(
+            query, session=session, batch_size=STREAM_BATCH_SIZE, **utils.create_projection(fields)
+        )
+        system_model = get_model_for_fields(SystemOut, fields)
+        return (system_model(**system) for system in systems)
+
+    def get_list_version(self, parent_id: Optional[str], session: Optional[ClientSession] = None) -> str:
+        """
+        Retrieve the version of the list of systems that `list` would return given the same filters, retrieving only the
+        ID and `modified_time` of each of them.
+
+        :param parent_id: ID of the parent system to query by, or `None`.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: Version of the list of systems (as returned by `compute_list_version`), which changes whenever any of
+                 the systems in it are created, modified or deleted.
+        """
+        query = utils.list_query({"parent_id": parent_id}, "systems")
+
+        systems = self._systems_collection.find(
+            query, session=session, **utils.create_projection(["id", "modified_time"])
+        )
+        return compute_list_version((system["_id"], system["modified_time"]) for system in systems)
 
     def update(self, system_id: str, system: SystemIn, session: Optional[ClientSession] = None) -> SystemOut:
         """
@@ -122,32 +275,44 @@ class SystemRepo:
         system_id = CustomObjectId(system_id)
 
         parent_id = str(system.parent_id) if system.parent_id else None
-        if parent_id and not self.get(parent_id, session=session):
+        parent_system = self.get(parent_id, session=session) if parent_id else None
+        if parent_id and not parent_system:
             raise MissingRecordError(f"No parent system found with ID '{parent_id}'")
 
         stored_system = self.get(str(system_id), session=session)
         moving_system = parent_id != stored_system.parent_id
+        renaming_system = system.name != stored_system.name
+
+        # The ancestors are only ever modified when moving (below)
+        update_data = system.model_dump(exclude={"ancestor_ids"})
 
-        # Prevent a system from being moved to one of its own children
         if moving_system:
-            if parent_id is not None and not utils.is_valid_move_result(
-                list(
-                    self._systems_collection.aggregate(
-                        utils.create_move_check_aggregation_pipeline(
-                            entity_id=str(system_id), destination_id=parent_id, collection_name="systems"
-                        ),
-                        session=session,
-                    )
-                )
-            ):
+            # Prevent a system from being moved to one of its own children
+            if parent_system and not utils.is_valid_move(str(system_id), parent_id, parent_system.ancestor_ids):
                 raise InvalidActionError("Cannot move a system to one of its own children")
 
+            update_data["ancestor_ids"] = (
+                utils.compute_ancestor_ids(parent_id, parent_system.ancestor_ids) if parent_system else []
+            )
+
         logger.info("Updating system with ID '%s' in the database", system_id)
         try:
-            self._systems_collection.update_one({"_id": system_id}, {"$set": system.model_dump()}, session=session)
+            self._systems_collection.update_one({"_id": system_id}, {"$set": update_data}, session=session)
         except DuplicateKeyError as exc:
             raise DuplicateRecordError("Duplicate system found within the parent system") from exc
 
+        # Ensure the ancestors of all of the descendants are also updated
+        if moving_system:
+            self._systems_collection.update_many(
+                {"ancestor_ids": system_id},
+                utils.create_move_descendants_update(system_id, update_data["ancestor_ids"]),
+                session=session,
+            )
+
+        # The breadcrumbs of the system and all of its descendants include its name and are affected by moving it
+        if moving_system or renaming_system:
+            self._invalidate_breadcrumbs(system_id, session=session)
+
         return self.get(str(system_id), session=session)
 
     def delete(self, system_id: str, session: Optional[ClientSession] = None) -> None:
@@ -162,9 +327,30 @@ class SystemRepo:
         :raises MissingRecordError: If the system doesn't exist.
         """
         logger.info("Deleting system with ID '%s' from the database", system_id)
-        result = self._systems_collection.delete_one({"_id": CustomObjectId(system_id)}, session=session)
+        system_id = CustomObjectId(system_id)
+        result = self._systems_collection.delete_one({"_id": system_id}, session=session)
         if result.deleted_count == 0:
             raise MissingRecordError(f"No system found with ID '{system_id}'")
+        run_after_commit(session, partial(system_breadcrumbs_cache.invalidate, [system_id]))
+
+    def _invalidate_breadcrumbs(self, system_id: CustomObjectId, session: Optional[ClientSession] = None) -> None:
+        """
+        Discard the cached breadcrumbs of a system and all of its descendants once any transaction the session is part
+        of has been committed.
+
+        Until then other requests can only read the breadcrumbs from before the transaction, so would just load them
+        back into the cache.
+
+        :param system_id: ID of the system to discard the breadcrumbs of.
+        :param session: PyMongo ClientSession to use for database operations.
+        """
+        descendants = self._systems_collection.find({"ancestor_ids": system_id}, {"_id": 1}, session=session)
+        run_after_commit(
+            session,
+            partial(
+                system_breadcrumbs_cache.invalidate, [system_id, *(descendant["_id"] for descendant in descendants)]
+            ),
+        )
 
     def has_child_elements(self, system_id: str, session: Optional[ClientSession] = None) -> bool:
         """
@@ -8,12 +8,22 @@ from typing import List, Optional
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 
+from inventory_management_system_api.core.cache import VersionedCache
+from inventory_management_system_api.core.change_streams import change_stream_watcher
+from inventory_management_system_api.core.consts import REFERENCE_DATA_CACHE_MAX_SIZE, REFERENCE_DATA_CACHE_TTL_SECONDS
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.database import DatabaseDep
 from inventory_management_system_api.models.system_type import SystemTypeOut
+from inventory_management_system_api.repositories import utils
 
 logger = logging.getLogger()
 
+# Cache of system type documents by ID, discarded whenever any are modified
+system_types_cache = VersionedCache(
+    ttl_seconds=REFERENCE_DATA_CACHE_TTL_SECONDS, max_size=REFERENCE_DATA_CACHE_MAX_SIZE
+)
+change_stream_watcher.register(["system_types"], system_types_cache.invalidate)
+
 
 class SystemTypeRepo:
     """
@@ -41,12 +51,33 @@ class SystemTypeRepo:
         system_type_id = CustomObjectId(system_type_id)
 
         logger.info("Retrieving system type with ID '%s' from the database", system_type_id)
-        system_type = self._system_types_collection.find_one({"_id": system_type_id}, session=session)
+        if session is None:
+            system_type = system_types_cache.get_or_load(
+                system_type_id, lambda: self._system_types_collection.find_one({"_id": system_type_id}, session=None)
+            )
+        else:
+            system_type = self._system_types_collection.find_one({"_id": system_type_id}, session=session)
 
         if system_type:
             return SystemTypeOut(**system_type)
         return None
 
+    def get_many(self, system_type_ids: List[str], session: Optional[ClientSession] = None) -> dict[str, SystemTypeOut]:
+        """
+        Retrieve multiple system types by their IDs from a MongoDB database using a single query.
+
+        :param system_type_ids: The IDs of the system types to retrieve.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: Dictionary of the retrieved system types with their IDs as keys. Any that were not found are omitted.
+        """
+        system_types = [
+            SystemTypeOut(**system_type)
+            for system_type in utils.find_many_by_ids(
+                self._system_types_collection, system_type_ids, "system types", system_types_cache, session=session
+            )
+        ]
+        return {system_type.id: system_type for system_type in system_types}
+
     def list(self, session: Optional[ClientSession] = None) -> List[SystemTypeOut]:
         """
         Retrieve system types from a MongoDB database.
@@ -5,27 +5,38 @@ Module for providing a repository for managing Units in a MongoDB database
 import logging
 from typing import List, Optional
 
+from pymongo import ASCENDING, IndexModel
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 from pymongo.errors import DuplicateKeyError
 
+from inventory_management_system_api.core.cache import VersionedCache
+from inventory_management_system_api.core.change_streams import change_stream_watcher
+from inventory_management_system_api.core.consts import REFERENCE_DATA_CACHE_MAX_SIZE, REFERENCE_DATA_CACHE_TTL_SECONDS
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
-from inventory_management_system_api.core.database import DatabaseDep
+from inventory_management_system_api.core.database import DatabaseDep, run_after_commit
 from inventory_management_system_api.core.exceptions import (
     DuplicateRecordError,
     MissingRecordError,
     PartOfCatalogueCategoryError,
 )
 from inventory_management_system_api.models.unit import UnitIn, UnitOut
+from inventory_management_system_api.repositories import utils
 
 logger = logging.getLogger()
 
+# Cache of unit documents by ID, discarded whenever any are modified
+units_cache = VersionedCache(ttl_seconds=REFERENCE_DATA_CACHE_TTL_SECONDS, max_size=REFERENCE_DATA_CACHE_MAX_SIZE)
+change_stream_watcher.register(["units"], units_cache.invalidate)
+
 
 class UnitRepo:
     """
     Repository for managing Units in a MongoDB database
     """
 
+    INDEXES = {"units": [IndexModel([("code", ASCENDING)], name="units_name_uniqueness_index", unique=True)]}
+
     def __init__(self, database: DatabaseDep) -> None:
         """
         Initialise the `UnitRepo` with a MongoDB database instance
@@ -49,6 +60,7 @@ class UnitRepo:
             result = self._units_collection.insert_one(unit.model_dump(), session=session)
         except DuplicateKeyError as exc:
             raise DuplicateRecordError("Duplicate unit found") from exc
+        run_after_commit(session, units_cache.invalidate)
 
         return self.get(str(result.inserted_id), session=session)
 
@@ -73,11 +85,30 @@ class UnitRepo:
         """
         unit_id = CustomObjectId(unit_id)
         logger.info("Retrieving unit with ID '%s' from the database", unit_id)
-        unit = self._units_collection.find_one({"_id": unit_id}, session=session)
+        if session is None:
+            unit = units_cache.get_or_load(
+                unit_id, lambda: self._units_collection.find_one({"_id": unit_id}, session=None)
+            )
+        else:
+            unit = self._units_collection.find_one({"_id": unit_id}, session=session)
         if unit:
             return UnitOut(**unit)
         return None
 
+    def get_many(self, unit_ids: List[str], session: Optional[ClientSession] = None) -> dict[str, UnitOut]:
+        """
+        Retrieve multiple units by their IDs from a MongoDB database using a single query.
+
+        :param unit_ids: The IDs of the units to retrieve.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: Dictionary of the retrieved units with their IDs as keys. Any that were not found are omitted.
+        """
+        units = [
+            UnitOut(**unit)
+            for unit in utils.find_many_by_ids(self._units_collection, unit_ids, "units", units_cache, session=session)
+        ]
+        return {unit.id: unit for unit in units}
+
     def delete(self, unit_id: str, session: Optional[ClientSession] = None) -> None:
         """
         Delete a unit by its ID from a MongoDB database.
@@ -95,6 +126,7 @@ class UnitRepo:
 
         logger.info("Deleting unit with ID '%s' from the database", unit_id)
         result = self._units_collection.delete_one({"_id": unit_id}, session=session)
+        run_after_commit(session, units_cache.invalidate)
         if result.deleted_count == 0:
             raise MissingRecordError(f"No unit found with ID '{unit_id}'")
 
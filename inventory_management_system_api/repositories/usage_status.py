@@ -5,12 +5,16 @@ Module for providing a repository for managing Usage statuses in a MongoDB datab
 import logging
 from typing import List, Optional
 
+from pymongo import ASCENDING, IndexModel
 from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 from pymongo.errors import DuplicateKeyError
 
+from inventory_management_system_api.core.cache import VersionedCache
+from inventory_management_system_api.core.change_streams import change_stream_watcher
+from inventory_management_system_api.core.consts import REFERENCE_DATA_CACHE_MAX_SIZE, REFERENCE_DATA_CACHE_TTL_SECONDS
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
-from inventory_management_system_api.core.database import DatabaseDep
+from inventory_management_system_api.core.database import DatabaseDep, run_after_commit
 from inventory_management_system_api.core.exceptions import (
     DuplicateRecordError,
     MissingRecordError,
@@ -18,15 +22,26 @@ from inventory_management_system_api.core.exceptions import (
     PartOfRuleError,
 )
 from inventory_management_system_api.models.usage_status import UsageStatusIn, UsageStatusOut
+from inventory_management_system_api.repositories import utils
 
 logger = logging.getLogger()
 
+# Cache of usage status documents by ID, discarded whenever any are modified
+usage_statuses_cache = VersionedCache(
+    ttl_seconds=REFERENCE_DATA_CACHE_TTL_SECONDS, max_size=REFERENCE_DATA_CACHE_MAX_SIZE
+)
+change_stream_watcher.register(["usage_statuses"], usage_statuses_cache.invalidate)
+
 
 class UsageStatusRepo:
     """
     Repository for managing Usage statuses in a MongoDB database
     """
 
+    INDEXES = {
+        "usage_statuses": [IndexModel([("code", ASCENDING)], name="usage_statuses_name_uniqueness_index", unique=True)]
+    }
+
     def __init__(self, database: DatabaseDep) -> None:
         """
         Initialise the `UsageStatusRepo` with a MongoDB database instance
@@ -52,6 +67,7 @@ class UsageStatusRepo:
             result = self._usage_statuses_collection.insert_one(usage_status.model_dump(), session=session)
         except DuplicateKeyError as exc:
             raise DuplicateRecordError("Duplicate usage status found") from exc
+        run_after_commit(session, usage_statuses_cache.invalidate)
 
         return self.get(str(result.inserted_id), session=session)
 
@@ -76,11 +92,39 @@ class UsageStatusRepo:
         """
         usage_status_id = CustomObjectId(usage_status_id)
         logger.info("Retrieving usage status with ID '%s' from the database", usage_status_id)
-        usage_status = self._usage_statuses_collection.find_one({"_id": usage_status_id}, session=session)
+        if session is None:
+            usage_status = usage_statuses_cache.get_or_load(
+                usage_status_id,
+                lambda: self._usage_statuses_collection.find_one({"_id": usage_status_id}, session=None),
+            )
+        else:
+            usage_status = self._usage_statuses_collection.find_one({"_id": usage_status_id}, session=session)
         if usage_status:
             return UsageStatusOut(**usage_status)
         return None
 
+    def get_many(
+        self, usage_status_ids: List[str], session: Optional[ClientSession] = None
+    ) -> dict[str, UsageStatusOut]:
+        """
+        Retrieve multiple usage statuses by their IDs from a MongoDB database using a single query.
+
+        :param usage_status_ids: The IDs of the usage statuses to retrieve.
+        :param session: PyMongo ClientSession to use for database operations.
+        :return: Dictionary of the retrieved usage statuses with their IDs as keys. Any that were not found are omitted.
+        """
+        usage_statuses = [
+            UsageStatusOut(**usage_status)
+            for usage_status in utils.find_many_by_ids(
+                self._usage_statuses_collection,
+                usage_status_ids,
+                "usage statuses",
+                usage_statuses_cache,
+                session=session,
+            )
+        ]
+        return {usage_status.id: usage_status for usage_status in usage_statuses}
+
     def delete(self, usage_status_id: str, session: Optional[ClientSession] = None) -> None:
         """
         Delete a usage status by its ID from a MongoDB database.
@@ -101,6 +145,7 @@ class UsageStatusRepo:
 
         logger.info("Deleting usage status with ID '%s' from the database", usage_status_id)
         result = self._usage_statuses_collection.delete_one({"_id": usage_status_id}, session=session)
+        run_after_commit(session, usage_statuses_cache.invalidate)
         if result.deleted_count == 0:
             raise MissingRecordError(f"No usage status found with ID '{usage_status_id}'")
 
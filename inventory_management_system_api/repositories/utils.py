@@ -3,11 +3,18 @@ Utility methods used in the repositories
 """
 
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple
 
+from pymongo import ASCENDING, DESCENDING
+from pymongo.client_session import ClientSession
+from pymongo.collection import Collection
+
+from inventory_management_system_api.core.cache import VersionedCache
 from inventory_management_system_api.core.consts import BREADCRUMBS_TRAIL_MAX_LENGTH
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.exceptions import DatabaseIntegrityError, MissingRecordError
+from inventory_management_system_api.core.filtering import Filter, FilterOperator, Sort
+from inventory_management_system_api.core.pagination import decode_cursor, decode_sorted_cursor
 from inventory_management_system_api.schemas.breadcrumbs import BreadcrumbsGetSchema
 
 logger = logging.getLogger()
@@ -41,12 +48,170 @@ def list_query(id_fields: dict[str, Optional[str]], entity_type: str) -> dict:
     return query
 
 
+def ids_query(entity_ids: List[str], entity_type: str) -> dict:
+    """
+    Constructs a filter for a pymongo collection that matches any of the given IDs while also logging the action.
+
+    :param entity_ids: List of the IDs to match. Each is converted to a CustomObjectId here.
+    :param entity_type: Name of the entity type e.g. catalogue categories/systems (Used for logging)
+    :return: Dictionary representing the query to pass to a pymongo's Collection `find` function.
+    """
+    query = {"_id": {"$in": [CustomObjectId(entity_id) for entity_id in entity_ids]}}
+
+    logger.info("Retrieving %s %s from the database", len(entity_ids), entity_type)
+    logger.debug("Provided ID(s): %s", entity_ids)
+    return query
+
+
+def find_many_by_ids(
+    collection: Collection,
+    entity_ids: List[str],
+    entity_type: str,
+    cache: VersionedCache,
+    session: Optional[ClientSession] = None,
+) -> List[dict]:
+    """
+    Finds the documents with any of the given IDs, obtaining any that are present in the given cache of the documents
+    by ID from it instead when not using a session.
+
+    :param collection: Collection to find the documents in.
+    :param entity_ids: List of the IDs of the documents to find.
+    :param entity_type: Name of the entity type e.g. units/usage statuses (Used for logging)
+    :param cache: Cache of the documents in the collection with their `_id` as keys.
+    :param session: PyMongo ClientSession to use for database operations. When given the cache is bypassed so that
+                    the documents are read as part of any transaction.
+    :return: List of the found documents. Any that were not found are omitted.
+    """
+    if session is not None:
+        return list(collection.find(ids_query(entity_ids, entity_type), session=session))
+
+    documents = cache.get_many_or_load(
+        [CustomObjectId(entity_id) for entity_id in entity_ids],
+        lambda missing_ids: {
+            document["_id"]: document
+            for document in collection.find(
+                ids_query([str(entity_id) for entity_id in missing_ids], entity_type), session=None
+            )
+        },
+    )
+    return [document for document in documents.values() if document is not None]
+
+
+# MongoDB query operators equivalent to each of the filter operators
+FILTER_OPERATORS = {
+    FilterOperator.EQ: "$eq",
+    FilterOperator.NE: "$ne",
+    FilterOperator.GT: "$gt",
+    FilterOperator.GTE: "$gte",
+    FilterOperator.LT: "$lt",
+    FilterOperator.LTE: "$lte",
+    FilterOperator.IN: "$in",
+}
+
+
+def create_filter_query(filters: List[Filter]) -> dict:
+    """
+    Compiles parsed filters into a query for a pymongo collection.
+
+    :param filters: Filters to compile (as returned by `parse_filters`).
+    :return: Dictionary representing the query to pass to a pymongo Collection's `find` function, which can be merged
+             with any other query on different fields.
+    """
+    query = {}
+    for requested_filter in filters:
+        query.setdefault(requested_filter.field, {})[
+            FILTER_OPERATORS[requested_filter.operator]
+        ] = requested_filter.value
+    return query
+
+
+def _create_after_sorted_cursor_query(sort: Sort, cursor: str) -> dict:
+    """
+    Creates a query matching the documents that come after the one pointed to by a cursor when sorted by a field
+    (and then by `_id` in the same direction to break ties).
+
+    As `None` sorts before any other value, documents without a value for the field are only followed by others
+    without a value when sorting in descending order, and are followed by all those with a value when ascending.
+    Range comparisons never match `None`, so when sorting in descending order the documents without a value must also
+    be explicitly included after those with one.
+
+    :param sort: Sort order of the documents.
+    :param cursor: Opaque cursor returned with the previous page.
+    :raises InvalidCursorError: If the given cursor is malformed or was created for a different sort order.
+    :return: Dictionary representing the query.
+    """
+    last_id, last_value = decode_sorted_cursor(cursor, sort)
+    comparison = "$lt" if sort.descending else "$gt"
+
+    same_value_query = {sort.field: last_value, "_id": {comparison: last_id}}
+    if last_value is None:
+        if sort.descending:
+            return same_value_query
+        return {"$or": [{sort.field: {"$ne": None}}, same_value_query]}
+    if sort.descending:
+        return {"$or": [{sort.field: {comparison: last_value}}, same_value_query, {sort.field: None}]}
+    return {"$or": [{sort.field: {comparison: last_value}}, same_value_query]}
+
+
+def paginate_query(
+    query: dict, limit: Optional[int], cursor: Optional[str], sort: Optional[Sort] = None
+) -> Tuple[dict, dict]:
+    """
+    Applies keyset pagination to a query so that the cost of obtaining each page does not depend on the size of the
+    collection.
+
+    Documents are paginated on `_id`, or when a sort order is given on the sorted field followed by `_id` to break any
+    ties.
+
+    :param query: Query to paginate (as would be passed to a pymongo Collection's `find` function).
+    :param limit: Maximum number of documents to return, or `None` to return all of them.
+    :param cursor: Opaque cursor returned with the previous page, or `None` to start from the first page.
+    :param sort: Sort order requested by the client, or `None` to use the default order.
+    :raises InvalidCursorError: If the given cursor is malformed or was created for a different sort order.
+    :return: Tuple containing the paginated query and any additional keyword arguments to pass to the `find` function.
+             When neither a limit, cursor or sort order are given both are returned unmodified.
+    """
+    if sort is not None:
+        direction = DESCENDING if sort.descending else ASCENDING
+        options = {"sort": [(sort.field, direction), ("_id", direction)]}
+        if cursor is not None:
+            query = {**query, **_create_after_sorted_cursor_query(sort, cursor)}
+    elif limit is None and cursor is None:
+        return query, {}
+    else:
+        options = {"sort": [("_id", ASCENDING)]}
+        if cursor is not None:
+            query = {**query, "_id": {"$gt": decode_cursor(cursor)}}
+
+    if limit is not None:
+        options["limit"] = limit
+    return query, options
+
+
+def create_projection(fields: Optional[List[str]]) -> dict:
+    """
+    Creates a projection so that only the requested fields of each document are returned from the database.
+
+    :param fields: List of the fields to return (using their API names, e.g. `id` rather than `_id`), or `None` to
+                   return all of them.
+    :return: Dictionary containing any additional keyword arguments to pass to a pymongo Collection's `find` or
+             `find_one` functions. Empty when all fields are requested.
+    """
+    if fields is None:
+        return {}
+
+    return {"projection": {("_id" if field == "id" else field): 1 for field in fields}}
+
+
 def create_breadcrumbs_aggregation_pipeline(entity_id: str, collection_name: str) -> list:
     """
     Returns an aggregate query for collecting breadcrumbs data
 
+    Uses the `ancestor_ids` stored on each entity so that only the ancestors actually in the trail are looked up (by
+    their IDs) rather than walking up the tree one parent at a time.
+
     :param entity_id: ID of the entity to look up the breadcrumbs for
-    :param collection_name: Value of "from" to use for the $graphLookup query - Should be the name of
+    :param collection_name: Value of "from" to use for the $lookup query - Should be the name of
                             the collection
 
     :raises InvalidObjectIdError: If the given entity_id is invalid
@@ -55,40 +220,90 @@ def create_breadcrumbs_aggregation_pipeline(entity_id: str, collection_name: str
     """
     return [
         {"$match": {"_id": CustomObjectId(entity_id)}},
+        _create_breadcrumbs_trail_projection_stage(),
         {
-            "$graphLookup": {
+            "$lookup": {
                 "from": collection_name,
-                "startWith": "$parent_id",
-                "connectFromField": "parent_id",
-                "connectToField": "_id",
+                "localField": "ancestor_ids",
+                "foreignField": "_id",
                 "as": "ancestors",
-                # maxDepth 0 will do one parent look up i.e. a trail length of 2
-                "maxDepth": BREADCRUMBS_TRAIL_MAX_LENGTH - 2,
-                "depthField": "level",
             }
         },
-        # The following ensures that just a list of the full breadcrumbs results are returned with only the
-        # necessary information in order from the top level down
+        # Keep only the necessary information
         {
-            "$facet": {
-                # Keep only these parameters
-                "root": [{"$project": {"_id": 1, "name": 1, "parent_id": 1}}],
-                "ancestors": [
-                    {"$unwind": "$ancestors"},
-                    {
-                        "$sort": {
-                            "ancestors.level": -1,
-                        },
-                    },
-                    {"$replaceRoot": {"newRoot": "$ancestors"}},
-                    {"$project": {"_id": 1, "name": 1, "parent_id": 1}},
-                ],
+            "$project": {
+                "name": 1,
+                "parent_id": 1,
+                "ancestor_ids": 1,
+                "ancestors._id": 1,
+                "ancestors.name": 1,
+                "ancestors.parent_id": 1,
+            }
+        },
+    ]
+
+
+def create_many_breadcrumbs_aggregation_pipeline(entity_ids: List[str], collection_name: str) -> list:
+    """
+    Returns an aggregate query for collecting the breadcrumbs data of multiple entities at once
+
+    The entities are grouped together so that each ancestor is only looked up once, regardless of how many of the
+    entities' trails it appears in.
+
+    :param entity_ids: IDs of the entities to look up the breadcrumbs for
+    :param collection_name: Value of "from" to use for the $lookup query - Should be the name of
+                            the collection
+
+    :raises InvalidObjectIdError: If any of the given entity_ids are invalid
+    :return: The query to feed to the collection's aggregate method. The value of list(result) should
+             be passed to compute_many_breadcrumbs below.
+    """
+    return [
+        {"$match": {"_id": {"$in": [CustomObjectId(entity_id) for entity_id in entity_ids]}}},
+        _create_breadcrumbs_trail_projection_stage(),
+        {"$group": {"_id": None, "entities": {"$push": "$$ROOT"}, "ancestor_ids": {"$push": "$ancestor_ids"}}},
+        # Combine the ancestors of all of the entities removing any duplicates
+        {
+            "$project": {
+                "entities": 1,
+                "ancestor_ids": {
+                    "$reduce": {
+                        "input": "$ancestor_ids",
+                        "initialValue": [],
+                        "in": {"$setUnion": ["$$value", "$$this"]},
+                    }
+                },
+            }
+        },
+        {
+            "$lookup": {
+                "from": collection_name,
+                "localField": "ancestor_ids",
+                "foreignField": "_id",
+                "as": "ancestors",
             }
         },
-        {"$project": {"result": {"$concatArrays": ["$ancestors", "$root"]}}},
+        # Keep only the necessary information
+        {"$project": {"entities": 1, "ancestors._id": 1, "ancestors.name": 1, "ancestors.parent_id": 1}},
     ]
 
 
+def _create_breadcrumbs_trail_projection_stage() -> dict:
+    """
+    Returns a projection stage keeping only the information of an entity needed for its breadcrumbs, including only
+    the last few ancestors that can appear in its trail
+
+    :return: The projection stage
+    """
+    return {
+        "$project": {
+            "name": 1,
+            "parent_id": 1,
+            "ancestor_ids": {"$slice": ["$ancestor_ids", -(BREADCRUMBS_TRAIL_MAX_LENGTH - 1)]},
+        }
+    }
+
+
 def compute_breadcrumbs(breadcrumb_query_result: list, entity_id: str, collection_name: str) -> BreadcrumbsGetSchema:
     """
     Processes the result of running breadcrumb query using the pipeline returned by
@@ -101,25 +316,77 @@ def compute_breadcrumbs(breadcrumb_query_result: list, entity_id: str, collectio
     :param collection_name: Should be the same as the value passed to create_breadcrumbs_aggregation_pipeline
                             (used for error messages)
     :raises MissingRecordError: If the entity with id 'entity_id' isn't found in the database
-    :raises DatabaseIntegrityError: If the query returned less than the maximum allowed trail while not
-                                    giving the full trail - this indicates a `parent_id` is invalid or doesn't
-                                    exist in the database which shouldn't occur
+    :raises DatabaseIntegrityError: If any of the ancestors of the entity could not be found or the trail is shorter
+                                    than the maximum allowed while not giving the full trail - this indicates an
+                                    `ancestor_ids` or `parent_id` is invalid which shouldn't occur
     :return: See BreadcrumbsGetSchema
     """
 
-    trail: list[tuple[str, str]] = []
-
-    result = breadcrumb_query_result[0]["result"]
-    if len(result) == 0:
+    if len(breadcrumb_query_result) == 0:
         raise MissingRecordError(
             f"Entity with the ID '{entity_id}' was not found in the collection '{collection_name}'"
         )
-    for element in result:
-        trail.append((str(element["_id"]), element["name"]))
-    full_trail = result[0]["parent_id"] is None
+    entity = breadcrumb_query_result[0]
+
+    return _compute_entity_breadcrumbs(
+        entity, {ancestor["_id"]: ancestor for ancestor in entity["ancestors"]}, entity_id, collection_name
+    )
+
+
+def compute_many_breadcrumbs(breadcrumb_query_result: list, collection_name: str) -> dict[str, BreadcrumbsGetSchema]:
+    """
+    Processes the result of running breadcrumb query using the pipeline returned by
+    create_many_breadcrumbs_aggregation_pipeline above
+
+    :param breadcrumb_query_result: Result of running the aggregation pipeline returned by
+                                    create_many_breadcrumbs_aggregation_pipeline
+    :param collection_name: Should be the same as the value passed to create_many_breadcrumbs_aggregation_pipeline
+                            (used for error messages)
+    :raises DatabaseIntegrityError: If any of the ancestors of the entities could not be found or a trail is shorter
+                                    than the maximum allowed while not giving the full trail - this indicates an
+                                    `ancestor_ids` or `parent_id` is invalid which shouldn't occur
+    :return: Dictionary of the breadcrumbs (see BreadcrumbsGetSchema) with the IDs of the entities as keys. Any
+             entities that were not found are omitted.
+    """
+
+    # When none of the entities are found there is nothing to group
+    if len(breadcrumb_query_result) == 0:
+        return {}
+    result = breadcrumb_query_result[0]
+
+    ancestors = {ancestor["_id"]: ancestor for ancestor in result["ancestors"]}
+    return {
+        str(entity["_id"]): _compute_entity_breadcrumbs(entity, ancestors, str(entity["_id"]), collection_name)
+        for entity in result["entities"]
+    }
+
+
+def _compute_entity_breadcrumbs(
+    entity: dict, ancestors: dict, entity_id: str, collection_name: str
+) -> BreadcrumbsGetSchema:
+    """
+    Computes the breadcrumbs of a single entity returned by one of the breadcrumb queries above
+
+    :param entity: Entity the breadcrumbs are for
+    :param ancestors: Dictionary of the looked up ancestors with their IDs as keys (may contain others too)
+    :param entity_id: ID of the entity (used for error messages)
+    :param collection_name: Name of the collection the entity is in (used for error messages)
+    :raises DatabaseIntegrityError: If any of the ancestors of the entity could not be found or the trail is shorter
+                                    than the maximum allowed while not giving the full trail
+    :return: See BreadcrumbsGetSchema
+    """
+
+    # The lookup doesn't preserve the order of the IDs, so order the ancestors from the top level down using them
+    if any(ancestor_id not in ancestors for ancestor_id in entity["ancestor_ids"]):
+        raise DatabaseIntegrityError(
+            f"Unable to locate full trail for entity with id '{entity_id}' from the database "
+            f"collection '{collection_name}'"
+        )
+    elements = [ancestors[ancestor_id] for ancestor_id in entity["ancestor_ids"]] + [entity]
+
+    trail: list[tuple[str, str]] = [(str(element["_id"]), element["name"]) for element in elements]
+    full_trail = elements[0]["parent_id"] is None
 
-    # Ensure none of the parent_id's are invalid - if they are we wont get the full trail even though we are supposed
-    # to
     if not full_trail and len(trail) != BREADCRUMBS_TRAIL_MAX_LENGTH:
         raise DatabaseIntegrityError(
             f"Unable to locate full trail for entity with id '{entity_id}' from the database "
@@ -128,61 +395,114 @@ def compute_breadcrumbs(breadcrumb_query_result: list, entity_id: str, collectio
     return BreadcrumbsGetSchema(trail=trail, full_trail=full_trail)
 
 
-def create_move_check_aggregation_pipeline(entity_id: str, destination_id: str, collection_name: str) -> list:
+# Fields of an entity that its breadcrumbs, along with those of any of its descendants, are computed from
+BREADCRUMBS_FIELDS = {"name", "parent_id", "ancestor_ids"}
+
+
+def invalidate_breadcrumbs_for_change(breadcrumbs_cache: VersionedCache, change: Optional[dict]) -> None:
+    """
+    Discards the cached breadcrumbs affected by a change to an entity, as given by a change stream.
+
+    These are the breadcrumbs of the entity itself along with any whose trail contains it. Moving an entity updates the
+    `ancestor_ids` of all of its descendants and so each of them is given their own change, while only renaming it
+    affects those whose trail contains it. Changes to any other fields don't affect the breadcrumbs at all.
+
+    :param breadcrumbs_cache: Cache of the breadcrumbs of the entities by ID.
+    :param change: Change event from the change stream, or `None` when any of the entities may have been modified.
+    """
+
+    if change is None or "documentKey" not in change:
+        breadcrumbs_cache.invalidate()
+        return
+
+    if change["operationType"] == "update":
+        update_description = change.get("updateDescription", {})
+        modified_fields = [*update_description.get("updatedFields", {}), *update_description.get("removedFields", [])]
+        if not any(field.split(".")[0] in BREADCRUMBS_FIELDS for field in modified_fields):
+            return
+
+    entity_id = change["documentKey"]["_id"]
+    breadcrumbs_cache.invalidate_where(
+        lambda key, breadcrumbs: key == entity_id or any(element[0] == str(entity_id) for element in breadcrumbs.trail)
+    )
+
+
+def create_subtree_query(entity_id: str, max_depth: Optional[int]) -> dict:
+    """
+    Returns a query for obtaining an entity along with all of its descendants using their `ancestor_ids`
+
+    :param entity_id: ID of the entity at the top of the subtree
+    :param max_depth: Maximum depth of the descendants to include relative to the entity (e.g. 1 would only include
+                      its children), or `None` to include all of them
+    :raises InvalidObjectIdError: If the given entity_id is invalid
+    :return: The query to feed to the collection's find method
+    """
+    entity_id = CustomObjectId(entity_id)
+
+    descendants_query = {"ancestor_ids": entity_id}
+    if max_depth is not None:
+        # The depth of a descendant is the number of its ancestors below the entity (inclusive)
+        descendants_query["$expr"] = {
+            "$lte": [
+                {"$subtract": [{"$size": "$ancestor_ids"}, {"$indexOfArray": ["$ancestor_ids", entity_id]}]},
+                max_depth,
+            ]
+        }
+
+    return {"$or": [{"_id": entity_id}, descendants_query]}
+
+
+def compute_ancestor_ids(parent_id: str, parent_ancestor_ids: List[str]) -> List[CustomObjectId]:
+    """
+    Returns the `ancestor_ids` an entity should have when placed inside a given parent
+
+    :param parent_id: ID of the parent entity
+    :param parent_ancestor_ids: `ancestor_ids` of the parent entity
+    :return: IDs of all of the entity's ancestors in order from the top level down
+    """
+    return [CustomObjectId(ancestor_id) for ancestor_id in parent_ancestor_ids] + [CustomObjectId(parent_id)]
+
+
+def is_valid_move(entity_id: str, destination_id: str, destination_ancestor_ids: List[str]) -> bool:
     """
-    Returns an aggregate query for checking whether an entity has been requested to move to one of its own children
+    Returns whether moving an entity to a destination is valid i.e. that the destination is neither the entity itself
+    nor one of its children
 
     :param entity_id: ID of the entity being moved
     :param destination_id: ID of the entity it is being moved to (i.e. the new parent_id)
+    :param destination_ancestor_ids: `ancestor_ids` of the entity it is being moved to
+    :return: True if the move is valid, False when the move destination is the entity itself or one of its children
+    """
+    return entity_id != destination_id and entity_id not in destination_ancestor_ids
 
-    :raises InvalidObjectIdError: If the given entity_id or destination_id is invalid
-    :return: The query to feed to the collection's aggregate method. The value of list(result) should
-             be passed to is_valid_move_result below.
+
+def create_move_descendants_update(entity_id: CustomObjectId, ancestor_ids: List[CustomObjectId]) -> list:
+    """
+    Returns an update pipeline for replacing the ancestors above a moved entity in the `ancestor_ids` of each of its
+    descendants
+
+    Should be used in an `update_many` with a filter of `{"ancestor_ids": entity_id}`.
+
+    :param entity_id: ID of the entity that has been moved
+    :param ancestor_ids: New `ancestor_ids` of the entity that has been moved
+    :return: The update pipeline to feed to the collection's update_many method
     """
     return [
-        {"$match": {"_id": CustomObjectId(destination_id)}},
         {
-            "$graphLookup": {
-                "from": collection_name,
-                "startWith": "$parent_id",
-                "connectFromField": "parent_id",
-                "connectToField": "_id",
-                "as": "ancestors",
-                "depthField": "level",
-                # Stop if hit the entity itself, no need to check further
-                "restrictSearchWithMatch": {"_id": {"$ne": CustomObjectId(entity_id)}},
-            }
-        },
-        # The following ensures that just a list of the parents containing only the parent_id's are returned
-        # in order from the top level down
-        {
-            "$facet": {
-                # Keep only these parameters
-                "root": [{"$project": {"parent_id": 1}}],
-                "ancestors": [
-                    {"$unwind": "$ancestors"},
-                    {
-                        "$sort": {
-                            "ancestors.level": -1,
+            "$set": {
+                "ancestor_ids": {
+                    "$concatArrays": [
+                        [*ancestor_ids, entity_id],
+                        # Keep everything below the moved entity
+                        {
+                            "$slice": [
+                                "$ancestor_ids",
+                                {"$add": [{"$indexOfArray": ["$ancestor_ids", entity_id]}, 1]},
+                                {"$size": "$ancestor_ids"},
+                            ]
                         },
-                    },
-                    {"$replaceRoot": {"newRoot": "$ancestors"}},
-                    {"$project": {"parent_id": 1}},
-                ],
+                    ]
+                }
             }
-        },
-        {"$project": {"result": {"$concatArrays": ["$ancestors", "$root"]}}},
+        }
     ]
-
-
-def is_valid_move_result(move_parent_check_result: list) -> bool:
-    """
-    Processes the result of running the query returned by create_move_check_aggregation_pipeline above and returns
-    whether it represents a valid move
-
-    :param move_parent_check_result: Result of running the aggregation pipeline returned by
-                                     create_move_check_aggregation_pipeline
-    :return: True if the move is valid, False when the move destination is a child of the entity being moved
-    """
-    result = move_parent_check_result[0]["result"]
-    return len(result) > 0 and result[0]["parent_id"] is None
@@ -11,10 +11,23 @@ Module for providing an API router which defines routes for managing catalogue c
 import logging
 from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, Response, status
+from pydantic import Field
 
 from inventory_management_system_api.auth.authorisation import AuthorisedDep
-from inventory_management_system_api.core.consts import HTTP_500_INTERNAL_SERVER_ERROR_DETAIL
+from inventory_management_system_api.core.conditional_requests import (
+    NOT_MODIFIED_RESPONSES,
+    compute_list_version,
+    create_etag,
+    create_not_modified_response,
+    has_if_none_match,
+    is_not_modified,
+)
+from inventory_management_system_api.core.consts import (
+    BREADCRUMBS_BATCH_MAX_IDS,
+    ETAG_HEADER,
+    HTTP_500_INTERNAL_SERVER_ERROR_DETAIL,
+)
 from inventory_management_system_api.core.exceptions import (
     ChildElementsExistError,
     DatabaseIntegrityError,
@@ -89,8 +102,15 @@ def create_catalogue_category(
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
 
 
-@router.get(path="", summary="Get catalogue categories", response_description="List of catalogue categories")
+@router.get(
+    path="",
+    summary="Get catalogue categories",
+    response_description="List of catalogue categories",
+    responses=NOT_MODIFIED_RESPONSES,
+)
 def get_catalogue_categories(
+    request: Request,
+    response: Response,
     catalogue_category_service: CatalogueCategoryServiceDep,
     parent_id: Annotated[Optional[str], Query(description="Filter catalogue categories by parent ID")] = None,
 ) -> List[CatalogueCategorySchema]:
@@ -99,7 +119,30 @@ def get_catalogue_categories(
         logger.debug("Parent ID filter '%s'", parent_id)
 
     try:
+        etag = None
+        # The version is only obtained separately when it is needed to check whether the client's version is current.
+        # Otherwise the ETag is computed from the catalogue categories returned instead so that they aren't queried
+        # twice.
+        if has_if_none_match(request):
+            # The version is obtained before the catalogue categories so that a modification in between can only ever
+            # result in an outdated ETag (and so an unnecessary full response later) rather than an outdated response
+            etag = create_etag(
+                CatalogueCategorySchema, catalogue_category_service.get_list_version(parent_id), parent_id
+            )
+            if is_not_modified(request, etag):
+                return create_not_modified_response(etag)
+            response.headers[ETAG_HEADER] = etag
+
         catalogue_categories = catalogue_category_service.list(parent_id)
+        if etag is None:
+            response.headers[ETAG_HEADER] = create_etag(
+                CatalogueCategorySchema,
+                compute_list_version(
+                    (catalogue_category.id, catalogue_category.modified_time)
+                    for catalogue_category in catalogue_categories
+                ),
+                parent_id,
+            )
         return [
             CatalogueCategorySchema(**catalogue_category.model_dump()) for catalogue_category in catalogue_categories
         ]
@@ -113,9 +156,12 @@ def get_catalogue_categories(
     path="/{catalogue_category_id}",
     summary="Get a catalogue category by ID",
     response_description="Single catalogue category",
+    responses=NOT_MODIFIED_RESPONSES,
 )
 def get_catalogue_category(
     catalogue_category_id: Annotated[str, Path(description="The ID of the catalogue category to get")],
+    request: Request,
+    response: Response,
     catalogue_category_service: CatalogueCategoryServiceDep,
 ) -> CatalogueCategorySchema:
     logger.info("Getting catalogue category with ID '%s'", catalogue_category_id)
@@ -124,12 +170,71 @@ def get_catalogue_category(
         catalogue_category = catalogue_category_service.get(catalogue_category_id)
         if not catalogue_category:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
+
+        etag = create_etag(CatalogueCategorySchema, catalogue_category.id, catalogue_category.modified_time)
+        if is_not_modified(request, etag):
+            return create_not_modified_response(etag)
+        response.headers[ETAG_HEADER] = etag
+
         return CatalogueCategorySchema(**catalogue_category.model_dump())
     except InvalidObjectIdError as exc:
         logger.exception(message)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message) from exc
 
 
+@router.get(
+    path="/{catalogue_category_id}/tree",
+    summary="Get a catalogue category along with all of its descendants",
+    response_description="List containing the catalogue category followed by its descendants, ordered from the top of "
+    "the tree down",
+)
+def get_catalogue_category_tree(
+    catalogue_category_id: Annotated[str, Path(description="The ID of the catalogue category to get the tree for")],
+    catalogue_category_service: CatalogueCategoryServiceDep,
+    max_depth: Annotated[
+        Optional[int],
+        Query(
+            description="Maximum depth of the descendants to return relative to the catalogue category e.g. 1 would "
+            "only return its children",
+            ge=0,
+        ),
+    ] = None,
+) -> List[CatalogueCategorySchema]:
+    logger.info("Getting tree for catalogue category with ID '%s'", catalogue_category_id)
+    try:
+        catalogue_categories = catalogue_category_service.get_tree(catalogue_category_id, max_depth=max_depth)
+        return [
+            CatalogueCategorySchema(**catalogue_category.model_dump()) for catalogue_category in catalogue_categories
+        ]
+    except (MissingRecordError, InvalidObjectIdError) as exc:
+        message = "Catalogue category not found"
+        logger.exception(message)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message) from exc
+
+
+@router.post(
+    path="/breadcrumbs",
+    summary="Get breadcrumbs data for multiple catalogue categories",
+    response_description="Breadcrumbs data for each of the catalogue categories found, keyed by their IDs",
+)
+def get_many_catalogue_category_breadcrumbs(
+    catalogue_category_ids: Annotated[
+        List[str],
+        Field(max_length=BREADCRUMBS_BATCH_MAX_IDS),
+        Body(description="List of the IDs of the catalogue categories to get the breadcrumbs for"),
+    ],
+    catalogue_category_service: CatalogueCategoryServiceDep,
+) -> dict[str, BreadcrumbsGetSchema]:
+    logger.info("Getting breadcrumbs for %s catalogue categories", len(catalogue_category_ids))
+    try:
+        return catalogue_category_service.get_many_breadcrumbs(catalogue_category_ids)
+    except DatabaseIntegrityError as exc:
+        logger.exception("Unable to obtain breadcrumbs")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=HTTP_500_INTERNAL_SERVER_ERROR_DETAIL
+        ) from exc
+
+
 @router.get(path="/{catalogue_category_id}/breadcrumbs", summary="Get breadcrumbs data for a catalogue category")
 def get_catalogue_category_breadcrumbs(
     catalogue_category_id: Annotated[
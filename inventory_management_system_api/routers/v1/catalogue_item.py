@@ -11,16 +11,33 @@ service.
 import logging
 from typing import Annotated, Any, List, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, Response, status
 from pydantic import Field
 
+from inventory_management_system_api.core.conditional_requests import (
+    NOT_MODIFIED_RESPONSES,
+    compute_list_version,
+    create_etag,
+    create_not_modified_response,
+    has_if_none_match,
+    is_not_modified,
+)
 from inventory_management_system_api.core.config import config
-from inventory_management_system_api.core.consts import HTTP_500_INTERNAL_SERVER_ERROR_DETAIL
+from inventory_management_system_api.core.consts import (
+    ETAG_HEADER,
+    HTTP_500_INTERNAL_SERVER_ERROR_DETAIL,
+    NEXT_CURSOR_HEADER,
+)
 from inventory_management_system_api.core.exceptions import (
     ChildElementsExistError,
+    DatabaseIntegrityError,
     InvalidActionError,
+    InvalidCursorError,
+    InvalidFieldsError,
+    InvalidFilterError,
     InvalidObjectIdError,
     InvalidPropertyTypeError,
+    InvalidSortError,
     MissingMandatoryProperty,
     MissingRecordError,
     NonLeafCatalogueCategoryError,
@@ -28,7 +45,18 @@ from inventory_management_system_api.core.exceptions import (
     ObjectStorageAPIServerError,
     ReplacementForObsoleteCatalogueItemError,
 )
+from inventory_management_system_api.core.filtering import (
+    create_filter_description,
+    create_sort_description,
+    get_fields_for_sort,
+    parse_filters,
+    parse_sort,
+)
+from inventory_management_system_api.core.pagination import get_next_cursor
+from inventory_management_system_api.core.sparse_fieldsets import create_json_response, create_schema, parse_fields
+from inventory_management_system_api.core.streaming import NDJSON_RESPONSES, accepts_ndjson, create_ndjson_response
 from inventory_management_system_api.schemas.catalogue_item import (
+    CATALOGUE_ITEM_FILTER_FIELDS,
     CATALOGUE_ITEM_WITH_CHILD_NON_EDITABLE_FIELDS,
     CatalogueItemPatchSchema,
     CatalogueItemPostSchema,
@@ -86,7 +114,9 @@ def create_catalogue_item(
     status_code=status.HTTP_201_CREATED,
 )
 def bulk_create_catalogue_item(
-    catalogue_items: Annotated[list[CatalogueItemPostSchema], Field(max_length=config.bulk.max_catalogue_items)],
+    catalogue_items: Annotated[
+        list[CatalogueItemPostSchema], Field(min_length=1, max_length=config.bulk.max_catalogue_items)
+    ],
     catalogue_item_service: CatalogueItemServiceDep,
 ) -> list[CatalogueItemSchema]:
     logger.info("Bulk creating catalogue items")
@@ -137,39 +167,187 @@ def bulk_validate_create_catalogue_item(
     return catalogue_item_service.bulk_validate_create(catalogue_items)
 
 
-@router.get(path="", summary="Get catalogue items", response_description="List of catalogue items")
+# pylint:disable=too-many-arguments
+# pylint:disable=too-many-positional-arguments
+# pylint:disable=too-many-locals
+@router.get(
+    path="",
+    summary="Get catalogue items",
+    response_description="List of catalogue items",
+    responses={**NDJSON_RESPONSES, **NOT_MODIFIED_RESPONSES},
+)
 def get_catalogue_items(
+    request: Request,
+    response: Response,
     catalogue_item_service: CatalogueItemServiceDep,
     catalogue_category_id: Annotated[
         Optional[str], Query(description="Filter catalogue items by catalogue category ID")
     ] = None,
+    limit: Annotated[
+        Optional[int],
+        Query(
+            description="Maximum number of catalogue items to return. When the page is full, the cursor for the next "
+            f"page is returned in the '{NEXT_CURSOR_HEADER}' response header (except for streamed NDJSON responses).",
+            ge=1,
+        ),
+    ] = None,
+    cursor: Annotated[
+        Optional[str],
+        Query(description=f"Cursor for the page to return as given in the '{NEXT_CURSOR_HEADER}' response header"),
+    ] = None,
+    fields: Annotated[
+        Optional[str],
+        Query(
+            description="Comma separated list of the fields to return for each catalogue item (the ID is always "
+            "returned)"
+        ),
+    ] = None,
+    filters: Annotated[
+        Optional[List[str]], Query(alias="filter", description=create_filter_description(CATALOGUE_ITEM_FILTER_FIELDS))
+    ] = None,
+    sort: Annotated[Optional[str], Query(description=create_sort_description(CATALOGUE_ITEM_FILTER_FIELDS))] = None,
 ) -> List[CatalogueItemSchema]:
     logger.info("Getting catalogue items")
     if catalogue_category_id:
         logger.debug("Catalogue category ID filter '%s'", catalogue_category_id)
 
     try:
-        catalogue_items = catalogue_item_service.list(catalogue_category_id)
-        return [CatalogueItemSchema(**catalogue_item.model_dump()) for catalogue_item in catalogue_items]
+        field_names = parse_fields(fields, CatalogueItemSchema)
+        parsed_filters = parse_filters(filters, CATALOGUE_ITEM_FILTER_FIELDS)
+        parsed_sort = parse_sort(sort, CATALOGUE_ITEM_FILTER_FIELDS)
+
+        etag_values = (
+            catalogue_category_id,
+            limit,
+            cursor,
+            field_names,
+            parsed_filters,
+            parsed_sort,
+            accepts_ndjson(request),
+        )
+        etag = None
+        # The version is only obtained separately when it is needed before the catalogue items are, i.e. to check
+        # whether the client's version is current or when streaming (as the headers are sent first). Otherwise the ETag
+        # is computed from the catalogue items returned instead so that they aren't queried twice.
+        if has_if_none_match(request) or accepts_ndjson(request):
+            # The version is obtained before the catalogue items so that a modification in between can only ever result
+            # in an outdated ETag (and so an unnecessary full response later) rather than an outdated response
+            etag = create_etag(
+                CatalogueItemSchema,
+                catalogue_item_service.get_list_version(
+                    catalogue_category_id, limit=limit, cursor=cursor, filters=parsed_filters, sort=parsed_sort
+                ),
+                *etag_values,
+            )
+            if is_not_modified(request, etag):
+                return create_not_modified_response(etag)
+            response.headers[ETAG_HEADER] = etag
+
+        if accepts_ndjson(request):
+            catalogue_items = catalogue_item_service.stream(
+                catalogue_category_id,
+                limit=limit,
+                cursor=cursor,
+                fields=field_names,
+                filters=parsed_filters,
+                sort=parsed_sort,
+            )
+            return create_ndjson_response(
+                (create_schema(CatalogueItemSchema, catalogue_item, field_names) for catalogue_item in catalogue_items),
+                exclude_unset=field_names is not None,
+                headers=response.headers,
+            )
+
+        list_field_names = get_fields_for_sort(field_names, parsed_sort)
+        catalogue_items = catalogue_item_service.list(
+            catalogue_category_id,
+            limit=limit,
+            cursor=cursor,
+            # The modified time and number of spares are required for the ETag even when they aren't being returned
+            fields=None if list_field_names is None else [*list_field_names, "modified_time", "number_of_spares"],
+            filters=parsed_filters,
+            sort=parsed_sort,
+        )
+        if etag is None:
+            response.headers[ETAG_HEADER] = create_etag(
+                CatalogueItemSchema,
+                compute_list_version(
+                    (catalogue_item.id, catalogue_item.modified_time, catalogue_item.number_of_spares)
+                    for catalogue_item in catalogue_items
+                ),
+                *etag_values,
+            )
+        next_cursor = get_next_cursor(catalogue_items, limit, parsed_sort)
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return create_json_response(
+            [create_schema(CatalogueItemSchema, catalogue_item, field_names) for catalogue_item in catalogue_items],
+            exclude_unset=field_names is not None,
+            headers=response.headers,
+        )
+    except (InvalidFieldsError, InvalidFilterError, InvalidSortError) as exc:
+        logger.exception(str(exc))
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
+    except InvalidCursorError as exc:
+        message = "Invalid cursor"
+        logger.exception(message)
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=message) from exc
     except InvalidObjectIdError:
         logger.exception("The provided catalogue category ID filter value is not a valid ObjectId value")
-        return []
+        return create_ndjson_response([]) if accepts_ndjson(request) else []
+
+
+# pylint:enable=too-many-arguments
+# pylint:enable=too-many-positional-arguments
+# pylint:enable=too-many-locals
 
 
 @router.get(
-    path="/{catalogue_item_id}", summary="Get a catalogue item by ID", response_description="Single catalogue item"
+    path="/{catalogue_item_id}",
+    summary="Get a catalogue item by ID",
+    response_description="Single catalogue item",
+    responses=NOT_MODIFIED_RESPONSES,
 )
 def get_catalogue_item(
     catalogue_item_id: Annotated[str, Path(description="The ID of the catalogue item to get")],
+    request: Request,
+    response: Response,
     catalogue_item_service: CatalogueItemServiceDep,
+    fields: Annotated[
+        Optional[str], Query(description="Comma separated list of the fields to return (the ID is always returned)")
+    ] = None,
 ) -> CatalogueItemSchema:
     logger.info("Getting catalogue item with ID '%s'", catalogue_item_id)
     message = "Catalogue item not found"
     try:
-        catalogue_item = catalogue_item_service.get(catalogue_item_id)
+        field_names = parse_fields(fields, CatalogueItemSchema)
+        # The modified time and number of spares are required for the ETag even when they aren't being returned
+        catalogue_item = catalogue_item_service.get(
+            catalogue_item_id,
+            fields=None if field_names is None else [*field_names, "modified_time", "number_of_spares"],
+        )
         if not catalogue_item:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
-        return CatalogueItemSchema(**catalogue_item.model_dump())
+
+        etag = create_etag(
+            CatalogueItemSchema,
+            catalogue_item.id,
+            catalogue_item.modified_time,
+            catalogue_item.number_of_spares,
+            field_names,
+        )
+        if is_not_modified(request, etag):
+            return create_not_modified_response(etag)
+        response.headers[ETAG_HEADER] = etag
+
+        return create_json_response(
+            create_schema(CatalogueItemSchema, catalogue_item, field_names),
+            exclude_unset=field_names is not None,
+            headers=response.headers,
+        )
+    except InvalidFieldsError as exc:
+        logger.exception(str(exc))
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
     except InvalidObjectIdError as exc:
         logger.exception("The ID is not a valid ObjectId value")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message) from exc
@@ -222,6 +400,11 @@ def partial_update_catalogue_item(
         message = "Catalogue item not found"
         logger.exception(message)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message) from exc
+    except DatabaseIntegrityError as exc:
+        logger.exception("Unable to update catalogue item")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=HTTP_500_INTERNAL_SERVER_ERROR_DETAIL
+        ) from exc
     except NonLeafCatalogueCategoryError as exc:
         message = "Adding a catalogue item to a non-leaf catalogue category is not allowed"
         logger.exception(message)
@@ -8,25 +8,58 @@ Module for providing an API router which defines routes for managing items using
 # pylint: disable=duplicate-code
 
 import logging
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response, status
+from pydantic import Field
 
 from inventory_management_system_api.auth.authorisation import AuthorisedDep
+from inventory_management_system_api.core.conditional_requests import (
+    NOT_MODIFIED_RESPONSES,
+    compute_list_version,
+    create_etag,
+    create_not_modified_response,
+    has_if_none_match,
+    is_not_modified,
+)
 from inventory_management_system_api.core.config import config
-from inventory_management_system_api.core.consts import HTTP_500_INTERNAL_SERVER_ERROR_DETAIL
+from inventory_management_system_api.core.consts import (
+    ETAG_HEADER,
+    HTTP_500_INTERNAL_SERVER_ERROR_DETAIL,
+    NEXT_CURSOR_HEADER,
+)
 from inventory_management_system_api.core.exceptions import (
     DatabaseIntegrityError,
     InvalidActionError,
+    InvalidCursorError,
+    InvalidFieldsError,
+    InvalidFilterError,
     InvalidObjectIdError,
     InvalidPropertyTypeError,
+    InvalidSortError,
     MissingMandatoryProperty,
     MissingRecordError,
     ObjectStorageAPIAuthError,
     ObjectStorageAPIServerError,
     WriteConflictError,
 )
-from inventory_management_system_api.schemas.item import ItemPatchSchema, ItemPostSchema, ItemSchema
+from inventory_management_system_api.core.filtering import (
+    create_filter_description,
+    create_sort_description,
+    get_fields_for_sort,
+    parse_filters,
+    parse_sort,
+)
+from inventory_management_system_api.core.pagination import get_next_cursor
+from inventory_management_system_api.core.sparse_fieldsets import create_json_response, create_schema, parse_fields
+from inventory_management_system_api.core.streaming import NDJSON_RESPONSES, accepts_ndjson, create_ndjson_response
+from inventory_management_system_api.schemas.item import (
+    ITEM_FILTER_FIELDS,
+    ItemBulkPostTemplateSchema,
+    ItemPatchSchema,
+    ItemPostSchema,
+    ItemSchema,
+)
 from inventory_management_system_api.services.item import ItemService
 
 logger = logging.getLogger()
@@ -79,11 +112,82 @@ def create_item(item: ItemPostSchema, item_service: ItemServiceDep, authorised:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=message) from exc
 
 
-@router.get(path="", summary="Get items", response_description="List of items")
+@router.post(
+    path="/bulk",
+    summary="Bulk create new items",
+    response_description="The created items",
+    status_code=status.HTTP_201_CREATED,
+)
+def bulk_create_items(
+    items: Union[
+        Annotated[List[ItemPostSchema], Field(min_length=1, max_length=config.bulk.max_items)],
+        ItemBulkPostTemplateSchema,
+    ],
+    item_service: ItemServiceDep,
+    authorised: AuthorisedDep,
+) -> List[ItemSchema]:
+    logger.info("Bulk creating items")
+    if isinstance(items, ItemBulkPostTemplateSchema):
+        items = items.get_items()
+    try:
+        return [ItemSchema(**item.model_dump()) for item in item_service.bulk_create(items, authorised)]
+    except InvalidPropertyTypeError as exc:
+        logger.exception(str(exc))
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
+    except (MissingRecordError, InvalidObjectIdError) as exc:
+        message = "A specified entity does not exist"
+        logger.exception(message)
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=message) from exc
+    except DatabaseIntegrityError as exc:
+        logger.exception("Unable to create items")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=HTTP_500_INTERNAL_SERVER_ERROR_DETAIL
+        ) from exc
+    except InvalidActionError as exc:
+        message = str(exc)
+        logger.exception(message)
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=message) from exc
+    except WriteConflictError as exc:
+        message = str(exc)
+        logger.exception(message)
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=message) from exc
+
+
+# pylint:disable=too-many-arguments
+# pylint:disable=too-many-positional-arguments
+# pylint:disable=too-many-locals
+@router.get(
+    path="",
+    summary="Get items",
+    response_description="List of items",
+    responses={**NDJSON_RESPONSES, **NOT_MODIFIED_RESPONSES},
+)
 def get_items(
+    request: Request,
+    response: Response,
     item_service: ItemServiceDep,
     system_id: Annotated[Optional[str], Query(description="Filter items by system ID")] = None,
     catalogue_item_id: Annotated[Optional[str], Query(description="Filter items by catalogue item ID")] = None,
+    limit: Annotated[
+        Optional[int],
+        Query(
+            description="Maximum number of items to return. When the page is full, the cursor for the next page is "
+            f"returned in the '{NEXT_CURSOR_HEADER}' response header (except for streamed NDJSON responses).",
+            ge=1,
+        ),
+    ] = None,
+    cursor: Annotated[
+        Optional[str],
+        Query(description=f"Cursor for the page to return as given in the '{NEXT_CURSOR_HEADER}' response header"),
+    ] = None,
+    fields: Annotated[
+        Optional[str],
+        Query(description="Comma separated list of the fields to return for each item (the ID is always returned)"),
+    ] = None,
+    filters: Annotated[
+        Optional[List[str]], Query(alias="filter", description=create_filter_description(ITEM_FILTER_FIELDS))
+    ] = None,
+    sort: Annotated[Optional[str], Query(description=create_sort_description(ITEM_FILTER_FIELDS))] = None,
 ) -> List[ItemSchema]:
     # pylint: disable=missing-function-docstring
     logger.info("Getting items")
@@ -92,9 +196,84 @@ def get_items(
     if catalogue_item_id:
         logger.debug("Catalogue item ID filter '%s'", catalogue_item_id)
     try:
-        items = item_service.list(system_id, catalogue_item_id)
-        return [ItemSchema(**item.model_dump()) for item in items]
+        field_names = parse_fields(fields, ItemSchema)
+        parsed_filters = parse_filters(filters, ITEM_FILTER_FIELDS)
+        parsed_sort = parse_sort(sort, ITEM_FILTER_FIELDS)
+
+        etag_values = (
+            system_id,
+            catalogue_item_id,
+            limit,
+            cursor,
+            field_names,
+            parsed_filters,
+            parsed_sort,
+            accepts_ndjson(request),
+        )
+        etag = None
+        # The version is only obtained separately when it is needed before the items are, i.e. to check whether the
+        # client's version is current or when streaming (as the headers are sent first). Otherwise the ETag is computed
+        # from the items returned instead so that they aren't queried twice.
+        if has_if_none_match(request) or accepts_ndjson(request):
+            # The version is obtained before the items so that a modification in between can only ever result in an
+            # outdated ETag (and so an unnecessary full response later) rather than an outdated response
+            etag = create_etag(
+                ItemSchema,
+                item_service.get_list_version(
+                    system_id, catalogue_item_id, limit=limit, cursor=cursor, filters=parsed_filters, sort=parsed_sort
+                ),
+                *etag_values,
+            )
+            if is_not_modified(request, etag):
+                return create_not_modified_response(etag)
+            response.headers[ETAG_HEADER] = etag
+
+        if accepts_ndjson(request):
+            items = item_service.stream(
+                system_id,
+                catalogue_item_id,
+                limit=limit,
+                cursor=cursor,
+                fields=field_names,
+                filters=parsed_filters,
+                sort=parsed_sort,
+            )
+            return create_ndjson_response(
+                (create_schema(ItemSchema, item, field_names) for item in items),
+                exclude_unset=field_names is not None,
+                headers=response.headers,
+            )
 
+        list_field_names = get_fields_for_sort(field_names, parsed_sort)
+        items = item_service.list(
+            system_id,
+            catalogue_item_id,
+            limit=limit,
+            cursor=cursor,
+            # The modified time is required for the ETag even when it isn't being returned
+            fields=None if list_field_names is None else [*list_field_names, "modified_time"],
+            filters=parsed_filters,
+            sort=parsed_sort,
+        )
+        if etag is None:
+            response.headers[ETAG_HEADER] = create_etag(
+                ItemSchema, compute_list_version((item.id, item.modified_time) for item in items), *etag_values
+            )
+        next_cursor = get_next_cursor(items, limit, parsed_sort)
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return create_json_response(
+            [create_schema(ItemSchema, item, field_names) for item in items],
+            exclude_unset=field_names is not None,
+            headers=response.headers,
+        )
+    except (InvalidFieldsError, InvalidFilterError, InvalidSortError) as exc:
+        logger.exception(str(exc))
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
+    except InvalidCursorError as exc:
+        message = "Invalid cursor"
+        logger.exception(message)
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=message) from exc
     except InvalidObjectIdError:
         if system_id:
             logger.exception("The provided system ID filter value is not a valid ObjectId value")
@@ -102,20 +281,51 @@ def get_items(
         if catalogue_item_id:
             logger.exception("The provided catalogue item ID filter value is not a valid ObjectId value")
 
-        return []
+        return create_ndjson_response([]) if accepts_ndjson(request) else []
+
+
+# pylint:enable=too-many-arguments
+# pylint:enable=too-many-positional-arguments
+# pylint:enable=too-many-locals
 
 
-@router.get(path="/{item_id}", summary="Get an item by ID", response_description="Single item")
+@router.get(
+    path="/{item_id}",
+    summary="Get an item by ID",
+    response_description="Single item",
+    responses=NOT_MODIFIED_RESPONSES,
+)
 def get_item(
-    item_id: Annotated[str, Path(description="The ID of the item to get")], item_service: ItemServiceDep
+    item_id: Annotated[str, Path(description="The ID of the item to get")],
+    request: Request,
+    response: Response,
+    item_service: ItemServiceDep,
+    fields: Annotated[
+        Optional[str], Query(description="Comma separated list of the fields to return (the ID is always returned)")
+    ] = None,
 ) -> ItemSchema:
     logger.info("Getting item with ID '%s'", item_id)
     message = "Item not found"
     try:
-        item = item_service.get(item_id)
+        field_names = parse_fields(fields, ItemSchema)
+        # The modified time is required for the ETag even when it isn't being returned
+        item = item_service.get(item_id, fields=None if field_names is None else [*field_names, "modified_time"])
         if not item:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
-        return ItemSchema(**item.model_dump())
+
+        etag = create_etag(ItemSchema, item.id, item.modified_time, field_names)
+        if is_not_modified(request, etag):
+            return create_not_modified_response(etag)
+        response.headers[ETAG_HEADER] = etag
+
+        return create_json_response(
+            create_schema(ItemSchema, item, field_names),
+            exclude_unset=field_names is not None,
+            headers=response.headers,
+        )
+    except InvalidFieldsError as exc:
+        logger.exception(str(exc))
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
     except InvalidObjectIdError as exc:
         logger.exception("The ID is not a valid ObjectId value")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message) from exc
@@ -0,0 +1,59 @@
+"""
+Module for providing an API router which defines routes for obtaining metrics about the running API.
+"""
+
+# We don't define docstrings in router methods as they would end up in the openapi/swagger docs.
+# pylint: disable=missing-function-docstring
+
+import logging
+
+from fastapi import APIRouter
+
+from inventory_management_system_api.core.database import connection_pool_metrics
+from inventory_management_system_api.repositories.catalogue_category import catalogue_category_breadcrumbs_cache
+from inventory_management_system_api.repositories.manufacturer import manufacturers_cache
+from inventory_management_system_api.repositories.rule import rules_cache
+from inventory_management_system_api.repositories.setting import settings_cache
+from inventory_management_system_api.repositories.system import system_breadcrumbs_cache
+from inventory_management_system_api.repositories.system_type import system_types_cache
+from inventory_management_system_api.repositories.unit import units_cache
+from inventory_management_system_api.repositories.usage_status import usage_statuses_cache
+from inventory_management_system_api.schemas.metrics import CacheMetricsSchema, DatabaseConnectionPoolMetricsSchema
+
+logger = logging.getLogger()
+
+router = APIRouter(prefix="/v1/metrics", tags=["metrics"])
+
+# In-process caches to report the metrics of, by name
+CACHES = {
+    "settings": settings_cache,
+    "rules": rules_cache,
+    "units": units_cache,
+    "usage_statuses": usage_statuses_cache,
+    "system_types": system_types_cache,
+    "manufacturers": manufacturers_cache,
+    "system_breadcrumbs": system_breadcrumbs_cache,
+    "catalogue_category_breadcrumbs": catalogue_category_breadcrumbs_cache,
+}
+
+
+@router.get(
+    path="/database-connection-pool",
+    summary="Get database connection pool metrics",
+    response_description="Statistics about the database connection pool since the API started",
+)
+def get_database_connection_pool_metrics() -> DatabaseConnectionPoolMetricsSchema:
+    logger.info("Getting database connection pool metrics")
+
+    return DatabaseConnectionPoolMetricsSchema(**connection_pool_metrics.get_statistics())
+
+
+@router.get(
+    path="/caches",
+    summary="Get in-process cache metrics",
+    response_description="Statistics about each of the in-process caches since the API started",
+)
+def get_cache_metrics() -> dict[str, CacheMetricsSchema]:
+    logger.info("Getting cache metrics")
+
+    return {name: CacheMetricsSchema(**cache.get_statistics()) for name, cache in CACHES.items()}
@@ -10,21 +10,37 @@ Module for providing an API router which defines routes for managing systems usi
 import logging
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, Response, status
+from pydantic import Field
 
+from inventory_management_system_api.core.conditional_requests import (
+    NOT_MODIFIED_RESPONSES,
+    compute_list_version,
+    create_etag,
+    create_not_modified_response,
+    has_if_none_match,
+    is_not_modified,
+)
 from inventory_management_system_api.core.config import config
-from inventory_management_system_api.core.consts import HTTP_500_INTERNAL_SERVER_ERROR_DETAIL
+from inventory_management_system_api.core.consts import (
+    BREADCRUMBS_BATCH_MAX_IDS,
+    ETAG_HEADER,
+    HTTP_500_INTERNAL_SERVER_ERROR_DETAIL,
+)
 from inventory_management_system_api.core.exceptions import (
     ChildElementsExistError,
     DatabaseIntegrityError,
     DuplicateRecordError,
     InvalidActionError,
+    InvalidFieldsError,
     InvalidObjectIdError,
     MissingRecordError,
     ObjectStorageAPIAuthError,
     ObjectStorageAPIServerError,
     WriteConflictError,
 )
+from inventory_management_system_api.core.sparse_fieldsets import create_json_response, create_schema, parse_fields
+from inventory_management_system_api.core.streaming import NDJSON_RESPONSES, accepts_ndjson, create_ndjson_response
 from inventory_management_system_api.schemas.breadcrumbs import BreadcrumbsGetSchema
 from inventory_management_system_api.schemas.system import SystemPatchSchema, SystemPostSchema, SystemSchema
 from inventory_management_system_api.services.system import SystemService
@@ -67,40 +83,174 @@ def create_system(system: SystemPostSchema, system_service: SystemServiceDep) ->
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=message) from exc
 
 
-@router.get(path="", summary="Get systems", response_description="List of systems")
+@router.get(
+    path="",
+    summary="Get systems",
+    response_description="List of systems",
+    responses={**NDJSON_RESPONSES, **NOT_MODIFIED_RESPONSES},
+)
 def get_systems(
+    request: Request,
+    response: Response,
     system_service: SystemServiceDep,
     parent_id: Annotated[Optional[str], Query(description="Filter systems by parent ID")] = None,
+    fields: Annotated[
+        Optional[str],
+        Query(description="Comma separated list of the fields to return for each system (the ID is always returned)"),
+    ] = None,
 ) -> list[SystemSchema]:
     logger.info("Getting systems")
     if parent_id:
         logger.debug("Parent ID filter '%s'", parent_id)
 
     try:
-        systems = system_service.list(parent_id)
-        return [SystemSchema(**system.model_dump()) for system in systems]
+        field_names = parse_fields(fields, SystemSchema)
+
+        etag = None
+        # The version is only obtained separately when it is needed before the systems are, i.e. to check whether the
+        # client's version is current or when streaming (as the headers are sent first). Otherwise the ETag is computed
+        # from the systems returned instead so that they aren't queried twice.
+        if has_if_none_match(request) or accepts_ndjson(request):
+            # The version is obtained before the systems so that a modification in between can only ever result in an
+            # outdated ETag (and so an unnecessary full response later) rather than an outdated response
+            etag = create_etag(
+                SystemSchema,
+                system_service.get_list_version(parent_id),
+                parent_id,
+                field_names,
+                accepts_ndjson(request),
+            )
+            if is_not_modified(request, etag):
+                return create_not_modified_response(etag)
+            response.headers[ETAG_HEADER] = etag
+
+        if accepts_ndjson(request):
+            systems = system_service.stream(parent_id, fields=field_names)
+            return create_ndjson_response(
+                (create_schema(SystemSchema, system, field_names) for system in systems),
+                exclude_unset=field_names is not None,
+                headers=response.headers,
+            )
+
+        # The modified time is required for the ETag even when it isn't being returned
+        systems = system_service.list(
+            parent_id, fields=None if field_names is None else [*field_names, "modified_time"]
+        )
+        if etag is None:
+            response.headers[ETAG_HEADER] = create_etag(
+                SystemSchema,
+                compute_list_version((system.id, system.modified_time) for system in systems),
+                parent_id,
+                field_names,
+                accepts_ndjson(request),
+            )
+        return create_json_response(
+            [create_schema(SystemSchema, system, field_names) for system in systems],
+            exclude_unset=field_names is not None,
+            headers=response.headers,
+        )
+    except InvalidFieldsError as exc:
+        logger.exception(str(exc))
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
     except InvalidObjectIdError:
         # As this endpoint filters, and to hide the database behaviour, we treat any invalid id the same as a valid one
         # that doesn't exist i.e. return an empty list
-        return []
+        return create_ndjson_response([]) if accepts_ndjson(request) else []
 
 
-@router.get(path="/{system_id}", summary="Get a system by ID", response_description="Single system")
+@router.get(
+    path="/{system_id}",
+    summary="Get a system by ID",
+    response_description="Single system",
+    responses=NOT_MODIFIED_RESPONSES,
+)
 def get_system(
-    system_id: Annotated[str, Path(description="ID of the system to get")], system_service: SystemServiceDep
+    system_id: Annotated[str, Path(description="ID of the system to get")],
+    request: Request,
+    response: Response,
+    system_service: SystemServiceDep,
+    fields: Annotated[
+        Optional[str], Query(description="Comma separated list of the fields to return (the ID is always returned)")
+    ] = None,
 ) -> SystemSchema:
     logger.info("Getting system with ID '%s'", system_id)
     message = "System not found"
     try:
-        system = system_service.get(system_id)
+        field_names = parse_fields(fields, SystemSchema)
+        # The modified time is required for the ETag even when it isn't being returned
+        system = system_service.get(system_id, fields=None if field_names is None else [*field_names, "modified_time"])
         if not system:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message)
-        return SystemSchema(**system.model_dump())
+
+        etag = create_etag(SystemSchema, system.id, system.modified_time, field_names)
+        if is_not_modified(request, etag):
+            return create_not_modified_response(etag)
+        response.headers[ETAG_HEADER] = etag
+
+        return create_json_response(
+            create_schema(SystemSchema, system, field_names),
+            exclude_unset=field_names is not None,
+            headers=response.headers,
+        )
+    except InvalidFieldsError as exc:
+        logger.exception(str(exc))
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
     except InvalidObjectIdError as exc:
         logger.exception("The ID is not a valid ObjectId value")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message) from exc
 
 
+@router.get(
+    path="/{system_id}/tree",
+    summary="Get a system along with all of its descendants",
+    response_description="List containing the system followed by its descendants, ordered from the top of the tree "
+    "down",
+)
+def get_system_tree(
+    system_id: Annotated[str, Path(description="The ID of the system to get the tree for")],
+    system_service: SystemServiceDep,
+    max_depth: Annotated[
+        Optional[int],
+        Query(
+            description="Maximum depth of the descendants to return relative to the system e.g. 1 would only return "
+            "its children",
+            ge=0,
+        ),
+    ] = None,
+) -> list[SystemSchema]:
+    logger.info("Getting tree for system with ID '%s'", system_id)
+    try:
+        systems = system_service.get_tree(system_id, max_depth=max_depth)
+        return create_json_response([create_schema(SystemSchema, system, None) for system in systems])
+    except (MissingRecordError, InvalidObjectIdError) as exc:
+        message = "System not found"
+        logger.exception(message)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=message) from exc
+
+
+@router.post(
+    path="/breadcrumbs",
+    summary="Get breadcrumbs data for multiple systems",
+    response_description="Breadcrumbs data for each of the systems found, keyed by their IDs",
+)
+def get_many_system_breadcrumbs(
+    system_ids: Annotated[
+        list[str],
+        Field(max_length=BREADCRUMBS_BATCH_MAX_IDS),
+        Body(description="List of the IDs of the systems to get the breadcrumbs for"),
+    ],
+    system_service: SystemServiceDep,
+) -> dict[str, BreadcrumbsGetSchema]:
+    logger.info("Getting breadcrumbs for %s systems", len(system_ids))
+    try:
+        return system_service.get_many_breadcrumbs(system_ids)
+    except DatabaseIntegrityError as exc:
+        logger.exception("Unable to obtain breadcrumbs")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=HTTP_500_INTERNAL_SERVER_ERROR_DETAIL
+        ) from exc
+
+
 @router.get(path="/{system_id}/breadcrumbs", summary="Get breadcrumbs data for a system")
 def get_system_breadcrumbs(
     system_id: Annotated[str, Path(description="The ID of the system to get the breadcrumbs for")],
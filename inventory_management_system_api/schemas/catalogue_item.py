@@ -6,6 +6,8 @@ from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
 
+from inventory_management_system_api.core.filtering import EQUALITY_OPERATORS, FilterField, FilterOperator
+from inventory_management_system_api.models.custom_object_id_data_types import CustomObjectIdField
 from inventory_management_system_api.schemas.mixins import CreatedModifiedSchemaMixin
 
 
@@ -103,3 +105,11 @@ class CatalogueItemSchema(CreatedModifiedSchemaMixin, CatalogueItemPostSchema):
     )
     criticality: Optional[float] = Field(default=None, description="The criticality of the catalogue item if known")
     is_flagged: Optional[bool] = Field(description="Whether the catalogue item is flagged as critical")
+
+
+# Fields that catalogue items can be filtered and sorted by when listing them (each must be covered by an index declared
+# by the `CatalogueItemRepo`)
+CATALOGUE_ITEM_FILTER_FIELDS = {
+    "manufacturer_id": FilterField(value_type=CustomObjectIdField, operators=EQUALITY_OPERATORS),
+    "name": FilterField(value_type=str, operators=frozenset({FilterOperator.EQ}), sortable=True),
+}
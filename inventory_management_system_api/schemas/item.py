@@ -4,8 +4,16 @@ Module for defining the API schema models for representing items.
 
 from typing import Optional, List
 
-from pydantic import BaseModel, Field, AwareDatetime
+from pydantic import BaseModel, Field, AwareDatetime, model_validator
 
+from inventory_management_system_api.core.config import config
+from inventory_management_system_api.core.filtering import (
+    EQUALITY_OPERATORS,
+    RANGE_OPERATORS,
+    FilterField,
+    FilterOperator,
+)
+from inventory_management_system_api.models.custom_object_id_data_types import CustomObjectIdField
 from inventory_management_system_api.schemas.catalogue_item import PropertyPostSchema, PropertySchema
 from inventory_management_system_api.schemas.mixins import CreatedModifiedSchemaMixin
 
@@ -32,6 +40,58 @@ class ItemPostSchema(BaseModel):
     )
 
 
+class ItemBulkPostTemplateSchema(BaseModel):
+    """
+    Schema model for a request to create multiple items from a single template.
+    """
+
+    template: ItemPostSchema = Field(
+        description="The item to create multiple copies of. Its serial and asset numbers are replaced by those in "
+        "`serial_numbers` and `asset_numbers` when they are given."
+    )
+    quantity: int = Field(ge=1, le=config.bulk.max_items, description="The number of items to create")
+    serial_numbers: Optional[List[Optional[str]]] = Field(
+        default=None, description="The serial number of each of the items to create (one per item)"
+    )
+    asset_numbers: Optional[List[Optional[str]]] = Field(
+        default=None, description="The asset number of each of the items to create (one per item)"
+    )
+
+    @model_validator(mode="after")
+    def validate_number_lists(self) -> "ItemBulkPostTemplateSchema":
+        """
+        Validator for the `serial_numbers` and `asset_numbers` fields.
+
+        Ensures they contain exactly one value for each of the items to create when they are given.
+
+        :return: The validated model.
+        :raises ValueError: If either list doesn't contain exactly `quantity` values.
+        """
+
+        for field_name in ("serial_numbers", "asset_numbers"):
+            values = getattr(self, field_name)
+            if values is not None and len(values) != self.quantity:
+                raise ValueError(f"{field_name} must contain exactly one value for each of the {self.quantity} items")
+        return self
+
+    def get_items(self) -> List[ItemPostSchema]:
+        """
+        Obtains the individual items to create from the template.
+
+        :return: List of the items to create.
+        """
+
+        items = []
+        for index in range(self.quantity):
+            update_data = {}
+            if self.serial_numbers is not None:
+                update_data["serial_number"] = self.serial_numbers[index]
+            if self.asset_numbers is not None:
+                update_data["asset_number"] = self.asset_numbers[index]
+            items.append(self.template.model_copy(update=update_data))
+        return items
+
+
 class ItemPatchSchema(ItemPostSchema):
     """
     Schema model for an item update request.
@@ -63,3 +123,13 @@ class ItemSchema(CreatedModifiedSchemaMixin, ItemPostSchema):
         description="The properties specific to this item as defined in the corresponding catalogue category.",
     )
     usage_status: str
+
+
+# Fields that items can be filtered and sorted by when listing them (each must be covered by an index declared by the
+# `ItemRepo`)
+ITEM_FILTER_FIELDS = {
+    "usage_status_id": FilterField(value_type=CustomObjectIdField, operators=EQUALITY_OPERATORS),
+    "is_defective": FilterField(value_type=bool, operators=frozenset({FilterOperator.EQ})),
+    "delivered_date": FilterField(value_type=AwareDatetime, operators=RANGE_OPERATORS, sortable=True),
+    "warranty_end_date": FilterField(value_type=AwareDatetime, operators=RANGE_OPERATORS, sortable=True),
+}
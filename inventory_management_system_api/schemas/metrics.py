@@ -0,0 +1,37 @@
+"""
+Module for defining the API schema models for representing metrics.
+"""
+
+from pydantic import BaseModel, Field
+
+
+class DatabaseConnectionPoolMetricsSchema(BaseModel):
+    """
+    Schema model for a database connection pool metrics get request response.
+    """
+
+    connections: int = Field(description="Number of connections currently open across all connection pools.")
+    connections_checked_out: int = Field(description="Number of connections currently checked out of the pools.")
+    checkouts: int = Field(description="Total number of successful connection checkouts.")
+    checkout_failures: dict[str, int] = Field(
+        description="Total number of failed connection checkouts by the reason they failed (e.g. `timeout` when the "
+        "pool was exhausted for longer than the wait queue timeout)."
+    )
+    checkout_wait_time_total_seconds: float = Field(
+        description="Total time spent waiting to check out connections in seconds."
+    )
+    checkout_wait_time_max_seconds: float = Field(
+        description="Longest time spent waiting to check out a connection in seconds."
+    )
+    pool_clears: int = Field(description="Number of times a connection pool has been cleared (e.g. due to an error).")
+
+
+class CacheMetricsSchema(BaseModel):
+    """
+    Schema model for the metrics of a single in-process cache.
+    """
+
+    entries: int = Field(description="Number of entries currently stored in the cache.")
+    hits: int = Field(description="Total number of lookups that were served from the cache.")
+    misses: int = Field(description="Total number of lookups that had to be loaded from the database.")
+    invalidations: int = Field(description="Number of times the cache has been invalidated due to a modification.")
@@ -7,6 +7,7 @@ from typing import Annotated, Any, List, Optional
 
 from fastapi import Depends
 
+from inventory_management_system_api.core.database import start_session_transaction
 from inventory_management_system_api.core.exceptions import (
     ChildElementsExistError,
     LeafCatalogueCategoryError,
@@ -99,6 +100,30 @@ class CatalogueCategoryService:
         """
         return self._catalogue_category_repository.get_breadcrumbs(catalogue_category_id)
 
+    def get_many_breadcrumbs(self, catalogue_category_ids: List[str]) -> dict[str, BreadcrumbsGetSchema]:
+        """
+        Retrieve the breadcrumbs for multiple catalogue categories
+
+        :param catalogue_category_ids: IDs of the catalogue categories to retrieve breadcrumbs for
+        :return: Dictionary of the breadcrumbs with the IDs of the catalogue categories as keys. Any that were not
+                 found (or are invalid) are omitted.
+        """
+        return self._catalogue_category_repository.get_many_breadcrumbs(
+            utils.get_valid_object_ids(catalogue_category_ids)
+        )
+
+    def get_tree(self, catalogue_category_id: str, max_depth: Optional[int] = None) -> List[CatalogueCategoryOut]:
+        """
+        Retrieve a catalogue category along with all of its descendants.
+
+        :param catalogue_category_id: ID of the catalogue category at the top of the tree.
+        :param max_depth: Maximum depth of the descendants to retrieve relative to the catalogue category, or `None` to
+                          retrieve all of them.
+        :return: List containing the catalogue category followed by its descendants, ordered from the top of the tree
+                 down.
+        """
+        return self._catalogue_category_repository.get_tree(catalogue_category_id, max_depth=max_depth)
+
     def list(self, parent_id: Optional[str]) -> List[CatalogueCategoryOut]:
         """
         Retrieve catalogue categories based on the provided filters.
@@ -108,6 +133,16 @@ class CatalogueCategoryService:
         """
         return self._catalogue_category_repository.list(parent_id)
 
+    def get_list_version(self, parent_id: Optional[str]) -> str:
+        """
+        Retrieve the version of the list of catalogue categories that `list` would return given the same filters.
+
+        :param parent_id: The `parent_id` to filter catalogue categories by.
+        :return: Version of the list of catalogue categories, which changes whenever any of them are created, modified
+                 or deleted.
+        """
+        return self._catalogue_category_repository.get_list_version(parent_id)
+
     def update(
         self, catalogue_category_id: str, catalogue_category: CatalogueCategoryPatchSchema
     ) -> CatalogueCategoryOut:
@@ -143,7 +178,10 @@ class CatalogueCategoryService:
         if "name" in update_data and catalogue_category.name != stored_catalogue_category.name:
             update_data["code"] = utils.generate_code(catalogue_category.name, "catalogue category")
 
-        if "parent_id" in update_data and catalogue_category.parent_id != stored_catalogue_category.parent_id:
+        moving_catalogue_category = (
+            "parent_id" in update_data and catalogue_category.parent_id != stored_catalogue_category.parent_id
+        )
+        if moving_catalogue_category:
             parent_catalogue_category = self.get(catalogue_category.parent_id) if catalogue_category.parent_id else None
 
             if parent_catalogue_category and parent_catalogue_category.is_leaf:
@@ -155,9 +193,16 @@ class CatalogueCategoryService:
             properties = self._add_property_unit_values(catalogue_category.properties)
             update_data["properties"] = properties
 
-        return self._catalogue_category_repository.update(
-            catalogue_category_id, CatalogueCategoryIn(**{**stored_catalogue_category.model_dump(), **update_data})
-        )
+        catalogue_category_in = CatalogueCategoryIn(**{**stored_catalogue_category.model_dump(), **update_data})
+
+        # Moving also updates the ancestors of all of the descendants, so ensure this happens atomically
+        if moving_catalogue_category:
+            with start_session_transaction("updating catalogue category") as session:
+                return self._catalogue_category_repository.update(
+                    catalogue_category_id, catalogue_category_in, session=session
+                )
+
+        return self._catalogue_category_repository.update(catalogue_category_id, catalogue_category_in)
 
     def delete(self, catalogue_category_id: str) -> None:
         """
@@ -179,10 +224,11 @@ class CatalogueCategoryService:
         :raises MissingRecordError: If a unit with the specified ID is not found.
         """
         logger.info("Adding unit values to the properties")
+        units = self._unit_repository.get_many([prop.unit_id for prop in properties if prop.unit_id is not None])
         properties_with_units = []
         for prop in properties:
             if prop.unit_id is not None:
-                unit = self._unit_repository.get(prop.unit_id)
+                unit = units.get(utils.normalise_object_id(prop.unit_id))
                 if not unit:
                     raise MissingRecordError(f"No unit found with ID '{prop.unit_id}'")
 
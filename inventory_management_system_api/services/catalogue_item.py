@@ -3,7 +3,7 @@ Module for providing a service for managing catalogue items using the `Catalogue
 repositories.
 """
 
-from typing import Annotated, Any, List, Optional
+from typing import Annotated, Any, Iterator, List, Optional
 
 from fastapi import Depends
 from pydantic import ValidationError
@@ -18,14 +18,17 @@ from inventory_management_system_api.core.consts import (
 from inventory_management_system_api.core.database import start_session_transaction
 from inventory_management_system_api.core.exceptions import (
     ChildElementsExistError,
+    DatabaseIntegrityError,
     InvalidActionError,
-    InvalidObjectIdError,
     MissingRecordError,
     NonLeafCatalogueCategoryError,
     ReplacementForObsoleteCatalogueItemError,
 )
+from inventory_management_system_api.core.filtering import Filter, Sort
 from inventory_management_system_api.core.object_storage_api_client import ObjectStorageAPIClient
+from inventory_management_system_api.models.catalogue_category import CatalogueCategoryOut
 from inventory_management_system_api.models.catalogue_item import CatalogueItemIn, CatalogueItemOut
+from inventory_management_system_api.models.manufacturer import ManufacturerOut
 from inventory_management_system_api.models.setting import SparesDefinitionOut
 from inventory_management_system_api.repositories.catalogue_category import CatalogueCategoryRepo
 from inventory_management_system_api.repositories.catalogue_item import CatalogueItemRepo
@@ -41,6 +44,84 @@ from inventory_management_system_api.schemas.validation import BulkValidationRes
 from inventory_management_system_api.services import utils
 
 
+class CatalogueItemReferences:
+    """
+    Existing records referenced by catalogue item creation data.
+
+    These are obtained for all of the data up front so that many catalogue items can be validated without querying the
+    database for each one. Lookups of values that are not valid IDs or names (e.g. `None` or an invalid type) find
+    nothing.
+    """
+
+    def __init__(
+        self,
+        catalogue_categories: dict[str, CatalogueCategoryOut],
+        manufacturers: dict[str, ManufacturerOut],
+        catalogue_items: dict[str, CatalogueItemOut],
+        duplicate_names: set[str],
+    ) -> None:
+        """
+        Initialise the `CatalogueItemReferences` with the records that have been obtained.
+
+        :param catalogue_categories: Dictionary of the referenced catalogue categories with their IDs as keys.
+        :param manufacturers: Dictionary of the referenced manufacturers with their IDs as keys.
+        :param catalogue_items: Dictionary of the referenced catalogue items with their IDs as keys.
+        :param duplicate_names: Set of the referenced names that are already used by existing catalogue items.
+        """
+        self._catalogue_categories = catalogue_categories
+        self._manufacturers = manufacturers
+        self._catalogue_items = catalogue_items
+        self._duplicate_names = duplicate_names
+
+    def get_catalogue_category(self, catalogue_category_id: Any) -> Optional[CatalogueCategoryOut]:
+        """
+        Retrieve a referenced catalogue category by its ID.
+
+        :param catalogue_category_id: The ID of the catalogue category to retrieve.
+        :return: The retrieved catalogue category, or `None` if not found.
+        """
+        return (
+            self._catalogue_categories.get(utils.normalise_object_id(catalogue_category_id))
+            if isinstance(catalogue_category_id, str)
+            else None
+        )
+
+    def get_manufacturer(self, manufacturer_id: Any) -> Optional[ManufacturerOut]:
+        """
+        Retrieve a referenced manufacturer by its ID.
+
+        :param manufacturer_id: The ID of the manufacturer to retrieve.
+        :return: The retrieved manufacturer, or `None` if not found.
+        """
+        return (
+            self._manufacturers.get(utils.normalise_object_id(manufacturer_id))
+            if isinstance(manufacturer_id, str)
+            else None
+        )
+
+    def get_catalogue_item(self, catalogue_item_id: Any) -> Optional[CatalogueItemOut]:
+        """
+        Retrieve a referenced catalogue item by its ID.
+
+        :param catalogue_item_id: The ID of the catalogue item to retrieve.
+        :return: The retrieved catalogue item, or `None` if not found.
+        """
+        return (
+            self._catalogue_items.get(utils.normalise_object_id(catalogue_item_id))
+            if isinstance(catalogue_item_id, str)
+            else None
+        )
+
+    def is_duplicate_name(self, name: Any) -> bool:
+        """
+        Check if a catalogue item with the same name already exists.
+
+        :param name: Name of the catalogue item to check for duplicates.
+        :return: `True` if a duplicate name is found.
+        """
+        return isinstance(name, str) and name in self._duplicate_names
+
+
 class CatalogueItemService:
     """
     Service for managing catalogue items.
@@ -83,8 +164,35 @@ class CatalogueItemService:
         :raises MissingRecordError: If the catalogue category does not exist, and/or the manufacturer does not exist
         :raises NonLeafCatalogueCategoryError: If the catalogue category is not a leaf category.
         """
+        references = self._get_create_references([catalogue_item.model_dump()])
+
+        # Obtain current spares definition to determine if the number of spares should be None (when its undefined)
+        # or 0 (when its defined)
+        spares_definition = self._setting_repository.get(SparesDefinitionOut, session=session)
+
+        return self._catalogue_item_repository.create(
+            self._create_catalogue_item_in(catalogue_item, references, spares_definition), session=session
+        )
+
+    def _create_catalogue_item_in(
+        self,
+        catalogue_item: CatalogueItemPostSchema,
+        references: CatalogueItemReferences,
+        spares_definition: Optional[SparesDefinitionOut],
+    ) -> CatalogueItemIn:
+        """
+        Performs the checks required to create a single catalogue item against prefetched references, returning the
+        catalogue item to insert.
+
+        :param catalogue_item: The catalogue item to be created.
+        :param references: Existing records referenced by the catalogue item, as obtained by `_get_create_references`.
+        :param spares_definition: The current spares definition (if any).
+        :return: The catalogue item to be inserted.
+        :raises MissingRecordError: If the catalogue category does not exist, and/or the manufacturer does not exist
+        :raises NonLeafCatalogueCategoryError: If the catalogue category is not a leaf category.
+        """
         catalogue_category_id = catalogue_item.catalogue_category_id
-        catalogue_category = self._catalogue_category_repository.get(catalogue_category_id)
+        catalogue_category = references.get_catalogue_category(catalogue_category_id)
         if not catalogue_category:
             raise MissingRecordError(f"No catalogue category found with ID '{catalogue_category_id}'")
 
@@ -92,12 +200,11 @@ class CatalogueItemService:
             raise NonLeafCatalogueCategoryError("Cannot add catalogue item to a non-leaf catalogue category")
 
         manufacturer_id = catalogue_item.manufacturer_id
-        manufacturer = self._manufacturer_repository.get(manufacturer_id)
-        if not manufacturer:
+        if not references.get_manufacturer(manufacturer_id):
             raise MissingRecordError(f"No manufacturer found with ID '{manufacturer_id}'")
 
         obsolete_replacement_catalogue_item_id = catalogue_item.obsolete_replacement_catalogue_item_id
-        if obsolete_replacement_catalogue_item_id and not self._catalogue_item_repository.get(
+        if obsolete_replacement_catalogue_item_id and not references.get_catalogue_item(
             obsolete_replacement_catalogue_item_id
         ):
             raise MissingRecordError(f"No catalogue item found with ID '{obsolete_replacement_catalogue_item_id}'")
@@ -106,55 +213,127 @@ class CatalogueItemService:
         supplied_properties = catalogue_item.properties if catalogue_item.properties else []
         supplied_properties = utils.process_properties(defined_properties, supplied_properties)
 
-        # Obtain current spares definition to determine if the number of spares should be None (when its undefined)
-        # or 0 (when its defined)
-        spares_definition = self._setting_repository.get(SparesDefinitionOut)
-
-        return self._catalogue_item_repository.create(
-            CatalogueItemIn(
-                **{
-                    **catalogue_item.model_dump(),
-                    "properties": supplied_properties,
-                },
-                number_of_spares=0 if spares_definition else None,
-            ),
-            session=session,
+        return CatalogueItemIn(
+            **{
+                **catalogue_item.model_dump(),
+                "properties": supplied_properties,
+            },
+            number_of_spares=0 if spares_definition else None,
         )
 
     def bulk_create(self, catalogue_items: List[CatalogueItemPostSchema]) -> List[CatalogueItemOut]:
         """
         Creates catalogue items in bulk.
 
-        Uses the single create method, but wrapped within a transaction so either all succeed or none do. Will
+        Performs the same checks as the single create method, but against references obtained for all of the catalogue
+        items up front, and then inserts them all at once within a transaction so either all succeed or none do. Will
         fail fast the moment it encounters an error, so for detailed information on what went wrong and where
-        `verify` should be used instead.
+        `bulk_validate_create` should be used instead.
 
         :param catalogue_items: The catalogue items to be created.
         :return: List of created catalogue items.
         """
-        created_catalogue_items = []
+        references = self._get_create_references([catalogue_item.model_dump() for catalogue_item in catalogue_items])
+
         with start_session_transaction("creating bulk catalogue items") as session:
-            for catalogue_item in catalogue_items:
-                created_catalogue_items.append(self.create(catalogue_item, session=session))
-        return created_catalogue_items
+            # Obtain current spares definition to determine if the number of spares should be None (when its undefined)
+            # or 0 (when its defined), using the session so that it is consistent with the insert
+            spares_definition = self._setting_repository.get(SparesDefinitionOut, session=session)
+
+            catalogue_items_in = [
+                self._create_catalogue_item_in(catalogue_item, references, spares_definition)
+                for catalogue_item in catalogue_items
+            ]
+            return self._catalogue_item_repository.create_many(catalogue_items_in, session=session)
 
-    def get(self, catalogue_item_id: str) -> Optional[CatalogueItemOut]:
+    def get(self, catalogue_item_id: str, fields: Optional[List[str]] = None) -> Optional[CatalogueItemOut]:
         """
         Retrieve a catalogue item by its ID.
 
         :param catalogue_item_id: The ID of the catalogue item to retrieve.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them.
         :return: The retrieved catalogue item, or `None` if not found.
         """
-        return self._catalogue_item_repository.get(catalogue_item_id)
+        return self._catalogue_item_repository.get(catalogue_item_id, fields=fields)
 
-    def list(self, catalogue_category_id: Optional[str]) -> List[CatalogueItemOut]:
+    # pylint:disable=too-many-arguments
+    # pylint:disable=too-many-positional-arguments
+    def list(
+        self,
+        catalogue_category_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> List[CatalogueItemOut]:
         """
         Retrieve all catalogue items.
 
         :param catalogue_category_id:  The ID of the catalogue category to filter catalogue items by.
+        :param limit: Maximum number of catalogue items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of catalogue items, or `None` to start from the first
+                       page.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them.
+        :param filters: Any additional filters to apply.
+        :param sort: Order to sort the catalogue items in, or `None` to use the default order.
         :return: A list of catalogue items, or an empty list if no catalogue items are retrieved.
         """
-        return self._catalogue_item_repository.list(catalogue_category_id)
+        return self._catalogue_item_repository.list(
+            catalogue_category_id, limit=limit, cursor=cursor, fields=fields, filters=filters, sort=sort
+        )
+
+    def stream(
+        self,
+        catalogue_category_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> Iterator[CatalogueItemOut]:
+        """
+        Lazily retrieve all catalogue items, retrieving them from the database as they are iterated over.
+
+        :param catalogue_category_id: The ID of the catalogue category to filter catalogue items by.
+        :param limit: Maximum number of catalogue items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of catalogue items, or `None` to start from the first
+                       page.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them.
+        :param filters: Any additional filters to apply.
+        :param sort: Order to sort the catalogue items in, or `None` to use the default order.
+        :return: Iterator of catalogue items.
+        """
+        return self._catalogue_item_repository.stream(
+            catalogue_category_id, limit=limit, cursor=cursor, fields=fields, filters=filters, sort=sort
+        )
+
+    def get_list_version(
+        self,
+        catalogue_category_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> str:
+        """
+        Retrieve the version of the list of catalogue items that `list` would return given the same filters.
+
+        :param catalogue_category_id: The ID of the catalogue category to filter catalogue items by.
+        :param limit: Maximum number of catalogue items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of catalogue items, or `None` to start from the first
+                       page.
+        :param filters: Any additional filters to apply.
+        :param sort: Order to sort the catalogue items in, or `None` to use the default order.
+        :return: Version of the list of catalogue items, which changes whenever any of them are created, modified or
+                 deleted.
+        """
+        return self._catalogue_item_repository.get_list_version(
+            catalogue_category_id, limit=limit, cursor=cursor, filters=filters, sort=sort
+        )
+
+    # pylint:enable=too-many-arguments
+    # pylint:enable=too-many-positional-arguments
 
     # pylint:disable=too-many-branches
     # pylint:disable=too-many-locals
@@ -171,6 +350,7 @@ class CatalogueItemService:
                                          entities, and there are child entities currently.
         :raises MissingRecordError: If the catalogue category doesn't exist.
         :raises NonLeafCatalogueCategoryError: If the catalogue category isn't a leaf category.
+        :raises DatabaseIntegrityError: If the catalogue category the catalogue item is currently in doesn't exist.
         :raises InvalidActionError: If moving the catalogue item between categories with different properties without
                                     explicitly specifying them.
         :raises MissingRecordError: If the manufacturer doesn't exist.
@@ -179,7 +359,7 @@ class CatalogueItemService:
         """
         update_data = catalogue_item.model_dump(exclude_unset=True)
 
-        stored_catalogue_item = self.get(catalogue_item_id)
+        stored_catalogue_item = self._catalogue_item_repository.get(catalogue_item_id)
         if not stored_catalogue_item:
             raise MissingRecordError(f"No catalogue item found with ID '{catalogue_item_id}'")
 
@@ -195,7 +375,16 @@ class CatalogueItemService:
             "catalogue_category_id" in update_data
             and catalogue_item.catalogue_category_id != stored_catalogue_item.catalogue_category_id
         ):
-            catalogue_category = self._catalogue_category_repository.get(catalogue_item.catalogue_category_id)
+            # When no properties are supplied the current catalogue category is also needed below, so obtain both
+            # at once
+            catalogue_category_ids = [catalogue_item.catalogue_category_id]
+            if "properties" not in update_data:
+                catalogue_category_ids.append(stored_catalogue_item.catalogue_category_id)
+            catalogue_categories = self._catalogue_category_repository.get_many(catalogue_category_ids)
+
+            catalogue_category = catalogue_categories.get(
+                utils.normalise_object_id(catalogue_item.catalogue_category_id)
+            )
             if not catalogue_category:
                 raise MissingRecordError(
                     f"No catalogue category found with ID '{catalogue_item.catalogue_category_id}'"
@@ -207,9 +396,11 @@ class CatalogueItemService:
             # If the catalogue category ID is updated but no catalogue item properties are supplied then we
             # only allow the item to be moved provided that the two categories expect exactly the same properties
             if "properties" not in update_data:
-                current_catalogue_category = self._catalogue_category_repository.get(
-                    stored_catalogue_item.catalogue_category_id
-                )
+                current_catalogue_category = catalogue_categories.get(stored_catalogue_item.catalogue_category_id)
+                if not current_catalogue_category:
+                    raise DatabaseIntegrityError(
+                        f"No catalogue category found with ID '{stored_catalogue_item.catalogue_category_id}'"
+                    )
 
                 # Ensure the properties are the same in every way ignoring the ids
                 invalid_action_error_message = (
@@ -289,8 +480,49 @@ class CatalogueItemService:
 
         self._catalogue_item_repository.delete(catalogue_item_id)
 
-    # pylint:disable=too-many-statements
-    def _validate_create(self, index: int, catalogue_item_data: dict[str, Any]) -> ValidationResultSchema:
+    def _get_create_references(
+        self, catalogue_items_data: List[dict[str, Any]], check_duplicate_names: bool = False
+    ) -> CatalogueItemReferences:
+        """
+        Obtains all of the existing records referenced by a set of catalogue item creation data using a single query
+        per collection.
+
+        :param catalogue_items_data: Catalogue items data to obtain the references of.
+        :param check_duplicate_names: Whether to also find which of the names are already used by existing catalogue
+                                      items.
+        :return: The referenced records.
+        """
+        catalogue_category_ids = utils.get_valid_object_ids(
+            catalogue_item_data.get("catalogue_category_id") for catalogue_item_data in catalogue_items_data
+        )
+        manufacturer_ids = utils.get_valid_object_ids(
+            catalogue_item_data.get("manufacturer_id") for catalogue_item_data in catalogue_items_data
+        )
+        obsolete_replacement_catalogue_item_ids = utils.get_valid_object_ids(
+            catalogue_item_data.get("obsolete_replacement_catalogue_item_id")
+            for catalogue_item_data in catalogue_items_data
+        )
+        duplicate_names: set[str] = set()
+        if check_duplicate_names:
+            names = list(
+                dict.fromkeys(
+                    catalogue_item_data["name"]
+                    for catalogue_item_data in catalogue_items_data
+                    if isinstance(catalogue_item_data.get("name"), str) and catalogue_item_data["name"]
+                )
+            )
+            duplicate_names = self._catalogue_item_repository.get_duplicate_names(names)
+
+        return CatalogueItemReferences(
+            catalogue_categories=self._catalogue_category_repository.get_many(catalogue_category_ids),
+            manufacturers=self._manufacturer_repository.get_many(manufacturer_ids),
+            catalogue_items=self._catalogue_item_repository.get_many(obsolete_replacement_catalogue_item_ids),
+            duplicate_names=duplicate_names,
+        )
+
+    def _validate_create(
+        self, index: int, catalogue_item_data: dict[str, Any], references: CatalogueItemReferences
+    ) -> ValidationResultSchema:
         """
         Performs validation of a single set of catalogue item creation data returning any errors.
 
@@ -299,6 +531,8 @@ class CatalogueItemService:
 
         :param index: Index of the catalogue item being validated.
         :param catalogue_item_data: Catalogue item data to verify.
+        :param references: Existing records referenced by the catalogue item data, as obtained by
+                           `_get_create_references`.
         :return: Schema containing the validation warnings/errors that been found within the data.
         """
         warnings = []
@@ -313,11 +547,8 @@ class CatalogueItemService:
         catalogue_category_id = catalogue_item_data.get("catalogue_category_id")
         catalogue_category = None
         if catalogue_category_id is not None:
-            try:
-                catalogue_category = self._catalogue_category_repository.get(catalogue_category_id)
-            except InvalidObjectIdError:
-                # Ignore invalid object ID, treat as missing
-                pass
+            # Invalid object IDs are treated as missing
+            catalogue_category = references.get_catalogue_category(catalogue_category_id)
             if catalogue_category is None:
                 errors.append(
                     utils.create_custom_validation_error_details(
@@ -341,15 +572,8 @@ class CatalogueItemService:
         # If defined, check obsolete replacement item exists
         obsolete_replacement_catalogue_item_id = catalogue_item_data.get("obsolete_replacement_catalogue_item_id")
         if obsolete_replacement_catalogue_item_id is not None:
-            obsolete_replacement_catalogue_item = None
-            try:
-                obsolete_replacement_catalogue_item = self._catalogue_item_repository.get(
-                    obsolete_replacement_catalogue_item_id
-                )
-            except InvalidObjectIdError:
-                # Ignore invalid object ID, treat as missing
-                pass
-            if obsolete_replacement_catalogue_item is None:
+            # Invalid object IDs are treated as missing
+            if references.get_catalogue_item(obsolete_replacement_catalogue_item_id) is None:
                 errors.append(
                     utils.create_custom_validation_error_details(
                         error_type=ERROR_TYPE_MISSING_RECORD,
@@ -362,13 +586,8 @@ class CatalogueItemService:
         # Check the manufacturer exists (if defined)
         manufacturer_id = catalogue_item_data.get("manufacturer_id")
         if manufacturer_id is not None:
-            manufacturer = None
-            try:
-                manufacturer = self._manufacturer_repository.get(manufacturer_id)
-            except InvalidObjectIdError:
-                # Ignore invalid object ID, treat as missing
-                pass
-            if not manufacturer:
+            # Invalid object IDs are treated as missing
+            if not references.get_manufacturer(manufacturer_id):
                 errors.append(
                     utils.create_custom_validation_error_details(
                         error_type=ERROR_TYPE_MISSING_RECORD,
@@ -380,7 +599,7 @@ class CatalogueItemService:
 
         # Check if the catalogue item is a duplicate
         if "name" in catalogue_item_data and catalogue_item_data["name"]:
-            if self._catalogue_item_repository.is_duplicate_name(catalogue_item_data["name"]):
+            if references.is_duplicate_name(catalogue_item_data["name"]):
                 warnings.append(
                     utils.create_custom_validation_error_details(
                         error_type=ERROR_TYPE_DUPLICATE_RECORD,
@@ -420,18 +639,20 @@ class CatalogueItemService:
             ).errors()
         return ValidationResultSchema(index=index, warnings=warnings, errors=errors)
 
-    # pylint:enable=too-many-statements
-
     def bulk_validate_create(self, catalogue_items_data: List[dict[str, Any]]) -> BulkValidationResultSchema:
         """
         Performs validation of bulk catalogue item creation data returning any errors.
 
+        Any existing records referenced by the data are obtained for all of the catalogue items up front, so the number
+        of database queries does not depend on the number of catalogue items being validated.
+
         :param catalogue_items_data: Catalogue items data to verify.
         :return: Schema containing the validation warnings/errors that been found within the data.
         """
+        references = self._get_create_references(catalogue_items_data, check_duplicate_names=True)
         return BulkValidationResultSchema(
             results=[
-                self._validate_create(index, catalogue_item_data)
+                self._validate_create(index, catalogue_item_data, references)
                 for index, catalogue_item_data in enumerate(catalogue_items_data)
             ]
         )
@@ -7,7 +7,7 @@ import logging
 import random
 import time
 from contextlib import contextmanager
-from typing import Annotated, Generator, List, Optional
+from typing import Annotated, Generator, Iterator, List, Optional, Tuple
 
 from fastapi import Depends
 from pymongo.client_session import ClientSession
@@ -22,6 +22,7 @@ from inventory_management_system_api.core.exceptions import (
     MissingRecordError,
     WriteConflictError,
 )
+from inventory_management_system_api.core.filtering import Filter, Sort
 from inventory_management_system_api.core.object_storage_api_client import ObjectStorageAPIClient
 from inventory_management_system_api.models.catalogue_item import PropertyOut
 from inventory_management_system_api.models.item import ItemIn, ItemOut
@@ -135,33 +136,204 @@ class ItemService:
         defined_properties = catalogue_category.properties
         properties = utils.process_properties(defined_properties, supplied_properties)
 
-        # Update number of spares when creating
-        with self._start_transaction_impacting_number_of_spares(
-            "creating item", catalogue_item_id, item.system_id
+        # Update the item counts and number of spares when creating
+        with self._start_transaction_impacting_item_counts(
+            "creating item", [(catalogue_item_id, None, system.type_id)], [item.system_id]
         ) as session:
             return self._item_repository.create(
-                ItemIn(**{**item.model_dump(), "properties": properties, "usage_status": usage_status.value}),
+                ItemIn(
+                    **{
+                        **item.model_dump(),
+                        "system_type_id": system.type_id,
+                        "properties": properties,
+                        "usage_status": usage_status.value,
+                    }
+                ),
                 session=session,
             )
 
-    def get(self, item_id: str) -> Optional[ItemOut]:
+    def bulk_create(self, items: List[ItemPostSchema], is_authorised: bool) -> List[ItemOut]:
+        """
+        Create multiple new items.
+
+        Performs the same checks as `create` for each of the items, but obtains the entities they reference using a
+        single query for each type of entity. All of the items are then created within a single transaction, during
+        which the item counts (and `number_of_spares` when a spares definition is set) of each of the affected catalogue
+        items are updated only once.
+
+        :param items: The items to be created.
+        :param is_authorised: Whether or not the user is authorised to bypass any creation rule checks.
+        :return: List of the created items in the same order as they were given.
+        :raises MissingRecordError: If a catalogue item does not exist.
+        :raises MissingRecordError: If a system does not exist.
+        :raises MissingRecordError: If a usage status does not exist.
+        :raises DatabaseIntegrityError: If the catalogue category of a catalogue item doesn't exist.
+        :raises InvalidActionError: If creating an item in a system with a usage status for which a creation rule does
+            not exist.
+        """
+        # Invalid IDs are left out of these lookups so that they are treated as missing
+        catalogue_items = self._catalogue_item_repository.get_many(
+            utils.get_valid_object_ids(item.catalogue_item_id for item in items)
+        )
+        catalogue_categories = self._catalogue_category_repository.get_many(
+            utils.get_valid_object_ids(
+                catalogue_item.catalogue_category_id for catalogue_item in catalogue_items.values()
+            )
+        )
+        systems = self._system_repository.get_many(utils.get_valid_object_ids(item.system_id for item in items))
+        usage_statuses = self._usage_status_repository.get_many(
+            utils.get_valid_object_ids(item.usage_status_id for item in items)
+        )
+        # Pairs of system type and usage status IDs for which a creation rule is known to exist
+        allowed_rules = set()
+
+        items_in = []
+        changes = []
+        dest_system_ids = []
+        for item in items:
+            catalogue_item = catalogue_items.get(utils.normalise_object_id(item.catalogue_item_id))
+            if not catalogue_item:
+                raise MissingRecordError(f"No catalogue item found with ID '{item.catalogue_item_id}'")
+
+            catalogue_category = catalogue_categories.get(catalogue_item.catalogue_category_id)
+            if not catalogue_category:
+                raise DatabaseIntegrityError(
+                    f"No catalogue category found with ID '{catalogue_item.catalogue_category_id}'"
+                )
+
+            system = systems.get(utils.normalise_object_id(item.system_id))
+            if not system:
+                raise MissingRecordError(f"No system found with ID '{item.system_id}'")
+
+            usage_status = usage_statuses.get(utils.normalise_object_id(item.usage_status_id))
+            if not usage_status:
+                raise MissingRecordError(f"No usage status found with ID '{item.usage_status_id}'")
+
+            # Bypass rule check if authorised
+            if not is_authorised and (system.type_id, item.usage_status_id) not in allowed_rules:
+                if not self._rule_repository.check_exists(
+                    src_system_type_id=None,
+                    dst_system_type_id=system.type_id,
+                    dst_usage_status_id=item.usage_status_id,
+                ):
+                    raise InvalidActionError(
+                        "No rule found for creating items in the specified system with the specified usage status"
+                    )
+                allowed_rules.add((system.type_id, item.usage_status_id))
+
+            supplied_properties = item.properties if item.properties else []
+            # Inherit the missing properties from the corresponding catalogue item
+            supplied_properties = self._merge_missing_properties(catalogue_item.properties, supplied_properties)
+            properties = utils.process_properties(catalogue_category.properties, supplied_properties)
+
+            items_in.append(
+                ItemIn(
+                    **{
+                        **item.model_dump(),
+                        "system_type_id": system.type_id,
+                        "properties": properties,
+                        "usage_status": usage_status.value,
+                    }
+                )
+            )
+            # Use the IDs as obtained from the database so that those given in a different case are grouped together
+            changes.append((catalogue_item.id, None, system.type_id))
+            dest_system_ids.append(system.id)
+
+        # Update the item counts of each catalogue item only once for all of the items being inserted
+        with self._start_transaction_impacting_item_counts("creating bulk items", changes, dest_system_ids) as session:
+            return self._item_repository.create_many(items_in, session=session)
+
+    def get(self, item_id: str, fields: Optional[List[str]] = None) -> Optional[ItemOut]:
         """
         Retrieve an item by its ID
 
         :param item_id: The ID of the item to retrieve
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them.
         :return: The retrieved item, or `None` if not found
         """
-        return self._item_repository.get(item_id)
+        return self._item_repository.get(item_id, fields=fields)
 
-    def list(self, system_id: Optional[str], catalogue_item_id: Optional[str]) -> List[ItemOut]:
+    # pylint:disable=too-many-arguments
+    # pylint:disable=too-many-positional-arguments
+    def list(
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> List[ItemOut]:
         """
         Get all items
 
         :param system_id: The ID of the system to filter items by.
         :param catalogue_item_id: The ID of the catalogue item to filter by.
+        :param limit: Maximum number of items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of items, or `None` to start from the first page.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them.
+        :param filters: Any additional filters to apply.
+        :param sort: Order to sort the items in, or `None` to use the default order.
         :return: list of all items
         """
-        return self._item_repository.list(system_id, catalogue_item_id)
+        return self._item_repository.list(
+            system_id, catalogue_item_id, limit=limit, cursor=cursor, fields=fields, filters=filters, sort=sort
+        )
+
+    def stream(
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> Iterator[ItemOut]:
+        """
+        Lazily get all items, retrieving them from the database as they are iterated over.
+
+        :param system_id: The ID of the system to filter items by.
+        :param catalogue_item_id: The ID of the catalogue item to filter by.
+        :param limit: Maximum number of items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of items, or `None` to start from the first page.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them.
+        :param filters: Any additional filters to apply.
+        :param sort: Order to sort the items in, or `None` to use the default order.
+        :return: Iterator of items.
+        """
+        return self._item_repository.stream(
+            system_id, catalogue_item_id, limit=limit, cursor=cursor, fields=fields, filters=filters, sort=sort
+        )
+
+    def get_list_version(
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        filters: Optional[List[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> str:
+        """
+        Get the version of the list of items that `list` would return given the same filters.
+
+        :param system_id: The ID of the system to filter items by.
+        :param catalogue_item_id: The ID of the catalogue item to filter by.
+        :param limit: Maximum number of items to return, or `None` to return all of them.
+        :param cursor: Cursor returned with the previous page of items, or `None` to start from the first page.
+        :param filters: Any additional filters to apply.
+        :param sort: Order to sort the items in, or `None` to use the default order.
+        :return: Version of the list of items, which changes whenever any of them are created, modified or deleted.
+        """
+        return self._item_repository.get_list_version(
+            system_id, catalogue_item_id, limit=limit, cursor=cursor, filters=filters, sort=sort
+        )
+
+    # pylint:enable=too-many-arguments
+    # pylint:enable=too-many-positional-arguments
 
     def update(self, item_id: str, item: ItemPatchSchema, is_authorised: bool) -> ItemOut:
         """
@@ -179,32 +351,40 @@ class ItemService:
         """
         update_data = item.model_dump(exclude_unset=True)
 
-        stored_item = self.get(item_id)
+        stored_item = self._item_repository.get(item_id)
         if not stored_item:
             raise MissingRecordError(f"No item found with ID '{item_id}'")
 
         if "catalogue_item_id" in update_data and item.catalogue_item_id != stored_item.catalogue_item_id:
             raise InvalidActionError("Cannot change the catalogue item the item belongs to")
 
-        moving_system = "system_id" in update_data and item.system_id != stored_item.system_id
+        moving_system = (
+            "system_id" in update_data and utils.normalise_object_id(item.system_id) != stored_item.system_id
+        )
 
         self._handle_system_and_usage_status_id_update(item, stored_item, update_data, moving_system, is_authorised)
         if "properties" in update_data:
             self._handle_properties_update(item, stored_item, update_data)
 
-        # Moving system could effect the number of spares of the catalogue item as the type of the system might be
-        # different
+        # Moving system could effect the item counts and number of spares of the catalogue item as the type of the
+        # system might be different
         if moving_system:
-            # Can't currently move items, so we can just write lock the stored catalogue item as opposed to checking
-            # the update data.
-            with self._start_transaction_impacting_number_of_spares(
-                "updating item", stored_item.catalogue_item_id, dest_system_id=item.system_id
+            # Can't currently move items between catalogue items, so we can just use the stored catalogue item as
+            # opposed to checking the update data.
+            with self._start_transaction_impacting_item_counts(
+                "updating item",
+                [(stored_item.catalogue_item_id, item_id, update_data["system_type_id"])],
+                dest_system_ids=[utils.normalise_object_id(item.system_id)],
             ) as session:
                 return self._item_repository.update(
                     item_id, ItemIn(**{**stored_item.model_dump(), **update_data}), session=session
                 )
 
-        return self._item_repository.update(item_id, ItemIn(**{**stored_item.model_dump(), **update_data}))
+        # The item counts of the catalogue item are only ever changed by the increments of a move, so the system must
+        # not be written back here in case the item was moved concurrently after it was obtained above
+        return self._item_repository.update(
+            item_id, ItemIn(**{**stored_item.model_dump(), **update_data}), update_system=False
+        )
 
     def delete(self, item_id: str, is_authorised: bool, access_token: Optional[str] = None) -> None:
         """
@@ -217,7 +397,7 @@ class ItemService:
         :raises DatabaseIntegrityError: If the system in which the item is currently located doesn't exist.
         :raises InvalidActionError: If deleting an item from the current system but a deletion rule does not exist.
         """
-        item = self.get(item_id)
+        item = self._item_repository.get(item_id)
         if item is None:
             raise MissingRecordError(f"No item found with ID '{item_id}'")
 
@@ -243,8 +423,11 @@ class ItemService:
             ObjectStorageAPIClient.delete_attachments(item_id, access_token)
             ObjectStorageAPIClient.delete_images(item_id, access_token)
 
-        # Deleting could effect the number of spares of the catalogue item if this one is currently a spare
-        with self._start_transaction_impacting_number_of_spares("deleting item", item.catalogue_item_id) as session:
+        # Deleting effects the item counts of the catalogue item and its number of spares if this one is currently a
+        # spare
+        with self._start_transaction_impacting_item_counts(
+            "deleting item", [(item.catalogue_item_id, item_id, None)]
+        ) as session:
             return self._item_repository.delete(item_id, session=session)
 
     def _handle_system_and_usage_status_id_update(
@@ -253,7 +436,8 @@ class ItemService:
         """
         Handle an update request that could modify the `system_id` or `usage_status_id` of the item.
 
-        Also inserts the new usage status value into `update_data` when updating the `usage_status_id`.
+        Also inserts the new usage status value into `update_data` when updating the `usage_status_id`, and the new
+        system type ID when moving the item between systems.
 
         :param item: Item containing the fields to be updated.
         :param stored_item: Current stored item from the database.
@@ -264,6 +448,7 @@ class ItemService:
                                     systems.
         :raises MissingRecordError: If the usage status doesn't exist.
         :raises MissingRecordError: If the system doesn't exist.
+        :raises DatabaseIntegrityError: If the system in which the item is currently located doesn't exist.
         :raises InvalidActionError: If moving the item between systems of different type and the moving rule doesn't
                                     exist.
         :raises InvalidActionError: If moving the item between systems of the same type and trying to change the usage
@@ -286,11 +471,14 @@ class ItemService:
             update_data["usage_status"] = usage_status.value
 
         if moving_system:
-            system = self._system_repository.get(item.system_id)
+            systems = self._system_repository.get_many([item.system_id, stored_item.system_id])
+            system = systems.get(utils.normalise_object_id(item.system_id))
             if not system:
                 raise MissingRecordError(f"No system found with ID '{item.system_id}'")
 
-            current_system = self._system_repository.get(stored_item.system_id)
+            current_system = systems.get(stored_item.system_id)
+            if not current_system:
+                raise DatabaseIntegrityError(f"No system found with ID '{stored_item.system_id}'")
 
             # Bypass rule check if authorised
             if current_system.type_id != system.type_id and not is_authorised:
@@ -309,6 +497,8 @@ class ItemService:
                     "Cannot change usage status of an item when moving between two systems of the same type"
                 )
 
+            update_data["system_type_id"] = system.type_id
+
     def _handle_properties_update(self, item: ItemPatchSchema, stored_item: ItemOut, update_data: dict) -> None:
         """
         Handle an update request that modifies the `properties` of the item.
@@ -365,89 +555,149 @@ class ItemService:
         return merged_properties
 
     @contextmanager
-    def _start_transaction_impacting_number_of_spares(
-        self, action_description: str, catalogue_item_id: str, dest_system_id: Optional[str] = None
-    ) -> Generator[Optional[ClientSession], None, None]:
+    def _start_transaction_impacting_item_counts(
+        self,
+        action_description: str,
+        changes: List[Tuple[str, Optional[str], Optional[str]]],
+        dest_system_ids: Optional[List[str]] = None,
+    ) -> Generator[ClientSession, None, None]:
         """
-        Handles recalculation of the `number_of_spares` field of a catalogue item for updates that will impact it but
-        only when there is a spares definition is set.
-
-        When necessary, starts a MongoDB session and transaction, then write locks the catalogue item before yielding to
-        allow an update to take place using the returned session. Once any tasks using the session context have finished
-        it will finish by recalculating the number of spares for the catalogue item before finishing the transaction.
-        This write lock prevents similar actions from occurring during the update to prevent an incorrect update e.g. if
-        another item was added between counting the documents and then updating the `number_of_spares` field it would
-        cause a miscount. It also ensures any action executed using the session will either fail or succeed with the
-        spares update.
+        Handles incremental updates of the per system type item counts of catalogue items, along with their
+        `number_of_spares` field when there is a spares definition set, for updates that will impact them.
+
+        Each change is classified as moving an item out of a system of one system type and into a system of another.
+        Starts a MongoDB session and transaction, then atomically increments the item counts (and number of spares) of
+        each of the affected catalogue items by the overall difference before yielding to allow an update to take place
+        using the returned session. The increment also write locks the catalogue items until the end of the
+        transaction so that any action executed using the session will either fail or succeed with the count updates,
+        while the time they are locked for stays constant regardless of how many items are in the catalogue item. A full
+        recount can be performed using `SettingService.recalculate_item_counts` should the values ever need repairing.
+
+        The system type any existing items are being moved out of is obtained from the items as stored at the start of
+        each attempt of the transaction, rather than as they were when the change was validated. Should the item be
+        moved or deleted by another request in the meantime, the classification then reflects the item being moved or
+        deleted by this one, while any conflicting changes made after the transaction starts cause a write conflict
+        that aborts the increments along with the update itself.
 
         :param action_description: Description of what the contents of the transaction is doing so it can be used in
                                    any logging or raise errors.
-        :param catalogue_item_id: ID of the effected catalogue item which will need its `number_of_spares` field
-                                  updating.
-        :param dest_system_id: ID of the system being put in/moved to (if applicable). Will be write locked to prevent
-                               editing of system type after counting spares to avoid miscounts.
+        :param changes: List of tuples containing the catalogue item ID, the ID of the existing item being moved or
+                        deleted (or `None` when creating) and the system type ID of the system the item is being put
+                        in/moved to (or `None` when deleting) for each item being changed.
+        :param dest_system_ids: IDs of the systems being put in/moved to (if applicable). Will be write locked to
+                                prevent editing of system type during the transaction to avoid miscounts.
+        :raises MissingRecordError: If any of the existing items no longer exist.
         """
 
-        # Use ObjectIDs from here on to avoid unnecessary conversions particularly for when we set the spares definition
-        catalogue_item_id = CustomObjectId(catalogue_item_id)
-
-        # Firstly obtain the spares definition to figure out if it is defined or not
-        spares_definition = self._setting_repository.get(SparesDefinitionOut)
-
-        if spares_definition is None:
-            # No session/transaction is needed as there is no spares update to perform
-            yield None
-        else:
-            # Particularly when creating multiple items within the same catalogue item in quick succession, multiple
-            # conflicting requests can occur. To reduce the chances we retry such requests so that the default 5ms
-            # transaction timeout is less of an issue.
-            start_time = time.perf_counter()
-            retry = True
-            num_attempts = 0
-            while retry:
-                try:
-                    with start_session_transaction(action_description) as session:
-                        num_attempts += 1
-
-                        # Write lock the catalogue item to prevent any other updates from occurring during the rest of
-                        # the transaction
-                        self._catalogue_item_repository.update_number_of_spares(
-                            catalogue_item_id, None, session=session
-                        )
-
-                        # Write lock the destination system
-                        # This will prevent the case where a system has no items currently, allowing the system type to
-                        # be modified after the count but before the update finishes and instead force conflicts with
-                        # system type modifications.
-                        if dest_system_id:
-                            self._system_repository.write_lock(dest_system_id, session)
-
-                        # Allow any other updates to occur using the same session
-                        yield session
+        dest_system_ids = list(dict.fromkeys(dest_system_ids)) if dest_system_ids else []
+
+        # Particularly when creating multiple items within the same catalogue item in quick succession, multiple
+        # conflicting requests can occur. To reduce the chances we retry such requests so that the default 5ms
+        # transaction timeout is less of an issue.
+        start_time = time.perf_counter()
+        retry = True
+        num_attempts = 0
+        while retry:
+            try:
+                with start_session_transaction(action_description) as session:
+                    num_attempts += 1
+
+                    # The number of spares is derived from the item counts of the system types in the spares
+                    # definition (if any). Read it using the session rather than from the cache so it is consistent with
+                    # the catalogue items being incremented, as any change to it made after the transaction starts then
+                    # conflicts with the increments instead of the wrong system types being counted.
+                    spares_definition = self._setting_repository.get(SparesDefinitionOut, session=session)
+                    spares_system_type_ids = (
+                        {system_type.id for system_type in spares_definition.system_types}
+                        if spares_definition
+                        else None
+                    )
 
-                        # Obtain and update the number of spares
-                        logger.info(
-                            "Updating the number of spares of the catalogue item with ID '%s'", catalogue_item_id
+                    item_counts_changes = self._compute_item_counts_changes(changes, session)
+
+                    # Update the item counts first so that the catalogue items are write locked to prevent any other
+                    # updates from occurring during the rest of the transaction
+                    for catalogue_item_id, catalogue_item_changes in item_counts_changes.items():
+                        number_of_spares_change = (
+                            sum(
+                                change
+                                for system_type_id, change in catalogue_item_changes.items()
+                                if system_type_id in spares_system_type_ids
+                            )
+                            if spares_system_type_ids is not None
+                            else None
                         )
-                        number_of_spares = self._item_repository.count_in_catalogue_item_with_system_type_one_of(
+                        logger.info(
+                            "Changing the item counts of the catalogue item with ID '%s' by %s",
                             catalogue_item_id,
-                            [CustomObjectId(system_type.id) for system_type in spares_definition.system_types],
-                            session=session,
+                            catalogue_item_changes,
                         )
-                        self._catalogue_item_repository.update_number_of_spares(
-                            catalogue_item_id, number_of_spares, session=session
+                        self._catalogue_item_repository.increment_item_counts(
+                            CustomObjectId(catalogue_item_id),
+                            catalogue_item_changes,
+                            number_of_spares_change,
+                            session=session,
                         )
 
-                    # Successful completion, log time take and number of attempts for debugging if we get reports of
-                    # conflicts
-                    retry = False
-                    logger.info("Transaction time taken: %s", time.perf_counter() - start_time)
-                    logger.info("Transaction number of attempts: %s", num_attempts)
-                except WriteConflictError as exc:
-                    # Keep retrying, but only if we have been retrying for less than 5 seconds so we dont let the
-                    # request take too long and leave potential for it to block other requests if the threadpool is full
-                    if time.perf_counter() - start_time > 30:
-                        raise exc
-                    # Wait some random time as there is no point in retrying immediately if we are already write
-                    # locked. Between 100ms and 500ms.
-                    time.sleep(random.uniform(0.1, 0.5))
+                    # Write lock the destination systems
+                    # This will prevent the case where a system has no items currently, allowing the system type to
+                    # be modified after the change is classified but before the update finishes and instead force
+                    # conflicts with system type modifications.
+                    for dest_system_id in dest_system_ids:
+                        self._system_repository.write_lock(dest_system_id, session)
+
+                    # Allow any other updates to occur using the same session
+                    yield session
+
+                # Successful completion, log time take and number of attempts for debugging if we get reports of
+                # conflicts
+                retry = False
+                logger.info("Transaction time taken: %s", time.perf_counter() - start_time)
+                logger.info("Transaction number of attempts: %s", num_attempts)
+            except WriteConflictError as exc:
+                # Keep retrying, but only if we have been retrying for less than 5 seconds so we dont let the
+                # request take too long and leave potential for it to block other requests if the threadpool is full
+                if time.perf_counter() - start_time > 30:
+                    raise exc
+                # Wait some random time as there is no point in retrying immediately if we are already write
+                # locked. Between 100ms and 500ms.
+                time.sleep(random.uniform(0.1, 0.5))
+
+    def _compute_item_counts_changes(
+        self, changes: List[Tuple[str, Optional[str], Optional[str]]], session: ClientSession
+    ) -> dict[str, dict[str, int]]:
+        """
+        Works out the overall change in the per system type item counts of each catalogue item for the given changes.
+
+        :param changes: List of tuples containing the catalogue item ID, the ID of the existing item being moved or
+                        deleted (or `None` when creating) and the system type ID of the system the item is being put
+                        in/moved to (or `None` when deleting) for each item being changed.
+        :param session: PyMongo ClientSession of the transaction the changes are being made in, used to obtain the
+                        current system type of any existing items.
+        :raises MissingRecordError: If any of the existing items no longer exist.
+        :return: Dictionary of the changes in the item counts (themselves keyed by the IDs of the system types) with the
+                 catalogue item IDs as keys. Any that end up unchanged are left out as they don't need updating or
+                 write locking.
+        """
+
+        item_counts_changes: dict[str, dict[str, int]] = {}
+        for catalogue_item_id, item_id, dst_system_type_id in changes:
+            src_system_type_id = None
+            if item_id is not None:
+                stored_item = self._item_repository.get(item_id, session=session)
+                if not stored_item:
+                    raise MissingRecordError(f"No item found with ID '{item_id}'")
+                src_system_type_id = stored_item.system_type_id
+
+            catalogue_item_changes = item_counts_changes.setdefault(catalogue_item_id, {})
+            for system_type_id, change in ((src_system_type_id, -1), (dst_system_type_id, 1)):
+                if system_type_id is not None:
+                    catalogue_item_changes[system_type_id] = catalogue_item_changes.get(system_type_id, 0) + change
+
+        for catalogue_item_id, catalogue_item_changes in list(item_counts_changes.items()):
+            for system_type_id, change in list(catalogue_item_changes.items()):
+                if change == 0:
+                    del catalogue_item_changes[system_type_id]
+            if not catalogue_item_changes:
+                del item_counts_changes[catalogue_item_id]
+        return item_counts_changes
@@ -7,6 +7,8 @@ from typing import Annotated, Callable, Iterable, Optional
 
 from fastapi import Depends
 
+from inventory_management_system_api.core.consts import BULK_WRITE_BATCH_SIZE
+from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.database import start_session_transaction
 from inventory_management_system_api.core.exceptions import InvalidActionError, MissingRecordError
 from inventory_management_system_api.models.setting import (
@@ -48,17 +50,15 @@ class SettingService:
         self._catalogue_item_repository = catalogue_item_repository
         self._item_repository = item_repository
 
-    def set_spares_definition(
-        self, spares_definition: SparesDefinitionIn, tracker: Optional[Callable[[Iterable], Iterable]] = None
-    ) -> SparesDefinitionOut:
+    def set_spares_definition(self, spares_definition: SparesDefinitionIn) -> SparesDefinitionOut:
         """
         Sets the spares definition to a new value.
 
-        No write locks are used on the catalogue items, it is assumed that the system should be in a state where users
-        are not able to access the API and no requests are currently in progress.
+        The `number_of_spares` of every catalogue item is derived from its existing per system type item counts, so no
+        items need to be scanned. No write locks are used on the catalogue items, it is assumed that the system should
+        be in a state where users are not able to access the API and no requests are currently in progress.
 
         :param spares_definition: New spares definition.
-        :param tracker: Tracker function to use for tracking progress e.g. Rich's track function.
         :return: Updated spares definition.
         :raises MissingRecordError: If any of the system types specified by the given IDs don't exist.
         :raises InvalidActionError: If the spares definition conflicts with the in use one.
@@ -66,8 +66,11 @@ class SettingService:
 
         # Ensure all the given system types exist and don't conflict with any existing in use definition
         in_use_definition = self.get_in_use_definition()
+        system_types = self._system_type_repository.get_many(
+            [str(system_type_id) for system_type_id in spares_definition.system_type_ids]
+        )
         for system_type_id in spares_definition.system_type_ids:
-            if not self._system_type_repository.get(str(system_type_id)):
+            if str(system_type_id) not in system_types:
                 raise MissingRecordError(f"No system type found with ID '{system_type_id}'")
             if in_use_definition is not None and any(
                 in_use_system_type.id == str(system_type_id) for in_use_system_type in in_use_definition.system_types
@@ -85,22 +88,48 @@ class SettingService:
                 spares_definition, SparesDefinitionOut, session=session
             )
 
-            # Obtain a list of all catalogue item ids (all will need a recount)
-            catalogue_item_ids = self._catalogue_item_repository.list_ids()
+            self._catalogue_item_repository.update_all_number_of_spares_from_item_counts(
+                spares_definition.system_type_ids, session=session
+            )
+
+            return new_spares_definition
+
+    def recalculate_item_counts(self, tracker: Optional[Callable[[Iterable], Iterable]] = None) -> None:
+        """
+        Recalculates the per system type item counts of all catalogue items from scratch, along with their
+        `number_of_spares` field when there is a spares definition set.
+
+        The item counts are otherwise maintained incrementally as items are created, moved and deleted, so this is only
+        needed to repair the values should they ever become incorrect. Like `set_spares_definition` it is assumed that
+        users are not able to access the API while this is in progress.
 
-            # Recalculate the number of spares for each catalogue item
-            logger.info("Updating the number of spares for all catalogue items")
-            for catalogue_item_id in catalogue_item_ids if tracker is None else tracker(catalogue_item_ids):
-                number_of_spares = self._item_repository.count_in_catalogue_item_with_system_type_one_of(
-                    catalogue_item_id,
-                    spares_definition.system_type_ids,
+        :param tracker: Tracker function to use for tracking progress e.g. Rich's track function.
+        """
+
+        with start_session_transaction("recalculating item counts") as session:
+            # Read using the session rather than from the cache so the number of spares is derived from the definition
+            # that is current when the counts are taken
+            spares_definition = self._setting_repository.get(SparesDefinitionOut, session=session)
+
+            # Count the items of every catalogue item at once (catalogue items without any are not included)
+            logger.info("Updating the item counts for all catalogue items")
+            item_counts = list(self._item_repository.count_by_catalogue_item_and_system_type(session=session).items())
+
+            # Clear first so that catalogue items without any items are also updated, then update the rest in batches
+            # to keep the size of each request down
+            self._catalogue_item_repository.update_all_item_counts({}, session=session)
+            batches = [
+                dict(item_counts[index : index + BULK_WRITE_BATCH_SIZE])
+                for index in range(0, len(item_counts), BULK_WRITE_BATCH_SIZE)
+            ]
+            for batch in batches if tracker is None else tracker(batches):
+                self._catalogue_item_repository.update_many_item_counts(batch, session=session)
+
+            if spares_definition is not None:
+                self._catalogue_item_repository.update_all_number_of_spares_from_item_counts(
+                    [CustomObjectId(system_type.id) for system_type in spares_definition.system_types],
                     session=session,
                 )
-                self._catalogue_item_repository.update_number_of_spares(
-                    catalogue_item_id, number_of_spares, session=session
-                )
-
-            return new_spares_definition
 
     def get_spares_definition(self) -> Optional[SparesDefinitionOut]:
         """
@@ -122,8 +151,11 @@ class SettingService:
 
         # Ensure all the given system types exist and don't conflict with any existing spares definition
         spares_definition = self.get_spares_definition()
+        system_types = self._system_type_repository.get_many(
+            [str(system_type_id) for system_type_id in in_use_definition.system_type_ids]
+        )
         for system_type_id in in_use_definition.system_type_ids:
-            if not self._system_type_repository.get(str(system_type_id)):
+            if str(system_type_id) not in system_types:
                 raise MissingRecordError(f"No system type found with ID '{system_type_id}'")
             if spares_definition is not None and any(
                 in_use_system_type.id == str(system_type_id) for in_use_system_type in spares_definition.system_types
@@ -3,7 +3,7 @@ Module for providing a service for managing systems using the `SystemRepo` repos
 """
 
 from contextlib import contextmanager
-from typing import Annotated, Generator, List, Optional
+from typing import Annotated, Generator, Iterator, List, Optional
 
 from fastapi import Depends
 from pymongo.client_session import ClientSession
@@ -16,9 +16,7 @@ from inventory_management_system_api.core.exceptions import (
     MissingRecordError,
 )
 from inventory_management_system_api.core.object_storage_api_client import ObjectStorageAPIClient
-from inventory_management_system_api.models.setting import SparesDefinitionOut
 from inventory_management_system_api.models.system import SystemIn, SystemOut
-from inventory_management_system_api.repositories.setting import SettingRepo
 from inventory_management_system_api.repositories.system import SystemRepo
 from inventory_management_system_api.repositories.system_type import SystemTypeRepo
 from inventory_management_system_api.schemas.breadcrumbs import BreadcrumbsGetSchema
@@ -35,7 +33,6 @@ class SystemService:
         self,
         system_repository: Annotated[SystemRepo, Depends(SystemRepo)],
         system_type_repository: Annotated[SystemTypeRepo, Depends(SystemTypeRepo)],
-        setting_repository: Annotated[SettingRepo, Depends(SettingRepo)],
     ) -> None:
         """
         Initialise the `SystemService` with a `SystemRepo` repository.
@@ -45,7 +42,6 @@ class SystemService:
         """
         self._system_repository = system_repository
         self._system_type_repository = system_type_repository
-        self._setting_repository = setting_repository
 
     def create(self, system: SystemPostSchema) -> SystemOut:
         """
@@ -74,14 +70,15 @@ class SystemService:
             )
         )
 
-    def get(self, system_id: str) -> Optional[SystemOut]:
+    def get(self, system_id: str, fields: Optional[List[str]] = None) -> Optional[SystemOut]:
         """
         Retrieve a system by its ID.
 
         :param system_id: ID of the system to retrieve.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them.
         :return: Retrieved system or `None` if not found.
         """
-        return self._system_repository.get(system_id)
+        return self._system_repository.get(system_id, fields=fields)
 
     def get_breadcrumbs(self, system_id: str) -> BreadcrumbsGetSchema:
         """
@@ -92,14 +89,56 @@ class SystemService:
         """
         return self._system_repository.get_breadcrumbs(system_id)
 
-    def list(self, parent_id: Optional[str]) -> List[SystemOut]:
+    def get_many_breadcrumbs(self, system_ids: List[str]) -> dict[str, BreadcrumbsGetSchema]:
+        """
+        Retrieve the breadcrumbs for multiple systems.
+
+        :param system_ids: IDs of the systems to retrieve breadcrumbs for.
+        :return: Dictionary of the breadcrumbs with the IDs of the systems as keys. Any that were not found (or are
+                 invalid) are omitted.
+        """
+        return self._system_repository.get_many_breadcrumbs(utils.get_valid_object_ids(system_ids))
+
+    def get_tree(self, system_id: str, max_depth: Optional[int] = None) -> List[SystemOut]:
+        """
+        Retrieve a system along with all of its descendants.
+
+        :param system_id: ID of the system at the top of the tree.
+        :param max_depth: Maximum depth of the descendants to retrieve relative to the system, or `None` to retrieve all
+                          of them.
+        :return: List containing the system followed by its descendants, ordered from the top of the tree down.
+        """
+        return self._system_repository.get_tree(system_id, max_depth=max_depth)
+
+    def list(self, parent_id: Optional[str], fields: Optional[List[str]] = None) -> List[SystemOut]:
         """
         Retrieve systems based on the provided filters.
 
         :param parent_id: ID of the parent system to query by, or `None`.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them.
         :return: List of systems or an empty list if no systems are retrieved.
         """
-        return self._system_repository.list(parent_id)
+        return self._system_repository.list(parent_id, fields=fields)
+
+    def stream(self, parent_id: Optional[str], fields: Optional[List[str]] = None) -> Iterator[SystemOut]:
+        """
+        Lazily retrieve systems based on the provided filters, retrieving them from the database as they are iterated
+        over.
+
+        :param parent_id: ID of the parent system to query by, or `None`.
+        :param fields: List of the fields to retrieve, or `None` to retrieve all of them.
+        :return: Iterator of systems.
+        """
+        return self._system_repository.stream(parent_id, fields=fields)
+
+    def get_list_version(self, parent_id: Optional[str]) -> str:
+        """
+        Retrieve the version of the list of systems that `list` would return given the same filters.
+
+        :param parent_id: ID of the parent system to query by, or `None`.
+        :return: Version of the list of systems, which changes whenever any of them are created, modified or deleted.
+        """
+        return self._system_repository.get_list_version(parent_id)
 
     def update(self, system_id: str, system: SystemPatchSchema) -> SystemOut:
         """
@@ -112,7 +151,7 @@ class SystemService:
         :raises MissingRecordError: If the system type specified by `type_id` doesn't exist.
         :raises InvalidActionError: When attempting to change the system type while the system has child elements.
         """
-        stored_system = self.get(system_id)
+        stored_system = self._system_repository.get(system_id)
         if not stored_system:
             raise MissingRecordError(f"No system found with ID '{system_id}'")
 
@@ -121,7 +160,7 @@ class SystemService:
         if "name" in update_data and system.name != stored_system.name:
             update_data["code"] = utils.generate_code(system.name, "system")
 
-        with self._start_transaction_effected_by_spares_calculation(
+        with self._start_update_transaction(
             "updating system", system_id, system, stored_system, update_data
         ) as session:
             # Perform this validation after any potential write lock to ensure no further updates occur after
@@ -157,7 +196,7 @@ class SystemService:
     # pylint:disable=too-many-arguments
     # pylint:disable=too-many-positional-arguments
     @contextmanager
-    def _start_transaction_effected_by_spares_calculation(
+    def _start_update_transaction(
         self,
         action_description: str,
         system_id: str,
@@ -166,21 +205,20 @@ class SystemService:
         update_data: dict,
     ) -> Generator[Optional[ClientSession], None, None]:
         """
-        Handles write locking to prevent unintended impacts to spares calculations.
+        Starts a MongoDB session and transaction when necessary for an update, write locking the system when needed to
+        prevent unintended impacts to the item counts of catalogue items.
 
-        When necessary starts a MongoDB session and transaction, then write locks the system before yielding to allow
-        an update to take place using the returned session. This transaction and write lock is only performed in the
-        specific case when:
-        1. The spares definition is defined.
-        2. The `type_id` is being changed.
+        A transaction is needed when the system is being moved so that the `ancestor_ids` of all of its descendants are
+        updated atomically with it, or when the `type_id` is being changed. In the latter case the system is also write
+        locked before yielding to allow the update to take place using the returned session.
 
         This in-turn prevents the following issue:
-        1. You have a spares definition defined and move an item to a system with nothing currently in it.
-        2. Another request changes the system type of the system, after the spares have been recounted but before the
-           update is complete.
+        1. You move an item to a system with nothing currently in it.
+        2. Another request changes the system type of the system, after the item counts have been updated but before
+           the update is complete.
         3. The request succeeds because the transaction for the move hasn't completed, so the system is still empty.
-        4. This leads to a miscalculation of spares. Instead here we force a conflict in such a case instead so the
-           update fails when there is an ongoing move.
+        4. This leads to a miscalculation of item counts (and spares). Instead here we force a conflict in such a case
+           instead so the update fails when there is an ongoing move.
 
         :param action_description: Description of what the contents of the transaction is doing so it can be used in
                                    any logging or raise errors.
@@ -190,23 +228,18 @@ class SystemService:
         :param update_data: Dictionary containing the update data.
         """
 
-        # Firstly obtain the spares definition to figure out if it is defined or not
-        spares_definition = self._setting_repository.get(SparesDefinitionOut)
+        moving_system = "parent_id" in update_data and system.parent_id != stored_system.parent_id
+        # Only need to conflict with an item count update when the type is being changed
+        changing_type = "type_id" in update_data and system.type_id != stored_system.type_id
 
-        type_id_changing = "type_id" in update_data and system.type_id != stored_system.type_id
-
-        if (
-            # No spares definition => Can't have any spares calculation
-            spares_definition is None
-            # Only need to conflict with a spares update when the type is being changed
-            or not type_id_changing
-        ):
-            yield None
-        else:
+        if moving_system or changing_type:
             with start_session_transaction(action_description) as session:
-                self._system_repository.write_lock(system_id, session)
+                if changing_type:
+                    self._system_repository.write_lock(system_id, session)
 
                 yield session
+        else:
+            yield None
 
     # pylint:enable=too-many-arguments
     # pylint:enable=too-many-positional-arguments
@@ -5,8 +5,9 @@ Collection of some utility functions used by services
 import logging
 import re
 from copy import deepcopy
-from typing import Any, Callable, Dict, List, LiteralString, Optional, Type, Union, cast
+from typing import Any, Callable, Dict, Iterable, List, LiteralString, Optional, Type, Union, cast
 
+from bson import ObjectId
 from pydantic_core import InitErrorDetails, PydanticCustomError
 
 from inventory_management_system_api.core.consts import (
@@ -56,6 +57,32 @@ def make_process_and_add_error(errors: List[InitErrorDetails]) -> ProcessErrorFu
     return process_and_add_error
 
 
+def normalise_object_id(value: Any) -> Any:
+    """
+    Normalises a value that is a valid `ObjectId` string into the lowercase form the IDs of entities obtained from the
+    database have, so that it can be used to look them up by ID e.g. in the results of a `get_many`.
+
+    :param value: Value to normalise.
+    :return: The normalised `ObjectId` string, or the value unchanged if it isn't a valid `ObjectId` string.
+    """
+    return str(ObjectId(value)) if isinstance(value, str) and ObjectId.is_valid(value) else value
+
+
+def get_valid_object_ids(values: Iterable[Any]) -> List[str]:
+    """
+    Obtains the unique values that are valid `ObjectId` strings, ignoring any others (e.g. `None` or invalid IDs).
+
+    :param values: Values to filter.
+    :return: List of the unique valid `ObjectId` strings, normalised using `normalise_object_id`, in the order they were
+             first found.
+    """
+    return list(
+        dict.fromkeys(
+            normalise_object_id(value) for value in values if isinstance(value, str) and ObjectId.is_valid(value)
+        )
+    )
+
+
 def generate_code(name: str, entity_type: str) -> str:
     """
     Generate a code for an entity based on its name. This is used to maintain uniqueness and prevent
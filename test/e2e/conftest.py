@@ -15,6 +15,7 @@ import pytest
 from fastapi.testclient import TestClient
 from httpx import Response
 
+from inventory_management_system_api.core.change_streams import change_stream_watcher
 from inventory_management_system_api.core.database import get_database
 from inventory_management_system_api.main import app
 
@@ -52,6 +53,8 @@ def fixture_cleanup_database_collections():
     database.rules.delete_many({})
     # Insert predefined rules
     database.rules.insert_many(RULES_DOCUMENT_DATA)
+    # Ensure no cached data remains for the next test
+    change_stream_watcher.notify()
 
 
 def replace_unit_values_with_ids_in_properties(properties_without_ids: list[dict], units: Optional[list]) -> list[dict]:
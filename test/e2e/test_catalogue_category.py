@@ -34,7 +34,7 @@ import pytest
 from bson import ObjectId
 from httpx import Response
 
-from inventory_management_system_api.core.consts import BREADCRUMBS_TRAIL_MAX_LENGTH
+from inventory_management_system_api.core.consts import BREADCRUMBS_BATCH_MAX_IDS, BREADCRUMBS_TRAIL_MAX_LENGTH
 from inventory_management_system_api.schemas.catalogue_category import CATALOGUE_CATEGORY_WITH_CHILD_NON_EDITABLE_FIELDS
 
 
@@ -361,15 +361,18 @@ class GetDSL(CreateDSL):
 
     _get_response_catalogue_category: Response
 
-    def get_catalogue_category(self, catalogue_category_id: str) -> None:
+    def get_catalogue_category(self, catalogue_category_id: str, etag: Optional[str] = None) -> None:
         """
         Gets a catalogue category with the given ID.
 
         :param catalogue_category_id: ID of the catalogue category to be obtained.
+        :param etag: ETag of a previously obtained version of the catalogue category to only obtain it if it has since
+                     changed, or `None` to always obtain it.
         """
 
         self._get_response_catalogue_category = self.test_client.get(
-            f"/v1/catalogue-categories/{catalogue_category_id}"
+            f"/v1/catalogue-categories/{catalogue_category_id}",
+            headers={"If-None-Match": etag} if etag is not None else None,
         )
 
     def check_get_catalogue_category_success(self, expected_catalogue_category_get_data: dict) -> None:
@@ -387,6 +390,18 @@ class GetDSL(CreateDSL):
             expected_catalogue_category_get_data, self.unit_value_id_dict
         )
 
+    def check_get_catalogue_category_not_modified(self, expected_etag: str) -> None:
+        """
+        Checks that a prior call to `get_catalogue_category` or `get_catalogue_categories` gave an empty response
+        indicating the data had not been modified.
+
+        :param expected_etag: ETag expected to be returned (i.e. the one given in the request).
+        """
+
+        assert self._get_response_catalogue_category.status_code == 304
+        assert self._get_response_catalogue_category.headers["ETag"] == expected_etag
+        assert self._get_response_catalogue_category.content == b""
+
     def check_get_catalogue_category_failed_with_detail(self, status_code: int, detail: str) -> None:
         """
         Checks that a prior call to `get_catalogue_category` gave a failed response with the expected code and error
@@ -411,6 +426,29 @@ class TestGet(GetDSL):
         self.get_catalogue_category(catalogue_category_id)
         self.check_get_catalogue_category_success(CATALOGUE_CATEGORY_GET_DATA_LEAF_NO_PARENT_WITH_PROPERTIES_MM)
 
+    def test_get_with_matching_etag(self):
+        """Test getting a catalogue category that hasn't been modified since it was last obtained."""
+
+        catalogue_category_id = self.post_catalogue_category(CATALOGUE_CATEGORY_POST_DATA_NON_LEAF_REQUIRED_VALUES_ONLY)
+        self.get_catalogue_category(catalogue_category_id)
+        etag = self._get_response_catalogue_category.headers["ETag"]
+
+        self.get_catalogue_category(catalogue_category_id, etag=etag)
+        self.check_get_catalogue_category_not_modified(etag)
+
+    def test_get_with_outdated_etag(self):
+        """Test getting a catalogue category that has been modified since it was last obtained."""
+
+        catalogue_category_id = self.post_catalogue_category(CATALOGUE_CATEGORY_POST_DATA_NON_LEAF_REQUIRED_VALUES_ONLY)
+        self.get_catalogue_category(catalogue_category_id)
+        etag = self._get_response_catalogue_category.headers["ETag"]
+        self.test_client.patch(f"/v1/catalogue-categories/{catalogue_category_id}", json={"name": "New name"})
+
+        self.get_catalogue_category(catalogue_category_id, etag=etag)
+        assert self._get_response_catalogue_category.status_code == 200
+        assert self._get_response_catalogue_category.json()["name"] == "New name"
+        assert self._get_response_catalogue_category.headers["ETag"] != etag
+
     def test_get_with_non_existent_id(self):
         """Test getting a catalogue category with a non-existent ID."""
 
@@ -547,6 +585,20 @@ class TestGetBreadcrumbs(GetBreadcrumbsDSL):
             expected_trail_length=BREADCRUMBS_TRAIL_MAX_LENGTH, expected_full_trail=False
         )
 
+    def test_get_breadcrumbs_after_renaming_ancestor(self):
+        """Test getting a catalogue category's breadcrumbs again after one of its ancestors has been renamed."""
+
+        catalogue_category_ids = self.post_nested_catalogue_categories(3)
+        self.get_last_catalogue_category_breadcrumbs()
+
+        self.test_client.patch(
+            f"/v1/catalogue-categories/{catalogue_category_ids[0]}", json={"name": "Renamed Catalogue Category"}
+        )
+        self._posted_catalogue_categories_get_data[0]["name"] = "Renamed Catalogue Category"
+
+        self.get_last_catalogue_category_breadcrumbs()
+        self.check_get_catalogue_categories_breadcrumbs_success(expected_trail_length=3, expected_full_trail=True)
+
     def test_get_breadcrumbs_with_non_existent_id(self):
         """Test getting a system's breadcrumbs when given a non-existent system ID."""
 
@@ -560,17 +612,181 @@ class TestGetBreadcrumbs(GetBreadcrumbsDSL):
         self.check_get_catalogue_categories_breadcrumbs_failed_with_detail(404, "Catalogue category not found")
 
 
+class GetManyBreadcrumbsDSL(GetBreadcrumbsDSL):
+    """Base class for batch breadcrumbs tests."""
+
+    def get_many_catalogue_category_breadcrumbs(self, catalogue_category_ids: list[str]) -> None:
+        """
+        Gets the breadcrumbs of multiple catalogue categories given their IDs.
+
+        :param catalogue_category_ids: IDs of the catalogue categories to obtain the breadcrumbs of.
+        """
+
+        self._get_response_catalogue_category = self.test_client.post(
+            "/v1/catalogue-categories/breadcrumbs", json=catalogue_category_ids
+        )
+
+    def check_get_many_catalogue_category_breadcrumbs_success(self, expected_trail_lengths: dict[str, int]) -> None:
+        """
+        Checks that a prior call to `get_many_catalogue_category_breadcrumbs` gave a successful response with the
+        expected data returned.
+
+        :param expected_trail_lengths: Dictionary of the expected trail lengths of the returned breadcrumbs, keyed by
+                                       the IDs of the nested catalogue categories they are expected to be returned
+                                       for. Each trail is expected to be the full trail.
+        """
+
+        positions = {
+            catalogue_category["id"]: i
+            for i, catalogue_category in enumerate(self._posted_catalogue_categories_get_data)
+        }
+
+        assert self._get_response_catalogue_category.status_code == 200
+        assert self._get_response_catalogue_category.json() == {
+            catalogue_category_id: {
+                "trail": [
+                    [catalogue_category["id"], catalogue_category["name"]]
+                    for catalogue_category in self._posted_catalogue_categories_get_data[
+                        positions[catalogue_category_id] + 1 - trail_length : positions[catalogue_category_id] + 1
+                    ]
+                ],
+                "full_trail": True,
+            }
+            for catalogue_category_id, trail_length in expected_trail_lengths.items()
+        }
+
+
+class TestGetManyBreadcrumbs(GetManyBreadcrumbsDSL):
+    """Tests for getting the breadcrumbs of multiple catalogue categories."""
+
+    def test_get_many_breadcrumbs(self):
+        """Test getting the breadcrumbs of multiple catalogue categories that share ancestors."""
+
+        catalogue_category_ids = self.post_nested_catalogue_categories(3)
+        self.get_many_catalogue_category_breadcrumbs(catalogue_category_ids)
+        self.check_get_many_catalogue_category_breadcrumbs_success(
+            {catalogue_category_ids[0]: 1, catalogue_category_ids[1]: 2, catalogue_category_ids[2]: 3}
+        )
+
+    def test_get_many_breadcrumbs_with_non_existent_and_invalid_ids(self):
+        """Test getting the breadcrumbs of multiple catalogue categories when some of the IDs are non-existent or
+        invalid."""
+
+        catalogue_category_ids = self.post_nested_catalogue_categories(2)
+        self.get_many_catalogue_category_breadcrumbs([catalogue_category_ids[1], str(ObjectId()), "invalid_id"])
+        self.check_get_many_catalogue_category_breadcrumbs_success({catalogue_category_ids[1]: 2})
+
+    def test_get_many_breadcrumbs_with_no_ids(self):
+        """Test getting the breadcrumbs of multiple catalogue categories when no IDs are given."""
+
+        self.get_many_catalogue_category_breadcrumbs([])
+        self.check_get_many_catalogue_category_breadcrumbs_success({})
+
+    def test_get_many_breadcrumbs_with_too_many_ids(self):
+        """Test getting the breadcrumbs of multiple catalogue categories when more IDs are given than are allowed."""
+
+        self.get_many_catalogue_category_breadcrumbs([str(ObjectId()) for _ in range(BREADCRUMBS_BATCH_MAX_IDS + 1)])
+
+        assert self._get_response_catalogue_category.status_code == 422
+
+
+class GetTreeDSL(GetBreadcrumbsDSL):
+    """Base class for tree tests."""
+
+    def get_catalogue_category_tree(self, catalogue_category_id: str, max_depth: Optional[int] = None) -> None:
+        """
+        Gets a catalogue category along with all of its descendants given its ID.
+
+        :param catalogue_category_id: ID of the catalogue category to obtain the tree of.
+        :param max_depth: Maximum depth of the descendants to obtain, or `None` to obtain all of them.
+        """
+
+        self._get_response_catalogue_category = self.test_client.get(
+            f"/v1/catalogue-categories/{catalogue_category_id}/tree",
+            params={} if max_depth is None else {"max_depth": max_depth},
+        )
+
+    def check_get_catalogue_category_tree_success(self, expected_catalogue_categories_get_data: list[dict]) -> None:
+        """
+        Checks that a prior call to `get_catalogue_category_tree` gave a successful response with the expected data
+        returned.
+
+        :param expected_catalogue_categories_get_data: List of dictionaries containing the expected catalogue category
+                                                       data returned as would be required for
+                                                       `CatalogueCategorySchema`'s in order from the top of the tree
+                                                       down.
+        """
+
+        assert self._get_response_catalogue_category.status_code == 200
+        assert self._get_response_catalogue_category.json() == expected_catalogue_categories_get_data
+
+    def check_get_catalogue_category_tree_failed_with_detail(self, status_code: int, detail: str) -> None:
+        """
+        Checks that a prior call to `get_catalogue_category_tree` gave a failed response with the expected code and
+        error message.
+
+        :param status_code: Expected status code of the response.
+        :param detail: Expected detail given in the response.
+        """
+
+        assert self._get_response_catalogue_category.status_code == status_code
+        assert self._get_response_catalogue_category.json()["detail"] == detail
+
+
+class TestGetTree(GetTreeDSL):
+    """Tests for getting a catalogue category along with all of its descendants."""
+
+    def test_get_tree(self):
+        """Test getting a catalogue category along with all of its descendants."""
+
+        catalogue_category_ids = self.post_nested_catalogue_categories(4)
+        self.get_catalogue_category_tree(catalogue_category_ids[1])
+        self.check_get_catalogue_category_tree_success(self._posted_catalogue_categories_get_data[1:])
+
+    def test_get_tree_with_max_depth(self):
+        """Test getting a catalogue category along with its descendants up to a maximum depth."""
+
+        catalogue_category_ids = self.post_nested_catalogue_categories(4)
+        self.get_catalogue_category_tree(catalogue_category_ids[0], max_depth=2)
+        self.check_get_catalogue_category_tree_success(self._posted_catalogue_categories_get_data[:3])
+
+    def test_get_tree_after_move(self):
+        """Test getting a catalogue category along with all of its descendants after one of them has been moved
+        elsewhere."""
+
+        catalogue_category_ids = self.post_nested_catalogue_categories(4)
+        self.test_client.patch(f"/v1/catalogue-categories/{catalogue_category_ids[2]}", json={"parent_id": None})
+        self.get_catalogue_category_tree(catalogue_category_ids[0])
+        self.check_get_catalogue_category_tree_success(self._posted_catalogue_categories_get_data[:2])
+
+    def test_get_tree_with_non_existent_id(self):
+        """Test getting a catalogue category's tree when given a non-existent catalogue category ID."""
+
+        self.get_catalogue_category_tree(str(ObjectId()))
+        self.check_get_catalogue_category_tree_failed_with_detail(404, "Catalogue category not found")
+
+    def test_get_tree_with_invalid_id(self):
+        """Test getting a catalogue category's tree when given an invalid catalogue category ID."""
+
+        self.get_catalogue_category_tree("invalid_id")
+        self.check_get_catalogue_category_tree_failed_with_detail(404, "Catalogue category not found")
+
+
 class ListDSL(GetBreadcrumbsDSL):
     """Base class for list tests."""
 
-    def get_catalogue_categories(self, filters: dict) -> None:
+    def get_catalogue_categories(self, filters: dict, etag: Optional[str] = None) -> None:
         """
         Gets a list of catalogue categories with the given filters.
 
         :param filters: Filters to use in the request.
+        :param etag: ETag of a previously obtained version of the list to only obtain it if it has since changed, or
+                     `None` to always obtain it.
         """
 
-        self._get_response_catalogue_category = self.test_client.get("/v1/catalogue-categories", params=filters)
+        self._get_response_catalogue_category = self.test_client.get(
+            "/v1/catalogue-categories", params=filters, headers={"If-None-Match": etag} if etag is not None else None
+        )
 
     def post_test_catalogue_category_with_child(self) -> list[dict]:
         """
@@ -642,6 +858,46 @@ class TestList(ListDSL):
         self.get_catalogue_categories(filters={"parent_id": "null"})
         self.check_get_catalogue_categories_success([catalogue_categories[0]])
 
+    def test_list_with_matching_etag(self):
+        """Test getting a list of catalogue categories that haven't been modified since they were last obtained."""
+
+        self.post_test_catalogue_category_with_child()
+        self.get_catalogue_categories(filters={})
+        etag = self._get_response_catalogue_category.headers["ETag"]
+
+        self.get_catalogue_categories(filters={}, etag=etag)
+        self.check_get_catalogue_category_not_modified(etag)
+
+    def test_list_with_etag_after_creating_catalogue_category(self):
+        """
+        Test getting a list of catalogue categories after another catalogue category has been created since it was last
+        obtained.
+        """
+
+        catalogue_categories = self.post_test_catalogue_category_with_child()
+        self.get_catalogue_categories(filters={"parent_id": "null"})
+        etag = self._get_response_catalogue_category.headers["ETag"]
+        self.post_catalogue_category(CATALOGUE_CATEGORY_POST_DATA_LEAF_REQUIRED_VALUES_ONLY)
+
+        self.get_catalogue_categories(filters={"parent_id": "null"}, etag=etag)
+        self.check_get_catalogue_categories_success(
+            [catalogue_categories[0], CATALOGUE_CATEGORY_GET_DATA_LEAF_REQUIRED_VALUES_ONLY]
+        )
+
+    def test_list_with_etag_after_deleting_catalogue_category(self):
+        """
+        Test getting a list of catalogue categories after one of them has been deleted since it was last obtained.
+        """
+
+        catalogue_categories = self.post_test_catalogue_category_with_child()
+        self.get_catalogue_categories(filters={})
+        etag = self._get_response_catalogue_category.headers["ETag"]
+        child_id = self._get_response_catalogue_category.json()[1]["id"]
+        self.test_client.delete(f"/v1/catalogue-categories/{child_id}")
+
+        self.get_catalogue_categories(filters={}, etag=etag)
+        self.check_get_catalogue_categories_success([catalogue_categories[0]])
+
     def test_list_with_parent_id_filter_with_no_matching_results(self):
         """Test getting a list of all catalogue categories with a `parent_id` filter that returns no results."""
 
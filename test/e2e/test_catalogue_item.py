@@ -9,6 +9,7 @@ End-to-End tests for the catalogue item router.
 # pylint: disable=too-many-ancestors
 
 import copy
+import json
 from test.e2e.conftest import E2ETestHelpers
 from test.e2e.test_catalogue_category import CreateDSL as CatalogueCategoryCreateDSL
 from test.e2e.test_manufacturer import CreateDSL as ManufacturerCreateDSL
@@ -780,6 +781,16 @@ class TestBulkCreate(BulkCreateDSL):
             422, "List should have at most 3 items after validation, not 4"
         )
 
+    def test_bulk_create_with_none(self):
+        """Test bulk creating catalogue items with an empty list of them."""
+
+        self.post_catalogue_item_prerequisites_no_properties()
+        self.post_bulk_catalogue_items([])
+
+        self.check_post_bulk_catalogue_items_failed_with_validation_message(
+            422, "List should have at least 1 item after validation, not 0"
+        )
+
     def test_bulk_create_obsolete_with_non_existent_obsolete_replacement_catalogue_item_id(self):
         """Test bulk creating an obsolete catalogue item with a non-existent
         `obsolete_replacement_catalogue_item_id`."""
@@ -919,14 +930,23 @@ class GetDSL(CreateDSL):
 
     _get_response_catalogue_item: Response
 
-    def get_catalogue_item(self, catalogue_item_id: str) -> None:
+    def get_catalogue_item(
+        self, catalogue_item_id: str, fields: Optional[str] = None, etag: Optional[str] = None
+    ) -> None:
         """
         Gets a catalogue item with the given ID.
 
         :param catalogue_item_id: ID of the catalogue item to be obtained.
+        :param fields: Comma separated list of the fields to obtain, or `None` to obtain all of them.
+        :param etag: ETag of a previously obtained version of the catalogue item to only obtain it if it has since
+                     changed, or `None` to always obtain it.
         """
 
-        self._get_response_catalogue_item = self.test_client.get(f"/v1/catalogue-items/{catalogue_item_id}")
+        self._get_response_catalogue_item = self.test_client.get(
+            f"/v1/catalogue-items/{catalogue_item_id}",
+            params={"fields": fields} if fields is not None else None,
+            headers={"If-None-Match": etag} if etag is not None else None,
+        )
 
     def check_get_catalogue_item_success(self, expected_catalogue_item_get_data: dict) -> None:
         """
@@ -943,6 +963,41 @@ class GetDSL(CreateDSL):
             expected_catalogue_item_get_data
         )
 
+    def check_get_catalogue_item_with_fields_success(
+        self, expected_catalogue_item_get_data: dict, expected_fields: list[str]
+    ) -> None:
+        """
+        Checks that a prior call to `get_catalogue_item` with specific fields gave a successful response with only the
+        expected fields of the expected data returned.
+
+        :param expected_catalogue_item_get_data: Dictionary containing the expected catalogue item data returned as
+                                                 would be required for a `CatalogueItemSchema`. Does not need mandatory
+                                                 IDs (e.g. `manufacturer_id`) as they will be added automatically to
+                                                 check they are as expected.
+        :param expected_fields: List of the fields expected to be returned.
+        """
+
+        expected_catalogue_item_get_data = self.add_ids_to_expected_catalogue_item_get_data(
+            expected_catalogue_item_get_data
+        )
+
+        assert self._get_response_catalogue_item.status_code == 200
+        assert self._get_response_catalogue_item.json() == {
+            field: expected_catalogue_item_get_data[field] for field in expected_fields
+        }
+
+    def check_get_catalogue_item_not_modified(self, expected_etag: str) -> None:
+        """
+        Checks that a prior call to `get_catalogue_item` or `get_catalogue_items` gave an empty response indicating the
+        data had not been modified.
+
+        :param expected_etag: ETag expected to be returned (i.e. the one given in the request).
+        """
+
+        assert self._get_response_catalogue_item.status_code == 304
+        assert self._get_response_catalogue_item.headers["ETag"] == expected_etag
+        assert self._get_response_catalogue_item.content == b""
+
     def check_get_catalogue_item_failed_with_detail(self, status_code: int, detail: str) -> None:
         """
         Checks that a prior call to `get_catalogue_item` gave a failed response with the expected code and error
@@ -969,6 +1024,51 @@ class TestGet(GetDSL):
         self.get_catalogue_item(catalogue_item_id)
         self.check_get_catalogue_item_success(CATALOGUE_ITEM_GET_DATA_REQUIRED_VALUES_ONLY)
 
+    def test_get_with_fields(self):
+        """Test getting only specific fields of a catalogue item."""
+
+        catalogue_item_id = self.post_catalogue_item_and_prerequisites_no_properties(
+            CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY
+        )
+
+        self.get_catalogue_item(catalogue_item_id, fields="name,manufacturer_id")
+        self.check_get_catalogue_item_with_fields_success(
+            CATALOGUE_ITEM_GET_DATA_REQUIRED_VALUES_ONLY, ["id", "name", "manufacturer_id"]
+        )
+
+    def test_get_with_matching_etag(self):
+        """Test getting a catalogue item that hasn't been modified since it was last obtained."""
+
+        catalogue_item_id = self.post_catalogue_item_and_prerequisites_no_properties(
+            CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY
+        )
+        self.get_catalogue_item(catalogue_item_id)
+        etag = self._get_response_catalogue_item.headers["ETag"]
+
+        self.get_catalogue_item(catalogue_item_id, etag=etag)
+        self.check_get_catalogue_item_not_modified(etag)
+
+    def test_get_with_outdated_etag(self):
+        """Test getting a catalogue item that has been modified since it was last obtained."""
+
+        catalogue_item_id = self.post_catalogue_item_and_prerequisites_no_properties(
+            CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY
+        )
+        self.get_catalogue_item(catalogue_item_id)
+        etag = self._get_response_catalogue_item.headers["ETag"]
+        self.test_client.patch(f"/v1/catalogue-items/{catalogue_item_id}", json={"name": "New name"})
+
+        self.get_catalogue_item(catalogue_item_id, etag=etag)
+        assert self._get_response_catalogue_item.status_code == 200
+        assert self._get_response_catalogue_item.json()["name"] == "New name"
+        assert self._get_response_catalogue_item.headers["ETag"] != etag
+
+    def test_get_with_invalid_fields(self):
+        """Test getting a catalogue item with fields that don't exist."""
+
+        self.get_catalogue_item(str(ObjectId()), fields="name,invalid_field")
+        self.check_get_catalogue_item_failed_with_detail(422, "Invalid field(s) requested: invalid_field")
+
     def test_get_with_non_existent_id(self):
         """Test getting a catalogue item with a non-existent ID."""
 
@@ -985,14 +1085,29 @@ class TestGet(GetDSL):
 class ListDSL(GetDSL):
     """Base class for list tests."""
 
-    def get_catalogue_items(self, filters: dict) -> None:
+    def get_catalogue_items(self, filters: dict, etag: Optional[str] = None) -> None:
         """
         Gets a list of catalogue items with the given filters.
 
+        :param filters: Filters to use in the request.
+        :param etag: ETag of a previously obtained version of the list to only obtain it if it has since changed, or
+                     `None` to always obtain it.
+        """
+
+        self._get_response_catalogue_item = self.test_client.get(
+            "/v1/catalogue-items", params=filters, headers={"If-None-Match": etag} if etag is not None else None
+        )
+
+    def get_catalogue_items_ndjson(self, filters: dict) -> None:
+        """
+        Gets a list of catalogue items with the given filters as a streamed NDJSON response.
+
         :param filters: Filters to use in the request.
         """
 
-        self._get_response_catalogue_item = self.test_client.get("/v1/catalogue-items", params=filters)
+        self._get_response_catalogue_item = self.test_client.get(
+            "/v1/catalogue-items", params=filters, headers={"Accept": "application/x-ndjson"}
+        )
 
     def post_test_catalogue_items_and_prerequisites(self) -> list[dict]:
         """
@@ -1037,6 +1152,33 @@ class ListDSL(GetDSL):
         assert self._get_response_catalogue_item.status_code == 200
         assert self._get_response_catalogue_item.json() == expected_catalogue_items_get_data
 
+    def check_get_catalogue_items_ndjson_success(self, expected_catalogue_items_get_data: list[dict]) -> None:
+        """
+        Checks that a prior call to `get_catalogue_items_ndjson` gave a successful response with the expected data
+        returned.
+
+        :param expected_catalogue_items_get_data: List of dictionaries containing the expected catalogue item data
+                                                  returned as would be required for `CatalogueItemSchema`'s.
+        """
+
+        assert self._get_response_catalogue_item.status_code == 200
+        assert self._get_response_catalogue_item.headers["content-type"] == "application/x-ndjson"
+        assert [
+            json.loads(line) for line in self._get_response_catalogue_item.text.splitlines()
+        ] == expected_catalogue_items_get_data
+
+    def check_get_catalogue_items_next_cursor(self, expect_next_cursor: bool) -> Optional[str]:
+        """
+        Checks whether a prior call to `get_catalogue_items` returned a cursor for the next page.
+
+        :param expect_next_cursor: Whether a cursor for the next page is expected to have been returned.
+        :return: The cursor for the next page if one was returned.
+        """
+
+        next_cursor = self._get_response_catalogue_item.headers.get("X-Next-Cursor")
+        assert (next_cursor is not None) == expect_next_cursor
+        return next_cursor
+
 
 class TestList(ListDSL):
     """Tests for getting a list of catalogue items."""
@@ -1064,6 +1206,53 @@ class TestList(ListDSL):
         self.get_catalogue_items(filters={"catalogue_category_id": catalogue_items[1]["catalogue_category_id"]})
         self.check_get_catalogue_items_success([catalogue_items[1]])
 
+    def test_list_with_matching_etag(self):
+        """Test getting a list of catalogue items that haven't been modified since they were last obtained."""
+
+        self.post_test_catalogue_items_and_prerequisites()
+        self.get_catalogue_items(filters={})
+        etag = self._get_response_catalogue_item.headers["ETag"]
+
+        self.get_catalogue_items(filters={}, etag=etag)
+        self.check_get_catalogue_item_not_modified(etag)
+
+    def test_list_with_etag_after_modifying_catalogue_item(self):
+        """Test getting a list of catalogue items after one of them has been modified since it was last obtained."""
+
+        self.post_test_catalogue_items_and_prerequisites()
+        self.get_catalogue_items(filters={})
+        etag = self._get_response_catalogue_item.headers["ETag"]
+        catalogue_item_id = self._get_response_catalogue_item.json()[1]["id"]
+        self.test_client.patch(f"/v1/catalogue-items/{catalogue_item_id}", json={"name": "New name"})
+
+        self.get_catalogue_items(filters={}, etag=etag)
+        assert self._get_response_catalogue_item.status_code == 200
+        assert self._get_response_catalogue_item.json()[1]["name"] == "New name"
+        assert self._get_response_catalogue_item.headers["ETag"] != etag
+
+    def test_list_with_etag_after_deleting_catalogue_item(self):
+        """Test getting a list of catalogue items after one of them has been deleted since it was last obtained."""
+
+        catalogue_items = self.post_test_catalogue_items_and_prerequisites()
+        self.get_catalogue_items(filters={})
+        etag = self._get_response_catalogue_item.headers["ETag"]
+        catalogue_item_id = self._get_response_catalogue_item.json()[1]["id"]
+        self.test_client.delete(f"/v1/catalogue-items/{catalogue_item_id}")
+
+        self.get_catalogue_items(filters={}, etag=etag)
+        self.check_get_catalogue_items_success([catalogue_items[0]])
+
+    def test_list_with_etag_from_ndjson_response(self):
+        """Test getting a list of catalogue items using the ETag of a streamed NDJSON list of them."""
+
+        self.post_test_catalogue_items_and_prerequisites()
+        self.get_catalogue_items_ndjson(filters={})
+        etag = self._get_response_catalogue_item.headers["ETag"]
+
+        self.get_catalogue_items(filters={}, etag=etag)
+        assert self._get_response_catalogue_item.status_code == 200
+        assert self._get_response_catalogue_item.headers["ETag"] != etag
+
     def test_list_with_catalogue_category_id_filter_with_no_matching_results(self):
         """Test getting a list of all catalogue items with a `catalogue_category_id` filter that returns no results."""
 
@@ -1077,6 +1266,133 @@ class TestList(ListDSL):
         self.get_catalogue_items(filters={"catalogue_category_id": "invalid-id"})
         self.check_get_catalogue_items_success([])
 
+    def test_list_with_limit_and_cursor(self):
+        """
+        Test getting a list of all catalogue items one page at a time using a `limit` and the returned cursors.
+
+        Posts two catalogue items and expects them to be returned over two pages, with the final page being empty as
+        the second page is full.
+        """
+
+        catalogue_items = self.post_test_catalogue_items_and_prerequisites()
+
+        self.get_catalogue_items(filters={"limit": 1})
+        self.check_get_catalogue_items_success([catalogue_items[0]])
+        next_cursor = self.check_get_catalogue_items_next_cursor(True)
+
+        self.get_catalogue_items(filters={"limit": 1, "cursor": next_cursor})
+        self.check_get_catalogue_items_success([catalogue_items[1]])
+        next_cursor = self.check_get_catalogue_items_next_cursor(True)
+
+        self.get_catalogue_items(filters={"limit": 1, "cursor": next_cursor})
+        self.check_get_catalogue_items_success([])
+        self.check_get_catalogue_items_next_cursor(False)
+
+    def test_list_with_invalid_cursor(self):
+        """Test getting a list of all catalogue items with an invalid `cursor` provided."""
+
+        self.get_catalogue_items(filters={"limit": 1, "cursor": "invalid-cursor"})
+        self.check_get_catalogue_item_failed_with_detail(422, "Invalid cursor")
+
+    def test_list_as_ndjson(self):
+        """
+        Test getting a list of all catalogue items as a streamed NDJSON response.
+
+        Posts two catalogue items in different catalogue categories and expects both to be returned, one per line.
+        """
+
+        catalogue_items = self.post_test_catalogue_items_and_prerequisites()
+        self.get_catalogue_items_ndjson(filters={})
+        self.check_get_catalogue_items_ndjson_success(catalogue_items)
+
+    def test_list_as_ndjson_with_invalid_catalogue_category_id_filter(self):
+        """
+        Test getting a list of all catalogue items as a streamed NDJSON response with an invalid
+        `catalogue_category_id` filter returns no results.
+        """
+
+        self.get_catalogue_items_ndjson(filters={"catalogue_category_id": "invalid-id"})
+        self.check_get_catalogue_items_ndjson_success([])
+
+    def test_list_with_fields(self):
+        """Test getting a list of only specific fields of all catalogue items."""
+
+        catalogue_items = self.post_test_catalogue_items_and_prerequisites()
+        self.get_catalogue_items(filters={"fields": "name"})
+        self.check_get_catalogue_items_success(
+            [{"id": catalogue_item["id"], "name": catalogue_item["name"]} for catalogue_item in catalogue_items]
+        )
+
+    def test_list_with_invalid_fields(self):
+        """Test getting a list of all catalogue items with fields that don't exist."""
+
+        self.get_catalogue_items(filters={"fields": "invalid_field"})
+        self.check_get_catalogue_item_failed_with_detail(422, "Invalid field(s) requested: invalid_field")
+
+    def test_list_with_manufacturer_id_filter(self):
+        """Test getting a list of all catalogue items with a `manufacturer_id` filter."""
+
+        catalogue_items = self.post_test_catalogue_items_and_prerequisites()
+
+        self.get_catalogue_items(filters={"filter": f"manufacturer_id:eq:{self.manufacturer_id}"})
+        self.check_get_catalogue_items_success(catalogue_items)
+
+        self.get_catalogue_items(filters={"filter": f"manufacturer_id:ne:{self.manufacturer_id}"})
+        self.check_get_catalogue_items_success([])
+
+    def test_list_with_invalid_filter_operator(self):
+        """Test getting a list of catalogue items with a filter using an operator that isn't supported."""
+
+        self.get_catalogue_items(filters={"filter": f"manufacturer_id:gt:{ObjectId()}"})
+        self.check_get_catalogue_item_failed_with_detail(
+            422, "Operator 'gt' is not supported when filtering on 'manufacturer_id'"
+        )
+
+    def test_list_with_sort_and_limit_and_cursor(self):
+        """
+        Test getting a list of all catalogue items sorted by `name` one page at a time.
+
+        Posts two catalogue items and expects them to be returned in alphabetical order over two pages, with the final
+        page being empty as the second page is full.
+        """
+
+        catalogue_items = self.post_test_catalogue_items_and_prerequisites()
+
+        self.get_catalogue_items(filters={"sort": "name", "limit": 1})
+        self.check_get_catalogue_items_success([catalogue_items[1]])
+        next_cursor = self.check_get_catalogue_items_next_cursor(True)
+
+        self.get_catalogue_items(filters={"sort": "name", "limit": 1, "cursor": next_cursor})
+        self.check_get_catalogue_items_success([catalogue_items[0]])
+        next_cursor = self.check_get_catalogue_items_next_cursor(True)
+
+        self.get_catalogue_items(filters={"sort": "name", "limit": 1, "cursor": next_cursor})
+        self.check_get_catalogue_items_success([])
+        self.check_get_catalogue_items_next_cursor(False)
+
+    def test_list_with_descending_sort(self):
+        """Test getting a list of all catalogue items sorted by `name` in descending order."""
+
+        catalogue_items = self.post_test_catalogue_items_and_prerequisites()
+
+        self.get_catalogue_items(filters={"sort": "-name"})
+        self.check_get_catalogue_items_success(catalogue_items)
+
+    def test_list_with_invalid_sort(self):
+        """Test getting a list of catalogue items sorted by a field that isn't supported."""
+
+        self.get_catalogue_items(filters={"sort": "cost_gbp"})
+        self.check_get_catalogue_item_failed_with_detail(422, "Sorting by 'cost_gbp' is not supported")
+
+    def test_list_as_ndjson_with_fields(self):
+        """Test getting a list of only specific fields of all catalogue items as a streamed NDJSON response."""
+
+        catalogue_items = self.post_test_catalogue_items_and_prerequisites()
+        self.get_catalogue_items_ndjson(filters={"fields": "name"})
+        self.check_get_catalogue_items_ndjson_success(
+            [{"id": catalogue_item["id"], "name": catalogue_item["name"]} for catalogue_item in catalogue_items]
+        )
+
 
 class UpdateDSL(ListDSL):
     """Base class for update tests."""
@@ -8,6 +8,7 @@ End-to-End tests for the item router.
 # pylint: disable=too-many-public-methods
 # pylint: disable=too-many-ancestors
 
+import json
 from test.e2e.conftest import E2ETestHelpers
 from test.e2e.test_catalogue_item import CreateDSL as CatalogueItemCreateDSL
 from test.e2e.test_system import CreateDSL as SystemCreateDSL
@@ -602,19 +603,238 @@ class TestCreate(CreateDSL):
         self.check_post_item_success(ITEM_GET_DATA_NEW_REQUIRED_VALUES_ONLY)
 
 
+class BulkCreateDSL(CreateDSL):
+    """Base class for bulk create tests."""
+
+    _post_bulk_response_item: Response
+
+    def post_bulk_items(self, items_data: list[dict]) -> Optional[list[str]]:
+        """
+        Posts bulk items with the given data.
+
+        :param items_data: List of dictionaries containing the basic item data as would be required for an
+                           `ItemPostSchema` but with mandatory IDs missing as they will be added automatically.
+        :return: IDs of the created items (or `None` if not successful).
+        """
+
+        full_items_data = []
+        for item_data in items_data:
+            full_item_data = item_data.copy()
+
+            # Insert mandatory IDs if they have been created
+            if self.catalogue_item_id:
+                full_item_data["catalogue_item_id"] = self.catalogue_item_id
+            if self.system_id:
+                full_item_data["system_id"] = self.system_id
+            full_items_data.append(full_item_data)
+
+        self._post_bulk_response_item = self.test_client.post("/v1/items/bulk", json=full_items_data)
+
+        return (
+            [item["id"] for item in self._post_bulk_response_item.json()]
+            if self._post_bulk_response_item.status_code == 201
+            else None
+        )
+
+    def post_bulk_items_from_template(self, template_data: dict) -> Optional[list[str]]:
+        """
+        Posts bulk items created from a template with the given data.
+
+        :param template_data: Dictionary containing the template data as would be required for an
+                              `ItemBulkPostTemplateSchema` but with mandatory IDs missing from the `template` as they
+                              will be added automatically.
+        :return: IDs of the created items (or `None` if not successful).
+        """
+
+        full_template_data = {**template_data, "template": template_data["template"].copy()}
+
+        # Insert mandatory IDs if they have been created
+        if self.catalogue_item_id:
+            full_template_data["template"]["catalogue_item_id"] = self.catalogue_item_id
+        if self.system_id:
+            full_template_data["template"]["system_id"] = self.system_id
+
+        self._post_bulk_response_item = self.test_client.post("/v1/items/bulk", json=full_template_data)
+
+        return (
+            [item["id"] for item in self._post_bulk_response_item.json()]
+            if self._post_bulk_response_item.status_code == 201
+            else None
+        )
+
+    def check_post_bulk_items_success(self, expected_items_get_data: list[dict]) -> None:
+        """
+        Checks that a prior call to `post_bulk_items` or `post_bulk_items_from_template` gave a successful response with
+        the expected data returned.
+
+        :param expected_items_get_data: List of dictionaries containing the expected item data returned as would be
+                                        required for an `ItemSchema`. Does not need mandatory IDs (e.g. `system_id`) as
+                                        they will be added automatically to check they are as expected.
+        """
+
+        assert self._post_bulk_response_item.status_code == 201
+        assert self._post_bulk_response_item.json() == [
+            self.add_ids_to_expected_item_get_data(expected_item_get_data)
+            for expected_item_get_data in expected_items_get_data
+        ]
+
+    def check_post_bulk_items_failed_with_detail(self, status_code: int, detail: str) -> None:
+        """
+        Checks that a prior call to `post_bulk_items` or `post_bulk_items_from_template` gave a failed response with
+        the expected code and error message.
+
+        :param status_code: Expected status code of the response.
+        :param detail: Expected detail given in the response.
+        """
+
+        assert self._post_bulk_response_item.status_code == status_code
+        assert self._post_bulk_response_item.json()["detail"] == detail
+
+    def check_post_bulk_items_failed_with_validation_message(self, status_code: int, message: str) -> None:
+        """
+        Checks that a prior call to `post_bulk_items` or `post_bulk_items_from_template` gave a failed response with
+        the expected code and pydantic validation error message.
+
+        :param status_code: Expected status code of the response.
+        :param message: Expected validation error message given in the response.
+        """
+
+        assert self._post_bulk_response_item.status_code == status_code
+        assert message in [error["msg"] for error in self._post_bulk_response_item.json()["detail"]]
+
+
+class TestBulkCreate(BulkCreateDSL):
+    """Tests for bulk creating items (As logic is reused from create, only specific errors caught at the router are
+    tested)."""
+
+    def test_bulk_create(self):
+        """Test bulk creating items."""
+
+        self.catalogue_item_id = self.post_catalogue_item_and_prerequisites_no_properties(
+            CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY
+        )
+        self.post_system(SYSTEM_POST_DATA_STORAGE_REQUIRED_VALUES_ONLY)
+        self.post_bulk_items([ITEM_DATA_NEW_REQUIRED_VALUES_ONLY, ITEM_DATA_NEW_ALL_VALUES_NO_PROPERTIES])
+
+        self.check_post_bulk_items_success(
+            [ITEM_GET_DATA_NEW_REQUIRED_VALUES_ONLY, ITEM_GET_DATA_NEW_ALL_VALUES_NO_PROPERTIES]
+        )
+
+    def test_bulk_create_with_none(self):
+        """Test bulk creating items with an empty list of them."""
+
+        self.post_bulk_items([])
+
+        self.check_post_bulk_items_failed_with_validation_message(
+            422, "List should have at least 1 item after validation, not 0"
+        )
+
+    def test_bulk_create_from_template(self):
+        """Test bulk creating items from a template with a serial number for each of them."""
+
+        self.catalogue_item_id = self.post_catalogue_item_and_prerequisites_no_properties(
+            CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY
+        )
+        self.post_system(SYSTEM_POST_DATA_STORAGE_REQUIRED_VALUES_ONLY)
+        self.post_bulk_items_from_template(
+            {
+                "template": ITEM_DATA_NEW_ALL_VALUES_NO_PROPERTIES,
+                "quantity": 2,
+                "serial_numbers": ["serial-1", "serial-2"],
+            }
+        )
+
+        self.check_post_bulk_items_success(
+            [
+                {**ITEM_GET_DATA_NEW_ALL_VALUES_NO_PROPERTIES, "serial_number": "serial-1"},
+                {**ITEM_GET_DATA_NEW_ALL_VALUES_NO_PROPERTIES, "serial_number": "serial-2"},
+            ]
+        )
+
+    def test_bulk_create_with_too_many(self):
+        """Test bulk creating items with too many of them."""
+
+        self.post_bulk_items([ITEM_DATA_NEW_REQUIRED_VALUES_ONLY] * 4)
+
+        self.check_post_bulk_items_failed_with_validation_message(
+            422, "List should have at most 3 items after validation, not 4"
+        )
+
+    def test_bulk_create_from_template_with_too_many(self):
+        """Test bulk creating items from a template with too large a quantity."""
+
+        self.post_bulk_items_from_template({"template": ITEM_DATA_NEW_REQUIRED_VALUES_ONLY, "quantity": 4})
+
+        self.check_post_bulk_items_failed_with_validation_message(422, "Input should be less than or equal to 3")
+
+    def test_bulk_create_from_template_with_wrong_number_of_serial_numbers(self):
+        """Test bulk creating items from a template with a different number of serial numbers to the quantity."""
+
+        self.post_bulk_items_from_template(
+            {"template": ITEM_DATA_NEW_REQUIRED_VALUES_ONLY, "quantity": 2, "serial_numbers": ["serial-1"]}
+        )
+
+        self.check_post_bulk_items_failed_with_validation_message(
+            422, "Value error, serial_numbers must contain exactly one value for each of the 2 items"
+        )
+
+    def test_bulk_create_with_non_existent_system_id(self):
+        """Test bulk creating items with a non-existent system ID."""
+
+        self.catalogue_item_id = self.post_catalogue_item_and_prerequisites_no_properties(
+            CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY
+        )
+        self.system_id = str(ObjectId())
+        self.post_bulk_items([ITEM_DATA_NEW_REQUIRED_VALUES_ONLY])
+
+        self.check_post_bulk_items_failed_with_detail(422, "A specified entity does not exist")
+
+    def test_bulk_create_with_invalid_system_id(self):
+        """Test bulk creating items with an invalid system ID."""
+
+        self.catalogue_item_id = self.post_catalogue_item_and_prerequisites_no_properties(
+            CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY
+        )
+        self.system_id = "invalid-id"
+        self.post_bulk_items([ITEM_DATA_NEW_REQUIRED_VALUES_ONLY])
+
+        self.check_post_bulk_items_failed_with_detail(422, "A specified entity does not exist")
+
+    def test_bulk_create_with_non_existent_rule(self):
+        """Test bulk creating items when there isn't a creation rule defined that allows items to be created in the
+        specified system with the specified usage status."""
+
+        self.catalogue_item_id = self.post_catalogue_item_and_prerequisites_no_properties(
+            CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY
+        )
+        self.post_system(SYSTEM_POST_DATA_OPERATIONAL_REQUIRED_VALUES_ONLY)
+        self.post_bulk_items([ITEM_DATA_NEW_REQUIRED_VALUES_ONLY])
+
+        self.check_post_bulk_items_failed_with_detail(
+            422, "No rule found for creating items in the specified system with the specified usage status"
+        )
+
+
 class GetDSL(CreateDSL):
     """Base class for get tests."""
 
     _get_response_item: Response
 
-    def get_item(self, item_id: str) -> None:
+    def get_item(self, item_id: str, fields: Optional[str] = None, etag: Optional[str] = None) -> None:
         """
         Gets an item with the given ID.
 
         :param item_id: ID of the item to be obtained.
+        :param fields: Comma separated list of the fields to obtain, or `None` to obtain all of them.
+        :param etag: ETag of a previously obtained version of the item to only obtain it if it has since changed, or
+                     `None` to always obtain it.
         """
 
-        self._get_response_item = self.test_client.get(f"/v1/items/{item_id}")
+        self._get_response_item = self.test_client.get(
+            f"/v1/items/{item_id}",
+            params={"fields": fields} if fields is not None else None,
+            headers={"If-None-Match": etag} if etag is not None else None,
+        )
 
     def check_get_item_success(self, expected_item_get_data: dict) -> None:
         """
@@ -628,6 +848,34 @@ class GetDSL(CreateDSL):
         assert self._get_response_item.status_code == 200
         assert self._get_response_item.json() == self.add_ids_to_expected_item_get_data(expected_item_get_data)
 
+    def check_get_item_with_fields_success(self, expected_item_get_data: dict, expected_fields: list[str]) -> None:
+        """
+        Checks that a prior call to `get_item` with specific fields gave a successful response with only the expected
+        fields of the expected data returned.
+
+        :param expected_item_get_data: Dictionary containing the expected item data returned as would be required for a
+                                       `ItemSchema`. Does not need mandatory IDs (e.g. `system_id`) as they will
+                                       be added automatically to check they are as expected.
+        :param expected_fields: List of the fields expected to be returned.
+        """
+
+        expected_item_get_data = self.add_ids_to_expected_item_get_data(expected_item_get_data)
+
+        assert self._get_response_item.status_code == 200
+        assert self._get_response_item.json() == {field: expected_item_get_data[field] for field in expected_fields}
+
+    def check_get_item_not_modified(self, expected_etag: str) -> None:
+        """
+        Checks that a prior call to `get_item` or `get_items` gave an empty response indicating the data had not been
+        modified.
+
+        :param expected_etag: ETag expected to be returned (i.e. the one given in the request).
+        """
+
+        assert self._get_response_item.status_code == 304
+        assert self._get_response_item.headers["ETag"] == expected_etag
+        assert self._get_response_item.content == b""
+
     def check_get_item_failed_with_detail(self, status_code: int, detail: str) -> None:
         """
         Checks that a prior call to `get_item` gave a failed response with the expected code and error
@@ -652,6 +900,51 @@ class TestGet(GetDSL):
         self.get_item(catalogue_item_id)
         self.check_get_item_success(ITEM_GET_DATA_NEW_REQUIRED_VALUES_ONLY)
 
+    def test_get_with_fields(self):
+        """Test getting only specific fields of an item."""
+
+        item_id = self.post_item_and_prerequisites_no_properties(ITEM_DATA_NEW_REQUIRED_VALUES_ONLY)
+
+        self.get_item(item_id, fields="system_id,serial_number")
+        self.check_get_item_with_fields_success(
+            ITEM_GET_DATA_NEW_REQUIRED_VALUES_ONLY, ["id", "system_id", "serial_number"]
+        )
+
+    def test_get_with_matching_etag(self):
+        """Test getting an item that hasn't been modified since it was last obtained."""
+
+        item_id = self.post_item_and_prerequisites_no_properties(ITEM_DATA_NEW_REQUIRED_VALUES_ONLY)
+        self.get_item(item_id)
+        etag = self._get_response_item.headers["ETag"]
+
+        self.get_item(item_id, etag=etag)
+        self.check_get_item_not_modified(etag)
+
+    def test_get_with_outdated_etag(self):
+        """Test getting an item that has been modified since it was last obtained."""
+
+        item_id = self.post_item_and_prerequisites_no_properties(ITEM_DATA_NEW_REQUIRED_VALUES_ONLY)
+        self.get_item(item_id)
+        etag = self._get_response_item.headers["ETag"]
+        self.test_client.patch(
+            f"/v1/items/{item_id}",
+            json={"serial_number": "New serial number"},
+            headers={"Authorization": f"Bearer {VALID_ACCESS_TOKEN_ADMIN_ROLE}"},
+        )
+
+        self.get_item(item_id, etag=etag)
+        assert self._get_response_item.status_code == 200
+        assert self._get_response_item.json()["serial_number"] == "New serial number"
+        assert self._get_response_item.headers["ETag"] != etag
+
+    def test_get_with_invalid_fields(self):
+        """Test getting an item with fields that don't exist."""
+
+        item_id = self.post_item_and_prerequisites_no_properties(ITEM_DATA_NEW_REQUIRED_VALUES_ONLY)
+
+        self.get_item(item_id, fields="system_id,invalid_field")
+        self.check_get_item_failed_with_detail(422, "Invalid field(s) requested: invalid_field")
+
     def test_get_with_non_existent_id(self):
         """Test getting an item with a non-existent ID."""
 
@@ -668,14 +961,29 @@ class TestGet(GetDSL):
 class ListDSL(GetDSL):
     """Base class for list tests."""
 
-    def get_items(self, filters: dict) -> None:
+    def get_items(self, filters: dict, etag: Optional[str] = None) -> None:
         """
         Gets a list of items with the given filters.
 
+        :param filters: Filters to use in the request.
+        :param etag: ETag of a previously obtained version of the list to only obtain it if it has since changed, or
+                     `None` to always obtain it.
+        """
+
+        self._get_response_item = self.test_client.get(
+            "/v1/items", params=filters, headers={"If-None-Match": etag} if etag is not None else None
+        )
+
+    def get_items_ndjson(self, filters: dict) -> None:
+        """
+        Gets a list of items with the given filters as a streamed NDJSON response.
+
         :param filters: Filters to use in the request.
         """
 
-        self._get_response_item = self.test_client.get("/v1/items", params=filters)
+        self._get_response_item = self.test_client.get(
+            "/v1/items", params=filters, headers={"Accept": "application/x-ndjson"}
+        )
 
     def post_test_items_and_prerequisites(self) -> list[dict]:
         """
@@ -731,6 +1039,30 @@ class ListDSL(GetDSL):
         assert self._get_response_item.status_code == 200
         assert self._get_response_item.json() == expected_items_get_data
 
+    def check_get_items_ndjson_success(self, expected_items_get_data: list[dict]) -> None:
+        """
+        Checks that a prior call to `get_items_ndjson` gave a successful response with the expected data returned.
+
+        :param expected_items_get_data: List of dictionaries containing the expected item data returned as would be
+                                        required for `ItemSchema`'s.
+        """
+
+        assert self._get_response_item.status_code == 200
+        assert self._get_response_item.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in self._get_response_item.text.splitlines()] == expected_items_get_data
+
+    def check_get_items_next_cursor(self, expect_next_cursor: bool) -> Optional[str]:
+        """
+        Checks whether a prior call to `get_items` returned a cursor for the next page.
+
+        :param expect_next_cursor: Whether a cursor for the next page is expected to have been returned.
+        :return: The cursor for the next page if one was returned.
+        """
+
+        next_cursor = self._get_response_item.headers.get("X-Next-Cursor")
+        assert (next_cursor is not None) == expect_next_cursor
+        return next_cursor
+
 
 class TestList(ListDSL):
     """Tests for getting a list of items."""
@@ -783,6 +1115,76 @@ class TestList(ListDSL):
         self.get_items(filters={"catalogue_item_id": "invalid-id"})
         self.check_get_items_success([])
 
+    def test_list_with_matching_etag(self):
+        """Test getting a list of items that haven't been modified since they were last obtained."""
+
+        self.post_test_items_and_prerequisites()
+        self.get_items(filters={})
+        etag = self._get_response_item.headers["ETag"]
+
+        self.get_items(filters={}, etag=etag)
+        self.check_get_item_not_modified(etag)
+
+    def test_list_with_etag_after_modifying_item(self):
+        """Test getting a list of items after one of them has been modified since it was last obtained."""
+
+        self.post_test_items_and_prerequisites()
+        self.get_items(filters={})
+        etag = self._get_response_item.headers["ETag"]
+        item_id = self._get_response_item.json()[2]["id"]
+        self.test_client.patch(
+            f"/v1/items/{item_id}",
+            json={"serial_number": "New serial number"},
+            headers={"Authorization": f"Bearer {VALID_ACCESS_TOKEN_ADMIN_ROLE}"},
+        )
+
+        self.get_items(filters={}, etag=etag)
+        assert self._get_response_item.status_code == 200
+        assert self._get_response_item.json()[2]["serial_number"] == "New serial number"
+        assert self._get_response_item.headers["ETag"] != etag
+
+    def test_list_with_etag_after_modifying_item_outside_page(self):
+        """Test getting a page of items after an item in a different page has been modified since it was last
+        obtained."""
+
+        self.post_test_items_and_prerequisites()
+        self.get_items(filters={})
+        item_id = self._get_response_item.json()[2]["id"]
+        self.get_items(filters={"limit": 2})
+        etag = self._get_response_item.headers["ETag"]
+        self.test_client.patch(
+            f"/v1/items/{item_id}",
+            json={"serial_number": "New serial number"},
+            headers={"Authorization": f"Bearer {VALID_ACCESS_TOKEN_ADMIN_ROLE}"},
+        )
+
+        self.get_items(filters={"limit": 2}, etag=etag)
+        self.check_get_item_not_modified(etag)
+
+    def test_list_with_etag_after_deleting_item_in_page(self):
+        """Test getting a page of items after one of them has been deleted since it was last obtained, so that the next
+        item takes its place without changing the number of items or their latest modified time."""
+
+        self.post_test_items_and_prerequisites()
+        self.get_items(filters={})
+        item_ids = [item["id"] for item in self._get_response_item.json()]
+        # Ensure the first item in the page is the most recently modified so the item sliding into the page isn't
+        self.test_client.patch(
+            f"/v1/items/{item_ids[0]}",
+            json={"serial_number": "New serial number"},
+            headers={"Authorization": f"Bearer {VALID_ACCESS_TOKEN_ADMIN_ROLE}"},
+        )
+        self.get_items(filters={"limit": 2})
+        etag = self._get_response_item.headers["ETag"]
+        self.test_client.delete(
+            f"/v1/items/{item_ids[1]}", headers={"Authorization": f"Bearer {VALID_ACCESS_TOKEN_ADMIN_ROLE}"}
+        )
+
+        self.get_items(filters={"limit": 2}, etag=etag)
+        assert self._get_response_item.status_code == 200
+        assert [item["id"] for item in self._get_response_item.json()] == [item_ids[0], item_ids[2]]
+        assert self._get_response_item.headers["ETag"] != etag
+
     def test_list_with_system_id_and_catalogue_item_id_filters(self):
         """
         Test getting a list of all items with `system_id` and `catalogue_item_id` filters provided.
@@ -804,6 +1206,219 @@ class TestList(ListDSL):
         self.get_items(filters={"system_id": str(ObjectId()), "catalogue_item_id": str(ObjectId())})
         self.check_get_items_success([])
 
+    def test_list_with_limit_and_cursor(self):
+        """
+        Test getting a list of all items one page at a time using a `limit` and the returned cursors.
+
+        Posts three items and expects them to be returned over two pages.
+        """
+
+        items = self.post_test_items_and_prerequisites()
+
+        self.get_items(filters={"limit": 2})
+        self.check_get_items_success(items[0:2])
+        next_cursor = self.check_get_items_next_cursor(True)
+
+        self.get_items(filters={"limit": 2, "cursor": next_cursor})
+        self.check_get_items_success(items[2:])
+        self.check_get_items_next_cursor(False)
+
+    def test_list_with_system_id_filter_and_limit(self):
+        """Test getting a list of all items with a `system_id` filter and a `limit` provided."""
+
+        items = self.post_test_items_and_prerequisites()
+        self.get_items(filters={"system_id": items[1]["system_id"], "limit": 1})
+        self.check_get_items_success([items[1]])
+        self.check_get_items_next_cursor(True)
+
+    def test_list_with_invalid_limit(self):
+        """Test getting a list of all items with an invalid `limit` provided."""
+
+        self.get_items(filters={"limit": 0})
+        assert self._get_response_item.status_code == 422
+        assert self._get_response_item.json()["detail"][0]["loc"] == ["query", "limit"]
+
+    def test_list_with_invalid_cursor(self):
+        """Test getting a list of all items with an invalid `cursor` provided."""
+
+        self.get_items(filters={"limit": 2, "cursor": "invalid-cursor"})
+        self.check_get_item_failed_with_detail(422, "Invalid cursor")
+
+    def test_list_as_ndjson(self):
+        """
+        Test getting a list of all items as a streamed NDJSON response.
+
+        Posts three items and expects all three to be returned, one per line.
+        """
+
+        items = self.post_test_items_and_prerequisites()
+        self.get_items_ndjson(filters={})
+        self.check_get_items_ndjson_success(items)
+
+    def test_list_as_ndjson_with_system_id_filter_and_limit(self):
+        """Test getting a list of items as a streamed NDJSON response with a `system_id` filter and `limit`."""
+
+        items = self.post_test_items_and_prerequisites()
+        self.get_items_ndjson(filters={"system_id": items[1]["system_id"], "limit": 1})
+        self.check_get_items_ndjson_success([items[1]])
+
+    def test_list_as_ndjson_with_invalid_cursor(self):
+        """Test getting a list of all items as a streamed NDJSON response with an invalid `cursor` provided."""
+
+        self.get_items_ndjson(filters={"cursor": "invalid-cursor"})
+        self.check_get_item_failed_with_detail(422, "Invalid cursor")
+
+    def test_list_with_fields(self):
+        """Test getting a list of only specific fields of all items."""
+
+        items = self.post_test_items_and_prerequisites()
+        self.get_items(filters={"fields": "serial_number,system_id"})
+        self.check_get_items_success(
+            [
+                {"id": item["id"], "serial_number": item["serial_number"], "system_id": item["system_id"]}
+                for item in items
+            ]
+        )
+
+    def test_list_with_fields_and_limit(self):
+        """Test getting a list of only specific fields of items with a `limit` provided."""
+
+        items = self.post_test_items_and_prerequisites()
+        self.get_items(filters={"fields": "serial_number", "limit": 2})
+        self.check_get_items_success(
+            [{"id": item["id"], "serial_number": item["serial_number"]} for item in items[0:2]]
+        )
+        self.check_get_items_next_cursor(True)
+
+    def test_list_with_invalid_fields(self):
+        """Test getting a list of all items with fields that don't exist."""
+
+        self.get_items(filters={"fields": "invalid_field"})
+        self.check_get_item_failed_with_detail(422, "Invalid field(s) requested: invalid_field")
+
+    def test_list_with_delivered_date_range_filter(self):
+        """Test getting a list of items delivered within a range of dates."""
+
+        items = self.post_test_items_and_prerequisites()
+        self.get_items(
+            filters={"filter": ["delivered_date:gte:2012-01-01T00:00:00Z", "delivered_date:lt:2013-01-01T00:00:00Z"]}
+        )
+        self.check_get_items_success([items[1]])
+
+    def test_list_with_usage_status_id_and_is_defective_filters(self):
+        """Test getting a list of items with `usage_status_id` and `is_defective` filters."""
+
+        items = self.post_test_items_and_prerequisites()
+        self.get_items(
+            filters={"filter": [f"usage_status_id:in:{items[0]['usage_status_id']}", "is_defective:eq:false"]}
+        )
+        self.check_get_items_success(items)
+
+    def test_list_with_invalid_filter(self):
+        """Test getting a list of items with a filter on a field that isn't supported."""
+
+        self.get_items(filters={"filter": "serial_number:eq:1234"})
+        self.check_get_item_failed_with_detail(422, "Filtering on 'serial_number' is not supported")
+
+    def test_list_with_invalid_filter_value(self):
+        """Test getting a list of items with a filter with an invalid value."""
+
+        self.get_items(filters={"filter": "usage_status_id:eq:invalid-id"})
+        self.check_get_item_failed_with_detail(422, "Invalid value 'invalid-id' for filter on 'usage_status_id'")
+
+    def test_list_with_descending_sort_and_limit_and_cursor(self):
+        """
+        Test getting a list of all items sorted by `delivered_date` in descending order one page at a time.
+
+        Only the second item has a `delivered_date` so it is expected first, followed by the others in descending order
+        of their IDs.
+        """
+
+        items = self.post_test_items_and_prerequisites()
+
+        self.get_items(filters={"sort": "-delivered_date", "limit": 2})
+        self.check_get_items_success([items[1], items[2]])
+        next_cursor = self.check_get_items_next_cursor(True)
+
+        self.get_items(filters={"sort": "-delivered_date", "limit": 2, "cursor": next_cursor})
+        self.check_get_items_success([items[0]])
+        self.check_get_items_next_cursor(False)
+
+    def test_list_with_sort_one_item_per_page(self):
+        """
+        Test getting a list of all items sorted by `delivered_date` in both directions one item per page.
+
+        Only the second item has a `delivered_date`, so when sorting in descending order the items without one must
+        still be returned after it, and when sorting in ascending order it must still be returned after them.
+        """
+
+        items = self.post_test_items_and_prerequisites()
+
+        for sort, expected_items in [
+            ("-delivered_date", [items[1], items[2], items[0]]),
+            ("delivered_date", [items[0], items[2], items[1]]),
+        ]:
+            obtained_items = []
+            next_cursor = None
+            for _ in range(len(expected_items)):
+                self.get_items(
+                    filters={"sort": sort, "limit": 1, **({"cursor": next_cursor} if next_cursor is not None else {})}
+                )
+                assert self._get_response_item.status_code == 200
+                obtained_items.extend(self._get_response_item.json())
+                next_cursor = self.check_get_items_next_cursor(True)
+
+            self.get_items(filters={"sort": sort, "limit": 1, "cursor": next_cursor})
+            self.check_get_items_success([])
+            assert obtained_items == expected_items
+
+    def test_list_with_sort_fields_and_limit_and_cursor(self):
+        """
+        Test getting a list of only specific fields of all items sorted by `delivered_date` in ascending order one page
+        at a time.
+
+        Items without a `delivered_date` are expected first, and the cursor must be created from the `delivered_date`
+        even though it isn't returned.
+        """
+
+        items = self.post_test_items_and_prerequisites()
+
+        self.get_items(filters={"sort": "delivered_date", "fields": "serial_number", "limit": 2})
+        self.check_get_items_success(
+            [{"id": item["id"], "serial_number": item["serial_number"]} for item in (items[0], items[2])]
+        )
+        next_cursor = self.check_get_items_next_cursor(True)
+
+        self.get_items(filters={"sort": "delivered_date", "fields": "serial_number", "limit": 2, "cursor": next_cursor})
+        self.check_get_items_success([{"id": items[1]["id"], "serial_number": items[1]["serial_number"]}])
+        self.check_get_items_next_cursor(False)
+
+    def test_list_with_sort_and_cursor_for_different_sort(self):
+        """Test getting a list of items sorted by a field with a cursor returned for a different sort order."""
+
+        self.post_test_items_and_prerequisites()
+
+        self.get_items(filters={"limit": 2})
+        next_cursor = self.check_get_items_next_cursor(True)
+
+        self.get_items(filters={"sort": "delivered_date", "limit": 2, "cursor": next_cursor})
+        self.check_get_item_failed_with_detail(422, "Invalid cursor")
+
+    def test_list_with_invalid_sort(self):
+        """Test getting a list of items sorted by a field that isn't supported."""
+
+        self.get_items(filters={"sort": "-serial_number"})
+        self.check_get_item_failed_with_detail(422, "Sorting by 'serial_number' is not supported")
+
+    def test_list_as_ndjson_with_fields(self):
+        """Test getting a list of only specific fields of all items as a streamed NDJSON response."""
+
+        items = self.post_test_items_and_prerequisites()
+        self.get_items_ndjson(filters={"fields": "serial_number"})
+        self.check_get_items_ndjson_success(
+            [{"id": item["id"], "serial_number": item["serial_number"]} for item in items]
+        )
+
 
 class UpdateDSL(ListDSL):
     """Base class for update tests."""
@@ -0,0 +1,101 @@
+"""
+End-to-End tests for the metrics router.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response
+
+
+class GetDatabaseConnectionPoolMetricsDSL:
+    """Base class for get database connection pool metrics tests."""
+
+    test_client: TestClient
+    _get_response_metrics: Response
+
+    @pytest.fixture(autouse=True)
+    def setup_get_database_connection_pool_metrics_dsl(self, test_client):
+        """Setup fixtures"""
+
+        self.test_client = test_client
+
+    def use_database(self) -> None:
+        """Performs a request that uses the database so that a connection will have been checked out."""
+
+        assert self.test_client.get("/v1/system-types").status_code == 200
+
+    def get_database_connection_pool_metrics(self) -> None:
+        """Gets the database connection pool metrics."""
+
+        self._get_response_metrics = self.test_client.get("/v1/metrics/database-connection-pool")
+
+    def check_get_database_connection_pool_metrics_success(self) -> None:
+        """
+        Checks that a prior call to `get_database_connection_pool_metrics` gave a successful response with the
+        expected statistics returned.
+        """
+
+        assert self._get_response_metrics.status_code == 200
+
+        metrics = self._get_response_metrics.json()
+        assert metrics["connections"] >= 1
+        assert metrics["checkouts"] >= 1
+        assert metrics["checkout_wait_time_max_seconds"] <= metrics["checkout_wait_time_total_seconds"]
+
+
+class TestGetDatabaseConnectionPoolMetrics(GetDatabaseConnectionPoolMetricsDSL):
+    """Tests for getting the database connection pool metrics."""
+
+    def test_get_database_connection_pool_metrics(self):
+        """Test getting the database connection pool metrics after the database has been used."""
+
+        self.use_database()
+        self.get_database_connection_pool_metrics()
+        self.check_get_database_connection_pool_metrics_success()
+
+
+class GetCacheMetricsDSL:
+    """Base class for get cache metrics tests."""
+
+    test_client: TestClient
+    _get_response_metrics: Response
+
+    @pytest.fixture(autouse=True)
+    def setup_get_cache_metrics_dsl(self, test_client):
+        """Setup fixtures"""
+
+        self.test_client = test_client
+
+    def get_cache_metrics(self) -> None:
+        """Gets the cache metrics."""
+
+        self._get_response_metrics = self.test_client.get("/v1/metrics/caches")
+
+    def check_get_cache_metrics_success(self) -> None:
+        """Checks that a prior call to `get_cache_metrics` gave a successful response with the expected caches."""
+
+        assert self._get_response_metrics.status_code == 200
+
+        metrics = self._get_response_metrics.json()
+        assert set(metrics) == {
+            "settings",
+            "rules",
+            "units",
+            "usage_statuses",
+            "system_types",
+            "manufacturers",
+            "system_breadcrumbs",
+            "catalogue_category_breadcrumbs",
+        }
+        for cache_metrics in metrics.values():
+            assert set(cache_metrics) == {"entries", "hits", "misses", "invalidations"}
+
+
+class TestGetCacheMetrics(GetCacheMetricsDSL):
+    """Tests for getting the cache metrics."""
+
+    def test_get_cache_metrics(self):
+        """Test getting the cache metrics."""
+
+        self.get_cache_metrics()
+        self.check_get_cache_metrics_success()
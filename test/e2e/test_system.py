@@ -4,8 +4,10 @@ End-to-End tests for the system router.
 
 # Expect some duplicate code inside tests as the tests for the different entities can be very similar
 # pylint: disable=duplicate-code
+# pylint: disable=too-many-lines
 # pylint: disable=too-many-public-methods
 
+import json
 from test.e2e.conftest import E2ETestHelpers
 from test.mock_data import (
     CATALOGUE_CATEGORY_POST_DATA_LEAF_NO_PARENT_NO_PROPERTIES,
@@ -25,7 +27,7 @@ from bson import ObjectId
 from fastapi.testclient import TestClient
 from httpx import Response
 
-from inventory_management_system_api.core.consts import BREADCRUMBS_TRAIL_MAX_LENGTH
+from inventory_management_system_api.core.consts import BREADCRUMBS_BATCH_MAX_IDS, BREADCRUMBS_TRAIL_MAX_LENGTH
 
 
 class CreateDSL:
@@ -175,14 +177,21 @@ class GetDSL(CreateDSL):
 
     _get_response_system: Response
 
-    def get_system(self, system_id: str):
+    def get_system(self, system_id: str, fields: Optional[str] = None, etag: Optional[str] = None):
         """
         Gets a system with the given ID.
 
         :param system_id: ID of the system to be obtained.
+        :param fields: Comma separated list of the fields to obtain, or `None` to obtain all of them.
+        :param etag: ETag of a previously obtained version of the system to only obtain it if it has since changed, or
+                     `None` to always obtain it.
         """
 
-        self._get_response_system = self.test_client.get(f"/v1/systems/{system_id}")
+        self._get_response_system = self.test_client.get(
+            f"/v1/systems/{system_id}",
+            params={"fields": fields} if fields is not None else None,
+            headers={"If-None-Match": etag} if etag is not None else None,
+        )
 
     def check_get_system_success(self, expected_system_get_data: dict):
         """
@@ -195,6 +204,18 @@ class GetDSL(CreateDSL):
         assert self._get_response_system.status_code == 200
         assert self._get_response_system.json() == expected_system_get_data
 
+    def check_get_system_not_modified(self, expected_etag: str):
+        """
+        Checks that a prior call to `get_system` or `get_systems` gave an empty response indicating the data had not
+        been modified.
+
+        :param expected_etag: ETag expected to be returned (i.e. the one given in the request).
+        """
+
+        assert self._get_response_system.status_code == 304
+        assert self._get_response_system.headers["ETag"] == expected_etag
+        assert self._get_response_system.content == b""
+
     def check_get_system_failed_with_detail(self, status_code: int, detail: str):
         """
         Checks that a prior call to `get_system` gave a failed response with the expected code and error message.
@@ -217,6 +238,48 @@ class TestGet(GetDSL):
         self.get_system(system_id)
         self.check_get_system_success(SYSTEM_GET_DATA_STORAGE_ALL_VALUES_NO_PARENT)
 
+    def test_get_with_fields(self):
+        """Test getting only specific fields of a system."""
+
+        system_id = self.post_system(SYSTEM_POST_DATA_STORAGE_ALL_VALUES_NO_PARENT)
+        self.get_system(system_id, fields="name,is_flagged")
+        self.check_get_system_success(
+            {
+                "id": system_id,
+                "name": SYSTEM_GET_DATA_STORAGE_ALL_VALUES_NO_PARENT["name"],
+                "is_flagged": SYSTEM_GET_DATA_STORAGE_ALL_VALUES_NO_PARENT["is_flagged"],
+            }
+        )
+
+    def test_get_with_matching_etag(self):
+        """Test getting a system that hasn't been modified since it was last obtained."""
+
+        system_id = self.post_system(SYSTEM_POST_DATA_STORAGE_ALL_VALUES_NO_PARENT)
+        self.get_system(system_id)
+        etag = self._get_response_system.headers["ETag"]
+
+        self.get_system(system_id, etag=etag)
+        self.check_get_system_not_modified(etag)
+
+    def test_get_with_outdated_etag(self):
+        """Test getting a system that has been modified since it was last obtained."""
+
+        system_id = self.post_system(SYSTEM_POST_DATA_STORAGE_ALL_VALUES_NO_PARENT)
+        self.get_system(system_id)
+        etag = self._get_response_system.headers["ETag"]
+        self.test_client.patch(f"/v1/systems/{system_id}", json={"name": "New name"})
+
+        self.get_system(system_id, etag=etag)
+        assert self._get_response_system.status_code == 200
+        assert self._get_response_system.json()["name"] == "New name"
+        assert self._get_response_system.headers["ETag"] != etag
+
+    def test_get_with_invalid_fields(self):
+        """Test getting a system with fields that don't exist."""
+
+        self.get_system(str(ObjectId()), fields="name,invalid_field")
+        self.check_get_system_failed_with_detail(422, "Invalid field(s) requested: invalid_field")
+
     def test_get_with_non_existent_id(self):
         """Test getting a system with a non-existent ID."""
 
@@ -346,6 +409,18 @@ class TestGetBreadcrumbs(GetBreadcrumbsDSL):
             expected_trail_length=BREADCRUMBS_TRAIL_MAX_LENGTH, expected_full_trail=False
         )
 
+    def test_get_breadcrumbs_after_renaming_ancestor(self):
+        """Test getting a system's breadcrumbs again after one of its ancestors has been renamed."""
+
+        system_ids = self.post_nested_systems(3)
+        self.get_last_system_breadcrumbs()
+
+        self.test_client.patch(f"/v1/systems/{system_ids[0]}", json={"name": "Renamed System"})
+        self._posted_systems_get_data[0]["name"] = "Renamed System"
+
+        self.get_last_system_breadcrumbs()
+        self.check_get_system_breadcrumbs_success(expected_trail_length=3, expected_full_trail=True)
+
     def test_get_breadcrumbs_with_non_existent_id(self):
         """Test getting a system's breadcrumbs when given a non-existent system ID."""
 
@@ -359,17 +434,186 @@ class TestGetBreadcrumbs(GetBreadcrumbsDSL):
         self.check_get_system_breadcrumbs_failed_with_detail(404, "System not found")
 
 
+class GetManyBreadcrumbsDSL(GetBreadcrumbsDSL):
+    """Base class for batch breadcrumbs tests."""
+
+    def get_many_system_breadcrumbs(self, system_ids: list[str]) -> None:
+        """
+        Gets the breadcrumbs of multiple systems given their IDs.
+
+        :param system_ids: IDs of the systems to obtain the breadcrumbs of.
+        """
+
+        self._get_response_system = self.test_client.post("/v1/systems/breadcrumbs", json=system_ids)
+
+    def check_get_many_system_breadcrumbs_success(self, expected_trail_lengths: dict[str, int]) -> None:
+        """
+        Checks that a prior call to `get_many_system_breadcrumbs` gave a successful response with the expected data
+        returned.
+
+        :param expected_trail_lengths: Dictionary of the expected trail lengths of the returned breadcrumbs, keyed by
+                                       the IDs of the nested systems they are expected to be returned for. Each trail
+                                       is expected to be the full trail.
+        """
+
+        positions = {system["id"]: i for i, system in enumerate(self._posted_systems_get_data)}
+
+        assert self._get_response_system.status_code == 200
+        assert self._get_response_system.json() == {
+            system_id: {
+                "trail": [
+                    [system["id"], system["name"]]
+                    for system in self._posted_systems_get_data[
+                        positions[system_id] + 1 - trail_length : positions[system_id] + 1
+                    ]
+                ],
+                "full_trail": True,
+            }
+            for system_id, trail_length in expected_trail_lengths.items()
+        }
+
+
+class TestGetManyBreadcrumbs(GetManyBreadcrumbsDSL):
+    """Tests for getting the breadcrumbs of multiple systems."""
+
+    def test_get_many_breadcrumbs(self):
+        """Test getting the breadcrumbs of multiple systems that share ancestors."""
+
+        system_ids = self.post_nested_systems(3)
+        self.get_many_system_breadcrumbs(system_ids)
+        self.check_get_many_system_breadcrumbs_success({system_ids[0]: 1, system_ids[1]: 2, system_ids[2]: 3})
+
+    def test_get_many_breadcrumbs_with_non_existent_and_invalid_ids(self):
+        """Test getting the breadcrumbs of multiple systems when some of the IDs are non-existent or invalid."""
+
+        system_ids = self.post_nested_systems(2)
+        self.get_many_system_breadcrumbs([system_ids[1], str(ObjectId()), "invalid_id"])
+        self.check_get_many_system_breadcrumbs_success({system_ids[1]: 2})
+
+    def test_get_many_breadcrumbs_with_no_ids(self):
+        """Test getting the breadcrumbs of multiple systems when no IDs are given."""
+
+        self.get_many_system_breadcrumbs([])
+        self.check_get_many_system_breadcrumbs_success({})
+
+    def test_get_many_breadcrumbs_with_too_many_ids(self):
+        """Test getting the breadcrumbs of multiple systems when more IDs are given than are allowed."""
+
+        self.get_many_system_breadcrumbs([str(ObjectId()) for _ in range(BREADCRUMBS_BATCH_MAX_IDS + 1)])
+
+        assert self._get_response_system.status_code == 422
+
+
+class GetTreeDSL(GetBreadcrumbsDSL):
+    """Base class for tree tests."""
+
+    def get_system_tree(self, system_id: str, max_depth: Optional[int] = None) -> None:
+        """
+        Gets a system along with all of its descendants given its ID.
+
+        :param system_id: ID of the system to obtain the tree of.
+        :param max_depth: Maximum depth of the descendants to obtain, or `None` to obtain all of them.
+        """
+
+        self._get_response_system = self.test_client.get(
+            f"/v1/systems/{system_id}/tree", params={} if max_depth is None else {"max_depth": max_depth}
+        )
+
+    def check_get_system_tree_success(self, expected_systems_get_data: list[dict]) -> None:
+        """
+        Checks that a prior call to `get_system_tree` gave a successful response with the expected data returned.
+
+        :param expected_systems_get_data: List of dictionaries containing the expected system data returned as would
+                                          be required for `SystemSchema`'s in order from the top of the tree down.
+        """
+
+        assert self._get_response_system.status_code == 200
+        assert self._get_response_system.json() == expected_systems_get_data
+
+    def check_get_system_tree_failed_with_detail(self, status_code: int, detail: str) -> None:
+        """
+        Checks that a prior call to `get_system_tree` gave a failed response with the expected code and error message.
+
+        :param status_code: Expected status code of the response.
+        :param detail: Expected detail given in the response.
+        """
+
+        assert self._get_response_system.status_code == status_code
+        assert self._get_response_system.json()["detail"] == detail
+
+
+class TestGetTree(GetTreeDSL):
+    """Tests for getting a system along with all of its descendants."""
+
+    def test_get_tree(self):
+        """Test getting a system along with all of its descendants."""
+
+        system_ids = self.post_nested_systems(4)
+        self.get_system_tree(system_ids[1])
+        self.check_get_system_tree_success(self._posted_systems_get_data[1:])
+
+    def test_get_tree_with_max_depth(self):
+        """Test getting a system along with its descendants up to a maximum depth."""
+
+        system_ids = self.post_nested_systems(4)
+        self.get_system_tree(system_ids[0], max_depth=2)
+        self.check_get_system_tree_success(self._posted_systems_get_data[:3])
+
+    def test_get_tree_after_move(self):
+        """Test getting a system along with all of its descendants after one of them has been moved elsewhere."""
+
+        system_ids = self.post_nested_systems(4)
+        self.test_client.patch(f"/v1/systems/{system_ids[2]}", json={"parent_id": None})
+        self.get_system_tree(system_ids[0])
+        self.check_get_system_tree_success(self._posted_systems_get_data[:2])
+
+    def test_get_tree_with_invalid_max_depth(self):
+        """Test getting a system's tree with a negative maximum depth."""
+
+        system_ids = self.post_nested_systems(1)
+        self.get_system_tree(system_ids[0], max_depth=-1)
+
+        assert self._get_response_system.status_code == 422
+
+    def test_get_tree_with_non_existent_id(self):
+        """Test getting a system's tree when given a non-existent system ID."""
+
+        self.get_system_tree(str(ObjectId()))
+        self.check_get_system_tree_failed_with_detail(404, "System not found")
+
+    def test_get_tree_with_invalid_id(self):
+        """Test getting a system's tree when given an invalid system ID."""
+
+        self.get_system_tree("invalid_id")
+        self.check_get_system_tree_failed_with_detail(404, "System not found")
+
+
 class ListDSL(GetBreadcrumbsDSL):
     """Base class for list tests."""
 
-    def get_systems(self, filters: dict) -> None:
+    def get_systems(self, filters: dict, etag: Optional[str] = None) -> None:
         """
         Gets a list of systems with the given filters.
 
+        :param filters: Filters to use in the request.
+        :param etag: ETag of a previously obtained version of the list to only obtain it if it has since changed, or
+                     `None` to always obtain it.
+        """
+
+        self._get_response_system = self.test_client.get(
+            "/v1/systems", params=filters, headers={"If-None-Match": etag} if etag is not None else None
+        )
+
+    def get_systems_ndjson(self, filters: dict) -> None:
+        """
+        Gets a list of systems with the given filters as a streamed NDJSON response.
+
         :param filters: Filters to use in the request.
         """
 
-        self._get_response_system = self.test_client.get("/v1/systems", params=filters)
+        self._get_response_system = self.test_client.get(
+            "/v1/systems", params=filters, headers={"Accept": "application/x-ndjson"}
+        )
 
     def post_test_system_with_child(self) -> list[dict]:
         """
@@ -398,6 +642,18 @@ class ListDSL(GetBreadcrumbsDSL):
         assert self._get_response_system.status_code == 200
         assert self._get_response_system.json() == expected_systems_get_data
 
+    def check_get_systems_ndjson_success(self, expected_systems_get_data: list[dict]) -> None:
+        """
+        Checks that a prior call to `get_systems_ndjson` gave a successful response with the expected data returned.
+
+        :param expected_systems_get_data: List of dictionaries containing the expected system data returned as would be
+                                          required for `SystemSchema`'s.
+        """
+
+        assert self._get_response_system.status_code == 200
+        assert self._get_response_system.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in self._get_response_system.text.splitlines()] == expected_systems_get_data
+
 
 class TestList(ListDSL):
     """Tests for getting a list of systems."""
@@ -449,6 +705,77 @@ class TestList(ListDSL):
         self.get_systems(filters={"parent_id": "invalid-id"})
         self.check_get_systems_success([])
 
+    def test_list_as_ndjson(self):
+        """
+        Test getting a list of all systems as a streamed NDJSON response.
+
+        Posts a system with a child and expects both to be returned, one per line.
+        """
+
+        systems = self.post_test_system_with_child()
+        self.get_systems_ndjson(filters={})
+        self.check_get_systems_ndjson_success(systems)
+
+    def test_list_as_ndjson_with_invalid_parent_id_filter(self):
+        """Test getting a list of all systems as a streamed NDJSON response with an invalid `parent_id` filter."""
+
+        self.get_systems_ndjson(filters={"parent_id": "invalid-id"})
+        self.check_get_systems_ndjson_success([])
+
+    def test_list_with_fields(self):
+        """Test getting a list of only specific fields of all systems."""
+
+        systems = self.post_test_system_with_child()
+        self.get_systems(filters={"fields": "name,parent_id"})
+        self.check_get_systems_success(
+            [{"id": system["id"], "name": system["name"], "parent_id": system["parent_id"]} for system in systems]
+        )
+
+    def test_list_with_matching_etag(self):
+        """Test getting a list of systems that haven't been modified since they were last obtained."""
+
+        self.post_test_system_with_child()
+        self.get_systems(filters={})
+        etag = self._get_response_system.headers["ETag"]
+
+        self.get_systems(filters={}, etag=etag)
+        self.check_get_system_not_modified(etag)
+
+    def test_list_with_etag_after_creating_system(self):
+        """Test getting a list of systems after another system has been created since it was last obtained."""
+
+        systems = self.post_test_system_with_child()
+        self.get_systems(filters={"parent_id": "null"})
+        etag = self._get_response_system.headers["ETag"]
+        self.post_system(SYSTEM_POST_DATA_STORAGE_REQUIRED_VALUES_ONLY)
+
+        self.get_systems(filters={"parent_id": "null"}, etag=etag)
+        self.check_get_systems_success([systems[0], SYSTEM_GET_DATA_STORAGE_REQUIRED_VALUES_ONLY])
+
+    def test_list_with_etag_after_deleting_system(self):
+        """Test getting a list of systems after one of them has been deleted since it was last obtained."""
+
+        systems = self.post_test_system_with_child()
+        self.get_systems(filters={})
+        etag = self._get_response_system.headers["ETag"]
+        self.test_client.delete(f"/v1/systems/{systems[1]['id']}")
+
+        self.get_systems(filters={}, etag=etag)
+        self.check_get_systems_success([systems[0]])
+
+    def test_list_with_invalid_fields(self):
+        """Test getting a list of all systems with fields that don't exist."""
+
+        self.get_systems(filters={"fields": "invalid_field"})
+        self.check_get_system_failed_with_detail(422, "Invalid field(s) requested: invalid_field")
+
+    def test_list_as_ndjson_with_fields(self):
+        """Test getting a list of only specific fields of all systems as a streamed NDJSON response."""
+
+        systems = self.post_test_system_with_child()
+        self.get_systems_ndjson(filters={"fields": "name"})
+        self.check_get_systems_ndjson_success([{"id": system["id"], "name": system["name"]} for system in systems])
+
 
 class UpdateDSL(ListDSL):
     """Base class for update tests."""
@@ -783,6 +783,7 @@ ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY = {
     **ITEM_DATA_NEW_REQUIRED_VALUES_ONLY,
     "catalogue_item_id": str(ObjectId()),
     "system_id": str(ObjectId()),
+    "system_type_id": str(ObjectId()),
     "usage_status": USAGE_STATUS_GET_DATA_NEW["value"],
 }
 
@@ -816,6 +817,7 @@ ITEM_IN_DATA_NEW_ALL_VALUES_NO_PROPERTIES = {
     **ITEM_DATA_NEW_ALL_VALUES_NO_PROPERTIES,
     "catalogue_item_id": str(ObjectId()),
     "system_id": str(ObjectId()),
+    "system_type_id": str(ObjectId()),
     "usage_status": USAGE_STATUS_OUT_DATA_NEW["value"],
 }
 
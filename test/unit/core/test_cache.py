@@ -0,0 +1,179 @@
+"""
+Unit tests for the `VersionedCache` inside the `cache` module.
+"""
+
+from unittest.mock import Mock, patch
+
+from inventory_management_system_api.core.cache import VersionedCache
+
+
+def test_get_or_load():
+    """Test `get_or_load` only calls the loader when the value isn't already cached."""
+
+    cache = VersionedCache()
+    loader = Mock(return_value="value")
+
+    assert cache.get_or_load("key", loader) == "value"
+    assert cache.get_or_load("key", loader) == "value"
+    loader.assert_called_once_with()
+
+
+def test_get_or_load_caches_none():
+    """Test `get_or_load` also caches `None` values."""
+
+    cache = VersionedCache()
+    loader = Mock(return_value=None)
+
+    assert cache.get_or_load("key", loader) is None
+    assert cache.get_or_load("key", loader) is None
+    loader.assert_called_once_with()
+
+
+def test_get_or_load_with_different_keys():
+    """Test `get_or_load` caches values separately for each key."""
+
+    cache = VersionedCache()
+
+    assert cache.get_or_load("key1", lambda: "value1") == "value1"
+    assert cache.get_or_load("key2", lambda: "value2") == "value2"
+    assert cache.get_or_load("key1", lambda: "other") == "value1"
+
+
+def test_get_or_load_after_expiry():
+    """Test `get_or_load` reloads a value once it has expired."""
+
+    cache = VersionedCache(ttl_seconds=10)
+    loader = Mock(side_effect=["value1", "value2"])
+
+    with patch("inventory_management_system_api.core.cache.time") as mock_time:
+        mock_time.monotonic.return_value = 100
+        assert cache.get_or_load("key", loader) == "value1"
+        mock_time.monotonic.return_value = 109
+        assert cache.get_or_load("key", loader) == "value1"
+        mock_time.monotonic.return_value = 110
+        assert cache.get_or_load("key", loader) == "value2"
+
+
+def test_get_many_or_load():
+    """Test `get_many_or_load` only loads the values that aren't already cached using a single call to the loader."""
+
+    cache = VersionedCache()
+    cache.get_or_load("key1", lambda: "value1")
+    loader = Mock(return_value={"key2": "value2"})
+
+    assert cache.get_many_or_load(["key1", "key2", "key3", "key2"], loader) == {
+        "key1": "value1",
+        "key2": "value2",
+        "key3": None,
+    }
+    loader.assert_called_once_with(["key2", "key3"])
+    # Values that weren't found should also have been cached as `None`
+    assert cache.get_many_or_load(["key1", "key2", "key3"], loader) == {
+        "key1": "value1",
+        "key2": "value2",
+        "key3": None,
+    }
+    loader.assert_called_once()
+
+
+def test_get_many_or_load_when_invalidated_while_loading():
+    """Test `get_many_or_load` doesn't cache values that were loaded while the cache was being invalidated."""
+
+    cache = VersionedCache()
+
+    def loader(keys):
+        cache.invalidate()
+        return {key: "stale" for key in keys}
+
+    assert cache.get_many_or_load(["key1", "key2"], loader) == {"key1": "stale", "key2": "stale"}
+    assert cache.get_statistics()["entries"] == 0
+
+
+def test_invalidate():
+    """Test `invalidate` discards all entries and increments the version."""
+
+    cache = VersionedCache()
+    loader = Mock(side_effect=["value1", "value2"])
+
+    cache.get_or_load("key", loader)
+    cache.invalidate()
+
+    assert cache.version == 1
+    assert cache.get_or_load("key", loader) == "value2"
+
+
+def test_invalidate_with_keys():
+    """Test `invalidate` only discards the entries with the given keys when some are given."""
+
+    cache = VersionedCache()
+
+    cache.get_or_load("key1", lambda: "value1")
+    cache.get_or_load("key2", lambda: "value2")
+    cache.get_or_load("key3", lambda: "value3")
+    cache.invalidate(["key1", "key3", "missing-key"])
+
+    assert cache.version == 1
+    assert cache.get_or_load("key1", lambda: "reloaded1") == "reloaded1"
+    assert cache.get_or_load("key2", lambda: "reloaded2") == "value2"
+    assert cache.get_or_load("key3", lambda: "reloaded3") == "reloaded3"
+
+
+def test_invalidate_where():
+    """Test `invalidate_where` only discards the entries matching the predicate."""
+
+    cache = VersionedCache()
+
+    cache.get_or_load("key1", lambda: "value1")
+    cache.get_or_load("key2", lambda: "value2")
+    cache.get_or_load("key3", lambda: "value3")
+    cache.invalidate_where(lambda key, value: key == "key1" or value == "value3")
+
+    assert cache.version == 1
+    assert cache.get_or_load("key1", lambda: "reloaded1") == "reloaded1"
+    assert cache.get_or_load("key2", lambda: "reloaded2") == "value2"
+    assert cache.get_or_load("key3", lambda: "reloaded3") == "reloaded3"
+
+
+def test_get_or_load_when_invalidated_while_loading():
+    """Test `get_or_load` doesn't cache a value that was loaded while the cache was being invalidated."""
+
+    cache = VersionedCache()
+
+    def loader():
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get_or_load("key", loader) == "stale"
+    assert cache.get_or_load("key", lambda: "value") == "value"
+
+
+def test_get_or_load_with_max_size():
+    """Test `get_or_load` evicts the least recently used entry when the maximum size is exceeded."""
+
+    cache = VersionedCache(max_size=2)
+    loader = Mock(side_effect=lambda: "reloaded")
+
+    cache.get_or_load("key1", lambda: "value1")
+    cache.get_or_load("key2", lambda: "value2")
+    # Use the first key so the second is the least recently used
+    cache.get_or_load("key1", loader)
+    cache.get_or_load("key3", lambda: "value3")
+
+    assert cache.get_or_load("key1", loader) == "value1"
+    assert cache.get_or_load("key3", loader) == "value3"
+    assert cache.get_or_load("key2", loader) == "reloaded"
+    assert cache.get_statistics()["entries"] == 2
+
+
+def test_get_statistics():
+    """Test `get_statistics` returns the number of entries, hits, misses and invalidations."""
+
+    cache = VersionedCache()
+
+    cache.get_or_load("key1", lambda: "value1")
+    cache.get_or_load("key1", lambda: "value1")
+    cache.get_or_load("key1", lambda: "value1")
+    cache.invalidate()
+    cache.get_or_load("key2", lambda: "value2")
+
+    assert cache.get_statistics() == {"entries": 1, "hits": 2, "misses": 2, "invalidations": 1}
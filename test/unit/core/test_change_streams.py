@@ -0,0 +1,168 @@
+"""
+Unit tests for the `ChangeStreamWatcher` inside the `change_streams` module.
+"""
+
+from typing import Optional
+from unittest.mock import MagicMock, Mock, call, patch
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from inventory_management_system_api.core.change_streams import (
+    CHANGE_STREAMS_NOT_SUPPORTED_ERROR_CODE,
+    ChangeStreamWatcher,
+)
+
+
+class ChangeStreamWatcherDSL:
+    """Base class for `ChangeStreamWatcher` tests."""
+
+    watcher: ChangeStreamWatcher
+    mock_database: MagicMock
+    mock_stream: MagicMock
+    mock_settings_callback: Mock
+    mock_rules_callback: Mock
+    mock_systems_change_callback: Mock
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup fixtures."""
+
+        self.watcher = ChangeStreamWatcher()
+        self.mock_settings_callback = Mock()
+        self.mock_rules_callback = Mock()
+        self.watcher.register(["settings", "system_types"], self.mock_settings_callback)
+        self.watcher.register(["rules"], self.mock_rules_callback)
+        self.mock_systems_change_callback = Mock()
+        self.watcher.register_change_callback(["systems"], self.mock_systems_change_callback)
+
+        self.mock_database = MagicMock()
+        self.mock_stream = self.mock_database.watch.return_value.__enter__.return_value
+
+    def mock_changes(self, collection_names: list[str]) -> None:
+        """
+        Mocks the change stream to return changes for the given collections before the watcher is stopped.
+
+        :param collection_names: Names of the collections to return a change for (in order).
+        """
+
+        changes = [self._create_change(collection_name) for collection_name in collection_names]
+
+        def try_next():
+            if changes:
+                return changes.pop(0)
+            # No more changes so stop the watcher
+            # pylint:disable=protected-access
+            self.watcher._stop_event.set()
+            return None
+
+        self.mock_stream.alive = True
+        self.mock_stream.try_next.side_effect = try_next
+
+    @staticmethod
+    def _create_change(collection_name: str) -> dict:
+        """
+        Creates a mock change event for a collection.
+
+        :param collection_name: Name of the collection the change is for.
+        :return: The mock change event.
+        """
+        return {"ns": {"db": "ims", "coll": collection_name}}
+
+    def call_watch(self) -> None:
+        """Calls the `ChangeStreamWatcher` `_watch` method directly so it runs in the current thread."""
+
+        # pylint:disable=protected-access
+        self.watcher._watch(self.mock_database)
+
+    def check_watch_success(
+        self,
+        expected_settings_calls: int,
+        expected_rules_calls: int,
+        expected_systems_changes: Optional[list[Optional[dict]]] = None,
+    ) -> None:
+        """
+        Checks that a prior call to `call_watch` worked as expected.
+
+        :param expected_settings_calls: Expected number of times the settings callback should have been called.
+        :param expected_rules_calls: Expected number of times the rules callback should have been called.
+        :param expected_systems_changes: Expected changes the systems change callback should have been called with (in
+                                         order).
+        """
+
+        self.mock_database.watch.assert_called_once()
+        assert self.mock_database.watch.call_args.args[0] == [
+            {"$match": {"ns.coll": {"$in": ["settings", "system_types", "rules", "systems"]}}}
+        ]
+        assert self.mock_settings_callback.call_count == expected_settings_calls
+        assert self.mock_rules_callback.call_count == expected_rules_calls
+        assert self.mock_systems_change_callback.call_args_list == [
+            call(change) for change in expected_systems_changes or []
+        ]
+
+
+class TestChangeStreamWatcher(ChangeStreamWatcherDSL):
+    """Tests for `ChangeStreamWatcher`."""
+
+    def test_notify(self):
+        """Test `notify` only calls the callbacks registered for the given collections."""
+
+        self.watcher.notify(["system_types"])
+
+        self.mock_settings_callback.assert_called_once_with()
+        self.mock_rules_callback.assert_not_called()
+        self.mock_systems_change_callback.assert_not_called()
+
+    def test_notify_with_change(self):
+        """Test `notify` calls the change callbacks registered for the given collections with the change."""
+
+        change = self._create_change("systems")
+        self.watcher.notify(["systems"], change)
+
+        self.mock_settings_callback.assert_not_called()
+        self.mock_rules_callback.assert_not_called()
+        self.mock_systems_change_callback.assert_called_once_with(change)
+
+    def test_notify_all(self):
+        """Test `notify` calls all of the callbacks when no collections are given."""
+
+        self.watcher.notify()
+
+        self.mock_settings_callback.assert_called_once_with()
+        self.mock_rules_callback.assert_called_once_with()
+        self.mock_systems_change_callback.assert_called_once_with(None)
+
+    def test_watch(self):
+        """Test watching for changes calls all callbacks when opened and then those for each changed collection, giving
+        the change to any registered for changes."""
+
+        self.mock_changes(["settings", "rules", "systems", "system_types"])
+        self.call_watch()
+        self.check_watch_success(
+            expected_settings_calls=3,
+            expected_rules_calls=2,
+            expected_systems_changes=[None, self._create_change("systems")],
+        )
+
+    def test_watch_when_change_streams_not_supported(self):
+        """Test watching for changes stops when change streams are not supported by the database."""
+
+        self.mock_database.watch.side_effect = OperationFailure(
+            "Not supported", code=CHANGE_STREAMS_NOT_SUPPORTED_ERROR_CODE
+        )
+        self.call_watch()
+        self.check_watch_success(expected_settings_calls=0, expected_rules_calls=0)
+
+    def test_watch_retries_after_error(self):
+        """Test watching for changes reopens the change stream after any other error."""
+
+        self.mock_changes([])
+        self.mock_database.watch.return_value.__enter__.side_effect = [OperationFailure("Failure"), self.mock_stream]
+
+        with patch("inventory_management_system_api.core.change_streams.CHANGE_STREAM_RETRY_DELAY_SECONDS", 0):
+            self.call_watch()
+
+        assert self.mock_database.watch.call_count == 2
+        self.mock_settings_callback.assert_called_once_with()
+        self.mock_rules_callback.assert_called_once_with()
+        self.mock_systems_change_callback.assert_called_once_with(None)
@@ -0,0 +1,149 @@
+"""
+Unit tests for functions inside the `conditional_requests` module.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from unittest.mock import Mock
+
+import pytest
+from bson import ObjectId
+from pydantic import BaseModel
+
+from inventory_management_system_api.core.conditional_requests import (
+    compute_list_version,
+    create_etag,
+    create_not_modified_response,
+    has_if_none_match,
+    is_not_modified,
+)
+
+
+class ExampleModel(BaseModel):
+    """Model used to test ETag creation."""
+
+    name: str
+
+
+class OtherExampleModel(BaseModel):
+    """Model with different fields used to test ETag creation."""
+
+    name: str
+    description: Optional[str] = None
+
+
+def test_create_etag():
+    """Test `create_etag` returns the same weak ETag when given the same schema and values."""
+
+    etag = create_etag(ExampleModel, "value", 1)
+
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert create_etag(ExampleModel, "value", 1) == etag
+
+
+@pytest.mark.parametrize(
+    "schema, values",
+    [
+        pytest.param(ExampleModel, ("value", 2), id="different_values"),
+        pytest.param(OtherExampleModel, ("value", 1), id="different_schema"),
+    ],
+)
+def test_create_etag_with_differences(schema, values):
+    """Test `create_etag` returns a different ETag when given a different schema or values."""
+
+    assert create_etag(schema, *values) != create_etag(ExampleModel, "value", 1)
+
+
+# IDs and modified times of the entities in a list used to test computing list versions
+LIST_VERSION_ENTITIES = [
+    (ObjectId(), datetime(2024, 1, 1, tzinfo=timezone.utc)),
+    (ObjectId(), datetime(2024, 1, 2, tzinfo=timezone.utc)),
+]
+
+
+def test_compute_list_version():
+    """Test `compute_list_version` returns the same version regardless of whether the IDs are given as strings."""
+
+    assert compute_list_version(LIST_VERSION_ENTITIES) == compute_list_version(
+        (str(entity_id), modified_time) for entity_id, modified_time in LIST_VERSION_ENTITIES
+    )
+
+
+@pytest.mark.parametrize(
+    "entities",
+    [
+        pytest.param([], id="empty"),
+        pytest.param(LIST_VERSION_ENTITIES[:1], id="deleted"),
+        pytest.param(LIST_VERSION_ENTITIES[:1] + [(ObjectId(), LIST_VERSION_ENTITIES[1][1])], id="replaced"),
+        pytest.param(
+            LIST_VERSION_ENTITIES[:1] + [(LIST_VERSION_ENTITIES[1][0], datetime(2024, 1, 3, tzinfo=timezone.utc))],
+            id="modified",
+        ),
+        pytest.param(
+            [(LIST_VERSION_ENTITIES[0][0], LIST_VERSION_ENTITIES[0][1] + timedelta(milliseconds=1))]
+            + LIST_VERSION_ENTITIES[1:],
+            id="modified_other_than_latest",
+        ),
+        pytest.param(list(reversed(LIST_VERSION_ENTITIES)), id="reordered"),
+    ],
+)
+def test_compute_list_version_with_differences(entities):
+    """Test `compute_list_version` returns a different version when any of the entities in the list differ."""
+
+    assert compute_list_version(entities) != compute_list_version(LIST_VERSION_ENTITIES)
+
+
+def test_compute_list_version_with_other_values():
+    """Test `compute_list_version` returns a different version when only another value of an entity differs."""
+
+    entities = [(entity_id, modified_time, 1) for entity_id, modified_time in LIST_VERSION_ENTITIES]
+
+    assert compute_list_version(entities) == compute_list_version(list(entities))
+    assert compute_list_version(entities) != compute_list_version(LIST_VERSION_ENTITIES)
+    assert compute_list_version(entities) != compute_list_version(entities[:1] + [(*entities[1][:2], 2)])
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        pytest.param({}, False, id="no_if_none_match_header"),
+        pytest.param({"if-none-match": 'W/"etag"'}, True, id="if_none_match_header"),
+    ],
+)
+def test_has_if_none_match(headers, expected):
+    """Test `has_if_none_match` correctly identifies when the request is conditional."""
+
+    request = Mock()
+    request.headers = headers
+
+    assert has_if_none_match(request) == expected
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        pytest.param(None, False, id="no_if_none_match_header"),
+        pytest.param('W/"etag"', True, id="matching"),
+        pytest.param('"etag"', True, id="matching_strong"),
+        pytest.param('W/"other"', False, id="not_matching"),
+        pytest.param('W/"other", W/"etag"', True, id="matching_one_of_many"),
+        pytest.param("*", True, id="any"),
+    ],
+)
+def test_is_not_modified(if_none_match, expected):
+    """Test `is_not_modified` correctly identifies when the client already holds the current version."""
+
+    request = Mock()
+    request.headers = {"if-none-match": if_none_match} if if_none_match is not None else {}
+
+    assert is_not_modified(request, 'W/"etag"') == expected
+
+
+def test_create_not_modified_response():
+    """Test `create_not_modified_response` returns an empty 304 response containing the ETag."""
+
+    response = create_not_modified_response('W/"etag"')
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == 'W/"etag"'
+    assert response.body == b""
@@ -2,14 +2,62 @@
 Unit tests for functions inside the `database` module.
 """
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from pydantic import ValidationError
 from pymongo.errors import OperationFailure
 
-from inventory_management_system_api.core.database import start_session_transaction
+from inventory_management_system_api.core.config import DatabaseConfig
+from inventory_management_system_api.core.database import (
+    get_client_options,
+    run_after_commit,
+    start_session_transaction,
+)
 from inventory_management_system_api.core.exceptions import WriteConflictError
 
+DATABASE_CONFIG_DATA = {
+    "protocol": "mongodb",
+    "username": "username",
+    "password": "password",
+    "host_and_options": "localhost:27017",
+    "name": "ims",
+}
+
+
+def test_get_client_options():
+    """Test `get_client_options` returns all configured options."""
+
+    database_config = DatabaseConfig(
+        **DATABASE_CONFIG_DATA,
+        max_pool_size=50,
+        min_pool_size=5,
+        max_idle_time_ms=60000,
+        wait_queue_timeout_ms=1000,
+        compressors=["zlib"],
+    )
+
+    assert get_client_options(database_config) == {
+        "maxPoolSize": 50,
+        "minPoolSize": 5,
+        "maxIdleTimeMS": 60000,
+        "waitQueueTimeoutMS": 1000,
+        "compressors": ["zlib"],
+    }
+
+
+def test_get_client_options_when_not_configured():
+    """Test `get_client_options` omits any options that are not configured so the driver defaults are used."""
+
+    assert not get_client_options(DatabaseConfig(**DATABASE_CONFIG_DATA))
+
+
+def test_database_config_with_unsupported_compressor():
+    """Test `DatabaseConfig` rejects compressors that require packages that are not installed."""
+
+    with pytest.raises(ValidationError):
+        DatabaseConfig(**DATABASE_CONFIG_DATA, compressors=["zstd", "zlib"])
+
 
 @patch("inventory_management_system_api.core.database.mongodb_client")
 def test_start_session_transaction(mock_mongodb_client):
@@ -53,3 +101,57 @@ def test_start_session_transaction_with_operation_failure_write_conflict(mock_mo
     assert expected_session == session
     expected_session.start_transaction.assert_called_once()
     assert str(exc.value) == "Write conflict while testing. Please try again later."
+
+
+@patch("inventory_management_system_api.core.database.mongodb_client")
+def test_run_after_commit(mock_mongodb_client):
+    """Test `run_after_commit` runs the callback only once the transaction has been committed."""
+
+    expected_session = MagicMock()
+    mock_mongodb_client.start_session.return_value.__enter__.return_value = expected_session
+    callback = Mock()
+
+    with start_session_transaction("testing") as session:
+        run_after_commit(session, callback)
+        callback.assert_not_called()
+        # The transaction is committed when its context manager exits without an exception
+        expected_session.start_transaction.return_value.__exit__.assert_not_called()
+
+    expected_session.start_transaction.return_value.__exit__.assert_called_once_with(None, None, None)
+    callback.assert_called_once_with()
+
+
+@patch("inventory_management_system_api.core.database.mongodb_client")
+def test_run_after_commit_with_aborted_transaction(mock_mongodb_client):
+    """Test `run_after_commit` doesn't run the callback when the transaction is aborted."""
+
+    mock_mongodb_client.start_session.return_value.__enter__.return_value = MagicMock()
+    callback = Mock()
+
+    with pytest.raises(OperationFailure):
+        with start_session_transaction("testing") as session:
+            run_after_commit(session, callback)
+            raise OperationFailure("Some operation error.")
+
+    callback.assert_not_called()
+
+
+def test_run_after_commit_without_session():
+    """Test `run_after_commit` runs the callback immediately when there is no session."""
+
+    callback = Mock()
+
+    run_after_commit(None, callback)
+
+    callback.assert_called_once_with()
+
+
+def test_run_after_commit_without_transaction():
+    """Test `run_after_commit` runs the callback immediately when the session wasn't started by
+    `start_session_transaction`."""
+
+    callback = Mock()
+
+    run_after_commit(MagicMock(), callback)
+
+    callback.assert_called_once_with()
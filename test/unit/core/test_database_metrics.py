@@ -0,0 +1,50 @@
+"""
+Unit tests for the `ConnectionPoolMetrics` listener inside the `database_metrics` module.
+"""
+
+from pymongo import monitoring
+
+from inventory_management_system_api.core.database_metrics import ConnectionPoolMetrics
+
+ADDRESS = ("localhost", 27017)
+
+
+def test_get_statistics_with_no_events():
+    """Test `get_statistics` before any events have been published."""
+
+    assert ConnectionPoolMetrics().get_statistics() == {
+        "connections": 0,
+        "connections_checked_out": 0,
+        "checkouts": 0,
+        "checkout_failures": {},
+        "checkout_wait_time_total_seconds": 0.0,
+        "checkout_wait_time_max_seconds": 0.0,
+        "pool_clears": 0,
+    }
+
+
+def test_get_statistics():
+    """Test `get_statistics` records the published connection pool events."""
+
+    metrics = ConnectionPoolMetrics()
+
+    metrics.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 1))
+    metrics.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 2))
+    metrics.connection_checked_out(monitoring.ConnectionCheckedOutEvent(ADDRESS, 1, 0.5))
+    metrics.connection_checked_out(monitoring.ConnectionCheckedOutEvent(ADDRESS, 2, 1.5))
+    metrics.connection_checked_in(monitoring.ConnectionCheckedInEvent(ADDRESS, 1))
+    metrics.connection_check_out_failed(
+        monitoring.ConnectionCheckOutFailedEvent(ADDRESS, monitoring.ConnectionCheckOutFailedReason.TIMEOUT, 2.0)
+    )
+    metrics.connection_closed(monitoring.ConnectionClosedEvent(ADDRESS, 1, monitoring.ConnectionClosedReason.STALE))
+    metrics.pool_cleared(monitoring.PoolClearedEvent(ADDRESS))
+
+    assert metrics.get_statistics() == {
+        "connections": 1,
+        "connections_checked_out": 1,
+        "checkouts": 2,
+        "checkout_failures": {"timeout": 1},
+        "checkout_wait_time_total_seconds": 4.0,
+        "checkout_wait_time_max_seconds": 2.0,
+        "pool_clears": 1,
+    }
@@ -0,0 +1,165 @@
+"""
+Unit tests for functions inside the `filtering` module.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from bson import ObjectId
+from pydantic import AwareDatetime
+
+from inventory_management_system_api.core.custom_object_id import CustomObjectId
+from inventory_management_system_api.core.exceptions import InvalidFilterError, InvalidSortError
+from inventory_management_system_api.core.filtering import (
+    EQUALITY_OPERATORS,
+    RANGE_OPERATORS,
+    Filter,
+    FilterField,
+    FilterOperator,
+    Sort,
+    create_filter_description,
+    create_sort_description,
+    get_fields_for_sort,
+    parse_filters,
+    parse_sort,
+)
+from inventory_management_system_api.models.custom_object_id_data_types import CustomObjectIdField
+
+EXAMPLE_ID = str(ObjectId())
+
+EXAMPLE_FILTER_FIELDS = {
+    "parent_id": FilterField(value_type=CustomObjectIdField, operators=EQUALITY_OPERATORS),
+    "is_flagged": FilterField(value_type=bool, operators=frozenset({FilterOperator.EQ})),
+    "created_date": FilterField(value_type=AwareDatetime, operators=RANGE_OPERATORS, sortable=True),
+    "name": FilterField(value_type=str, operators=frozenset({FilterOperator.EQ}), sortable=True),
+}
+
+
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        pytest.param(None, [], id="none"),
+        pytest.param([], [], id="empty"),
+        pytest.param(
+            [f"parent_id:eq:{EXAMPLE_ID}"],
+            [Filter("parent_id", FilterOperator.EQ, CustomObjectId(EXAMPLE_ID))],
+            id="id",
+        ),
+        pytest.param(
+            [f"parent_id:in:{EXAMPLE_ID},{EXAMPLE_ID}"],
+            [Filter("parent_id", FilterOperator.IN, [CustomObjectId(EXAMPLE_ID), CustomObjectId(EXAMPLE_ID)])],
+            id="in",
+        ),
+        pytest.param(["is_flagged:eq:true"], [Filter("is_flagged", FilterOperator.EQ, True)], id="bool"),
+        pytest.param(
+            ["created_date:gte:2024-01-01T00:00:00Z", "created_date:lt:2024-02-01T00:00:00Z"],
+            [
+                Filter("created_date", FilterOperator.GTE, datetime(2024, 1, 1, tzinfo=timezone.utc)),
+                Filter("created_date", FilterOperator.LT, datetime(2024, 2, 1, tzinfo=timezone.utc)),
+            ],
+            id="date_range",
+        ),
+        pytest.param(["name:eq:Name: A"], [Filter("name", FilterOperator.EQ, "Name: A")], id="value_with_colon"),
+    ],
+)
+def test_parse_filters(filters, expected):
+    """Test `parse_filters` when given valid filters."""
+
+    assert parse_filters(filters, EXAMPLE_FILTER_FIELDS) == expected
+
+
+@pytest.mark.parametrize(
+    "filters, expected_message",
+    [
+        pytest.param(["is_flagged"], "Invalid filter 'is_flagged', expected 'field:operator:value'", id="malformed"),
+        pytest.param(["description:eq:test"], "Filtering on 'description' is not supported", id="unsupported_field"),
+        pytest.param(
+            ["is_flagged:ne:true"], "Operator 'ne' is not supported when filtering on 'is_flagged'", id="unsupported_op"
+        ),
+        pytest.param(
+            ["name:like:test"], "Operator 'like' is not supported when filtering on 'name'", id="unknown_operator"
+        ),
+        pytest.param(["parent_id:eq:invalid"], "Invalid value 'invalid' for filter on 'parent_id'", id="invalid_id"),
+        pytest.param(["is_flagged:eq:maybe"], "Invalid value 'maybe' for filter on 'is_flagged'", id="invalid_bool"),
+        pytest.param(
+            ["created_date:gt:2024-01-01T00:00:00"],
+            "Invalid value '2024-01-01T00:00:00' for filter on 'created_date'",
+            id="naive_datetime",
+        ),
+        pytest.param(
+            [f"parent_id:in:{EXAMPLE_ID},invalid"], "Invalid value 'invalid' for filter on 'parent_id'", id="invalid_in"
+        ),
+        pytest.param(
+            ["is_flagged:eq:true", "is_flagged:eq:false"], "Duplicate 'eq' filter on 'is_flagged'", id="duplicate"
+        ),
+    ],
+)
+def test_parse_filters_with_invalid_filters(filters, expected_message):
+    """Test `parse_filters` when given invalid filters."""
+
+    with pytest.raises(InvalidFilterError) as exc:
+        parse_filters(filters, EXAMPLE_FILTER_FIELDS)
+
+    assert str(exc.value) == expected_message
+
+
+@pytest.mark.parametrize(
+    "sort, expected",
+    [
+        pytest.param(None, None, id="none"),
+        pytest.param("name", Sort("name"), id="ascending"),
+        pytest.param("-created_date", Sort("created_date", descending=True), id="descending"),
+    ],
+)
+def test_parse_sort(sort, expected):
+    """Test `parse_sort` when given a valid sort order."""
+
+    assert parse_sort(sort, EXAMPLE_FILTER_FIELDS) == expected
+
+
+@pytest.mark.parametrize(
+    "sort, expected_message",
+    [
+        pytest.param("description", "Sorting by 'description' is not supported", id="unknown_field"),
+        pytest.param("-is_flagged", "Sorting by 'is_flagged' is not supported", id="unsortable_field"),
+    ],
+)
+def test_parse_sort_with_invalid_sort(sort, expected_message):
+    """Test `parse_sort` when given an invalid sort order."""
+
+    with pytest.raises(InvalidSortError) as exc:
+        parse_sort(sort, EXAMPLE_FILTER_FIELDS)
+
+    assert str(exc.value) == expected_message
+
+
+@pytest.mark.parametrize(
+    "fields, sort, expected",
+    [
+        pytest.param(None, Sort("name"), None, id="all_fields"),
+        pytest.param(["id", "is_flagged"], None, ["id", "is_flagged"], id="no_sort"),
+        pytest.param(["id", "name"], Sort("name"), ["id", "name"], id="sort_field_included"),
+        pytest.param(["id"], Sort("created_date"), ["id", "created_date"], id="sort_field_missing"),
+    ],
+)
+def test_get_fields_for_sort(fields, sort, expected):
+    """Test `get_fields_for_sort`."""
+
+    assert get_fields_for_sort(fields, sort) == expected
+
+
+def test_create_filter_description():
+    """Test `create_filter_description`."""
+
+    description = create_filter_description(EXAMPLE_FILTER_FIELDS)
+
+    assert description.endswith(
+        "Supported fields (and operators): parent_id (eq, in, ne); is_flagged (eq); "
+        "created_date (eq, gt, gte, lt, lte); name (eq)"
+    )
+
+
+def test_create_sort_description():
+    """Test `create_sort_description`."""
+
+    assert create_sort_description(EXAMPLE_FILTER_FIELDS).endswith("Supported fields: created_date, name")
@@ -0,0 +1,144 @@
+"""
+Unit tests for functions inside the `pagination` module.
+"""
+
+import base64
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+from bson import ObjectId
+
+from inventory_management_system_api.core.exceptions import InvalidCursorError
+from inventory_management_system_api.core.filtering import Sort
+from inventory_management_system_api.core.pagination import (
+    decode_cursor,
+    decode_sorted_cursor,
+    encode_cursor,
+    get_next_cursor,
+)
+
+
+def test_encode_and_decode_cursor():
+    """Test that a cursor created by `encode_cursor` can be decoded by `decode_cursor`."""
+
+    last_id = str(ObjectId())
+
+    cursor = encode_cursor(last_id)
+
+    assert decode_cursor(cursor) == ObjectId(last_id)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        pytest.param("invalid-cursor", id="invalid_base64"),
+        pytest.param(base64.urlsafe_b64encode(b"not json").decode("ascii"), id="invalid_json"),
+        pytest.param(base64.urlsafe_b64encode(b'{"_id": "not an id"}').decode("ascii"), id="invalid_id"),
+        pytest.param(base64.urlsafe_b64encode(b"[]").decode("ascii"), id="not_a_dict"),
+        pytest.param("ä", id="non_ascii"),
+    ],
+)
+def test_decode_cursor_with_invalid_cursor(cursor):
+    """Test `decode_cursor` when given an invalid cursor."""
+
+    with pytest.raises(InvalidCursorError) as exc:
+        decode_cursor(cursor)
+
+    assert str(exc.value) == f"Invalid cursor '{cursor}'"
+
+
+def test_decode_cursor_with_sorted_cursor():
+    """Test `decode_cursor` when given a cursor created for documents sorted by another field."""
+
+    cursor = encode_cursor(str(ObjectId()), Sort("name"), "Catalogue Item A")
+
+    with pytest.raises(InvalidCursorError) as exc:
+        decode_cursor(cursor)
+
+    assert str(exc.value) == f"Invalid cursor '{cursor}'"
+
+
+@pytest.mark.parametrize(
+    "sort, sort_value",
+    [
+        pytest.param(Sort("sort_field"), "Catalogue Item A", id="string"),
+        pytest.param(Sort("sort_field", descending=True), datetime(2024, 1, 2, 3, 4, 5), id="datetime_descending"),
+        pytest.param(Sort("sort_field"), None, id="none"),
+    ],
+)
+def test_encode_and_decode_sorted_cursor(sort, sort_value):
+    """Test that a cursor created by `encode_cursor` with a sort order can be decoded by `decode_sorted_cursor`."""
+
+    last_id = str(ObjectId())
+
+    cursor = encode_cursor(last_id, sort, sort_value)
+
+    assert decode_sorted_cursor(cursor, sort) == (ObjectId(last_id), sort_value)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        pytest.param("invalid-cursor", id="invalid_base64"),
+        pytest.param(encode_cursor(str(ObjectId())), id="unsorted"),
+        pytest.param(encode_cursor(str(ObjectId()), Sort("other_field"), "value"), id="different_field"),
+        pytest.param(
+            encode_cursor(str(ObjectId()), Sort("sort_field", descending=True), "value"), id="different_direction"
+        ),
+        pytest.param(
+            base64.urlsafe_b64encode(b'{"_id": {"$oid": "6571b3bd4d2af1b30ab8d8a0"}, "sort": "name"}').decode("ascii"),
+            id="sort_not_a_dict",
+        ),
+        pytest.param(
+            base64.urlsafe_b64encode(
+                b'{"_id": {"$oid": "6571b3bd4d2af1b30ab8d8a0"}, "sort": {"field": "sort_field", "descending": false}}'
+            ).decode("ascii"),
+            id="missing_value",
+        ),
+    ],
+)
+def test_decode_sorted_cursor_with_invalid_cursor(cursor):
+    """Test `decode_sorted_cursor` when given an invalid cursor."""
+
+    with pytest.raises(InvalidCursorError) as exc:
+        decode_sorted_cursor(cursor, Sort("sort_field"))
+
+    assert str(exc.value) == f"Invalid cursor '{cursor}'"
+
+
+def test_get_next_cursor():
+    """Test `get_next_cursor` when the page is full."""
+
+    results = [Mock(id=str(ObjectId())), Mock(id=str(ObjectId()))]
+
+    next_cursor = get_next_cursor(results, 2)
+
+    assert decode_cursor(next_cursor) == ObjectId(results[-1].id)
+
+
+def test_get_next_cursor_when_page_not_full():
+    """Test `get_next_cursor` when the page is not full."""
+
+    assert get_next_cursor([Mock(id=str(ObjectId()))], 2) is None
+
+
+def test_get_next_cursor_when_not_paginating():
+    """Test `get_next_cursor` when no limit was given."""
+
+    assert get_next_cursor([Mock(id=str(ObjectId()))], None) is None
+
+
+def test_get_next_cursor_with_sort():
+    """Test `get_next_cursor` when the page is full and the results are sorted by another field."""
+
+    results = [
+        Mock(id=str(ObjectId()), delivered_date=datetime(2024, 1, 2)),
+        Mock(id=str(ObjectId()), delivered_date=datetime(2024, 1, 1)),
+    ]
+
+    sort = Sort("delivered_date", descending=True)
+
+    next_cursor = get_next_cursor(results, 2, sort)
+
+    assert decode_sorted_cursor(next_cursor, sort) == (ObjectId(results[-1].id), datetime(2024, 1, 1))
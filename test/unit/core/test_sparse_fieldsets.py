@@ -0,0 +1,175 @@
+"""
+Unit tests for functions inside the `sparse_fieldsets` module.
+"""
+
+import json
+import warnings
+from enum import Enum
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from inventory_management_system_api.core.exceptions import InvalidFieldsError
+from inventory_management_system_api.core.sparse_fieldsets import (
+    create_json_response,
+    create_partial_model,
+    create_schema,
+    get_model_for_fields,
+    parse_fields,
+)
+
+
+class ExampleSchema(BaseModel):
+    """Schema used to test sparse fieldsets."""
+
+    id: str
+    name: str
+    description: Optional[str] = None
+    is_flagged: bool = False
+
+
+class ExampleStatus(str, Enum):
+    """Enum used to test constructing schemas."""
+
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+
+
+class ExampleChildSchema(BaseModel):
+    """Nested schema used to test constructing schemas."""
+
+    id: str
+    status: ExampleStatus
+
+
+class ExampleParentSchema(BaseModel):
+    """Schema containing nested schemas and enums used to test constructing schemas."""
+
+    id: str
+    status: ExampleStatus
+    primary_child: Optional[ExampleChildSchema] = None
+    children: List[ExampleChildSchema] = []
+
+
+class ExampleChildOut(BaseModel):
+    """Database model equivalent of `ExampleChildSchema`, which stores the status as a plain string."""
+
+    id: str
+    status: str
+
+
+class ExampleParentOut(BaseModel):
+    """Database model equivalent of `ExampleParentSchema`."""
+
+    id: str
+    status: str
+    primary_child: Optional[ExampleChildOut] = None
+    children: List[ExampleChildOut] = []
+    internal_field: str
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [
+        pytest.param(None, None, id="no_fields"),
+        pytest.param("name", ["id", "name"], id="single_field"),
+        pytest.param("name,description", ["id", "name", "description"], id="multiple_fields"),
+        pytest.param("name, name,description", ["id", "name", "description"], id="duplicate_fields"),
+        pytest.param("name,id", ["id", "name"], id="id_field"),
+        pytest.param("", ["id"], id="empty"),
+    ],
+)
+def test_parse_fields(fields, expected):
+    """Test `parse_fields` returns the requested fields, always including `id`."""
+
+    assert parse_fields(fields, ExampleSchema) == expected
+
+
+def test_parse_fields_with_invalid_fields():
+    """Test `parse_fields` when given fields that don't exist in the schema."""
+
+    with pytest.raises(InvalidFieldsError) as exc:
+        parse_fields("name,invalid_a,invalid_b", ExampleSchema)
+
+    assert str(exc.value) == "Invalid field(s) requested: invalid_a, invalid_b"
+
+
+def test_create_partial_model():
+    """Test `create_partial_model` returns a cached subclass that can be validated using a subset of the fields."""
+
+    partial_model = create_partial_model(ExampleSchema)
+    partial_instance = partial_model(id="id", description="description")
+
+    assert create_partial_model(ExampleSchema) is partial_model
+    assert issubclass(partial_model, ExampleSchema)
+    assert partial_instance.model_dump(exclude_unset=True) == {"id": "id", "description": "description"}
+
+
+def test_get_model_for_fields():
+    """Test `get_model_for_fields` only returns the partial model when specific fields are requested."""
+
+    assert get_model_for_fields(ExampleSchema, None) is ExampleSchema
+    assert get_model_for_fields(ExampleSchema, ["id"]) is create_partial_model(ExampleSchema)
+
+
+def test_create_schema():
+    """Test `create_schema` returns a full schema instance when all fields are requested."""
+
+    data = ExampleSchema(id="id", name="name")
+
+    assert create_schema(ExampleSchema, data, None) == data
+
+
+def test_create_schema_with_nested_models_and_enums():
+    """Test `create_schema` converts any nested models and enums into those used by the schema."""
+
+    data = ExampleParentOut(
+        id="id",
+        status="active",
+        primary_child={"id": "child_a", "status": "inactive"},
+        children=[{"id": "child_a", "status": "inactive"}, {"id": "child_b", "status": "active"}],
+        internal_field="internal",
+    )
+
+    schema = create_schema(ExampleParentSchema, data, None)
+
+    assert schema == ExampleParentSchema(**data.model_dump())
+    # Would fail if any of the values weren't the types expected by the schema
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        schema.model_dump_json()
+
+
+def test_create_schema_with_fields():
+    """Test `create_schema` returns a partial schema instance containing only the requested fields."""
+
+    data = ExampleParentOut(id="id", status="active", primary_child=None, internal_field="internal")
+
+    schema = create_schema(ExampleParentSchema, data, ["id", "primary_child"])
+
+    assert isinstance(schema, create_partial_model(ExampleParentSchema))
+    assert schema.model_dump(exclude_unset=True) == {"id": "id", "primary_child": None}
+
+
+def test_create_json_response():
+    """Test `create_json_response` returns a response containing all of the fields of a schema model instance."""
+
+    data = ExampleSchema(id="id", name="name")
+
+    response = create_json_response(create_schema(ExampleSchema, data, None), headers={"ETag": "etag"})
+
+    assert response.media_type == "application/json"
+    assert response.headers["ETag"] == "etag"
+    assert json.loads(response.body) == {"id": "id", "name": "name", "description": None, "is_flagged": False}
+
+
+def test_create_json_response_with_partial_models():
+    """Test `create_json_response` returns a response containing only the requested fields when excluding unset
+    fields."""
+
+    data = ExampleSchema(id="id", name="name", description="description", is_flagged=True)
+
+    response = create_json_response([create_schema(ExampleSchema, data, ["id", "is_flagged"])], exclude_unset=True)
+
+    assert json.loads(response.body) == [{"id": "id", "is_flagged": True}]
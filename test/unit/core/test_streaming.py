@@ -0,0 +1,75 @@
+"""
+Unit tests for functions inside the `streaming` module.
+"""
+
+from typing import Optional
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from inventory_management_system_api.core.streaming import NDJSON_MEDIA_TYPE, accepts_ndjson, create_ndjson_response
+
+
+class ExampleModel(BaseModel):
+    """Model used to test NDJSON serialisation."""
+
+    name: str
+    description: Optional[str] = None
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        pytest.param(None, False, id="no_accept_header"),
+        pytest.param("application/json", False, id="json"),
+        pytest.param("*/*", False, id="any"),
+        pytest.param("application/x-ndjson", True, id="ndjson"),
+        pytest.param("application/json;q=0.5, application/x-ndjson;q=1", True, id="ndjson_with_parameters"),
+    ],
+)
+def test_accepts_ndjson(accept, expected):
+    """Test `accepts_ndjson` correctly identifies when an NDJSON response was requested."""
+
+    request = Mock()
+    request.headers = {"accept": accept} if accept is not None else {}
+
+    assert accepts_ndjson(request) == expected
+
+
+async def test_create_ndjson_response():
+    """Test `create_ndjson_response` returns a response streaming one line per model."""
+
+    response = create_ndjson_response(ExampleModel(name=name) for name in ["a", "b"])
+
+    assert response.media_type == NDJSON_MEDIA_TYPE
+    assert [line async for line in response.body_iterator] == [
+        '{"name":"a","description":null}\n',
+        '{"name":"b","description":null}\n',
+    ]
+
+
+async def test_create_ndjson_response_excluding_unset():
+    """Test `create_ndjson_response` only streams fields that were set when requested."""
+
+    response = create_ndjson_response(
+        [ExampleModel(name="a"), ExampleModel(name="b", description="b")], exclude_unset=True
+    )
+
+    assert [line async for line in response.body_iterator] == ['{"name":"a"}\n', '{"name":"b","description":"b"}\n']
+
+
+def test_create_ndjson_response_with_headers():
+    """Test `create_ndjson_response` includes any given headers in the response."""
+
+    response = create_ndjson_response([], headers={"ETag": 'W/"etag"'})
+
+    assert response.headers["etag"] == 'W/"etag"'
+
+
+async def test_create_ndjson_response_with_no_models():
+    """Test `create_ndjson_response` returns an empty response when there are no models."""
+
+    response = create_ndjson_response([])
+
+    assert [line async for line in response.body_iterator] == []
@@ -15,17 +15,16 @@ from test.mock_data import (
     CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY,
 )
 from test.unit.repositories.conftest import RepositoryTestHelpers
-from test.unit.repositories.test_utils import (
-    MOCK_BREADCRUMBS_QUERY_RESULT_LESS_THAN_MAX_LENGTH,
-    MOCK_MOVE_QUERY_RESULT_INVALID,
-    MOCK_MOVE_QUERY_RESULT_VALID,
-)
+from test.unit.repositories.test_utils import MOCK_BREADCRUMBS_QUERY_RESULT_LESS_THAN_MAX_LENGTH
+from datetime import datetime, timezone
 from typing import Optional
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
 from bson import ObjectId
 
+from inventory_management_system_api.core.cache import VersionedCache
+from inventory_management_system_api.core.conditional_requests import compute_list_version
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.exceptions import (
     ChildElementsExistError,
@@ -52,6 +51,8 @@ class CatalogueCategoryRepoDSL:
     catalogue_category_repository: CatalogueCategoryRepo
     catalogue_categories_collection: Mock
     catalogue_items_collection: Mock
+    catalogue_category_breadcrumbs_cache: VersionedCache
+    mock_run_after_commit: Mock
 
     mock_session = MagicMock()
 
@@ -68,10 +69,28 @@ class CatalogueCategoryRepoDSL:
         self.catalogue_categories_collection = database_mock.catalogue_categories
         self.catalogue_items_collection = database_mock.catalogue_items
 
-        with patch("inventory_management_system_api.repositories.catalogue_category.utils") as mock_utils:
+        # Use a separate cache for each test
+        self.catalogue_category_breadcrumbs_cache = VersionedCache()
+        with (
+            patch("inventory_management_system_api.repositories.catalogue_category.utils") as mock_utils,
+            patch(
+                "inventory_management_system_api.repositories.catalogue_category.catalogue_category_breadcrumbs_cache",
+                self.catalogue_category_breadcrumbs_cache,
+            ),
+            patch(
+                "inventory_management_system_api.repositories.catalogue_category.run_after_commit"
+            ) as mock_run_after_commit,
+        ):
             self.mock_utils = mock_utils
+            self.mock_run_after_commit = mock_run_after_commit
             yield
 
+    def check_run_after_commit(self) -> None:
+        """Checks that a callback was deferred until after the transaction commits, then runs it as though it has."""
+
+        self.mock_run_after_commit.assert_called_once_with(self.mock_session, ANY)
+        self.mock_run_after_commit.call_args.args[1]()
+
     def mock_has_child_elements(
         self, child_catalogue_category_data: Optional[dict] = None, child_catalogue_item_data: Optional[dict] = None
     ) -> None:
@@ -109,6 +128,8 @@ class CreateDSL(CatalogueCategoryRepoDSL):
     """Base class for `create` tests."""
 
     _catalogue_category_in: CatalogueCategoryIn
+    _parent_ancestor_ids: Optional[list[str]]
+    _expected_ancestor_ids: list[CustomObjectId]
     _expected_catalogue_category_out: CatalogueCategoryOut
     _created_catalogue_category: CatalogueCategoryOut
     _create_exception: pytest.ExceptionInfo
@@ -139,8 +160,16 @@ class CreateDSL(CatalogueCategoryRepoDSL):
             **self._catalogue_category_in.model_dump(by_alias=True), id=inserted_catalogue_category_id
         )
 
+        self._parent_ancestor_ids = None
+        self._expected_ancestor_ids = []
+
         # When a parent_id is given, need to mock the find_one for it too
         if self._catalogue_category_in.parent_id:
+            parent_ancestor_ids = [CustomObjectId(str(ObjectId()))]
+            if parent_catalogue_category_in_data:
+                self._parent_ancestor_ids = [str(ancestor_id) for ancestor_id in parent_ancestor_ids]
+                self._expected_ancestor_ids = self.mock_utils.compute_ancestor_ids.return_value
+
             # If parent_catalogue_category_data is given as None, then it is intentionally supposed to be, otherwise
             # pass through CatalogueCategoryIn first to ensure it has creation and modified times
             RepositoryTestHelpers.mock_find_one(
@@ -149,6 +178,7 @@ class CreateDSL(CatalogueCategoryRepoDSL):
                     {
                         **CatalogueCategoryIn(**parent_catalogue_category_in_data).model_dump(by_alias=True),
                         "_id": self._catalogue_category_in.parent_id,
+                        "ancestor_ids": parent_ancestor_ids,
                     }
                     if parent_catalogue_category_in_data
                     else None
@@ -207,8 +237,15 @@ class CreateDSL(CatalogueCategoryRepoDSL):
         )
         self.catalogue_categories_collection.find_one.assert_has_calls(expected_find_one_calls)
 
+        if self._parent_ancestor_ids is not None:
+            self.mock_utils.compute_ancestor_ids.assert_called_once_with(
+                str(self._catalogue_category_in.parent_id), self._parent_ancestor_ids
+            )
+        else:
+            self.mock_utils.compute_ancestor_ids.assert_not_called()
+
         self.catalogue_categories_collection.insert_one.assert_called_once_with(
-            catalogue_category_in_data, session=self.mock_session
+            {**catalogue_category_in_data, "ancestor_ids": self._expected_ancestor_ids}, session=self.mock_session
         )
         assert self._created_catalogue_category == self._expected_catalogue_category_out
 
@@ -222,7 +259,8 @@ class CreateDSL(CatalogueCategoryRepoDSL):
         """
         if expecting_insert_one_called:
             self.catalogue_categories_collection.insert_one.assert_called_once_with(
-                self._catalogue_category_in.model_dump(by_alias=True), session=None
+                {**self._catalogue_category_in.model_dump(by_alias=True), "ancestor_ids": self._expected_ancestor_ids},
+                session=None,
             )
         else:
             self.catalogue_categories_collection.insert_one.assert_not_called()
@@ -405,6 +443,7 @@ class GetBreadcrumbsDSL(CatalogueCategoryRepoDSL):
     _mock_aggregation_pipeline = MagicMock()
     _expected_breadcrumbs: MagicMock
     _obtained_catalogue_category_id: str
+    _obtained_session: Optional[MagicMock]
     _obtained_breadcrumbs: MagicMock
 
     def mock_breadcrumbs(self, breadcrumbs_query_result: list[dict]) -> None:
@@ -423,16 +462,18 @@ class GetBreadcrumbsDSL(CatalogueCategoryRepoDSL):
         self.catalogue_categories_collection.aggregate.return_value = breadcrumbs_query_result
         self.mock_utils.compute_breadcrumbs.return_value = self._expected_breadcrumbs
 
-    def call_get_breadcrumbs(self, catalogue_category_id: str) -> None:
+    def call_get_breadcrumbs(self, catalogue_category_id: str, use_session: bool = True) -> None:
         """
         Calls the `CatalogueCategoryRepo` `get_breadcrumbs` method.
 
         :param catalogue_category_id: ID of the catalogue category to obtain the breadcrumbs of.
+        :param use_session: Whether to pass a session to the `get_breadcrumbs` method (those without use the cache).
         """
 
         self._obtained_catalogue_category_id = catalogue_category_id
+        self._obtained_session = self.mock_session if use_session else None
         self._obtained_breadcrumbs = self.catalogue_category_repository.get_breadcrumbs(
-            catalogue_category_id, session=self.mock_session
+            catalogue_category_id, session=self._obtained_session
         )
 
     def check_get_breadcrumbs_success(self) -> None:
@@ -442,7 +483,7 @@ class GetBreadcrumbsDSL(CatalogueCategoryRepoDSL):
             entity_id=self._obtained_catalogue_category_id, collection_name="catalogue_categories"
         )
         self.catalogue_categories_collection.aggregate.assert_called_once_with(
-            self._mock_aggregation_pipeline, session=self.mock_session
+            self._mock_aggregation_pipeline, session=self._obtained_session
         )
         self.mock_utils.compute_breadcrumbs.assert_called_once_with(
             list(self._breadcrumbs_query_result),
@@ -463,6 +504,292 @@ class TestGetBreadcrumbs(GetBreadcrumbsDSL):
         self.call_get_breadcrumbs(str(ObjectId()))
         self.check_get_breadcrumbs_success()
 
+    def test_get_breadcrumbs_without_session_uses_cache(self):
+        """Test getting a catalogue category's breadcrumbs without a session only queries the database the first
+        time."""
+
+        catalogue_category_id = str(ObjectId())
+
+        self.mock_breadcrumbs(MOCK_BREADCRUMBS_QUERY_RESULT_LESS_THAN_MAX_LENGTH)
+        self.call_get_breadcrumbs(catalogue_category_id, use_session=False)
+        self.call_get_breadcrumbs(catalogue_category_id, use_session=False)
+        self.check_get_breadcrumbs_success()
+
+
+class GetManyDSL(CatalogueCategoryRepoDSL):
+    """Base class for `get_many` tests."""
+
+    _catalogue_category_ids: list[str]
+    _expected_catalogue_categories_out: dict[str, CatalogueCategoryOut]
+    _obtained_catalogue_categories_out: dict[str, CatalogueCategoryOut]
+    _get_many_exception: pytest.ExceptionInfo
+
+    def mock_get_many(self, catalogue_categories_in_data: list[dict], number_of_non_existent_ids: int = 0) -> None:
+        """
+        Mocks database methods appropriately to test the `get_many` repo method.
+
+        :param catalogue_categories_in_data: List of dictionaries containing the catalogue category data as would be
+                                             required for a `CatalogueCategoryIn` database model (i.e. no ID or created
+                                             and modified times required) for each of the catalogue categories that
+                                             exist.
+        :param number_of_non_existent_ids: Number of additional IDs to request that don't belong to any catalogue
+                                           category.
+        """
+        expected_catalogue_categories_out = [
+            CatalogueCategoryOut(
+                **CatalogueCategoryIn(**catalogue_category_in_data).model_dump(by_alias=True), id=ObjectId()
+            )
+            for catalogue_category_in_data in catalogue_categories_in_data
+        ]
+        self._expected_catalogue_categories_out = {
+            catalogue_category_out.id: catalogue_category_out
+            for catalogue_category_out in expected_catalogue_categories_out
+        }
+        self._catalogue_category_ids = [
+            catalogue_category_out.id for catalogue_category_out in expected_catalogue_categories_out
+        ] + [str(ObjectId()) for _ in range(number_of_non_existent_ids)]
+
+        RepositoryTestHelpers.mock_find(
+            self.catalogue_categories_collection,
+            [catalogue_category_out.model_dump() for catalogue_category_out in expected_catalogue_categories_out],
+        )
+
+    def call_get_many(self) -> None:
+        """Calls the `CatalogueCategoryRepo` `get_many` method with the appropriate data from a prior call to
+        `mock_get_many`."""
+        self._obtained_catalogue_categories_out = self.catalogue_category_repository.get_many(
+            self._catalogue_category_ids, session=self.mock_session
+        )
+
+    def check_get_many_success(self) -> None:
+        """Checks that a prior call to `call_get_many` worked as expected."""
+        self.mock_utils.ids_query.assert_called_once_with(self._catalogue_category_ids, "catalogue categories")
+        self.catalogue_categories_collection.find.assert_called_once_with(
+            self.mock_utils.ids_query.return_value, session=self.mock_session
+        )
+        assert self._obtained_catalogue_categories_out == self._expected_catalogue_categories_out
+
+
+class TestGetMany(GetManyDSL):
+    """Tests for getting multiple catalogue categories."""
+
+    def test_get_many(self):
+        """Test getting multiple catalogue categories."""
+
+        self.mock_get_many(
+            [
+                CATALOGUE_CATEGORY_IN_DATA_NON_LEAF_NO_PARENT_NO_PROPERTIES_A,
+                CATALOGUE_CATEGORY_IN_DATA_NON_LEAF_NO_PARENT_NO_PROPERTIES_B,
+            ]
+        )
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_non_existent_ids(self):
+        """Test getting multiple catalogue categories when some of the IDs don't exist."""
+
+        self.mock_get_many(
+            [CATALOGUE_CATEGORY_IN_DATA_NON_LEAF_NO_PARENT_NO_PROPERTIES_A], number_of_non_existent_ids=2
+        )
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_no_ids(self):
+        """Test getting multiple catalogue categories when no IDs are given."""
+
+        self.mock_get_many([])
+        self.call_get_many()
+        self.check_get_many_success()
+
+
+class GetManyBreadcrumbsDSL(CatalogueCategoryRepoDSL):
+    """Base class for `get_many_breadcrumbs` tests."""
+
+    _breadcrumbs_query_result: list[dict]
+    _mock_aggregation_pipeline = MagicMock()
+    _expected_breadcrumbs: MagicMock
+    _obtained_catalogue_category_ids: list[str]
+    _obtained_breadcrumbs: MagicMock
+
+    def mock_many_breadcrumbs(self, breadcrumbs_query_result: list[dict]) -> None:
+        """Mocks database methods appropriately to test the `get_many_breadcrumbs` repo method.
+
+        :param breadcrumbs_query_result: List of dictionaries containing the breadcrumbs query result from the
+                                         aggregation pipeline.
+        """
+        self._breadcrumbs_query_result = breadcrumbs_query_result
+        self._mock_aggregation_pipeline = MagicMock()
+        self._expected_breadcrumbs = MagicMock()
+
+        self.mock_utils.create_many_breadcrumbs_aggregation_pipeline.return_value = self._mock_aggregation_pipeline
+        self.catalogue_categories_collection.aggregate.return_value = breadcrumbs_query_result
+        self.mock_utils.compute_many_breadcrumbs.return_value = self._expected_breadcrumbs
+
+    def call_get_many_breadcrumbs(self, catalogue_category_ids: list[str]) -> None:
+        """
+        Calls the `CatalogueCategoryRepo` `get_many_breadcrumbs` method.
+
+        :param catalogue_category_ids: IDs of the catalogue categories to obtain the breadcrumbs of.
+        """
+
+        self._obtained_catalogue_category_ids = catalogue_category_ids
+        self._obtained_breadcrumbs = self.catalogue_category_repository.get_many_breadcrumbs(
+            catalogue_category_ids, session=self.mock_session
+        )
+
+    def check_get_many_breadcrumbs_success(self) -> None:
+        """Checks that a prior call to `call_get_many_breadcrumbs` worked as expected."""
+
+        self.mock_utils.create_many_breadcrumbs_aggregation_pipeline.assert_called_once_with(
+            entity_ids=self._obtained_catalogue_category_ids, collection_name="catalogue_categories"
+        )
+        self.catalogue_categories_collection.aggregate.assert_called_once_with(
+            self._mock_aggregation_pipeline, session=self.mock_session
+        )
+        self.mock_utils.compute_many_breadcrumbs.assert_called_once_with(
+            list(self._breadcrumbs_query_result), collection_name="catalogue_categories"
+        )
+
+        assert self._obtained_breadcrumbs == self._expected_breadcrumbs
+
+
+class TestGetManyBreadcrumbs(GetManyBreadcrumbsDSL):
+    """Tests for getting the breadcrumbs of multiple catalogue categories."""
+
+    def test_get_many_breadcrumbs(self):
+        """Test getting the breadcrumbs of multiple catalogue categories."""
+
+        self.mock_many_breadcrumbs(MOCK_BREADCRUMBS_QUERY_RESULT_LESS_THAN_MAX_LENGTH)
+        self.call_get_many_breadcrumbs([str(ObjectId()), str(ObjectId())])
+        self.check_get_many_breadcrumbs_success()
+
+
+class GetTreeDSL(CatalogueCategoryRepoDSL):
+    """Base class for `get_tree` tests."""
+
+    _catalogue_category_id: str
+    _max_depth: Optional[int]
+    _expected_catalogue_categories_out: list[CatalogueCategoryOut]
+    _obtained_catalogue_categories_out: list[CatalogueCategoryOut]
+    _get_tree_exception: pytest.ExceptionInfo
+
+    def mock_get_tree(self, catalogue_categories_in_data: list[dict]) -> None:
+        """
+        Mocks database methods appropriately to test the `get_tree` repo method.
+
+        :param catalogue_categories_in_data: List of dictionaries containing the catalogue category data as would be
+                                             required for a `CatalogueCategoryIn` database model (i.e. no ID or created
+                                             and modified times required) for each of the catalogue categories in the
+                                             tree. Each is placed inside the previous one, with the first being the
+                                             catalogue category at the top of the tree.
+        """
+        self._catalogue_category_id = str(ObjectId())
+        self._expected_catalogue_categories_out = []
+        ancestor_ids = []
+        for catalogue_category_in_data in catalogue_categories_in_data:
+            catalogue_category_id = str(ObjectId()) if ancestor_ids else self._catalogue_category_id
+            self._expected_catalogue_categories_out.append(
+                CatalogueCategoryOut(
+                    **{
+                        **CatalogueCategoryIn(**catalogue_category_in_data).model_dump(by_alias=True),
+                        "ancestor_ids": ancestor_ids,
+                    },
+                    id=catalogue_category_id,
+                )
+            )
+            ancestor_ids = [*ancestor_ids, catalogue_category_id]
+
+        # Database order is arbitrary so ensure the catalogue categories are sorted by the repo
+        RepositoryTestHelpers.mock_find(
+            self.catalogue_categories_collection,
+            [
+                catalogue_category_out.model_dump()
+                for catalogue_category_out in reversed(self._expected_catalogue_categories_out)
+            ],
+        )
+
+    def call_get_tree(self, max_depth: Optional[int] = None) -> None:
+        """
+        Calls the `CatalogueCategoryRepo` `get_tree` method with the appropriate data from a prior call to
+        `mock_get_tree`.
+
+        :param max_depth: Maximum depth to pass to `get_tree`.
+        """
+        self._max_depth = max_depth
+        self._obtained_catalogue_categories_out = self.catalogue_category_repository.get_tree(
+            self._catalogue_category_id, max_depth=max_depth, session=self.mock_session
+        )
+
+    def call_get_tree_expecting_error(self, error_type: type[BaseException]) -> None:
+        """
+        Calls the `CatalogueCategoryRepo` `get_tree` method with the appropriate data from a prior call to
+        `mock_get_tree` while expecting an error to be raised.
+
+        :param error_type: Expected exception to be raised.
+        """
+        self._max_depth = None
+        with pytest.raises(error_type) as exc:
+            self.catalogue_category_repository.get_tree(self._catalogue_category_id, session=self.mock_session)
+        self._get_tree_exception = exc
+
+    def check_get_tree_success(self) -> None:
+        """Checks that a prior call to `call_get_tree` worked as expected."""
+        self.mock_utils.create_subtree_query.assert_called_once_with(self._catalogue_category_id, self._max_depth)
+        self.catalogue_categories_collection.find.assert_called_once_with(
+            self.mock_utils.create_subtree_query.return_value, session=self.mock_session
+        )
+        assert self._obtained_catalogue_categories_out == self._expected_catalogue_categories_out
+
+    def check_get_tree_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_get_tree_expecting_error` worked as expected, raising an exception with the
+        correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+        self.catalogue_categories_collection.find.assert_called_once_with(
+            self.mock_utils.create_subtree_query.return_value, session=self.mock_session
+        )
+        assert str(self._get_tree_exception.value) == message
+
+
+class TestGetTree(GetTreeDSL):
+    """Tests for getting a catalogue category along with all of its descendants."""
+
+    def test_get_tree(self):
+        """Test getting a catalogue category along with all of its descendants."""
+
+        self.mock_get_tree(
+            [
+                CATALOGUE_CATEGORY_IN_DATA_NON_LEAF_NO_PARENT_NO_PROPERTIES_A,
+                CATALOGUE_CATEGORY_IN_DATA_NON_LEAF_NO_PARENT_NO_PROPERTIES_B,
+                CATALOGUE_CATEGORY_IN_DATA_LEAF_NO_PARENT_NO_PROPERTIES,
+            ]
+        )
+        self.call_get_tree()
+        self.check_get_tree_success()
+
+    def test_get_tree_with_max_depth(self):
+        """Test getting a catalogue category along with its descendants up to a maximum depth."""
+
+        self.mock_get_tree(
+            [
+                CATALOGUE_CATEGORY_IN_DATA_NON_LEAF_NO_PARENT_NO_PROPERTIES_A,
+                CATALOGUE_CATEGORY_IN_DATA_LEAF_NO_PARENT_NO_PROPERTIES,
+            ]
+        )
+        self.call_get_tree(max_depth=1)
+        self.check_get_tree_success()
+
+    def test_get_tree_with_non_existent_id(self):
+        """Test getting the tree of a catalogue category with a non-existent ID."""
+
+        self.mock_get_tree([])
+        self.call_get_tree_expecting_error(MissingRecordError)
+        self.check_get_tree_failed_with_exception(
+            f"No catalogue category found with ID '{self._catalogue_category_id}'"
+        )
+
 
 class ListDSL(CatalogueCategoryRepoDSL):
     """Base class for `list` tests."""
@@ -564,16 +891,86 @@ class TestList(ListDSL):
         self.check_list_success()
 
 
+class GetListVersionDSL(CatalogueCategoryRepoDSL):
+    """Base class for `get_list_version` tests."""
+
+    _parent_id_filter: Optional[str]
+    _expected_list_version: str
+    _obtained_list_version: str
+
+    def mock_get_list_version(self) -> None:
+        """Mocks database methods appropriately to test the `get_list_version` repo method."""
+
+        catalogue_categories = [{"_id": ObjectId(), "modified_time": datetime.now(timezone.utc)} for _ in range(2)]
+        self._expected_list_version = compute_list_version(
+            (catalogue_category["_id"], catalogue_category["modified_time"])
+            for catalogue_category in catalogue_categories
+        )
+
+        self.mock_utils.create_projection.return_value = {"projection": {"_id": 1, "modified_time": 1}}
+        self.catalogue_categories_collection.find.return_value = catalogue_categories
+
+    def call_get_list_version(self, parent_id: Optional[str]) -> None:
+        """
+        Calls the `CatalogueCategoryRepo` `get_list_version` method.
+
+        :param parent_id: ID of the parent catalogue category to query by, or `None`.
+        """
+
+        self._parent_id_filter = parent_id
+        self._obtained_list_version = self.catalogue_category_repository.get_list_version(
+            parent_id, session=self.mock_session
+        )
+
+    def check_get_list_version_success(self) -> None:
+        """Checks that a prior call to `call_get_list_version` worked as expected."""
+
+        self.mock_utils.list_query.assert_called_once_with(
+            {"parent_id": self._parent_id_filter}, "catalogue categories"
+        )
+        self.mock_utils.create_projection.assert_called_once_with(["id", "modified_time"])
+        self.catalogue_categories_collection.find.assert_called_once_with(
+            self.mock_utils.list_query.return_value,
+            session=self.mock_session,
+            **self.mock_utils.create_projection.return_value,
+        )
+
+        assert self._obtained_list_version == self._expected_list_version
+
+
+class TestGetListVersion(GetListVersionDSL):
+    """Tests for getting the version of a list of catalogue categories."""
+
+    def test_get_list_version(self):
+        """Test getting the version of the list of all catalogue categories."""
+
+        self.mock_get_list_version()
+        self.call_get_list_version(parent_id=None)
+        self.check_get_list_version_success()
+
+    def test_get_list_version_with_parent_id_filter(self):
+        """Test getting the version of the list of all catalogue categories with a given `parent_id`."""
+
+        self.mock_get_list_version()
+        self.call_get_list_version(parent_id=str(ObjectId()))
+        self.check_get_list_version_success()
+
+
 class UpdateDSL(CatalogueCategoryRepoDSL):
     """Base class for `update` tests."""
 
     # pylint:disable=too-many-instance-attributes
     _catalogue_category_in: CatalogueCategoryIn
     _stored_catalogue_category_out: Optional[CatalogueCategoryOut]
+    _parent_ancestor_ids: Optional[list[str]]
+    _expected_update_data: dict
     _expected_catalogue_category_out: CatalogueCategoryOut
     _updated_catalogue_category_id: str
     _updated_catalogue_category: CatalogueCategoryOut
     _moving_catalogue_category: bool
+    _renaming_catalogue_category: bool
+    _descendant_ids: list[CustomObjectId]
+    _unrelated_catalogue_category_id: CustomObjectId
     _update_exception: pytest.ExceptionInfo
 
     def set_update_data(self, new_catalogue_category_in_data: dict):
@@ -617,8 +1014,14 @@ class UpdateDSL(CatalogueCategoryRepoDSL):
         """
         self.set_update_data(new_catalogue_category_in_data)
 
+        self._parent_ancestor_ids = None
+
         # When a parent_id is given, need to mock the find_one for it too
         if new_catalogue_category_in_data["parent_id"]:
+            parent_ancestor_ids = [CustomObjectId(str(ObjectId()))]
+            if new_parent_catalogue_category_in_data:
+                self._parent_ancestor_ids = [str(ancestor_id) for ancestor_id in parent_ancestor_ids]
+
             # If new_parent_catalogue_category_data is given as none, then it is intentionally supposed to be, otherwise
             # pass through CatalogueCategoryIn first to ensure it has creation and modified times
             RepositoryTestHelpers.mock_find_one(
@@ -627,6 +1030,7 @@ class UpdateDSL(CatalogueCategoryRepoDSL):
                     {
                         **CatalogueCategoryIn(**new_parent_catalogue_category_in_data).model_dump(by_alias=True),
                         "_id": new_catalogue_category_in_data["parent_id"],
+                        "ancestor_ids": parent_ancestor_ids,
                     }
                     if new_parent_catalogue_category_in_data
                     else None
@@ -662,15 +1066,29 @@ class UpdateDSL(CatalogueCategoryRepoDSL):
         self._moving_catalogue_category = stored_catalogue_category_in_data is not None and (
             new_catalogue_category_in_data["parent_id"] != stored_catalogue_category_in_data["parent_id"]
         )
+        self._renaming_catalogue_category = stored_catalogue_category_in_data is not None and (
+            new_catalogue_category_in_data["name"] != stored_catalogue_category_in_data["name"]
+        )
+        self._expected_update_data = self._catalogue_category_in.model_dump(by_alias=True, exclude={"ancestor_ids"})
         if self._moving_catalogue_category:
-            mock_aggregation_pipeline = MagicMock()
-            self.mock_utils.create_move_check_aggregation_pipeline.return_value = mock_aggregation_pipeline
-            if valid_move_result:
-                self.mock_utils.is_valid_move_result.return_value = True
-                self.catalogue_categories_collection.aggregate.return_value = MOCK_MOVE_QUERY_RESULT_VALID
-            else:
-                self.mock_utils.is_valid_move_result.return_value = False
-                self.catalogue_categories_collection.aggregate.return_value = MOCK_MOVE_QUERY_RESULT_INVALID
+            self.mock_utils.is_valid_move.return_value = valid_move_result
+            self._expected_update_data["ancestor_ids"] = (
+                self.mock_utils.compute_ancestor_ids.return_value if self._parent_ancestor_ids is not None else []
+            )
+
+        # Descendants whose breadcrumbs may need to be discarded, along with cached breadcrumbs for them, the catalogue
+        # category itself and another unrelated catalogue category
+        self._descendant_ids = [CustomObjectId(str(ObjectId())), CustomObjectId(str(ObjectId()))]
+        self._unrelated_catalogue_category_id = CustomObjectId(str(ObjectId()))
+        self.catalogue_categories_collection.find.return_value = [
+            {"_id": descendant_id} for descendant_id in self._descendant_ids
+        ]
+        for cached_catalogue_category_id in [
+            CustomObjectId(catalogue_category_id),
+            *self._descendant_ids,
+            self._unrelated_catalogue_category_id,
+        ]:
+            self.catalogue_category_breadcrumbs_cache.get_or_load(cached_catalogue_category_id, lambda: "cached")
 
     def call_update(self, catalogue_category_id: str) -> None:
         """
@@ -719,26 +1137,71 @@ class UpdateDSL(CatalogueCategoryRepoDSL):
         )
         self.catalogue_categories_collection.find_one.assert_has_calls(expected_find_one_calls)
 
-        if self._moving_catalogue_category:
-            self.mock_utils.create_move_check_aggregation_pipeline.assert_called_once_with(
-                entity_id=self._updated_catalogue_category_id,
-                destination_id=str(self._catalogue_category_in.parent_id),
-                collection_name="catalogue_categories",
+        if self._moving_catalogue_category and self._parent_ancestor_ids is not None:
+            self.mock_utils.is_valid_move.assert_called_once_with(
+                self._updated_catalogue_category_id,
+                str(self._catalogue_category_in.parent_id),
+                self._parent_ancestor_ids,
             )
-            self.catalogue_categories_collection.aggregate.assert_called_once_with(
-                self.mock_utils.create_move_check_aggregation_pipeline.return_value, session=self.mock_session
+            self.mock_utils.compute_ancestor_ids.assert_called_once_with(
+                str(self._catalogue_category_in.parent_id), self._parent_ancestor_ids
             )
+        else:
+            self.mock_utils.is_valid_move.assert_not_called()
+            self.mock_utils.compute_ancestor_ids.assert_not_called()
 
         self.catalogue_categories_collection.update_one.assert_called_once_with(
             {
                 "_id": CustomObjectId(self._updated_catalogue_category_id),
             },
             {
-                "$set": self._catalogue_category_in.model_dump(by_alias=True),
+                "$set": self._expected_update_data,
             },
             session=self.mock_session,
         )
 
+        if self._moving_catalogue_category:
+            self.mock_utils.create_move_descendants_update.assert_called_once_with(
+                CustomObjectId(self._updated_catalogue_category_id), self._expected_update_data["ancestor_ids"]
+            )
+            self.catalogue_categories_collection.update_many.assert_called_once_with(
+                {"ancestor_ids": CustomObjectId(self._updated_catalogue_category_id)},
+                self.mock_utils.create_move_descendants_update.return_value,
+                session=self.mock_session,
+            )
+        else:
+            self.catalogue_categories_collection.update_many.assert_not_called()
+
+        # Breadcrumbs of the catalogue category and its descendants should only be discarded when they are affected
+        invalidating_breadcrumbs = self._moving_catalogue_category or self._renaming_catalogue_category
+        if invalidating_breadcrumbs:
+            # Nothing should be discarded before the transaction commits
+            assert self.catalogue_category_breadcrumbs_cache.version == 0
+            self.check_run_after_commit()
+        else:
+            self.mock_run_after_commit.assert_not_called()
+        if invalidating_breadcrumbs:
+            self.catalogue_categories_collection.find.assert_called_once_with(
+                {"ancestor_ids": CustomObjectId(self._updated_catalogue_category_id)},
+                {"_id": 1},
+                session=self.mock_session,
+            )
+        else:
+            self.catalogue_categories_collection.find.assert_not_called()
+        for cached_catalogue_category_id in [
+            CustomObjectId(self._updated_catalogue_category_id),
+            *self._descendant_ids,
+        ]:
+            assert self.catalogue_category_breadcrumbs_cache.get_or_load(
+                cached_catalogue_category_id, lambda: "reloaded"
+            ) == ("reloaded" if invalidating_breadcrumbs else "cached")
+        assert (
+            self.catalogue_category_breadcrumbs_cache.get_or_load(
+                self._unrelated_catalogue_category_id, lambda: "reloaded"
+            )
+            == "cached"
+        )
+
         assert self._updated_catalogue_category == self._expected_catalogue_category_out
 
     def check_update_failed_with_exception(self, message: str, expecting_update_one_called: bool = False) -> None:
@@ -755,7 +1218,7 @@ class UpdateDSL(CatalogueCategoryRepoDSL):
                     "_id": CustomObjectId(self._updated_catalogue_category_id),
                 },
                 {
-                    "$set": self._catalogue_category_in.model_dump(by_alias=True),
+                    "$set": self._expected_update_data,
                 },
                 session=None,
             )
@@ -944,6 +1407,9 @@ class DeleteDSL(CatalogueCategoryRepoDSL):
         self.catalogue_categories_collection.delete_one.assert_called_once_with(
             {"_id": CustomObjectId(self._delete_catalogue_category_id)}, session=self.mock_session
         )
+        assert self.catalogue_category_breadcrumbs_cache.version == 0
+        self.check_run_after_commit()
+        assert self.catalogue_category_breadcrumbs_cache.version == 1
 
     def check_delete_failed_with_exception(self, message: str, expecting_delete_one_called: bool = False) -> None:
         """
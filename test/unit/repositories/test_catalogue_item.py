@@ -14,14 +14,25 @@ from test.mock_data import (
     PROPERTY_DATA_BOOLEAN_MANDATORY_TRUE,
 )
 from test.unit.repositories.conftest import RepositoryTestHelpers
+from datetime import datetime, timezone
 from typing import Optional
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from bson import ObjectId
+from pymongo import UpdateOne
 
+from inventory_management_system_api.core.conditional_requests import compute_list_version
+from inventory_management_system_api.core.consts import STREAM_BATCH_SIZE
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
-from inventory_management_system_api.core.exceptions import InvalidObjectIdError, MissingRecordError
+from inventory_management_system_api.core.exceptions import (
+    InvalidCursorError,
+    InvalidObjectIdError,
+    MissingRecordError,
+)
+from inventory_management_system_api.core.filtering import Filter, FilterOperator, Sort
+from inventory_management_system_api.core.pagination import decode_cursor, encode_cursor
+from inventory_management_system_api.core.sparse_fieldsets import create_partial_model
 from inventory_management_system_api.models.catalogue_item import CatalogueItemIn, CatalogueItemOut, PropertyIn
 from inventory_management_system_api.repositories.catalogue_item import CatalogueItemRepo
 
@@ -113,6 +124,81 @@ class TestCreate(CreateDSL):
         self.check_create_success()
 
 
+class CreateManyDSL(CatalogueItemRepoDSL):
+    """Base class for `create_many` tests."""
+
+    _catalogue_items_in: list[CatalogueItemIn]
+    _expected_catalogue_items_out: list[CatalogueItemOut]
+    _created_catalogue_items: list[CatalogueItemOut]
+
+    def mock_create_many(self, catalogue_items_in_data: list[dict]) -> None:
+        """Mocks database methods appropriately to test the `create_many` repo method.
+
+        :param catalogue_items_in_data: List of dictionaries containing the catalogue item data as would be required
+                                        for a `CatalogueItemIn` database model (i.e. no ID or created and modified
+                                        times required).
+        """
+
+        inserted_catalogue_item_ids = [CustomObjectId(str(ObjectId())) for _ in catalogue_items_in_data]
+
+        # Pass through `CatalogueItemIn` first as need creation and modified times
+        self._catalogue_items_in = [
+            CatalogueItemIn(**catalogue_item_in_data) for catalogue_item_in_data in catalogue_items_in_data
+        ]
+
+        self._expected_catalogue_items_out = [
+            CatalogueItemOut(**catalogue_item_in.model_dump(by_alias=True), id=inserted_catalogue_item_id)
+            for catalogue_item_in, inserted_catalogue_item_id in zip(
+                self._catalogue_items_in, inserted_catalogue_item_ids
+            )
+        ]
+
+        self.catalogue_items_collection.insert_many.return_value.inserted_ids = inserted_catalogue_item_ids
+
+    def call_create_many(self) -> None:
+        """Calls the `CatalogueItemRepo` `create_many` method with the appropriate data from a prior call to
+        `mock_create_many`."""
+
+        self._created_catalogue_items = self.catalogue_item_repository.create_many(
+            self._catalogue_items_in, session=self.mock_session
+        )
+
+    def check_create_many_success(self):
+        """Checks that a prior call to `call_create_many` worked as expected."""
+
+        if self._catalogue_items_in:
+            self.catalogue_items_collection.insert_many.assert_called_once_with(
+                [catalogue_item_in.model_dump(by_alias=True) for catalogue_item_in in self._catalogue_items_in],
+                ordered=True,
+                session=self.mock_session,
+            )
+        else:
+            self.catalogue_items_collection.insert_many.assert_not_called()
+        # Should not need to read the created catalogue items back from the database
+        self.catalogue_items_collection.find.assert_not_called()
+        self.catalogue_items_collection.find_one.assert_not_called()
+
+        assert self._created_catalogue_items == self._expected_catalogue_items_out
+
+
+class TestCreateMany(CreateManyDSL):
+    """Tests for creating multiple catalogue items."""
+
+    def test_create_many(self):
+        """Test creating multiple catalogue items."""
+        self.mock_create_many(
+            [CATALOGUE_ITEM_IN_DATA_REQUIRED_VALUES_ONLY, CATALOGUE_ITEM_IN_DATA_NOT_OBSOLETE_NO_PROPERTIES]
+        )
+        self.call_create_many()
+        self.check_create_many_success()
+
+    def test_create_many_with_none(self):
+        """Test creating multiple catalogue items when none are given."""
+        self.mock_create_many([])
+        self.call_create_many()
+        self.check_create_many_success()
+
+
 class GetDSL(CatalogueItemRepoDSL):
     """Base class for `get` tests"""
 
@@ -121,13 +207,16 @@ class GetDSL(CatalogueItemRepoDSL):
     _obtained_catalogue_item: Optional[CatalogueItemOut]
     _get_exception: pytest.ExceptionInfo
 
-    def mock_get(self, catalogue_item_id: str, catalogue_item_in_data: Optional[dict]) -> None:
+    def mock_get(
+        self, catalogue_item_id: str, catalogue_item_in_data: Optional[dict], fields: Optional[list[str]] = None
+    ) -> None:
         """Mocks database methods appropriately to test the `get` repo method.
 
         :param catalogue_item_id: ID of the catalogue item to be obtained.
         :param catalogue_item_in_data: Either `None` or a Dictionary containing the catalogue item data as would
                                            be required for a `CatalogueItemIn` database model (i.e. No ID or created
                                            and modified times required).
+        :param fields: List of the fields that will be requested, or `None` if all of them will be.
         """
 
         self._expected_catalogue_item_out = (
@@ -138,21 +227,32 @@ class GetDSL(CatalogueItemRepoDSL):
             if catalogue_item_in_data
             else None
         )
+        if self._expected_catalogue_item_out and fields is not None:
+            self._expected_catalogue_item_out = create_partial_model(CatalogueItemOut)(
+                **self._expected_catalogue_item_out.model_dump(include=set(fields))
+            )
 
         RepositoryTestHelpers.mock_find_one(
             self.catalogue_items_collection,
-            self._expected_catalogue_item_out.model_dump() if self._expected_catalogue_item_out else None,
+            (
+                self._expected_catalogue_item_out.model_dump(exclude_unset=True)
+                if self._expected_catalogue_item_out
+                else None
+            ),
         )
 
-    def call_get(self, catalogue_item_id: str) -> None:
+    def call_get(self, catalogue_item_id: str, fields: Optional[list[str]] = None) -> None:
         """
         Calls the `CatalogueItemRepo` `get` method with the appropriate data from a prior call to `mock_get`.
 
         :param catalogue_item_id: ID of the catalogue item to be obtained.
+        :param fields: List of the fields to retrieve, or `None`.
         """
 
         self._obtained_catalogue_item_id = catalogue_item_id
-        self._obtained_catalogue_item = self.catalogue_item_repository.get(catalogue_item_id, session=self.mock_session)
+        self._obtained_catalogue_item = self.catalogue_item_repository.get(
+            catalogue_item_id, session=self.mock_session, fields=fields
+        )
 
     def call_get_expecting_error(self, catalogue_item_id: str, error_type: type[BaseException]) -> None:
         """
@@ -167,11 +267,18 @@ class GetDSL(CatalogueItemRepoDSL):
             self.catalogue_item_repository.get(catalogue_item_id)
         self._get_exception = exc
 
-    def check_get_success(self) -> None:
-        """Checks that a prior call to `call_get` worked as expected."""
+    def check_get_success(self, expected_projection: Optional[dict] = None) -> None:
+        """
+        Checks that a prior call to `call_get` worked as expected.
+
+        :param expected_projection: Projection expected to have been used when retrieving the catalogue item, or `None`
+                                    if all fields should have been retrieved.
+        """
 
         self.catalogue_items_collection.find_one.assert_called_once_with(
-            {"_id": CustomObjectId(self._obtained_catalogue_item_id)}, session=self.mock_session
+            {"_id": CustomObjectId(self._obtained_catalogue_item_id)},
+            session=self.mock_session,
+            **({"projection": expected_projection} if expected_projection else {}),
         )
         assert self._obtained_catalogue_item == self._expected_catalogue_item_out
 
@@ -200,6 +307,15 @@ class TestGet(GetDSL):
         self.call_get(catalogue_item_id)
         self.check_get_success()
 
+    def test_get_with_fields(self):
+        """Test getting only specific fields of a catalogue item."""
+
+        catalogue_item_id = str(ObjectId())
+
+        self.mock_get(catalogue_item_id, CATALOGUE_ITEM_IN_DATA_REQUIRED_VALUES_ONLY, fields=["id", "name"])
+        self.call_get(catalogue_item_id, fields=["id", "name"])
+        self.check_get_success(expected_projection={"_id": 1, "name": 1})
+
     def test_get_with_non_existent_id(self):
         """Test getting a catalogue item with a non-existent ID."""
 
@@ -218,55 +334,247 @@ class TestGet(GetDSL):
         self.check_get_failed_with_exception("Invalid ObjectId value 'invalid-id'")
 
 
+class GetManyDSL(CatalogueItemRepoDSL):
+    """Base class for `get_many` tests."""
+
+    _catalogue_item_ids: list[str]
+    _expected_catalogue_items_out: dict[str, CatalogueItemOut]
+    _obtained_catalogue_items_out: dict[str, CatalogueItemOut]
+    _get_many_exception: pytest.ExceptionInfo
+
+    def mock_get_many(self, catalogue_items_in_data: list[dict], number_of_non_existent_ids: int = 0) -> None:
+        """
+        Mocks database methods appropriately to test the `get_many` repo method.
+
+        :param catalogue_items_in_data: List of dictionaries containing the catalogue item data as would be required for
+                                        a `CatalogueItemIn` database model (i.e. no ID or created and modified times
+                                        required) for each of the catalogue items that exist.
+        :param number_of_non_existent_ids: Number of additional IDs to request that don't belong to any catalogue item.
+        """
+        expected_catalogue_items_out = [
+            CatalogueItemOut(**CatalogueItemIn(**catalogue_item_in_data).model_dump(by_alias=True), id=ObjectId())
+            for catalogue_item_in_data in catalogue_items_in_data
+        ]
+        self._expected_catalogue_items_out = {
+            catalogue_item_out.id: catalogue_item_out for catalogue_item_out in expected_catalogue_items_out
+        }
+        self._catalogue_item_ids = [catalogue_item_out.id for catalogue_item_out in expected_catalogue_items_out] + [
+            str(ObjectId()) for _ in range(number_of_non_existent_ids)
+        ]
+
+        RepositoryTestHelpers.mock_find(
+            self.catalogue_items_collection,
+            [catalogue_item_out.model_dump() for catalogue_item_out in expected_catalogue_items_out],
+        )
+
+    def call_get_many(self) -> None:
+        """Calls the `CatalogueItemRepo` `get_many` method with the appropriate data from a prior call to
+        `mock_get_many`."""
+        self._obtained_catalogue_items_out = self.catalogue_item_repository.get_many(
+            self._catalogue_item_ids, session=self.mock_session
+        )
+
+    def call_get_many_expecting_error(self, catalogue_item_ids: list[str], error_type: type[BaseException]) -> None:
+        """
+        Calls the `CatalogueItemRepo` `get_many` method while expecting an error to be raised.
+
+        :param catalogue_item_ids: IDs of the catalogue items to be obtained.
+        :param error_type: Expected exception to be raised.
+        """
+        with pytest.raises(error_type) as exc:
+            self.catalogue_item_repository.get_many(catalogue_item_ids, session=self.mock_session)
+        self._get_many_exception = exc
+
+    def check_get_many_success(self) -> None:
+        """Checks that a prior call to `call_get_many` worked as expected."""
+        self.catalogue_items_collection.find.assert_called_once_with(
+            {"_id": {"$in": [CustomObjectId(catalogue_item_id) for catalogue_item_id in self._catalogue_item_ids]}},
+            session=self.mock_session,
+        )
+        assert self._obtained_catalogue_items_out == self._expected_catalogue_items_out
+
+    def check_get_many_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_get_many_expecting_error` worked as expected, raising an exception with the
+        correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+        self.catalogue_items_collection.find.assert_not_called()
+        assert str(self._get_many_exception.value) == message
+
+
+class TestGetMany(GetManyDSL):
+    """Tests for getting multiple catalogue items."""
+
+    def test_get_many(self):
+        """Test getting multiple catalogue items."""
+
+        self.mock_get_many(
+            [CATALOGUE_ITEM_IN_DATA_REQUIRED_VALUES_ONLY, CATALOGUE_ITEM_IN_DATA_NOT_OBSOLETE_NO_PROPERTIES]
+        )
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_non_existent_ids(self):
+        """Test getting multiple catalogue items when some of the IDs don't exist."""
+
+        self.mock_get_many([CATALOGUE_ITEM_IN_DATA_REQUIRED_VALUES_ONLY], number_of_non_existent_ids=2)
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_no_ids(self):
+        """Test getting multiple catalogue items when no IDs are given."""
+
+        self.mock_get_many([])
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_invalid_id(self):
+        """Test getting multiple catalogue items when one of the IDs is invalid."""
+        catalogue_item_id = "invalid-id"
+
+        self.call_get_many_expecting_error([str(ObjectId()), catalogue_item_id], InvalidObjectIdError)
+        self.check_get_many_failed_with_exception(f"Invalid ObjectId value '{catalogue_item_id}'")
+
+
 class ListDSL(CatalogueItemRepoDSL):
     """Base class for `list` tests."""
 
+    # pylint:disable=too-many-instance-attributes
     _expected_catalogue_items_out: list[CatalogueItemOut]
     _catalogue_category_id_filter: Optional[str]
+    _limit: Optional[int]
+    _cursor: Optional[str]
+    _filters: Optional[list[Filter]]
+    _sort: Optional[Sort]
     _obtained_catalogue_items_out: list[CatalogueItemOut]
+    _list_exception: pytest.ExceptionInfo
 
-    def mock_list(self, catalogue_items_in_data: list[dict]) -> None:
+    def mock_list(self, catalogue_items_in_data: list[dict], fields: Optional[list[str]] = None) -> None:
         """Mocks database methods appropriately to test the `list` repo method.
 
         :param catalogue_items_in_data: List of dictionaries containing the catalogue item data as would be
                                              required for a `CatalogueItemIn` database model (i.e. no ID or created
                                              and modified times required).
+        :param fields: List of the fields that will be requested, or `None` if all of them will be.
         """
 
         self._expected_catalogue_items_out = [
             CatalogueItemOut(**CatalogueItemIn(**catalogue_item_in_data).model_dump(by_alias=True), id=ObjectId())
             for catalogue_item_in_data in catalogue_items_in_data
         ]
+        if fields is not None:
+            self._expected_catalogue_items_out = [
+                create_partial_model(CatalogueItemOut)(**catalogue_item_out.model_dump(include=set(fields)))
+                for catalogue_item_out in self._expected_catalogue_items_out
+            ]
 
         RepositoryTestHelpers.mock_find(
             self.catalogue_items_collection,
-            [catalogue_item_out.model_dump() for catalogue_item_out in self._expected_catalogue_items_out],
+            [
+                catalogue_item_out.model_dump(exclude_unset=True)
+                for catalogue_item_out in self._expected_catalogue_items_out
+            ],
         )
 
-    def call_list(self, catalogue_category_id: Optional[str]) -> None:
+    # pylint:disable=too-many-arguments
+    # pylint:disable=too-many-positional-arguments
+    def call_list(
+        self,
+        catalogue_category_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        filters: Optional[list[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> None:
         """
         Calls the `CatalogueItemRepo` `list` method.
 
         :param catalogue_category_id: ID of the catalogue category to query by, or `None`.
+        :param limit: Maximum number of catalogue items to return, or `None`.
+        :param cursor: Cursor of the page to return, or `None`. Only supported when not sorting.
+        :param fields: List of the fields to retrieve, or `None`.
+        :param filters: List of the filters to apply, or `None`.
+        :param sort: Sort to apply, or `None`.
         """
 
         self._catalogue_category_id_filter = catalogue_category_id
+        self._limit = limit
+        self._cursor = cursor
+        self._filters = filters
+        self._sort = sort
 
         self._obtained_catalogue_items_out = self.catalogue_item_repository.list(
-            catalogue_category_id=catalogue_category_id, session=self.mock_session
+            catalogue_category_id=catalogue_category_id,
+            session=self.mock_session,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+            filters=filters,
+            sort=sort,
         )
 
-    def check_list_success(self) -> None:
-        """Checks that a prior call to `call_list` worked as expected."""
+    def call_list_expecting_error(self, cursor: str, error_type: type[BaseException]) -> None:
+        """
+        Calls the `CatalogueItemRepo` `list` method while expecting an error to be raised.
+
+        :param cursor: Cursor of the page to return.
+        :param error_type: Expected exception to be raised.
+        """
+
+        with pytest.raises(error_type) as exc:
+            self.catalogue_item_repository.list(catalogue_category_id=None, session=self.mock_session, cursor=cursor)
+        self._list_exception = exc
+
+    def check_list_success(self, expected_projection: Optional[dict] = None) -> None:
+        """
+        Checks that a prior call to `call_list` worked as expected.
+
+        :param expected_projection: Projection expected to have been used when retrieving the catalogue items, or
+                                    `None` if all fields should have been retrieved.
+        """
 
         expected_query = {}
         if self._catalogue_category_id_filter:
             expected_query["catalogue_category_id"] = CustomObjectId(self._catalogue_category_id_filter)
-
-        self.catalogue_items_collection.find.assert_called_once_with(expected_query, session=self.mock_session)
+        for expected_filter in self._filters or []:
+            expected_query.setdefault(expected_filter.field, {})[
+                f"${expected_filter.operator.value}"
+            ] = expected_filter.value
+
+        expected_options = {"projection": expected_projection} if expected_projection else {}
+        if self._limit is None and self._cursor is None and self._sort is None:
+            self.catalogue_items_collection.find.assert_called_once_with(
+                expected_query, session=self.mock_session, **expected_options
+            )
+        else:
+            if self._cursor is not None:
+                expected_query["_id"] = {"$gt": decode_cursor(self._cursor)}
+            direction = -1 if self._sort is not None and self._sort.descending else 1
+            self.catalogue_items_collection.find.assert_called_once_with(
+                expected_query,
+                session=self.mock_session,
+                sort=([(self._sort.field, direction)] if self._sort is not None else []) + [("_id", direction)],
+                **({"limit": self._limit} if self._limit is not None else {}),
+                **expected_options,
+            )
 
         assert self._obtained_catalogue_items_out == self._expected_catalogue_items_out
 
+    def check_list_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_list_expecting_error` worked as expected, raising an exception with the
+        correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+
+        self.catalogue_items_collection.find.assert_not_called()
+
+        assert str(self._list_exception.value) == message
+
 
 class TestList(ListDSL):
     """Tests for listing catalogue items."""
@@ -302,6 +610,270 @@ class TestList(ListDSL):
         self.call_list(catalogue_category_id=str(ObjectId()))
         self.check_list_success()
 
+    def test_list_with_limit(self):
+        """Test listing the first page of catalogue items."""
+
+        self.mock_list([CATALOGUE_ITEM_IN_DATA_REQUIRED_VALUES_ONLY])
+        self.call_list(catalogue_category_id=None, limit=1)
+        self.check_list_success()
+
+    def test_list_with_catalogue_category_id_filter_limit_and_cursor(self):
+        """Test listing a subsequent page of catalogue items with a given `catalogue_category_id`."""
+
+        self.mock_list([CATALOGUE_ITEM_IN_DATA_REQUIRED_VALUES_ONLY])
+        self.call_list(catalogue_category_id=str(ObjectId()), limit=1, cursor=encode_cursor(str(ObjectId())))
+        self.check_list_success()
+
+    def test_list_with_invalid_cursor(self):
+        """Test listing catalogue items with an invalid cursor."""
+
+        self.call_list_expecting_error("invalid-cursor", InvalidCursorError)
+        self.check_list_failed_with_exception("Invalid cursor 'invalid-cursor'")
+
+    def test_list_with_fields(self):
+        """Test listing only specific fields of catalogue items."""
+
+        self.mock_list(
+            [CATALOGUE_ITEM_IN_DATA_REQUIRED_VALUES_ONLY, CATALOGUE_ITEM_IN_DATA_NOT_OBSOLETE_NO_PROPERTIES],
+            fields=["id", "name", "manufacturer_id"],
+        )
+        self.call_list(catalogue_category_id=None, fields=["id", "name", "manufacturer_id"])
+        self.check_list_success(expected_projection={"_id": 1, "name": 1, "manufacturer_id": 1})
+
+    def test_list_with_filters_and_sort(self):
+        """Test listing catalogue items with filters sorted by a field."""
+
+        self.mock_list([CATALOGUE_ITEM_IN_DATA_REQUIRED_VALUES_ONLY, CATALOGUE_ITEM_IN_DATA_NOT_OBSOLETE_NO_PROPERTIES])
+        self.call_list(
+            catalogue_category_id=str(ObjectId()),
+            filters=[Filter("manufacturer_id", FilterOperator.NE, CustomObjectId(str(ObjectId())))],
+            sort=Sort("name"),
+        )
+        self.check_list_success()
+
+
+class StreamDSL(ListDSL):
+    """Base class for `stream` tests."""
+
+    def call_stream(
+        self, catalogue_category_id: Optional[str], limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> None:
+        """
+        Calls the `CatalogueItemRepo` `stream` method and consumes the returned iterator.
+
+        :param catalogue_category_id: ID of the catalogue category to query by, or `None`.
+        :param limit: Maximum number of catalogue items to return, or `None`.
+        :param cursor: Cursor of the page to return, or `None`.
+        """
+
+        self._catalogue_category_id_filter = catalogue_category_id
+        self._limit = limit
+        self._cursor = cursor
+
+        self._obtained_catalogue_items_out = list(
+            self.catalogue_item_repository.stream(
+                catalogue_category_id=catalogue_category_id, session=self.mock_session, limit=limit, cursor=cursor
+            )
+        )
+
+    def call_stream_expecting_error(self, cursor: str, error_type: type[BaseException]) -> None:
+        """
+        Calls the `CatalogueItemRepo` `stream` method while expecting an error to be raised before the returned
+        iterator is consumed.
+
+        :param cursor: Cursor of the page to return.
+        :param error_type: Expected exception to be raised.
+        """
+
+        with pytest.raises(error_type) as exc:
+            self.catalogue_item_repository.stream(catalogue_category_id=None, session=self.mock_session, cursor=cursor)
+        self._list_exception = exc
+
+    def check_stream_success(self) -> None:
+        """Checks that a prior call to `call_stream` worked as expected."""
+
+        expected_query = {}
+        if self._catalogue_category_id_filter:
+            expected_query["catalogue_category_id"] = CustomObjectId(self._catalogue_category_id_filter)
+
+        expected_options = {}
+        if self._limit is not None or self._cursor is not None:
+            if self._cursor is not None:
+                expected_query["_id"] = {"$gt": decode_cursor(self._cursor)}
+            expected_options["sort"] = [("_id", 1)]
+            if self._limit is not None:
+                expected_options["limit"] = self._limit
+
+        self.catalogue_items_collection.find.assert_called_once_with(
+            expected_query, session=self.mock_session, batch_size=STREAM_BATCH_SIZE, **expected_options
+        )
+
+        assert self._obtained_catalogue_items_out == self._expected_catalogue_items_out
+
+
+class TestStream(StreamDSL):
+    """Tests for streaming catalogue items."""
+
+    def test_stream(self):
+        """Test streaming all catalogue items."""
+
+        self.mock_list(
+            [
+                CATALOGUE_ITEM_IN_DATA_REQUIRED_VALUES_ONLY,
+                CATALOGUE_ITEM_IN_DATA_NOT_OBSOLETE_NO_PROPERTIES,
+            ]
+        )
+        self.call_stream(catalogue_category_id=None)
+        self.check_stream_success()
+
+    def test_stream_with_catalogue_category_id_filter_limit_and_cursor(self):
+        """Test streaming a subsequent page of catalogue items with a given `catalogue_category_id`."""
+
+        self.mock_list([CATALOGUE_ITEM_IN_DATA_REQUIRED_VALUES_ONLY])
+        self.call_stream(catalogue_category_id=str(ObjectId()), limit=1, cursor=encode_cursor(str(ObjectId())))
+        self.check_stream_success()
+
+    def test_stream_with_invalid_cursor(self):
+        """Test streaming catalogue items with an invalid cursor."""
+
+        self.call_stream_expecting_error("invalid-cursor", InvalidCursorError)
+        self.check_list_failed_with_exception("Invalid cursor 'invalid-cursor'")
+
+
+class GetListVersionDSL(CatalogueItemRepoDSL):
+    """Base class for `get_list_version` tests."""
+
+    _catalogue_category_id_filter: Optional[str]
+    _limit: Optional[int]
+    _cursor: Optional[str]
+    _expected_list_version: str
+    _obtained_list_version: str
+    _get_list_version_exception: pytest.ExceptionInfo
+
+    def mock_get_list_version(self, count: int) -> None:
+        """
+        Mocks database methods appropriately to test the `get_list_version` repo method.
+
+        :param count: Number of catalogue items the list should contain.
+        """
+
+        catalogue_items = [
+            {"_id": ObjectId(), "modified_time": datetime.now(timezone.utc), "number_of_spares": index}
+            for index in range(count)
+        ]
+        self._expected_list_version = compute_list_version(
+            (catalogue_item["_id"], catalogue_item["modified_time"], catalogue_item["number_of_spares"])
+            for catalogue_item in catalogue_items
+        )
+        self.catalogue_items_collection.find.return_value = catalogue_items
+
+    def call_get_list_version(
+        self, catalogue_category_id: Optional[str], limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> None:
+        """
+        Calls the `CatalogueItemRepo` `get_list_version` method.
+
+        :param catalogue_category_id: ID of the catalogue category to query by, or `None`.
+        :param limit: Maximum number of catalogue items in the list, or `None`.
+        :param cursor: Cursor of the page of the list, or `None`.
+        """
+
+        self._catalogue_category_id_filter = catalogue_category_id
+        self._limit = limit
+        self._cursor = cursor
+
+        self._obtained_list_version = self.catalogue_item_repository.get_list_version(
+            catalogue_category_id=catalogue_category_id, session=self.mock_session, limit=limit, cursor=cursor
+        )
+
+    def call_get_list_version_expecting_error(self, cursor: str, error_type: type[BaseException]) -> None:
+        """
+        Calls the `CatalogueItemRepo` `get_list_version` method while expecting an error to be raised.
+
+        :param cursor: Cursor of the page of the list.
+        :param error_type: Expected exception to be raised.
+        """
+
+        with pytest.raises(error_type) as exc:
+            self.catalogue_item_repository.get_list_version(
+                catalogue_category_id=None, session=self.mock_session, cursor=cursor
+            )
+        self._get_list_version_exception = exc
+
+    def check_get_list_version_success(self) -> None:
+        """Checks that a prior call to `call_get_list_version` worked as expected."""
+
+        expected_query = {}
+        if self._catalogue_category_id_filter:
+            expected_query["catalogue_category_id"] = CustomObjectId(self._catalogue_category_id_filter)
+        if self._cursor is not None:
+            expected_query["_id"] = {"$gt": decode_cursor(self._cursor)}
+
+        expected_options = {}
+        if self._limit is not None or self._cursor is not None:
+            expected_options["sort"] = [("_id", 1)]
+            if self._limit is not None:
+                expected_options["limit"] = self._limit
+
+        self.catalogue_items_collection.find.assert_called_once_with(
+            expected_query,
+            session=self.mock_session,
+            projection={"_id": 1, "modified_time": 1, "number_of_spares": 1},
+            **expected_options,
+        )
+
+        assert self._obtained_list_version == self._expected_list_version
+
+    def check_get_list_version_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_get_list_version_expecting_error` worked as expected, raising an exception
+        with the correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+
+        self.catalogue_items_collection.find.assert_not_called()
+
+        assert str(self._get_list_version_exception.value) == message
+
+
+class TestGetListVersion(GetListVersionDSL):
+    """Tests for getting the version of a list of catalogue items."""
+
+    def test_get_list_version(self):
+        """Test getting the version of the list of all catalogue items."""
+
+        self.mock_get_list_version(2)
+        self.call_get_list_version(catalogue_category_id=None)
+        self.check_get_list_version_success()
+
+    def test_get_list_version_with_catalogue_category_id_filter(self):
+        """Test getting the version of the list of all catalogue items with a given `catalogue_category_id`."""
+
+        self.mock_get_list_version(1)
+        self.call_get_list_version(catalogue_category_id=str(ObjectId()))
+        self.check_get_list_version_success()
+
+    def test_get_list_version_with_limit_and_cursor(self):
+        """Test getting the version of a subsequent page of catalogue items."""
+
+        self.mock_get_list_version(1)
+        self.call_get_list_version(catalogue_category_id=None, limit=1, cursor=encode_cursor(str(ObjectId())))
+        self.check_get_list_version_success()
+
+    def test_get_list_version_with_no_results(self):
+        """Test getting the version of a list of catalogue items that is empty."""
+
+        self.mock_get_list_version(0)
+        self.call_get_list_version(catalogue_category_id=str(ObjectId()))
+        self.check_get_list_version_success()
+
+    def test_get_list_version_with_invalid_cursor(self):
+        """Test getting the version of a list of catalogue items with an invalid cursor."""
+
+        self.call_get_list_version_expecting_error("invalid-cursor", InvalidCursorError)
+        self.check_get_list_version_failed_with_exception("Invalid cursor 'invalid-cursor'")
+
 
 class UpdateDSL(CatalogueItemRepoDSL):
     """Base class for `update` tests."""
@@ -378,7 +950,9 @@ class UpdateDSL(CatalogueItemRepoDSL):
                 "_id": CustomObjectId(self._updated_catalogue_item_id),
             },
             {
-                "$set": self._catalogue_item_in.model_dump(by_alias=True),
+                "$set": self._catalogue_item_in.model_dump(
+                    by_alias=True, exclude={"item_counts_by_system_type", "number_of_spares"}
+                ),
             },
             session=self.mock_session,
         )
@@ -865,31 +1439,47 @@ class TestUpdateAllPropertiesWithID(UpdateAllPropertiesWithIDDSL):
         self.check_update_all_properties_with_id()
 
 
-class UpdateNumberOfSparesDSL(CatalogueItemRepoDSL):
-    """Base class for `update_number_of_spares` tests."""
+class IncrementItemCountsDSL(CatalogueItemRepoDSL):
+    """Base class for `increment_item_counts` tests."""
 
-    _update_number_of_spares_catalogue_item_id: ObjectId
-    _update_number_of_spares_number_of_spares: Optional[int]
+    _increment_item_counts_catalogue_item_id: ObjectId
+    _increment_item_counts_item_counts_changes: dict[str, int]
+    _increment_item_counts_number_of_spares_change: Optional[int]
 
-    def call_update_number_of_spares(self, catalogue_item_id: ObjectId, number_of_spares: Optional[int]) -> None:
-        """Calls the `CatalogueItemRepo` `update_number_of_spares` method.
+    def call_increment_item_counts(
+        self,
+        catalogue_item_id: ObjectId,
+        item_counts_changes: dict[str, int],
+        number_of_spares_change: Optional[int],
+    ) -> None:
+        """Calls the `CatalogueItemRepo` `increment_item_counts` method.
 
         :param catalogue_item_id: The ID of the catalogue item to update.
-        :param number_of_spares: New number of spares to update to.
+        :param item_counts_changes: Dictionary of the amounts to change the item counts by with the IDs of the system
+                                    types as keys.
+        :param number_of_spares_change: Amount to change the number of spares by or `None`.
         """
 
-        self._update_number_of_spares_catalogue_item_id = catalogue_item_id
-        self._update_number_of_spares_number_of_spares = number_of_spares
-        self.catalogue_item_repository.update_number_of_spares(
-            catalogue_item_id, number_of_spares, session=self.mock_session
+        self._increment_item_counts_catalogue_item_id = catalogue_item_id
+        self._increment_item_counts_item_counts_changes = item_counts_changes
+        self._increment_item_counts_number_of_spares_change = number_of_spares_change
+        self.catalogue_item_repository.increment_item_counts(
+            catalogue_item_id, item_counts_changes, number_of_spares_change, session=self.mock_session
         )
 
-    def check_update_number_of_spares(self) -> None:
-        """Checks that a prior call to `update_number_of_spares` worked as expected."""
+    def check_increment_item_counts(self) -> None:
+        """Checks that a prior call to `increment_item_counts` worked as expected."""
+
+        expected_increments = {
+            f"item_counts_by_system_type.{system_type_id}": change
+            for system_type_id, change in self._increment_item_counts_item_counts_changes.items()
+        }
+        if self._increment_item_counts_number_of_spares_change is not None:
+            expected_increments["number_of_spares"] = self._increment_item_counts_number_of_spares_change
 
         self.catalogue_items_collection.update_one.assert_called_once_with(
-            {"_id": self._update_number_of_spares_catalogue_item_id},
-            {"$set": {"number_of_spares": self._update_number_of_spares_number_of_spares}},
+            {"_id": self._increment_item_counts_catalogue_item_id},
+            {"$inc": expected_increments},
             session=self.mock_session,
         )
 
@@ -934,14 +1524,148 @@ class TestDeleteProperties(DeletePropertiesDSL):
         self.check_delete_properties()
 
 
-class TestUpdateNumberOfSpares(UpdateNumberOfSparesDSL):
-    """Tests for `update_number_of_spares`."""
+class TestIncrementItemCounts(IncrementItemCountsDSL):
+    """Tests for `increment_item_counts`."""
 
-    def test_update_number_of_spares(self):
-        """Test `update_number_of_spares`."""
+    def test_increment_item_counts(self):
+        """Test `increment_item_counts`."""
 
-        self.call_update_number_of_spares(ObjectId(), 42)
-        self.check_update_number_of_spares()
+        self.call_increment_item_counts(ObjectId(), {str(ObjectId()): 1, str(ObjectId()): -1}, None)
+        self.check_increment_item_counts()
+
+    def test_increment_item_counts_with_number_of_spares_change(self):
+        """Test `increment_item_counts` when also changing the number of spares."""
+
+        self.call_increment_item_counts(ObjectId(), {str(ObjectId()): -2}, -2)
+        self.check_increment_item_counts()
+
+
+class UpdateAllNumberOfSparesFromItemCountsDSL(CatalogueItemRepoDSL):
+    """Base class for `update_all_number_of_spares_from_item_counts` tests."""
+
+    _update_all_number_of_spares_from_item_counts_system_type_ids: list[ObjectId]
+
+    def call_update_all_number_of_spares_from_item_counts(self, system_type_ids: list[ObjectId]) -> None:
+        """Calls the `CatalogueItemRepo` `update_all_number_of_spares_from_item_counts` method.
+
+        :param system_type_ids: IDs of the system types that define a spare.
+        """
+
+        self._update_all_number_of_spares_from_item_counts_system_type_ids = system_type_ids
+        self.catalogue_item_repository.update_all_number_of_spares_from_item_counts(
+            system_type_ids, session=self.mock_session
+        )
+
+    def check_update_all_number_of_spares_from_item_counts(self) -> None:
+        """Checks that a prior call to `update_all_number_of_spares_from_item_counts` worked as expected."""
+
+        self.catalogue_items_collection.update_many.assert_called_once_with(
+            {},
+            [
+                {
+                    "$set": {
+                        "number_of_spares": {
+                            "$add": [
+                                {"$ifNull": [f"$item_counts_by_system_type.{system_type_id}", 0]}
+                                for system_type_id in self._update_all_number_of_spares_from_item_counts_system_type_ids
+                            ]
+                        }
+                    }
+                }
+            ],
+            session=self.mock_session,
+        )
+
+
+class TestUpdateAllNumberOfSparesFromItemCounts(UpdateAllNumberOfSparesFromItemCountsDSL):
+    """Tests for `update_all_number_of_spares_from_item_counts`."""
+
+    def test_update_all_number_of_spares_from_item_counts(self):
+        """Test `update_all_number_of_spares_from_item_counts`."""
+
+        self.call_update_all_number_of_spares_from_item_counts([ObjectId(), ObjectId()])
+        self.check_update_all_number_of_spares_from_item_counts()
+
+
+class UpdateAllItemCountsDSL(CatalogueItemRepoDSL):
+    """Base class for `update_all_item_counts` tests."""
+
+    _update_all_item_counts_item_counts: dict[str, int]
+
+    def call_update_all_item_counts(self, item_counts: dict[str, int]) -> None:
+        """Calls the `CatalogueItemRepo` `update_all_item_counts` method.
+
+        :param item_counts: New item counts to update to.
+        """
+
+        self._update_all_item_counts_item_counts = item_counts
+        self.catalogue_item_repository.update_all_item_counts(item_counts, session=self.mock_session)
+
+    def check_update_all_item_counts(self) -> None:
+        """Checks that a prior call to `update_all_item_counts` worked as expected."""
+
+        self.catalogue_items_collection.update_many.assert_called_once_with(
+            {},
+            {"$set": {"item_counts_by_system_type": self._update_all_item_counts_item_counts}},
+            session=self.mock_session,
+        )
+
+
+class TestUpdateAllItemCounts(UpdateAllItemCountsDSL):
+    """Tests for `update_all_item_counts`."""
+
+    def test_update_all_item_counts(self):
+        """Test `update_all_item_counts`."""
+
+        self.call_update_all_item_counts({})
+        self.check_update_all_item_counts()
+
+
+class UpdateManyItemCountsDSL(CatalogueItemRepoDSL):
+    """Base class for `update_many_item_counts` tests."""
+
+    _update_many_item_counts_item_counts: dict[ObjectId, dict[str, int]]
+
+    def call_update_many_item_counts(self, item_counts: dict[ObjectId, dict[str, int]]) -> None:
+        """Calls the `CatalogueItemRepo` `update_many_item_counts` method.
+
+        :param item_counts: Dictionary of the new item counts to update to with the IDs of the catalogue items to update
+                            as keys.
+        """
+
+        self._update_many_item_counts_item_counts = item_counts
+        self.catalogue_item_repository.update_many_item_counts(item_counts, session=self.mock_session)
+
+    def check_update_many_item_counts(self) -> None:
+        """Checks that a prior call to `update_many_item_counts` worked as expected."""
+
+        if not self._update_many_item_counts_item_counts:
+            self.catalogue_items_collection.bulk_write.assert_not_called()
+        else:
+            self.catalogue_items_collection.bulk_write.assert_called_once_with(
+                [
+                    UpdateOne({"_id": catalogue_item_id}, {"$set": {"item_counts_by_system_type": counts}})
+                    for catalogue_item_id, counts in self._update_many_item_counts_item_counts.items()
+                ],
+                ordered=False,
+                session=self.mock_session,
+            )
+
+
+class TestUpdateManyItemCounts(UpdateManyItemCountsDSL):
+    """Tests for `update_many_item_counts`."""
+
+    def test_update_many_item_counts(self):
+        """Test `update_many_item_counts`."""
+
+        self.call_update_many_item_counts({ObjectId(): {str(ObjectId()): 42}, ObjectId(): {str(ObjectId()): 3}})
+        self.check_update_many_item_counts()
+
+    def test_update_many_item_counts_with_no_catalogue_items(self):
+        """Test `update_many_item_counts` when there are no catalogue items to update."""
+
+        self.call_update_many_item_counts({})
+        self.check_update_many_item_counts()
 
 
 class IsDuplicateNameDSL(CatalogueItemRepoDSL):
@@ -1002,3 +1726,60 @@ class TestIsDuplicateName(IsDuplicateNameDSL):
         self.mock_is_duplicate_name(duplicate_catalogue_item_data=CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY)
         self.call_is_duplicate_name("Test")
         self.check_is_duplicate_name_success(expected_result=True)
+
+
+class GetDuplicateNamesDSL(CatalogueItemRepoDSL):
+    """Base class for `get_duplicate_names` tests"""
+
+    _get_duplicate_names_names: list[str]
+    _get_duplicate_names_result: set[str]
+
+    def mock_get_duplicate_names(self, duplicate_names: list[str]) -> None:
+        """
+        Mocks database methods appropriately for when the `get_duplicate_names` repo method will be called.
+
+        :param duplicate_names: List of the names that already exist, as would be returned by `distinct`.
+        """
+
+        self.catalogue_items_collection.distinct.return_value = duplicate_names
+
+    def call_get_duplicate_names(self, names: list[str]) -> None:
+        """Calls the `CatalogueItemRepo` `get_duplicate_names` method.
+
+        :param names: Names of the catalogue items to check.
+        """
+
+        self._get_duplicate_names_names = names
+        self._get_duplicate_names_result = self.catalogue_item_repository.get_duplicate_names(
+            names, session=self.mock_session
+        )
+
+    def check_get_duplicate_names_success(self, expected_result: set[str]) -> None:
+        """Checks that a prior call to `call_get_duplicate_names` worked as expected.
+
+        :param expected_result: The expected result returned by `get_duplicate_names`.
+        """
+
+        self.catalogue_items_collection.distinct.assert_called_once_with(
+            "name", {"name": {"$in": self._get_duplicate_names_names}}, session=self.mock_session
+        )
+
+        assert self._get_duplicate_names_result == expected_result
+
+
+class TestGetDuplicateNames(GetDuplicateNamesDSL):
+    """Tests for `get_duplicate_names`."""
+
+    def test_get_duplicate_names_with_no_duplicates(self):
+        """Test `get_duplicate_names` when there are no duplicate catalogue items."""
+
+        self.mock_get_duplicate_names([])
+        self.call_get_duplicate_names(["Test A", "Test B"])
+        self.check_get_duplicate_names_success(expected_result=set())
+
+    def test_get_duplicate_names_with_duplicates(self):
+        """Test `get_duplicate_names` when there are duplicate catalogue items."""
+
+        self.mock_get_duplicate_names(["Test B"])
+        self.call_get_duplicate_names(["Test A", "Test B"])
+        self.check_get_duplicate_names_success(expected_result={"Test B"})
@@ -0,0 +1,268 @@
+"""
+Unit tests for the functions inside the `indexes` module in /repositories.
+"""
+
+from unittest.mock import MagicMock, call
+
+import pytest
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from inventory_management_system_api.core.filtering import EQUALITY_OPERATORS, FilterField
+from inventory_management_system_api.repositories.indexes import (
+    FILTER_FIELDS,
+    diff_indexes,
+    find_unindexed_filter_fields,
+    find_unique_indexes_to_drop,
+    get_declared_indexes,
+    sync_indexes,
+)
+
+ID_INDEX_INFORMATION = {"_id_": {"v": 2, "key": [("_id", 1)]}}
+
+NAME_INDEX = IndexModel([("name", ASCENDING)], name="name_index")
+NAME_INDEX_INFORMATION = {"name_index": {"v": 2, "key": [("name", 1)]}}
+
+CODE_UNIQUENESS_INDEX = IndexModel(
+    [("parent_id", ASCENDING), ("code", ASCENDING)], name="code_uniqueness_index", unique=True
+)
+CODE_UNIQUENESS_INDEX_INFORMATION = {
+    "code_uniqueness_index": {"v": 2, "key": [("parent_id", 1), ("code", 1)], "unique": True}
+}
+
+
+def test_get_declared_indexes():
+    """Test `get_declared_indexes` returns the indexes declared by the repositories."""
+
+    declared_indexes = get_declared_indexes()
+
+    assert [index.document["name"] for index in declared_indexes["items"]] == [
+        "items_catalogue_item_id_system_type_id_index",
+        "items_system_id_index",
+        "items_properties_id_index",
+        "items_usage_status_id_index",
+        "items_is_defective_index",
+        "items_delivered_date_index",
+        "items_warranty_end_date_index",
+    ]
+    assert [index.document["name"] for index in declared_indexes["systems"]] == [
+        "systems_name_uniqueness_index",
+        "systems_ancestor_ids_index",
+    ]
+
+
+def test_find_unindexed_filter_fields():
+    """Test `find_unindexed_filter_fields` finds no fields that can be filtered or sorted by without a declared
+    index."""
+
+    assert not find_unindexed_filter_fields(get_declared_indexes(), FILTER_FIELDS)
+
+
+def test_find_unindexed_filter_fields_with_unindexed_fields():
+    """Test `find_unindexed_filter_fields` when there are fields that aren't covered by the declared indexes."""
+
+    assert find_unindexed_filter_fields(
+        {
+            "collection_a": [NAME_INDEX, CODE_UNIQUENESS_INDEX],
+            "collection_b": [IndexModel([("name", ASCENDING), ("_id", ASCENDING)], name="name_index")],
+        },
+        {
+            "collection_a": {
+                "name": FilterField(value_type=str, operators=EQUALITY_OPERATORS, sortable=True),
+                "parent_id": FilterField(value_type=str, operators=EQUALITY_OPERATORS),
+                "code": FilterField(value_type=str, operators=EQUALITY_OPERATORS),
+            },
+            "collection_b": {"name": FilterField(value_type=str, operators=EQUALITY_OPERATORS, sortable=True)},
+            "collection_c": {"name": FilterField(value_type=str, operators=EQUALITY_OPERATORS)},
+        },
+    ) == {"collection_a": ["name", "code"], "collection_c": ["name"]}
+
+
+class IndexesDSL:
+    """Base class for `indexes` tests."""
+
+    mock_database: MagicMock
+    mock_collections: dict[str, MagicMock]
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Setup fixtures."""
+
+        self.mock_collections = {"collection_a": MagicMock(), "collection_b": MagicMock()}
+        self.mock_database = MagicMock()
+        self.mock_database.__getitem__.side_effect = lambda collection_name: self.mock_collections[collection_name]
+
+
+class DiffIndexesDSL(IndexesDSL):
+    """Base class for `diff_indexes` tests."""
+
+    _obtained_indexes_to_create: dict[str, list[IndexModel]]
+    _obtained_indexes_to_drop: dict[str, list[str]]
+
+    def mock_diff_indexes(self, live_index_information: dict[str, dict]) -> None:
+        """
+        Mocks database methods appropriately to test the `diff_indexes` function.
+
+        :param live_index_information: Dictionary of the index information to return for each collection name as would
+                                       be returned by `Collection.index_information`.
+        """
+
+        for collection_name, index_information in live_index_information.items():
+            self.mock_collections[collection_name].index_information.return_value = index_information
+
+    def call_diff_indexes(self, declared_indexes: dict[str, list[IndexModel]]) -> None:
+        """
+        Calls the `diff_indexes` function.
+
+        :param declared_indexes: Dictionary of the declared indexes for each collection name.
+        """
+
+        self._obtained_indexes_to_create, self._obtained_indexes_to_drop = diff_indexes(
+            self.mock_database, declared_indexes
+        )
+
+    def check_diff_indexes_success(
+        self, expected_indexes_to_create: dict[str, list[IndexModel]], expected_indexes_to_drop: dict[str, list[str]]
+    ) -> None:
+        """
+        Checks that a prior call to `call_diff_indexes` worked as expected.
+
+        :param expected_indexes_to_create: Dictionary of the indexes expected to be created for each collection name.
+        :param expected_indexes_to_drop: Dictionary of the names of the indexes expected to be dropped for each
+                                         collection name.
+        """
+
+        assert self._obtained_indexes_to_create == expected_indexes_to_create
+        assert self._obtained_indexes_to_drop == expected_indexes_to_drop
+
+
+class TestDiffIndexes(DiffIndexesDSL):
+    """Tests for comparing the declared indexes against those in the database."""
+
+    def test_diff_indexes_when_up_to_date(self):
+        """Test comparing indexes when the database already contains exactly the declared indexes."""
+
+        self.mock_diff_indexes(
+            {"collection_a": {**ID_INDEX_INFORMATION, **NAME_INDEX_INFORMATION, **CODE_UNIQUENESS_INDEX_INFORMATION}}
+        )
+        self.call_diff_indexes({"collection_a": [NAME_INDEX, CODE_UNIQUENESS_INDEX]})
+        self.check_diff_indexes_success({}, {})
+
+    def test_diff_indexes_with_missing_indexes(self):
+        """Test comparing indexes when the declared indexes don't exist in the database."""
+
+        self.mock_diff_indexes({"collection_a": {**ID_INDEX_INFORMATION}, "collection_b": {}})
+        self.call_diff_indexes({"collection_a": [NAME_INDEX, CODE_UNIQUENESS_INDEX], "collection_b": [NAME_INDEX]})
+        self.check_diff_indexes_success(
+            {"collection_a": [NAME_INDEX, CODE_UNIQUENESS_INDEX], "collection_b": [NAME_INDEX]}, {}
+        )
+
+    def test_diff_indexes_with_undeclared_indexes(self):
+        """Test comparing indexes when the database contains indexes that aren't declared."""
+
+        self.mock_diff_indexes(
+            {"collection_a": {**ID_INDEX_INFORMATION, **NAME_INDEX_INFORMATION, **CODE_UNIQUENESS_INDEX_INFORMATION}}
+        )
+        self.call_diff_indexes({"collection_a": [CODE_UNIQUENESS_INDEX]})
+        self.check_diff_indexes_success({}, {"collection_a": ["name_index"]})
+
+    def test_diff_indexes_with_changed_keys(self):
+        """Test comparing indexes when an index in the database has the same name as a declared one but different
+        keys."""
+
+        changed_name_index = IndexModel([("name", DESCENDING)], name="name_index")
+
+        self.mock_diff_indexes({"collection_a": {**ID_INDEX_INFORMATION, **NAME_INDEX_INFORMATION}})
+        self.call_diff_indexes({"collection_a": [changed_name_index]})
+        self.check_diff_indexes_success({"collection_a": [changed_name_index]}, {"collection_a": ["name_index"]})
+
+    def test_diff_indexes_with_changed_options(self):
+        """Test comparing indexes when an index in the database has the same name and keys as a declared one but
+        different options."""
+
+        non_unique_code_index = IndexModel(
+            [("parent_id", ASCENDING), ("code", ASCENDING)], name="code_uniqueness_index"
+        )
+
+        self.mock_diff_indexes({"collection_a": {**ID_INDEX_INFORMATION, **CODE_UNIQUENESS_INDEX_INFORMATION}})
+        self.call_diff_indexes({"collection_a": [non_unique_code_index]})
+        self.check_diff_indexes_success(
+            {"collection_a": [non_unique_code_index]}, {"collection_a": ["code_uniqueness_index"]}
+        )
+
+
+class TestFindUniqueIndexesToDrop(IndexesDSL):
+    """Tests for finding the unique indexes among those to be dropped."""
+
+    def test_find_unique_indexes_to_drop(self):
+        """Test finding the unique indexes to drop when some are unique."""
+
+        self.mock_collections["collection_a"].index_information.return_value = {
+            **ID_INDEX_INFORMATION,
+            **NAME_INDEX_INFORMATION,
+            **CODE_UNIQUENESS_INDEX_INFORMATION,
+        }
+        self.mock_collections["collection_b"].index_information.return_value = {
+            **ID_INDEX_INFORMATION,
+            **NAME_INDEX_INFORMATION,
+        }
+
+        assert find_unique_indexes_to_drop(
+            self.mock_database,
+            {"collection_a": ["name_index", "code_uniqueness_index"], "collection_b": ["name_index"]},
+        ) == {"collection_a": ["code_uniqueness_index"]}
+
+    def test_find_unique_indexes_to_drop_with_none_to_drop(self):
+        """Test finding the unique indexes to drop when there are no indexes to drop."""
+
+        assert not find_unique_indexes_to_drop(self.mock_database, {})
+
+
+class SyncIndexesDSL(IndexesDSL):
+    """Base class for `sync_indexes` tests."""
+
+    _indexes_to_create: dict[str, list[IndexModel]]
+    _indexes_to_drop: dict[str, list[str]]
+
+    def call_sync_indexes(
+        self, indexes_to_create: dict[str, list[IndexModel]], indexes_to_drop: dict[str, list[str]]
+    ) -> None:
+        """
+        Calls the `sync_indexes` function.
+
+        :param indexes_to_create: Dictionary of the indexes to create for each collection name.
+        :param indexes_to_drop: Dictionary of the names of the indexes to drop for each collection name.
+        """
+
+        self._indexes_to_create = indexes_to_create
+        self._indexes_to_drop = indexes_to_drop
+        sync_indexes(self.mock_database, indexes_to_create, indexes_to_drop)
+
+    def check_sync_indexes_success(self) -> None:
+        """Checks that a prior call to `call_sync_indexes` worked as expected."""
+
+        for collection_name, mock_collection in self.mock_collections.items():
+            mock_collection.drop_index.assert_has_calls(
+                [call(index_name) for index_name in self._indexes_to_drop.get(collection_name, [])]
+            )
+            if collection_name in self._indexes_to_create:
+                mock_collection.create_indexes.assert_called_once_with(self._indexes_to_create[collection_name])
+            else:
+                mock_collection.create_indexes.assert_not_called()
+
+
+class TestSyncIndexes(SyncIndexesDSL):
+    """Tests for synchronising the indexes in the database."""
+
+    def test_sync_indexes(self):
+        """Test synchronising indexes."""
+
+        self.call_sync_indexes(
+            {"collection_a": [NAME_INDEX, CODE_UNIQUENESS_INDEX]}, {"collection_a": ["old_index"], "collection_b": []}
+        )
+        self.check_sync_indexes_success()
+
+    def test_sync_indexes_with_no_differences(self):
+        """Test synchronising indexes when there are no differences."""
+
+        self.call_sync_indexes({}, {})
+        self.check_sync_indexes_success()
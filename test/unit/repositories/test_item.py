@@ -2,20 +2,34 @@
 Unit tests for the `ItemRepo` repository.
 """
 
+# Expect some duplicate code inside tests as the tests for the different entities can be very similar
+# pylint: disable=duplicate-code
+# pylint: disable=too-many-lines
+
 from test.mock_data import (
     ITEM_IN_DATA_NEW_ALL_VALUES_NO_PROPERTIES,
     ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY,
     PROPERTY_DATA_STRING_MANDATORY_TEXT,
 )
 from test.unit.repositories.conftest import RepositoryTestHelpers
+from datetime import datetime, timezone
 from typing import Optional
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from bson import ObjectId
 
+from inventory_management_system_api.core.conditional_requests import compute_list_version
+from inventory_management_system_api.core.consts import STREAM_BATCH_SIZE
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
-from inventory_management_system_api.core.exceptions import InvalidObjectIdError, MissingRecordError
+from inventory_management_system_api.core.exceptions import (
+    InvalidCursorError,
+    InvalidObjectIdError,
+    MissingRecordError,
+)
+from inventory_management_system_api.core.filtering import Filter, FilterOperator, Sort
+from inventory_management_system_api.core.pagination import decode_cursor, encode_cursor
+from inventory_management_system_api.core.sparse_fieldsets import create_partial_model
 from inventory_management_system_api.models.catalogue_item import PropertyIn
 from inventory_management_system_api.models.item import ItemIn, ItemOut
 from inventory_management_system_api.repositories.item import ItemRepo
@@ -98,6 +112,74 @@ class TestCreate(CreateDSL):
         self.check_create_success()
 
 
+class CreateManyDSL(ItemRepoDSL):
+    """Base class for `create_many` tests."""
+
+    _items_in: list[ItemIn]
+    _expected_items_out: list[ItemOut]
+    _created_items: list[ItemOut]
+
+    def mock_create_many(self, items_in_data: list[dict]) -> None:
+        """Mocks database methods appropriately to test the `create_many` repo method.
+
+        :param items_in_data: List of dictionaries containing the item data as would be required for an `ItemIn`
+                              database model (i.e. no ID or created and modified times required).
+        """
+
+        inserted_item_ids = [CustomObjectId(str(ObjectId())) for _ in items_in_data]
+
+        # Pass through `ItemIn` first as need creation and modified times
+        self._items_in = [ItemIn(**item_in_data) for item_in_data in items_in_data]
+
+        self._expected_items_out = [
+            ItemOut(**item_in.model_dump(by_alias=True), id=inserted_item_id)
+            for item_in, inserted_item_id in zip(self._items_in, inserted_item_ids)
+        ]
+
+        self.items_collection.insert_many.return_value.inserted_ids = inserted_item_ids
+
+    def call_create_many(self) -> None:
+        """Calls the `ItemRepo` `create_many` method with the appropriate data from a prior call to
+        `mock_create_many`."""
+
+        self._created_items = self.item_repository.create_many(self._items_in, session=self.mock_session)
+
+    def check_create_many_success(self):
+        """Checks that a prior call to `call_create_many` worked as expected."""
+
+        if self._items_in:
+            self.items_collection.insert_many.assert_called_once_with(
+                [item_in.model_dump(by_alias=True) for item_in in self._items_in],
+                ordered=True,
+                session=self.mock_session,
+            )
+        else:
+            self.items_collection.insert_many.assert_not_called()
+        # Should not need to read the created items back from the database
+        self.items_collection.find.assert_not_called()
+        self.items_collection.find_one.assert_not_called()
+
+        assert self._created_items == self._expected_items_out
+
+
+class TestCreateMany(CreateManyDSL):
+    """Tests for creating multiple items."""
+
+    def test_create_many(self):
+        """Test creating multiple items."""
+
+        self.mock_create_many([ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY, ITEM_IN_DATA_NEW_ALL_VALUES_NO_PROPERTIES])
+        self.call_create_many()
+        self.check_create_many_success()
+
+    def test_create_many_with_none(self):
+        """Test creating multiple items when none are given."""
+
+        self.mock_create_many([])
+        self.call_create_many()
+        self.check_create_many_success()
+
+
 class GetDSL(ItemRepoDSL):
     """Base class for `get` tests"""
 
@@ -106,12 +188,13 @@ class GetDSL(ItemRepoDSL):
     _obtained_item: Optional[ItemOut]
     _get_exception: pytest.ExceptionInfo
 
-    def mock_get(self, item_id: str, item_in_data: Optional[dict]) -> None:
+    def mock_get(self, item_id: str, item_in_data: Optional[dict], fields: Optional[list[str]] = None) -> None:
         """Mocks database methods appropriately to test the `get` repo method.
 
         :param item_id: ID of the item to be obtained.
         :param item_in_data: Either `None` or a Dictionary containing the item data as would be required for a `ItemIn`
                              database model (i.e. No ID or created and modified times required).
+        :param fields: List of the fields that will be requested, or `None` if all of them will be.
         """
 
         self._expected_item_out = (
@@ -122,21 +205,26 @@ class GetDSL(ItemRepoDSL):
             if item_in_data
             else None
         )
+        if self._expected_item_out and fields is not None:
+            self._expected_item_out = create_partial_model(ItemOut)(
+                **self._expected_item_out.model_dump(include=set(fields))
+            )
 
         RepositoryTestHelpers.mock_find_one(
             self.items_collection,
-            self._expected_item_out.model_dump() if self._expected_item_out else None,
+            self._expected_item_out.model_dump(exclude_unset=True) if self._expected_item_out else None,
         )
 
-    def call_get(self, item_id: str) -> None:
+    def call_get(self, item_id: str, fields: Optional[list[str]] = None) -> None:
         """
         Calls the `ItemRepo` `get` method with the appropriate data from a prior call to `mock_get`.
 
         :param item_id: ID of the item to be obtained.
+        :param fields: List of the fields to retrieve, or `None`.
         """
 
         self._obtained_item_id = item_id
-        self._obtained_item = self.item_repository.get(item_id, session=self.mock_session)
+        self._obtained_item = self.item_repository.get(item_id, session=self.mock_session, fields=fields)
 
     def call_get_expecting_error(self, item_id: str, error_type: type[BaseException]) -> None:
         """
@@ -151,11 +239,18 @@ class GetDSL(ItemRepoDSL):
             self.item_repository.get(item_id)
         self._get_exception = exc
 
-    def check_get_success(self) -> None:
-        """Checks that a prior call to `call_get` worked as expected."""
+    def check_get_success(self, expected_projection: Optional[dict] = None) -> None:
+        """
+        Checks that a prior call to `call_get` worked as expected.
+
+        :param expected_projection: Projection expected to have been used when retrieving the item, or `None` if all
+                                    fields should have been retrieved.
+        """
 
         self.items_collection.find_one.assert_called_once_with(
-            {"_id": CustomObjectId(self._obtained_item_id)}, session=self.mock_session
+            {"_id": CustomObjectId(self._obtained_item_id)},
+            session=self.mock_session,
+            **({"projection": expected_projection} if expected_projection else {}),
         )
         assert self._obtained_item == self._expected_item_out
 
@@ -184,6 +279,15 @@ class TestGet(GetDSL):
         self.call_get(item_id)
         self.check_get_success()
 
+    def test_get_with_fields(self):
+        """Test getting only specific fields of an item."""
+
+        item_id = str(ObjectId())
+
+        self.mock_get(item_id, ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY, fields=["id", "system_id", "serial_number"])
+        self.call_get(item_id, fields=["id", "system_id", "serial_number"])
+        self.check_get_success(expected_projection={"_id": 1, "system_id": 1, "serial_number": 1})
+
     def test_get_with_non_existent_id(self):
         """Test getting an item with a non-existent ID."""
 
@@ -202,57 +306,238 @@ class TestGet(GetDSL):
         self.check_get_failed_with_exception("Invalid ObjectId value 'invalid-id'")
 
 
+class GetManyDSL(ItemRepoDSL):
+    """Base class for `get_many` tests."""
+
+    _item_ids: list[str]
+    _expected_items_out: dict[str, ItemOut]
+    _obtained_items_out: dict[str, ItemOut]
+    _get_many_exception: pytest.ExceptionInfo
+
+    def mock_get_many(self, items_in_data: list[dict], number_of_non_existent_ids: int = 0) -> None:
+        """
+        Mocks database methods appropriately to test the `get_many` repo method.
+
+        :param items_in_data: List of dictionaries containing the item data as would be required for a `ItemIn` database
+                              model (i.e. no ID or created and modified times required) for each of the items that
+                              exist.
+        :param number_of_non_existent_ids: Number of additional IDs to request that don't belong to any item.
+        """
+        expected_items_out = [
+            ItemOut(**ItemIn(**item_in_data).model_dump(by_alias=True), id=ObjectId()) for item_in_data in items_in_data
+        ]
+        self._expected_items_out = {item_out.id: item_out for item_out in expected_items_out}
+        self._item_ids = [item_out.id for item_out in expected_items_out] + [
+            str(ObjectId()) for _ in range(number_of_non_existent_ids)
+        ]
+
+        RepositoryTestHelpers.mock_find(
+            self.items_collection, [item_out.model_dump() for item_out in expected_items_out]
+        )
+
+    def call_get_many(self) -> None:
+        """Calls the `ItemRepo` `get_many` method with the appropriate data from a prior call to `mock_get_many`."""
+        self._obtained_items_out = self.item_repository.get_many(self._item_ids, session=self.mock_session)
+
+    def call_get_many_expecting_error(self, item_ids: list[str], error_type: type[BaseException]) -> None:
+        """
+        Calls the `ItemRepo` `get_many` method while expecting an error to be raised.
+
+        :param item_ids: IDs of the items to be obtained.
+        :param error_type: Expected exception to be raised.
+        """
+        with pytest.raises(error_type) as exc:
+            self.item_repository.get_many(item_ids, session=self.mock_session)
+        self._get_many_exception = exc
+
+    def check_get_many_success(self) -> None:
+        """Checks that a prior call to `call_get_many` worked as expected."""
+        self.items_collection.find.assert_called_once_with(
+            {"_id": {"$in": [CustomObjectId(item_id) for item_id in self._item_ids]}}, session=self.mock_session
+        )
+        assert self._obtained_items_out == self._expected_items_out
+
+    def check_get_many_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_get_many_expecting_error` worked as expected, raising an exception with the
+        correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+        self.items_collection.find.assert_not_called()
+        assert str(self._get_many_exception.value) == message
+
+
+class TestGetMany(GetManyDSL):
+    """Tests for getting multiple items."""
+
+    def test_get_many(self):
+        """Test getting multiple items."""
+
+        self.mock_get_many([ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY, ITEM_IN_DATA_NEW_ALL_VALUES_NO_PROPERTIES])
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_non_existent_ids(self):
+        """Test getting multiple items when some of the IDs don't exist."""
+
+        self.mock_get_many([ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY], number_of_non_existent_ids=2)
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_no_ids(self):
+        """Test getting multiple items when no IDs are given."""
+
+        self.mock_get_many([])
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_invalid_id(self):
+        """Test getting multiple items when one of the IDs is invalid."""
+        item_id = "invalid-id"
+
+        self.call_get_many_expecting_error([str(ObjectId()), item_id], InvalidObjectIdError)
+        self.check_get_many_failed_with_exception(f"Invalid ObjectId value '{item_id}'")
+
+
 class ListDSL(ItemRepoDSL):
     """Base class for `list` tests."""
 
+    # pylint:disable=too-many-instance-attributes
     _expected_items_out: list[ItemOut]
     _system_id_filter: Optional[str]
     _catalogue_item_id_filter: Optional[str]
+    _limit: Optional[int]
+    _cursor: Optional[str]
+    _filters: Optional[list[Filter]]
+    _sort: Optional[Sort]
     _obtained_items_out: list[ItemOut]
+    _list_exception: pytest.ExceptionInfo
 
-    def mock_list(self, items_in_data: list[dict]) -> None:
+    def mock_list(self, items_in_data: list[dict], fields: Optional[list[str]] = None) -> None:
         """Mocks database methods appropriately to test the `list` repo method
 
         :param items_in_data: List of dictionaries containing the item data as would be required for a `ItemIn` database
                               model (i.e. no ID or created and modified times required)
+        :param fields: List of the fields that will be requested, or `None` if all of them will be.
         """
 
         self._expected_items_out = [
             ItemOut(**ItemIn(**item_in_data).model_dump(by_alias=True), id=ObjectId()) for item_in_data in items_in_data
         ]
+        if fields is not None:
+            self._expected_items_out = [
+                create_partial_model(ItemOut)(**item_out.model_dump(include=set(fields)))
+                for item_out in self._expected_items_out
+            ]
 
         RepositoryTestHelpers.mock_find(
-            self.items_collection, [item_out.model_dump() for item_out in self._expected_items_out]
+            self.items_collection, [item_out.model_dump(exclude_unset=True) for item_out in self._expected_items_out]
         )
 
-    def call_list(self, system_id: Optional[str], catalogue_item_id: Optional[str]) -> None:
+    # pylint:disable=too-many-arguments
+    # pylint:disable=too-many-positional-arguments
+    def call_list(
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        filters: Optional[list[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> None:
         """
         Calls the `ItemRepo` `list` method.
 
         :param system_id: ID of the system to query by, or `None`.
         :param catalogue_item_id: ID of the catalogue item to query by, or `None`.
+        :param limit: Maximum number of items to return, or `None`.
+        :param cursor: Cursor of the page to return, or `None`. Only supported when not sorting.
+        :param fields: List of the fields to retrieve, or `None`.
+        :param filters: List of the filters to apply, or `None`.
+        :param sort: Sort to apply, or `None`.
         """
 
         self._system_id_filter = system_id
         self._catalogue_item_id_filter = catalogue_item_id
+        self._limit = limit
+        self._cursor = cursor
+        self._filters = filters
+        self._sort = sort
 
         self._obtained_items_out = self.item_repository.list(
-            system_id=system_id, catalogue_item_id=catalogue_item_id, session=self.mock_session
+            system_id=system_id,
+            catalogue_item_id=catalogue_item_id,
+            session=self.mock_session,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+            filters=filters,
+            sort=sort,
         )
 
-    def check_list_success(self) -> None:
-        """Checks that a prior call to `call_list` worked as expected."""
+    def call_list_expecting_error(self, cursor: str, error_type: type[BaseException]) -> None:
+        """
+        Calls the `ItemRepo` `list` method while expecting an error to be raised.
+
+        :param cursor: Cursor of the page to return.
+        :param error_type: Expected exception to be raised.
+        """
+
+        with pytest.raises(error_type) as exc:
+            self.item_repository.list(system_id=None, catalogue_item_id=None, session=self.mock_session, cursor=cursor)
+        self._list_exception = exc
+
+    def check_list_success(self, expected_projection: Optional[dict] = None) -> None:
+        """
+        Checks that a prior call to `call_list` worked as expected.
+
+        :param expected_projection: Projection expected to have been used when retrieving the items, or `None` if all
+                                    fields should have been retrieved.
+        """
 
         expected_query = {}
         if self._system_id_filter:
             expected_query["system_id"] = CustomObjectId(self._system_id_filter)
         if self._catalogue_item_id_filter:
             expected_query["catalogue_item_id"] = CustomObjectId(self._catalogue_item_id_filter)
-
-        self.items_collection.find.assert_called_once_with(expected_query, session=self.mock_session)
+        for expected_filter in self._filters or []:
+            expected_query.setdefault(expected_filter.field, {})[
+                f"${expected_filter.operator.value}"
+            ] = expected_filter.value
+
+        expected_options = {"projection": expected_projection} if expected_projection else {}
+        if self._limit is None and self._cursor is None and self._sort is None:
+            self.items_collection.find.assert_called_once_with(
+                expected_query, session=self.mock_session, **expected_options
+            )
+        else:
+            if self._cursor is not None:
+                expected_query["_id"] = {"$gt": decode_cursor(self._cursor)}
+            direction = -1 if self._sort is not None and self._sort.descending else 1
+            self.items_collection.find.assert_called_once_with(
+                expected_query,
+                session=self.mock_session,
+                sort=([(self._sort.field, direction)] if self._sort is not None else []) + [("_id", direction)],
+                **({"limit": self._limit} if self._limit is not None else {}),
+                **expected_options,
+            )
 
         assert self._obtained_items_out == self._expected_items_out
 
+    def check_list_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_list_expecting_error` worked as expected, raising an exception with the
+        correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+
+        self.items_collection.find.assert_not_called()
+
+        assert str(self._list_exception.value) == message
+
 
 class TestList(ListDSL):
     """Tests for listing items."""
@@ -285,11 +570,322 @@ class TestList(ListDSL):
         self.call_list(system_id=str(ObjectId()), catalogue_item_id=str(ObjectId()))
         self.check_list_success()
 
+    def test_list_with_limit(self):
+        """Test listing the first page of items."""
+
+        self.mock_list([ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY])
+        self.call_list(system_id=None, catalogue_item_id=None, limit=1)
+        self.check_list_success()
+
+    def test_list_with_system_id_filter_limit_and_cursor(self):
+        """Test listing a subsequent page of items with a given `system_id`."""
+
+        self.mock_list([ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY])
+        self.call_list(
+            system_id=str(ObjectId()), catalogue_item_id=None, limit=1, cursor=encode_cursor(str(ObjectId()))
+        )
+        self.check_list_success()
+
+    def test_list_with_cursor_only(self):
+        """Test listing all remaining items after a cursor."""
+
+        self.mock_list([ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY, ITEM_IN_DATA_NEW_ALL_VALUES_NO_PROPERTIES])
+        self.call_list(system_id=None, catalogue_item_id=None, cursor=encode_cursor(str(ObjectId())))
+        self.check_list_success()
+
+    def test_list_with_invalid_cursor(self):
+        """Test listing items with an invalid cursor."""
+
+        self.call_list_expecting_error("invalid-cursor", InvalidCursorError)
+        self.check_list_failed_with_exception("Invalid cursor 'invalid-cursor'")
+
+    def test_list_with_fields(self):
+        """Test listing only specific fields of items."""
+
+        self.mock_list(
+            [ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY, ITEM_IN_DATA_NEW_ALL_VALUES_NO_PROPERTIES],
+            fields=["id", "serial_number"],
+        )
+        self.call_list(system_id=None, catalogue_item_id=None, fields=["id", "serial_number"])
+        self.check_list_success(expected_projection={"_id": 1, "serial_number": 1})
+
+    def test_list_with_filters(self):
+        """Test listing items with filters."""
+
+        self.mock_list([ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY])
+        self.call_list(
+            system_id=str(ObjectId()),
+            catalogue_item_id=None,
+            filters=[
+                Filter("usage_status_id", FilterOperator.IN, [CustomObjectId(str(ObjectId()))]),
+                Filter("is_defective", FilterOperator.EQ, False),
+                Filter("delivered_date", FilterOperator.GTE, datetime(2024, 1, 1, tzinfo=timezone.utc)),
+                Filter("delivered_date", FilterOperator.LT, datetime(2024, 2, 1, tzinfo=timezone.utc)),
+            ],
+        )
+        self.check_list_success()
+
+    def test_list_with_sort_and_limit(self):
+        """Test listing the first page of items sorted by a field."""
+
+        self.mock_list([ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY, ITEM_IN_DATA_NEW_ALL_VALUES_NO_PROPERTIES])
+        self.call_list(system_id=None, catalogue_item_id=None, limit=2, sort=Sort("warranty_end_date", descending=True))
+        self.check_list_success()
+
+
+class StreamDSL(ListDSL):
+    """Base class for `stream` tests."""
+
+    def call_stream(
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> None:
+        """
+        Calls the `ItemRepo` `stream` method and consumes the returned iterator.
+
+        :param system_id: ID of the system to query by, or `None`.
+        :param catalogue_item_id: ID of the catalogue item to query by, or `None`.
+        :param limit: Maximum number of items to return, or `None`.
+        :param cursor: Cursor of the page to return, or `None`.
+        """
+
+        self._system_id_filter = system_id
+        self._catalogue_item_id_filter = catalogue_item_id
+        self._limit = limit
+        self._cursor = cursor
+
+        self._obtained_items_out = list(
+            self.item_repository.stream(
+                system_id=system_id,
+                catalogue_item_id=catalogue_item_id,
+                session=self.mock_session,
+                limit=limit,
+                cursor=cursor,
+            )
+        )
+
+    def call_stream_expecting_error(self, cursor: str, error_type: type[BaseException]) -> None:
+        """
+        Calls the `ItemRepo` `stream` method while expecting an error to be raised before the returned iterator is
+        consumed.
+
+        :param cursor: Cursor of the page to return.
+        :param error_type: Expected exception to be raised.
+        """
+
+        with pytest.raises(error_type) as exc:
+            self.item_repository.stream(
+                system_id=None, catalogue_item_id=None, session=self.mock_session, cursor=cursor
+            )
+        self._list_exception = exc
+
+    def check_stream_success(self) -> None:
+        """Checks that a prior call to `call_stream` worked as expected."""
+
+        expected_query = {}
+        if self._system_id_filter:
+            expected_query["system_id"] = CustomObjectId(self._system_id_filter)
+        if self._catalogue_item_id_filter:
+            expected_query["catalogue_item_id"] = CustomObjectId(self._catalogue_item_id_filter)
+
+        expected_options = {}
+        if self._limit is not None or self._cursor is not None:
+            if self._cursor is not None:
+                expected_query["_id"] = {"$gt": decode_cursor(self._cursor)}
+            expected_options["sort"] = [("_id", 1)]
+            if self._limit is not None:
+                expected_options["limit"] = self._limit
+
+        self.items_collection.find.assert_called_once_with(
+            expected_query, session=self.mock_session, batch_size=STREAM_BATCH_SIZE, **expected_options
+        )
+
+        assert self._obtained_items_out == self._expected_items_out
+
+
+class TestStream(StreamDSL):
+    """Tests for streaming items."""
+
+    def test_stream(self):
+        """Test streaming all items."""
+
+        self.mock_list([ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY, ITEM_IN_DATA_NEW_ALL_VALUES_NO_PROPERTIES])
+        self.call_stream(system_id=None, catalogue_item_id=None)
+        self.check_stream_success()
+
+    def test_stream_with_system_id_and_catalogue_item_id_filters(self):
+        """Test streaming all items with a given `system_id` and `catalogue_item_id`."""
+
+        self.mock_list([ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY])
+        self.call_stream(system_id=str(ObjectId()), catalogue_item_id=str(ObjectId()))
+        self.check_stream_success()
+
+    def test_stream_with_limit_and_cursor(self):
+        """Test streaming a subsequent page of items."""
+
+        self.mock_list([ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY])
+        self.call_stream(system_id=None, catalogue_item_id=None, limit=1, cursor=encode_cursor(str(ObjectId())))
+        self.check_stream_success()
+
+    def test_stream_with_invalid_cursor(self):
+        """Test streaming items with an invalid cursor."""
+
+        self.call_stream_expecting_error("invalid-cursor", InvalidCursorError)
+        self.check_list_failed_with_exception("Invalid cursor 'invalid-cursor'")
+
+
+class GetListVersionDSL(ItemRepoDSL):
+    """Base class for `get_list_version` tests."""
+
+    _system_id_filter: Optional[str]
+    _catalogue_item_id_filter: Optional[str]
+    _limit: Optional[int]
+    _cursor: Optional[str]
+    _expected_list_version: str
+    _obtained_list_version: str
+    _get_list_version_exception: pytest.ExceptionInfo
+
+    def mock_get_list_version(self, count: int) -> None:
+        """
+        Mocks database methods appropriately to test the `get_list_version` repo method.
+
+        :param count: Number of items the list should contain.
+        """
+
+        items = [{"_id": ObjectId(), "modified_time": datetime.now(timezone.utc)} for _ in range(count)]
+        self._expected_list_version = compute_list_version((item["_id"], item["modified_time"]) for item in items)
+        self.items_collection.find.return_value = items
+
+    def call_get_list_version(
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> None:
+        """
+        Calls the `ItemRepo` `get_list_version` method.
+
+        :param system_id: ID of the system to query by, or `None`.
+        :param catalogue_item_id: ID of the catalogue item to query by, or `None`.
+        :param limit: Maximum number of items in the list, or `None`.
+        :param cursor: Cursor of the page of the list, or `None`.
+        """
+
+        self._system_id_filter = system_id
+        self._catalogue_item_id_filter = catalogue_item_id
+        self._limit = limit
+        self._cursor = cursor
+
+        self._obtained_list_version = self.item_repository.get_list_version(
+            system_id=system_id,
+            catalogue_item_id=catalogue_item_id,
+            session=self.mock_session,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    def call_get_list_version_expecting_error(self, cursor: str, error_type: type[BaseException]) -> None:
+        """
+        Calls the `ItemRepo` `get_list_version` method while expecting an error to be raised.
+
+        :param cursor: Cursor of the page of the list.
+        :param error_type: Expected exception to be raised.
+        """
+
+        with pytest.raises(error_type) as exc:
+            self.item_repository.get_list_version(
+                system_id=None, catalogue_item_id=None, session=self.mock_session, cursor=cursor
+            )
+        self._get_list_version_exception = exc
+
+    def check_get_list_version_success(self) -> None:
+        """Checks that a prior call to `call_get_list_version` worked as expected."""
+
+        expected_query = {}
+        if self._system_id_filter:
+            expected_query["system_id"] = CustomObjectId(self._system_id_filter)
+        if self._catalogue_item_id_filter:
+            expected_query["catalogue_item_id"] = CustomObjectId(self._catalogue_item_id_filter)
+        if self._cursor is not None:
+            expected_query["_id"] = {"$gt": decode_cursor(self._cursor)}
+
+        expected_options = {}
+        if self._limit is not None or self._cursor is not None:
+            expected_options["sort"] = [("_id", 1)]
+            if self._limit is not None:
+                expected_options["limit"] = self._limit
+
+        self.items_collection.find.assert_called_once_with(
+            expected_query,
+            session=self.mock_session,
+            projection={"_id": 1, "modified_time": 1},
+            **expected_options,
+        )
+
+        assert self._obtained_list_version == self._expected_list_version
+
+    def check_get_list_version_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_get_list_version_expecting_error` worked as expected, raising an exception
+        with the correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+
+        self.items_collection.find.assert_not_called()
+
+        assert str(self._get_list_version_exception.value) == message
+
+
+class TestGetListVersion(GetListVersionDSL):
+    """Tests for getting the version of a list of items."""
+
+    def test_get_list_version(self):
+        """Test getting the version of the list of all items."""
+
+        self.mock_get_list_version(2)
+        self.call_get_list_version(system_id=None, catalogue_item_id=None)
+        self.check_get_list_version_success()
+
+    def test_get_list_version_with_system_id_and_catalogue_item_id_filters(self):
+        """Test getting the version of the list of all items with a given `system_id` and `catalogue_item_id`."""
+
+        self.mock_get_list_version(1)
+        self.call_get_list_version(system_id=str(ObjectId()), catalogue_item_id=str(ObjectId()))
+        self.check_get_list_version_success()
+
+    def test_get_list_version_with_limit_and_cursor(self):
+        """Test getting the version of a subsequent page of items."""
+
+        self.mock_get_list_version(1)
+        self.call_get_list_version(
+            system_id=None, catalogue_item_id=None, limit=1, cursor=encode_cursor(str(ObjectId()))
+        )
+        self.check_get_list_version_success()
+
+    def test_get_list_version_with_no_results(self):
+        """Test getting the version of a list of items that is empty."""
+
+        self.mock_get_list_version(0)
+        self.call_get_list_version(system_id=str(ObjectId()), catalogue_item_id=None)
+        self.check_get_list_version_success()
+
+    def test_get_list_version_with_invalid_cursor(self):
+        """Test getting the version of a list of items with an invalid cursor."""
+
+        self.call_get_list_version_expecting_error("invalid-cursor", InvalidCursorError)
+        self.check_get_list_version_failed_with_exception("Invalid cursor 'invalid-cursor'")
+
 
 class UpdateDSL(ItemRepoDSL):
     """Base class for `update` tests."""
 
     _item_in: ItemIn
+    _update_system: bool
     _expected_item_out: ItemOut
     _updated_item_id: str
     _updated_item: ItemOut
@@ -322,16 +918,20 @@ class UpdateDSL(ItemRepoDSL):
         self._expected_item_out = ItemOut(**self._item_in.model_dump(), id=CustomObjectId(item_id))
         RepositoryTestHelpers.mock_find_one(self.items_collection, self._expected_item_out.model_dump(by_alias=True))
 
-    def call_update(self, item_id: str) -> None:
+    def call_update(self, item_id: str, update_system: bool = True) -> None:
         """
         Calls the `ItemRepo` `update` method with the appropriate data from a prior call to `mock_update`
         (or `set_update_data`).
 
         :param item_id: ID of the item to be updated.
+        :param update_system: Whether to update the `system_id` and `system_type_id` of the item.
         """
 
         self._updated_item_id = item_id
-        self._updated_item = self.item_repository.update(item_id, self._item_in, session=self.mock_session)
+        self._update_system = update_system
+        self._updated_item = self.item_repository.update(
+            item_id, self._item_in, update_system=update_system, session=self.mock_session
+        )
 
     def call_update_expecting_error(self, item_id: str, error_type: type[BaseException]) -> None:
         """
@@ -354,7 +954,9 @@ class UpdateDSL(ItemRepoDSL):
                 "_id": CustomObjectId(self._updated_item_id),
             },
             {
-                "$set": self._item_in.model_dump(by_alias=True),
+                "$set": self._item_in.model_dump(
+                    by_alias=True, exclude=None if self._update_system else {"system_id", "system_type_id"}
+                ),
             },
             session=self.mock_session,
         )
@@ -386,6 +988,15 @@ class TestUpdate(UpdateDSL):
         self.call_update(item_id)
         self.check_update_success()
 
+    def test_update_without_system(self):
+        """Test updating an item without updating its system."""
+
+        item_id = str(ObjectId())
+
+        self.mock_update(item_id, ITEM_IN_DATA_NEW_REQUIRED_VALUES_ONLY)
+        self.call_update(item_id, update_system=False)
+        self.check_update_success()
+
     def test_update_with_invalid_id(self):
         """Test updating an item with an invalid ID."""
 
@@ -638,70 +1249,68 @@ class TestDeleteProperties(DeletePropertiesDSL):
         self.check_delete_properties()
 
 
-class CountInCatalogueItemWithSystemTypeOneOfDSL(ItemRepoDSL):
-    """Base class for `count_in_catalogue_item_with_system_type_one_of` tests."""
+class CountByCatalogueItemAndSystemTypeDSL(ItemRepoDSL):
+    """Base class for `count_by_catalogue_item_and_system_type` tests."""
 
-    _catalogue_item_id: ObjectId
-    _system_type_ids: list[ObjectId]
-    _expected_count: Optional[int]
-    _obtained_count: int
+    _expected_counts: dict[ObjectId, dict[str, int]]
+    _obtained_counts: dict[ObjectId, dict[str, int]]
 
-    def mock_count_in_catalogue_item_with_system_type_one_of(self, count: Optional[int]):
+    def mock_count_by_catalogue_item_and_system_type(self, counts: dict[ObjectId, dict[ObjectId, int]]):
         """
-        Mocks database methods appropriately to test the `count_in_catalogue_item_with_system_type_one_of` repo
-        method.
+        Mocks database methods appropriately to test the `count_by_catalogue_item_and_system_type` repo method.
 
-        :param count: Either `None` (if there are no results from the aggregate query) or the count as should be
-                      returned from the function.
+        :param counts: Dictionary of the counts that should be returned from the aggregation (themselves keyed by the
+                       system type IDs) with the catalogue item IDs as keys.
         """
 
-        self._expected_count = 0 if count is None else count
-        self.items_collection.aggregate.return_value = [] if count is None else [{"matching_items": count}]
+        self._expected_counts = {
+            catalogue_item_id: {str(system_type_id): count for system_type_id, count in catalogue_item_counts.items()}
+            for catalogue_item_id, catalogue_item_counts in counts.items()
+        }
+        self.items_collection.aggregate.return_value = [
+            {"_id": {"catalogue_item_id": catalogue_item_id, "system_type_id": system_type_id}, "count": count}
+            for catalogue_item_id, catalogue_item_counts in counts.items()
+            for system_type_id, count in catalogue_item_counts.items()
+        ]
 
-    def call_count_in_catalogue_item_with_system_type_one_of(
-        self, catalogue_item_id: ObjectId, system_type_ids: list[ObjectId]
-    ) -> None:
-        """Calls the `ItemRepo` `count_in_catalogue_item_with_system_type_one_of` method.
+    def call_count_by_catalogue_item_and_system_type(self) -> None:
+        """Calls the `ItemRepo` `count_by_catalogue_item_and_system_type` method."""
 
-        :param catalogue_item_id: ID of the catalogue item for which items should be counted.
-        :param system_type_ids: List of system type IDs which should be included in the count.
-        """
+        self._obtained_counts = self.item_repository.count_by_catalogue_item_and_system_type(session=self.mock_session)
 
-        self._catalogue_item_id = catalogue_item_id
-        self._system_type_ids = system_type_ids
-        self._obtained_count = self.item_repository.count_in_catalogue_item_with_system_type_one_of(
-            catalogue_item_id, system_type_ids, session=self.mock_session
-        )
-
-    def check_count_in_catalogue_item_with_system_type_one_of(self) -> None:
-        """Checks that a prior call to `count_in_catalogue_item_with_system_type_one_of` worked as expected."""
+    def check_count_by_catalogue_item_and_system_type(self) -> None:
+        """Checks that a prior call to `count_by_catalogue_item_and_system_type` worked as expected."""
 
         self.items_collection.aggregate.assert_called_once_with(
             [
-                # Obtain a list of items with the same catalogue item ID
-                {"$match": {"catalogue_item_id": self._catalogue_item_id}},
-                {"$lookup": {"from": "systems", "localField": "system_id", "foreignField": "_id", "as": "system"}},
-                {"$match": {"system.type_id": {"$in": self._system_type_ids}}},
-                {"$count": "matching_items"},
+                {"$sort": {"catalogue_item_id": 1, "system_type_id": 1}},
+                {
+                    "$group": {
+                        "_id": {"catalogue_item_id": "$catalogue_item_id", "system_type_id": "$system_type_id"},
+                        "count": {"$sum": 1},
+                    }
+                },
             ],
             session=self.mock_session,
         )
-        assert self._obtained_count == self._expected_count
+        assert self._obtained_counts == self._expected_counts
 
 
-class TestCountInCatalogueItemWithSystemTypeOneOf(CountInCatalogueItemWithSystemTypeOneOfDSL):
-    """Tests for `count_in_catalogue_item_with_system_type_one_of`."""
+class TestCountByCatalogueItemAndSystemType(CountByCatalogueItemAndSystemTypeDSL):
+    """Tests for `count_by_catalogue_item_and_system_type`."""
 
-    def test_count_in_catalogue_item_with_system_type_one_of(self):
-        """Test `count_in_catalogue_item_with_system_type_one_of`."""
+    def test_count_by_catalogue_item_and_system_type(self):
+        """Test `count_by_catalogue_item_and_system_type`."""
 
-        self.mock_count_in_catalogue_item_with_system_type_one_of(42)
-        self.call_count_in_catalogue_item_with_system_type_one_of(ObjectId(), [ObjectId(), ObjectId()])
-        self.check_count_in_catalogue_item_with_system_type_one_of()
+        self.mock_count_by_catalogue_item_and_system_type(
+            {ObjectId(): {ObjectId(): 42, ObjectId(): 2}, ObjectId(): {ObjectId(): 1}}
+        )
+        self.call_count_by_catalogue_item_and_system_type()
+        self.check_count_by_catalogue_item_and_system_type()
 
-    def test_count_in_catalogue_item_with_system_type_one_of_when_no_result(self):
-        """Test `count_in_catalogue_item_with_system_type_one_of` when there is no result."""
+    def test_count_by_catalogue_item_and_system_type_when_no_result(self):
+        """Test `count_by_catalogue_item_and_system_type` when there is no result."""
 
-        self.mock_count_in_catalogue_item_with_system_type_one_of(None)
-        self.call_count_in_catalogue_item_with_system_type_one_of(ObjectId(), [ObjectId(), ObjectId()])
-        self.check_count_in_catalogue_item_with_system_type_one_of()
+        self.mock_count_by_catalogue_item_and_system_type({})
+        self.call_count_by_catalogue_item_and_system_type()
+        self.check_count_by_catalogue_item_and_system_type()
@@ -8,11 +8,12 @@ Unit tests for the `ManufacturerRepo` repository.
 from test.mock_data import CATALOGUE_ITEM_IN_DATA_REQUIRED_VALUES_ONLY, MANUFACTURER_IN_DATA_A, MANUFACTURER_IN_DATA_B
 from test.unit.repositories.conftest import RepositoryTestHelpers
 from typing import Optional
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from bson import ObjectId
 
+from inventory_management_system_api.core.cache import VersionedCache
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.exceptions import (
     DuplicateRecordError,
@@ -32,6 +33,9 @@ class ManufacturerRepoDSL:
     manufacturers_collection: Mock
     catalogue_items_collection: Mock
 
+    manufacturers_cache: VersionedCache
+    mock_run_after_commit: Mock
+
     mock_session = MagicMock()
 
     @pytest.fixture(autouse=True)
@@ -42,7 +46,15 @@ class ManufacturerRepoDSL:
         self.manufacturers_collection = database_mock.manufacturers
         self.catalogue_items_collection = database_mock.catalogue_items
 
-        yield
+        # Use a separate cache for each test
+        self.manufacturers_cache = VersionedCache()
+        with patch(
+            "inventory_management_system_api.repositories.manufacturer.manufacturers_cache", self.manufacturers_cache
+        ):
+            with patch(
+                "inventory_management_system_api.repositories.manufacturer.run_after_commit"
+            ) as self.mock_run_after_commit:
+                yield
 
 
 class CreateDSL(ManufacturerRepoDSL):
@@ -114,6 +126,7 @@ class CreateDSL(ManufacturerRepoDSL):
         )
 
         assert self._created_manufacturer == self._expected_manufacturer_out
+        self.mock_run_after_commit.assert_called_once_with(self.mock_session, self.manufacturers_cache.invalidate)
 
     def check_create_failed_with_exception(self, message: str) -> None:
         """
@@ -148,6 +161,7 @@ class GetDSL(ManufacturerRepoDSL):
     """Base class for `get` tests."""
 
     _obtained_manufacturer_id: str
+    _obtained_session: Optional[MagicMock]
     _expected_manufacturer_out: Optional[ManufacturerOut]
     _obtained_manufacturer_out: ManufacturerOut
     _get_exception: pytest.ExceptionInfo
@@ -171,14 +185,18 @@ class GetDSL(ManufacturerRepoDSL):
             self._expected_manufacturer_out.model_dump() if self._expected_manufacturer_out else None,
         )
 
-    def call_get(self, manufacturer_id: str) -> None:
+    def call_get(self, manufacturer_id: str, use_session: bool = True) -> None:
         """
         Calls the `ManufacturerRepo` `get` method with the appropriate data from a prior call to `mock_get`.
 
         :param manufacturer_id: ID of the manufacturer to be obtained.
+        :param use_session: Whether to pass a session to the `get` method (those without use the cache).
         """
         self._obtained_manufacturer_id = manufacturer_id
-        self._obtained_manufacturer_out = self.manufacturer_repository.get(manufacturer_id, session=self.mock_session)
+        self._obtained_session = self.mock_session if use_session else None
+        self._obtained_manufacturer_out = self.manufacturer_repository.get(
+            manufacturer_id, session=self._obtained_session
+        )
 
     def call_get_expecting_error(self, manufacturer_id: str, error_type: type[BaseException]) -> None:
         """
@@ -195,7 +213,7 @@ class GetDSL(ManufacturerRepoDSL):
     def check_get_success(self) -> None:
         """Checks that a prior call to `call_get` worked as expected."""
         self.manufacturers_collection.find_one.assert_called_once_with(
-            {"_id": CustomObjectId(self._obtained_manufacturer_id)}, session=self.mock_session
+            {"_id": CustomObjectId(self._obtained_manufacturer_id)}, session=self._obtained_session
         )
         assert self._obtained_manufacturer_out == self._expected_manufacturer_out
 
@@ -236,6 +254,133 @@ class TestGet(GetDSL):
         self.call_get_expecting_error(manufacturer_id, InvalidObjectIdError)
         self.check_get_failed_with_exception(f"Invalid ObjectId value '{manufacturer_id}'")
 
+    def test_get_without_session_uses_cache(self):
+        """Test getting a manufacturer without a session only queries the database the first time."""
+        manufacturer_id = str(ObjectId())
+
+        self.mock_get(manufacturer_id, MANUFACTURER_IN_DATA_A)
+        self.call_get(manufacturer_id, use_session=False)
+        self.call_get(manufacturer_id, use_session=False)
+        self.check_get_success()
+
+
+class GetManyDSL(ManufacturerRepoDSL):
+    """Base class for `get_many` tests."""
+
+    _manufacturer_ids: list[str]
+    _expected_manufacturers_out: dict[str, ManufacturerOut]
+    _obtained_manufacturers_out: dict[str, ManufacturerOut]
+    _get_many_session: Optional[MagicMock]
+    _get_many_exception: pytest.ExceptionInfo
+
+    def mock_get_many(self, manufacturers_in_data: list[dict], number_of_non_existent_ids: int = 0) -> None:
+        """
+        Mocks database methods appropriately to test the `get_many` repo method.
+
+        :param manufacturers_in_data: List of dictionaries containing the manufacturer data as would be required for a
+                                      `ManufacturerIn` database model (i.e. no ID or created and modified times
+                                      required) for each of the manufacturers that exist.
+        :param number_of_non_existent_ids: Number of additional IDs to request that don't belong to any manufacturer.
+        """
+        expected_manufacturers_out = [
+            ManufacturerOut(**ManufacturerIn(**manufacturer_in_data).model_dump(), id=ObjectId())
+            for manufacturer_in_data in manufacturers_in_data
+        ]
+        self._expected_manufacturers_out = {
+            manufacturer_out.id: manufacturer_out for manufacturer_out in expected_manufacturers_out
+        }
+        self._manufacturer_ids = [manufacturer_out.id for manufacturer_out in expected_manufacturers_out] + [
+            str(ObjectId()) for _ in range(number_of_non_existent_ids)
+        ]
+
+        RepositoryTestHelpers.mock_find(
+            self.manufacturers_collection,
+            [
+                {**manufacturer_out.model_dump(by_alias=True), "_id": CustomObjectId(manufacturer_out.id)}
+                for manufacturer_out in expected_manufacturers_out
+            ],
+        )
+
+    def call_get_many(self, use_session: bool = True) -> None:
+        """
+        Calls the `ManufacturerRepo` `get_many` method with the appropriate data from a prior call to `mock_get_many`.
+
+        :param use_session: Whether to pass a session to the `get_many` method (those without use the cache).
+        """
+        self._get_many_session = self.mock_session if use_session else None
+        self._obtained_manufacturers_out = self.manufacturer_repository.get_many(
+            self._manufacturer_ids, session=self._get_many_session
+        )
+
+    def call_get_many_expecting_error(self, manufacturer_ids: list[str], error_type: type[BaseException]) -> None:
+        """
+        Calls the `ManufacturerRepo` `get_many` method while expecting an error to be raised.
+
+        :param manufacturer_ids: IDs of the manufacturers to be obtained.
+        :param error_type: Expected exception to be raised.
+        """
+        with pytest.raises(error_type) as exc:
+            self.manufacturer_repository.get_many(manufacturer_ids, session=self.mock_session)
+        self._get_many_exception = exc
+
+    def check_get_many_success(self) -> None:
+        """Checks that a prior call to `call_get_many` worked as expected."""
+        self.manufacturers_collection.find.assert_called_once_with(
+            {"_id": {"$in": [CustomObjectId(manufacturer_id) for manufacturer_id in self._manufacturer_ids]}},
+            session=self._get_many_session,
+        )
+        assert self._obtained_manufacturers_out == self._expected_manufacturers_out
+
+    def check_get_many_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_get_many_expecting_error` worked as expected, raising an exception with the
+        correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+        self.manufacturers_collection.find.assert_not_called()
+        assert str(self._get_many_exception.value) == message
+
+
+class TestGetMany(GetManyDSL):
+    """Tests for getting multiple manufacturers."""
+
+    def test_get_many(self):
+        """Test getting multiple manufacturers."""
+
+        self.mock_get_many([MANUFACTURER_IN_DATA_A, MANUFACTURER_IN_DATA_B])
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_non_existent_ids(self):
+        """Test getting multiple manufacturers when some of the IDs don't exist."""
+
+        self.mock_get_many([MANUFACTURER_IN_DATA_A], number_of_non_existent_ids=2)
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_no_ids(self):
+        """Test getting multiple manufacturers when no IDs are given."""
+
+        self.mock_get_many([])
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_without_session_uses_cache(self):
+        """Test getting multiple manufacturers without a session only queries the database the first time."""
+
+        self.mock_get_many([MANUFACTURER_IN_DATA_A], number_of_non_existent_ids=1)
+        self.call_get_many(use_session=False)
+        self.call_get_many(use_session=False)
+        self.check_get_many_success()
+
+    def test_get_many_with_invalid_id(self):
+        """Test getting multiple manufacturers when one of the IDs is invalid."""
+        manufacturer_id = "invalid-id"
+
+        self.call_get_many_expecting_error([str(ObjectId()), manufacturer_id], InvalidObjectIdError)
+        self.check_get_many_failed_with_exception(f"Invalid ObjectId value '{manufacturer_id}'")
+
 
 class ListDSL(ManufacturerRepoDSL):
     """Base class for `list` tests."""
@@ -385,6 +530,7 @@ class UpdateDSL(ManufacturerRepoDSL):
         )
 
         assert self._updated_manufacturer == self._expected_manufacturer_out
+        self.mock_run_after_commit.assert_called_once_with(self.mock_session, self.manufacturers_cache.invalidate)
 
     def check_update_failed_with_exception(self, message: str, expecting_update_one_called: bool = False) -> None:
         """
@@ -498,6 +644,7 @@ class DeleteDSL(ManufacturerRepoDSL):
         self.manufacturers_collection.delete_one.assert_called_once_with(
             {"_id": CustomObjectId(self._delete_manufacturer_id)}, session=self.mock_session
         )
+        self.mock_run_after_commit.assert_called_once_with(self.mock_session, self.manufacturers_cache.invalidate)
 
     def check_delete_failed_with_exception(self, message: str, expecting_delete_one_called: bool = False) -> None:
         """
@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from bson import ObjectId
 
+from inventory_management_system_api.core.cache import VersionedCache
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.models.rule import RuleOut
 from inventory_management_system_api.repositories.rule import (
@@ -25,6 +26,7 @@ class RuleRepoDSL:
     mock_utils: Mock
     rule_repository: RuleRepo
     rules_collection: Mock
+    rules_cache: VersionedCache
 
     mock_session = MagicMock()
 
@@ -36,7 +38,13 @@ class RuleRepoDSL:
         self.rule_repository = RuleRepo(database_mock)
         self.rules_collection = database_mock.rules
 
-        with patch("inventory_management_system_api.repositories.rule.utils") as mock_utils:
+        # Use a separate cache for each test
+        self.rules_cache = VersionedCache()
+
+        with (
+            patch("inventory_management_system_api.repositories.rule.utils") as mock_utils,
+            patch("inventory_management_system_api.repositories.rule.rules_cache", self.rules_cache),
+        ):
             self.mock_utils = mock_utils
             yield
 
@@ -196,3 +204,106 @@ class TestCheckExists(CheckExistsDSL):
         self.mock_check_exists(False)
         self.call_check_exists(src_system_type_id=None, dst_system_type_id=None, dst_usage_status_id=None)
         self.check_check_exists_success()
+
+
+class CheckExistsWithoutSessionDSL(RuleRepoDSL):
+    """Base class for `check_exists` tests performed without a session (and therefore using the rule table)."""
+
+    _rules_data: list[dict]
+    _obtained_results: list[bool]
+
+    def mock_check_exists_without_session(self, rules_data: list[dict]) -> None:
+        """
+        Mocks database methods appropriately to test the `check_exists` repo method without a session.
+
+        :param rules_data: List of dictionaries containing the rule data as would be found in the database.
+        """
+
+        self._rules_data = rules_data
+        self.rules_collection.find.return_value = rules_data
+
+    def call_check_exists_without_session(self, checks: list[tuple[Optional[str], Optional[str], Optional[str]]]):
+        """
+        Calls the `RuleRepo` `check_exists` method without a session once for each of the given checks.
+
+        :param checks: List of tuples containing the `src_system_type_id`, `dst_system_type_id` and
+                       `dst_usage_status_id` to check for.
+        """
+
+        self._obtained_results = [self.rule_repository.check_exists(*check) for check in checks]
+
+    def check_check_exists_without_session_success(self, expected_results: list[bool]) -> None:
+        """
+        Checks that prior calls to `call_check_exists_without_session` worked as expected.
+
+        :param expected_results: Expected results of each check.
+        """
+
+        self.rules_collection.find.assert_called_once_with(
+            {}, {"src_system_type_id": True, "dst_system_type_id": True, "dst_usage_status_id": True}
+        )
+        self.rules_collection.find_one.assert_not_called()
+
+        assert self._obtained_results == expected_results
+
+
+class TestCheckExistsWithoutSession(CheckExistsWithoutSessionDSL):
+    """Tests for checking if a rule exists without a session."""
+
+    def test_check_exists_without_session(self):
+        """Test checking the existence of rules without a session only loads the rules once."""
+
+        src_system_type_id = ObjectId()
+        dst_system_type_id = ObjectId()
+        dst_usage_status_id = ObjectId()
+
+        self.mock_check_exists_without_session(
+            [
+                {
+                    "_id": ObjectId(),
+                    "src_system_type_id": None,
+                    "dst_system_type_id": dst_system_type_id,
+                    "dst_usage_status_id": dst_usage_status_id,
+                },
+                {
+                    "_id": ObjectId(),
+                    "src_system_type_id": src_system_type_id,
+                    "dst_system_type_id": None,
+                    "dst_usage_status_id": None,
+                },
+            ]
+        )
+        self.call_check_exists_without_session(
+            [
+                (None, str(dst_system_type_id), str(dst_usage_status_id)),
+                (str(src_system_type_id), None, None),
+                (str(src_system_type_id), str(dst_system_type_id), str(dst_usage_status_id)),
+                (None, str(dst_system_type_id), str(ObjectId())),
+            ]
+        )
+        self.check_check_exists_without_session_success([True, True, False, False])
+
+    def test_check_exists_without_session_after_invalidation(self):
+        """Test checking the existence of a rule without a session reloads the rules after they are modified."""
+
+        dst_system_type_id = str(ObjectId())
+        dst_usage_status_id = str(ObjectId())
+
+        self.mock_check_exists_without_session([])
+        self.call_check_exists_without_session([(None, dst_system_type_id, dst_usage_status_id)])
+        self.check_check_exists_without_session_success([False])
+
+        self.rules_cache.invalidate()
+        self.rules_collection.find.reset_mock()
+        self.mock_check_exists_without_session(
+            [
+                {
+                    "_id": ObjectId(),
+                    "src_system_type_id": None,
+                    "dst_system_type_id": ObjectId(dst_system_type_id),
+                    "dst_usage_status_id": ObjectId(dst_usage_status_id),
+                }
+            ]
+        )
+        self.call_check_exists_without_session([(None, dst_system_type_id, dst_usage_status_id)])
+        self.check_check_exists_without_session_success([True])
@@ -9,10 +9,11 @@ from test.mock_data import (
 )
 from test.unit.repositories.conftest import RepositoryTestHelpers
 from typing import ClassVar, Optional, Type
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from inventory_management_system_api.core.cache import VersionedCache
 from inventory_management_system_api.models.setting import (
     InUseDefinitionOut,
     SettingInBase,
@@ -46,6 +47,8 @@ class SettingRepoDSL:
     settings_collection: Mock
 
     mock_session = MagicMock
+    settings_cache: VersionedCache
+    mock_run_after_commit: Mock
 
     @pytest.fixture(autouse=True)
     def setup(self, database_mock):
@@ -57,6 +60,14 @@ class SettingRepoDSL:
 
         self.mock_session = MagicMock()
 
+        # Use a separate cache for each test
+        self.settings_cache = VersionedCache()
+        with patch("inventory_management_system_api.repositories.setting.settings_cache", self.settings_cache):
+            with patch(
+                "inventory_management_system_api.repositories.setting.run_after_commit"
+            ) as self.mock_run_after_commit:
+                yield
+
 
 class UpsertDSL(SettingRepoDSL):
     """Base class for `upset` tests."""
@@ -111,6 +122,7 @@ class UpsertDSL(SettingRepoDSL):
             upsert=True,
             session=self.mock_session,
         )
+        self.mock_run_after_commit.assert_called_once_with(self.mock_session, self.settings_cache.invalidate)
 
         assert self._upserted_setting == self._expected_setting_out
 
@@ -149,6 +161,7 @@ class GetDSL(SettingRepoDSL):
     _obtained_out_model_type: Type[SettingOutBaseT]
     _expected_setting_out: SettingOutBaseT
     _obtained_setting: Optional[SettingOutBaseT]
+    _obtained_session: Optional[MagicMock]
 
     def mock_get(self, out_model_type: Type[SettingOutBaseT], setting_out_data: Optional[dict]) -> None:
         """
@@ -168,14 +181,16 @@ class GetDSL(SettingRepoDSL):
                 (self._expected_setting_out.model_dump() if self._expected_setting_out else None),
             )
 
-    def call_get(self, out_model_type: Type[SettingOutBaseT]) -> None:
+    def call_get(self, out_model_type: Type[SettingOutBaseT], use_session: bool = True) -> None:
         """Calls the `SettingRepo` `get` method with the appropriate data from a prior call to `mock_get`.
 
         :param out_model_type: The type of the setting's output model to be obtained.
+        :param use_session: Whether to pass a session to the `get` method (those without use the cache).
         """
 
         self._obtained_out_model_type = out_model_type
-        self._obtained_setting = self.setting_repo.get(out_model_type, session=self.mock_session)
+        self._obtained_session = self.mock_session if use_session else None
+        self._obtained_setting = self.setting_repo.get(out_model_type, session=self._obtained_session)
 
     def check_get_success(self) -> None:
         """Checks that a prior call to `call_get` worked as expected."""
@@ -183,12 +198,12 @@ class GetDSL(SettingRepoDSL):
         if self._obtained_out_model_type is SparesDefinitionOut or self._obtained_out_model_type is InUseDefinitionOut:
             self.settings_collection.aggregate.assert_called_once_with(
                 construct_definition_with_system_types_aggregation_pipeline(self._obtained_out_model_type.SETTING_ID),
-                session=self.mock_session,
+                session=self._obtained_session,
             )
         else:
             self.settings_collection.find_one.assert_called_once_with(
                 {"_id": self._obtained_out_model_type.SETTING_ID},
-                session=self.mock_session,
+                session=self._obtained_session,
             )
         assert self._obtained_setting == self._expected_setting_out
 
@@ -237,3 +252,27 @@ class TestGet(GetDSL):
         self.mock_get(InUseDefinitionOut, None)
         self.call_get(InUseDefinitionOut)
         self.check_get_success()
+
+    def test_get_without_session_uses_cache(self):
+        """Test getting a setting without a session only queries the database the first time."""
+
+        self.mock_get(SparesDefinitionOut, SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE)
+        self.call_get(SparesDefinitionOut, use_session=False)
+        self.call_get(SparesDefinitionOut, use_session=False)
+        self.check_get_success()
+
+    def test_get_without_session_when_non_existent_uses_cache(self):
+        """Test getting a non-existent setting without a session only queries the database the first time."""
+
+        self.mock_get(SparesDefinitionOut, None)
+        self.call_get(SparesDefinitionOut, use_session=False)
+        self.call_get(SparesDefinitionOut, use_session=False)
+        self.check_get_success()
+
+    def test_get_with_session_bypasses_cache(self):
+        """Test getting a setting with a session doesn't use a previously cached value."""
+
+        self.mock_get(SparesDefinitionOut, SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE)
+        self.settings_cache.get_or_load(SparesDefinitionOut.SETTING_ID, lambda: None)
+        self.call_get(SparesDefinitionOut)
+        self.check_get_success()
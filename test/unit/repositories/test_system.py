@@ -12,17 +12,17 @@ from test.mock_data import (
     SYSTEM_IN_DATA_STORAGE_NO_PARENT_B,
 )
 from test.unit.repositories.conftest import RepositoryTestHelpers
-from test.unit.repositories.test_utils import (
-    MOCK_BREADCRUMBS_QUERY_RESULT_LESS_THAN_MAX_LENGTH,
-    MOCK_MOVE_QUERY_RESULT_INVALID,
-    MOCK_MOVE_QUERY_RESULT_VALID,
-)
+from test.unit.repositories.test_utils import MOCK_BREADCRUMBS_QUERY_RESULT_LESS_THAN_MAX_LENGTH
+from datetime import datetime, timezone
 from typing import Optional
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
 from bson import ObjectId
 
+from inventory_management_system_api.core.cache import VersionedCache
+from inventory_management_system_api.core.conditional_requests import compute_list_version
+from inventory_management_system_api.core.consts import STREAM_BATCH_SIZE
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.exceptions import (
     DuplicateRecordError,
@@ -30,6 +30,7 @@ from inventory_management_system_api.core.exceptions import (
     InvalidObjectIdError,
     MissingRecordError,
 )
+from inventory_management_system_api.core.sparse_fieldsets import create_partial_model
 from inventory_management_system_api.models.system import SystemIn, SystemOut
 from inventory_management_system_api.repositories.system import SystemRepo
 
@@ -43,6 +44,8 @@ class SystemRepoDSL:
     system_repository: SystemRepo
     systems_collection: Mock
     items_collection: Mock
+    system_breadcrumbs_cache: VersionedCache
+    mock_run_after_commit: Mock
 
     mock_session = MagicMock()
 
@@ -59,15 +62,33 @@ class SystemRepoDSL:
         self.systems_collection = database_mock.systems
         self.items_collection = database_mock.items
 
-        with patch("inventory_management_system_api.repositories.system.utils") as mock_utils:
+        # Use a separate cache for each test
+        self.system_breadcrumbs_cache = VersionedCache()
+        with (
+            patch("inventory_management_system_api.repositories.system.utils") as mock_utils,
+            patch(
+                "inventory_management_system_api.repositories.system.system_breadcrumbs_cache",
+                self.system_breadcrumbs_cache,
+            ),
+            patch("inventory_management_system_api.repositories.system.run_after_commit") as mock_run_after_commit,
+        ):
             self.mock_utils = mock_utils
+            self.mock_run_after_commit = mock_run_after_commit
             yield
 
+    def check_run_after_commit(self) -> None:
+        """Checks that a callback was deferred until after the transaction commits, then runs it as though it has."""
+
+        self.mock_run_after_commit.assert_called_once_with(self.mock_session, ANY)
+        self.mock_run_after_commit.call_args.args[1]()
+
 
 class CreateDSL(SystemRepoDSL):
     """Base class for `create` tests."""
 
     _system_in: SystemIn
+    _parent_ancestor_ids: Optional[list[str]]
+    _expected_ancestor_ids: list[CustomObjectId]
     _expected_system_out: SystemOut
     _created_system: SystemOut
     _create_exception: pytest.ExceptionInfo
@@ -95,14 +116,26 @@ class CreateDSL(SystemRepoDSL):
 
         self._expected_system_out = SystemOut(**self._system_in.model_dump(), id=inserted_system_id)
 
+        self._parent_ancestor_ids = None
+        self._expected_ancestor_ids = []
+
         # When a parent_id is given, need to mock the find_one for it too
         if system_in_data["parent_id"]:
+            parent_ancestor_ids = [CustomObjectId(str(ObjectId()))]
+            if parent_system_in_data:
+                self._parent_ancestor_ids = [str(ancestor_id) for ancestor_id in parent_ancestor_ids]
+                self._expected_ancestor_ids = self.mock_utils.compute_ancestor_ids.return_value
+
             # If parent_system_data is given as None, then it is intentionally supposed to be, otherwise
             # pass through SystemIn first to ensure it has creation and modified times
             RepositoryTestHelpers.mock_find_one(
                 self.systems_collection,
                 (
-                    {**SystemIn(**parent_system_in_data).model_dump(), "_id": system_in_data["parent_id"]}
+                    {
+                        **SystemIn(**parent_system_in_data).model_dump(),
+                        "_id": system_in_data["parent_id"],
+                        "ancestor_ids": parent_ancestor_ids,
+                    }
                     if parent_system_in_data
                     else None
                 ),
@@ -149,8 +182,15 @@ class CreateDSL(SystemRepoDSL):
             )
         )
 
+        if self._parent_ancestor_ids is not None:
+            self.mock_utils.compute_ancestor_ids.assert_called_once_with(
+                str(self._system_in.parent_id), self._parent_ancestor_ids
+            )
+        else:
+            self.mock_utils.compute_ancestor_ids.assert_not_called()
+
         self.systems_collection.insert_one.assert_called_once_with(
-            self._system_in.model_dump(), session=self.mock_session
+            {**self._system_in.model_dump(), "ancestor_ids": self._expected_ancestor_ids}, session=self.mock_session
         )
         self.systems_collection.find_one.assert_has_calls(expected_find_one_calls)
 
@@ -165,7 +205,9 @@ class CreateDSL(SystemRepoDSL):
         :param expecting_insert_one_called: Whether the `insert_one` method is expected to be called or not.
         """
         if expecting_insert_one_called:
-            self.systems_collection.insert_one.assert_called_once_with(self._system_in.model_dump(), session=None)
+            self.systems_collection.insert_one.assert_called_once_with(
+                {**self._system_in.model_dump(), "ancestor_ids": self._expected_ancestor_ids}, session=None
+            )
         else:
             self.systems_collection.insert_one.assert_not_called()
 
@@ -219,17 +261,19 @@ class GetDSL(SystemRepoDSL):
     """Base class for `get` tests."""
 
     _obtained_system_id: str
+    _obtained_fields: Optional[list[str]]
     _expected_system_out: Optional[SystemOut]
     _obtained_system: Optional[SystemOut]
     _get_exception: pytest.ExceptionInfo
 
-    def mock_get(self, system_id: str, system_in_data: Optional[dict]) -> None:
+    def mock_get(self, system_id: str, system_in_data: Optional[dict], fields: Optional[list[str]] = None) -> None:
         """
         Mocks database methods appropriately to test the `get` repo method.
 
         :param system_id: ID of the system to be obtained.
         :param system_in_data: Either `None` or a dictionary containing the system data as would be required for a
                                `SystemIn` database model (i.e. No ID or created and modified times required).
+        :param fields: List of the fields to be obtained, or `None` if all of them are to be obtained.
         """
 
         self._expected_system_out = (
@@ -237,20 +281,28 @@ class GetDSL(SystemRepoDSL):
             if system_in_data
             else None
         )
+        if self._expected_system_out and fields is not None:
+            self._expected_system_out = create_partial_model(SystemOut)(
+                **self._expected_system_out.model_dump(include=set(fields))
+            )
 
+        self.mock_utils.create_projection.return_value = {"projection": {"_id": 1}} if fields is not None else {}
         RepositoryTestHelpers.mock_find_one(
-            self.systems_collection, self._expected_system_out.model_dump() if self._expected_system_out else None
+            self.systems_collection,
+            self._expected_system_out.model_dump(exclude_unset=True) if self._expected_system_out else None,
         )
 
-    def call_get(self, system_id: str) -> None:
+    def call_get(self, system_id: str, fields: Optional[list[str]] = None) -> None:
         """
         Calls the `SystemRepo` `get` method with the appropriate data from a prior call to `mock_get`.
 
         :param system_id: ID of the system to be obtained.
+        :param fields: List of the fields to be obtained, or `None` if all of them are to be obtained.
         """
 
         self._obtained_system_id = system_id
-        self._obtained_system = self.system_repository.get(system_id, session=self.mock_session)
+        self._obtained_fields = fields
+        self._obtained_system = self.system_repository.get(system_id, session=self.mock_session, fields=fields)
 
     def call_get_expecting_error(self, system_id: str, error_type: type[BaseException]) -> None:
         """
@@ -268,8 +320,11 @@ class GetDSL(SystemRepoDSL):
     def check_get_success(self) -> None:
         """Checks that a prior call to `call_get` worked as expected."""
 
+        self.mock_utils.create_projection.assert_called_once_with(self._obtained_fields)
         self.systems_collection.find_one.assert_called_once_with(
-            {"_id": CustomObjectId(self._obtained_system_id)}, session=self.mock_session
+            {"_id": CustomObjectId(self._obtained_system_id)},
+            session=self.mock_session,
+            **self.mock_utils.create_projection.return_value,
         )
         assert self._obtained_system == self._expected_system_out
 
@@ -298,6 +353,15 @@ class TestGet(GetDSL):
         self.call_get(system_id)
         self.check_get_success()
 
+    def test_get_with_fields(self):
+        """Test getting only specific fields of a system."""
+
+        system_id = str(ObjectId())
+
+        self.mock_get(system_id, SYSTEM_IN_DATA_STORAGE_NO_PARENT_A, fields=["id", "name"])
+        self.call_get(system_id, fields=["id", "name"])
+        self.check_get_success()
+
     def test_get_with_non_existent_id(self):
         """Test getting a system with a non-existent ID."""
 
@@ -323,6 +387,7 @@ class GetBreadcrumbsDSL(SystemRepoDSL):
     _mock_aggregation_pipeline = MagicMock()
     _expected_breadcrumbs: MagicMock
     _obtained_system_id: str
+    _obtained_session: Optional[MagicMock]
     _obtained_breadcrumbs: MagicMock
 
     def mock_breadcrumbs(self, breadcrumbs_query_result: list[dict]) -> None:
@@ -339,15 +404,17 @@ class GetBreadcrumbsDSL(SystemRepoDSL):
         self.systems_collection.aggregate.return_value = breadcrumbs_query_result
         self.mock_utils.compute_breadcrumbs.return_value = self._expected_breadcrumbs
 
-    def call_get_breadcrumbs(self, system_id: str) -> None:
+    def call_get_breadcrumbs(self, system_id: str, use_session: bool = True) -> None:
         """
         Calls the SystemRepo `get_breadcrumbs` method.
 
         :param system_id: ID of the system to obtain the breadcrumbs of.
+        :param use_session: Whether to pass a session to the `get_breadcrumbs` method (those without use the cache).
         """
 
         self._obtained_system_id = system_id
-        self._obtained_breadcrumbs = self.system_repository.get_breadcrumbs(system_id, session=self.mock_session)
+        self._obtained_session = self.mock_session if use_session else None
+        self._obtained_breadcrumbs = self.system_repository.get_breadcrumbs(system_id, session=self._obtained_session)
 
     def check_get_breadcrumbs_success(self):
         """Checks that a prior call to `call_get_breadcrumbs` worked as expected."""
@@ -356,7 +423,7 @@ class GetBreadcrumbsDSL(SystemRepoDSL):
             entity_id=self._obtained_system_id, collection_name="systems"
         )
         self.systems_collection.aggregate.assert_called_once_with(
-            self._mock_aggregation_pipeline, session=self.mock_session
+            self._mock_aggregation_pipeline, session=self._obtained_session
         )
         self.mock_utils.compute_breadcrumbs.assert_called_once_with(
             list(self._breadcrumbs_query_result), entity_id=self._obtained_system_id, collection_name="systems"
@@ -375,47 +442,302 @@ class TestGetBreadcrumbs(GetBreadcrumbsDSL):
         self.call_get_breadcrumbs(str(ObjectId()))
         self.check_get_breadcrumbs_success()
 
+    def test_get_breadcrumbs_without_session_uses_cache(self):
+        """Test getting a system's breadcrumbs without a session only queries the database the first time."""
+
+        system_id = str(ObjectId())
+
+        self.mock_breadcrumbs(MOCK_BREADCRUMBS_QUERY_RESULT_LESS_THAN_MAX_LENGTH)
+        self.call_get_breadcrumbs(system_id, use_session=False)
+        self.call_get_breadcrumbs(system_id, use_session=False)
+        self.check_get_breadcrumbs_success()
+
+
+class GetManyBreadcrumbsDSL(SystemRepoDSL):
+    """Base class for `get_many_breadcrumbs` tests."""
+
+    _breadcrumbs_query_result: list[dict]
+    _mock_aggregation_pipeline = MagicMock()
+    _expected_breadcrumbs: MagicMock
+    _obtained_system_ids: list[str]
+    _obtained_breadcrumbs: MagicMock
+
+    def mock_many_breadcrumbs(self, breadcrumbs_query_result: list[dict]) -> None:
+        """Mocks database methods appropriately to test the `get_many_breadcrumbs` repo method.
+
+        :param breadcrumbs_query_result: List of dictionaries containing the breadcrumbs query result from the
+                                         aggregation pipeline.
+        """
+        self._breadcrumbs_query_result = breadcrumbs_query_result
+        self._mock_aggregation_pipeline = MagicMock()
+        self._expected_breadcrumbs = MagicMock()
+
+        self.mock_utils.create_many_breadcrumbs_aggregation_pipeline.return_value = self._mock_aggregation_pipeline
+        self.systems_collection.aggregate.return_value = breadcrumbs_query_result
+        self.mock_utils.compute_many_breadcrumbs.return_value = self._expected_breadcrumbs
+
+    def call_get_many_breadcrumbs(self, system_ids: list[str]) -> None:
+        """
+        Calls the `SystemRepo` `get_many_breadcrumbs` method.
+
+        :param system_ids: IDs of the systems to obtain the breadcrumbs of.
+        """
+
+        self._obtained_system_ids = system_ids
+        self._obtained_breadcrumbs = self.system_repository.get_many_breadcrumbs(system_ids, session=self.mock_session)
+
+    def check_get_many_breadcrumbs_success(self) -> None:
+        """Checks that a prior call to `call_get_many_breadcrumbs` worked as expected."""
+
+        self.mock_utils.create_many_breadcrumbs_aggregation_pipeline.assert_called_once_with(
+            entity_ids=self._obtained_system_ids, collection_name="systems"
+        )
+        self.systems_collection.aggregate.assert_called_once_with(
+            self._mock_aggregation_pipeline, session=self.mock_session
+        )
+        self.mock_utils.compute_many_breadcrumbs.assert_called_once_with(
+            list(self._breadcrumbs_query_result), collection_name="systems"
+        )
+
+        assert self._obtained_breadcrumbs == self._expected_breadcrumbs
+
+
+class TestGetManyBreadcrumbs(GetManyBreadcrumbsDSL):
+    """Tests for getting the breadcrumbs of multiple systems."""
+
+    def test_get_many_breadcrumbs(self):
+        """Test getting the breadcrumbs of multiple systems."""
+
+        self.mock_many_breadcrumbs(MOCK_BREADCRUMBS_QUERY_RESULT_LESS_THAN_MAX_LENGTH)
+        self.call_get_many_breadcrumbs([str(ObjectId()), str(ObjectId())])
+        self.check_get_many_breadcrumbs_success()
+
+
+class GetTreeDSL(SystemRepoDSL):
+    """Base class for `get_tree` tests."""
+
+    _system_id: str
+    _max_depth: Optional[int]
+    _expected_systems_out: list[SystemOut]
+    _obtained_systems_out: list[SystemOut]
+    _get_tree_exception: pytest.ExceptionInfo
+
+    def mock_get_tree(self, systems_in_data: list[dict]) -> None:
+        """
+        Mocks database methods appropriately to test the `get_tree` repo method.
+
+        :param systems_in_data: List of dictionaries containing the system data as would be required for a `SystemIn`
+                                database model (i.e. no ID or created and modified times required) for each of the
+                                systems in the tree. Each is placed inside the previous one, with the first being the
+                                system at the top of the tree.
+        """
+        self._system_id = str(ObjectId())
+        self._expected_systems_out = []
+        ancestor_ids = []
+        for system_in_data in systems_in_data:
+            system_id = str(ObjectId()) if ancestor_ids else self._system_id
+            self._expected_systems_out.append(
+                SystemOut(**{**SystemIn(**system_in_data).model_dump(), "ancestor_ids": ancestor_ids}, id=system_id)
+            )
+            ancestor_ids = [*ancestor_ids, system_id]
+
+        # Database order is arbitrary so ensure the systems are sorted by the repo
+        RepositoryTestHelpers.mock_find(
+            self.systems_collection, [system_out.model_dump() for system_out in reversed(self._expected_systems_out)]
+        )
+
+    def call_get_tree(self, max_depth: Optional[int] = None) -> None:
+        """
+        Calls the `SystemRepo` `get_tree` method with the appropriate data from a prior call to `mock_get_tree`.
+
+        :param max_depth: Maximum depth to pass to `get_tree`.
+        """
+        self._max_depth = max_depth
+        self._obtained_systems_out = self.system_repository.get_tree(
+            self._system_id, max_depth=max_depth, session=self.mock_session
+        )
+
+    def call_get_tree_expecting_error(self, error_type: type[BaseException]) -> None:
+        """
+        Calls the `SystemRepo` `get_tree` method with the appropriate data from a prior call to `mock_get_tree` while
+        expecting an error to be raised.
+
+        :param error_type: Expected exception to be raised.
+        """
+        self._max_depth = None
+        with pytest.raises(error_type) as exc:
+            self.system_repository.get_tree(self._system_id, session=self.mock_session)
+        self._get_tree_exception = exc
+
+    def check_get_tree_success(self) -> None:
+        """Checks that a prior call to `call_get_tree` worked as expected."""
+        self.mock_utils.create_subtree_query.assert_called_once_with(self._system_id, self._max_depth)
+        self.systems_collection.find.assert_called_once_with(
+            self.mock_utils.create_subtree_query.return_value, session=self.mock_session
+        )
+        assert self._obtained_systems_out == self._expected_systems_out
+
+    def check_get_tree_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_get_tree_expecting_error` worked as expected, raising an exception with the
+        correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+        self.systems_collection.find.assert_called_once_with(
+            self.mock_utils.create_subtree_query.return_value, session=self.mock_session
+        )
+        assert str(self._get_tree_exception.value) == message
+
+
+class TestGetTree(GetTreeDSL):
+    """Tests for getting a system along with all of its descendants."""
+
+    def test_get_tree(self):
+        """Test getting a system along with all of its descendants."""
+
+        self.mock_get_tree(
+            [SYSTEM_IN_DATA_STORAGE_NO_PARENT_A, SYSTEM_IN_DATA_STORAGE_NO_PARENT_B, SYSTEM_IN_DATA_STORAGE_NO_PARENT_A]
+        )
+        self.call_get_tree()
+        self.check_get_tree_success()
+
+    def test_get_tree_with_max_depth(self):
+        """Test getting a system along with its descendants up to a maximum depth."""
+
+        self.mock_get_tree([SYSTEM_IN_DATA_STORAGE_NO_PARENT_A, SYSTEM_IN_DATA_STORAGE_NO_PARENT_B])
+        self.call_get_tree(max_depth=1)
+        self.check_get_tree_success()
+
+    def test_get_tree_with_non_existent_id(self):
+        """Test getting the tree of a system with a non-existent ID."""
+
+        self.mock_get_tree([])
+        self.call_get_tree_expecting_error(MissingRecordError)
+        self.check_get_tree_failed_with_exception(f"No system found with ID '{self._system_id}'")
+
+
+class GetManyDSL(SystemRepoDSL):
+    """Base class for `get_many` tests."""
+
+    _system_ids: list[str]
+    _expected_systems_out: dict[str, SystemOut]
+    _obtained_systems_out: dict[str, SystemOut]
+    _get_many_exception: pytest.ExceptionInfo
+
+    def mock_get_many(self, systems_in_data: list[dict], number_of_non_existent_ids: int = 0) -> None:
+        """
+        Mocks database methods appropriately to test the `get_many` repo method.
+
+        :param systems_in_data: List of dictionaries containing the system data as would be required for a `SystemIn`
+                                database model (i.e. no ID or created and modified times required) for each of the
+                                systems that exist.
+        :param number_of_non_existent_ids: Number of additional IDs to request that don't belong to any system.
+        """
+        expected_systems_out = [
+            SystemOut(**SystemIn(**system_in_data).model_dump(), id=ObjectId()) for system_in_data in systems_in_data
+        ]
+        self._expected_systems_out = {system_out.id: system_out for system_out in expected_systems_out}
+        self._system_ids = [system_out.id for system_out in expected_systems_out] + [
+            str(ObjectId()) for _ in range(number_of_non_existent_ids)
+        ]
+
+        RepositoryTestHelpers.mock_find(
+            self.systems_collection, [system_out.model_dump() for system_out in expected_systems_out]
+        )
+
+    def call_get_many(self) -> None:
+        """Calls the `SystemRepo` `get_many` method with the appropriate data from a prior call to `mock_get_many`."""
+        self._obtained_systems_out = self.system_repository.get_many(self._system_ids, session=self.mock_session)
+
+    def check_get_many_success(self) -> None:
+        """Checks that a prior call to `call_get_many` worked as expected."""
+        self.mock_utils.ids_query.assert_called_once_with(self._system_ids, "systems")
+        self.systems_collection.find.assert_called_once_with(
+            self.mock_utils.ids_query.return_value, session=self.mock_session
+        )
+        assert self._obtained_systems_out == self._expected_systems_out
+
+
+class TestGetMany(GetManyDSL):
+    """Tests for getting multiple systems."""
+
+    def test_get_many(self):
+        """Test getting multiple systems."""
+
+        self.mock_get_many([SYSTEM_IN_DATA_STORAGE_NO_PARENT_A, SYSTEM_IN_DATA_STORAGE_NO_PARENT_B])
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_non_existent_ids(self):
+        """Test getting multiple systems when some of the IDs don't exist."""
+
+        self.mock_get_many([SYSTEM_IN_DATA_STORAGE_NO_PARENT_A], number_of_non_existent_ids=2)
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_no_ids(self):
+        """Test getting multiple systems when no IDs are given."""
+
+        self.mock_get_many([])
+        self.call_get_many()
+        self.check_get_many_success()
+
 
 class ListDSL(SystemRepoDSL):
     """Base class for `list` tests."""
 
     _expected_systems_out: list[SystemOut]
     _parent_id_filter: Optional[str]
+    _fields: Optional[list[str]]
     _obtained_systems_out: list[SystemOut]
 
-    def mock_list(self, systems_in_data: list[dict]):
+    def mock_list(self, systems_in_data: list[dict], fields: Optional[list[str]] = None):
         """
         Mocks database methods appropriately to test the `list` repo method.
 
         :param systems_in_data: List of dictionaries containing the system data as would be required for a
                                 `SystemIn` database model (i.e. no ID or created and modified times required).
+        :param fields: List of the fields to be obtained, or `None` if all of them are to be obtained.
         """
 
         self._expected_systems_out = [
             SystemOut(**SystemIn(**system_in_data).model_dump(), id=ObjectId()) for system_in_data in systems_in_data
         ]
+        if fields is not None:
+            self._expected_systems_out = [
+                create_partial_model(SystemOut)(**system_out.model_dump(include=set(fields)))
+                for system_out in self._expected_systems_out
+            ]
 
+        self.mock_utils.create_projection.return_value = {"projection": {"_id": 1}} if fields is not None else {}
         RepositoryTestHelpers.mock_find(
-            self.systems_collection, [system_out.model_dump() for system_out in self._expected_systems_out]
+            self.systems_collection,
+            [system_out.model_dump(exclude_unset=True) for system_out in self._expected_systems_out],
         )
 
-    def call_list(self, parent_id: Optional[str]):
+    def call_list(self, parent_id: Optional[str], fields: Optional[list[str]] = None):
         """
         Calls the `SystemRepo` `list` method.
 
         :param parent_id: ID of the parent system to query by, or `None`.
+        :param fields: List of the fields to be obtained, or `None` if all of them are to be obtained.
         """
 
         self._parent_id_filter = parent_id
+        self._fields = fields
 
-        self._obtained_systems_out = self.system_repository.list(parent_id, session=self.mock_session)
+        self._obtained_systems_out = self.system_repository.list(parent_id, session=self.mock_session, fields=fields)
 
     def check_list_success(self):
         """Checks that a prior call to `call_list` worked as expected."""
 
         self.mock_utils.list_query.assert_called_once_with({"parent_id": self._parent_id_filter}, "systems")
+        self.mock_utils.create_projection.assert_called_once_with(self._fields)
         self.systems_collection.find.assert_called_once_with(
-            self.mock_utils.list_query.return_value, session=self.mock_session
+            self.mock_utils.list_query.return_value,
+            session=self.mock_session,
+            **self.mock_utils.create_projection.return_value,
         )
 
         assert self._obtained_systems_out == self._expected_systems_out
@@ -452,6 +774,121 @@ class TestList(ListDSL):
         self.call_list(parent_id=str(ObjectId()))
         self.check_list_success()
 
+    def test_list_with_fields(self):
+        """Test listing only specific fields of systems."""
+
+        self.mock_list([SYSTEM_IN_DATA_STORAGE_NO_PARENT_A, SYSTEM_IN_DATA_STORAGE_NO_PARENT_B], fields=["id", "name"])
+        self.call_list(parent_id=None, fields=["id", "name"])
+        self.check_list_success()
+
+
+class StreamDSL(ListDSL):
+    """Base class for `stream` tests."""
+
+    def call_stream(self, parent_id: Optional[str]):
+        """
+        Calls the `SystemRepo` `stream` method and consumes the returned iterator.
+
+        :param parent_id: ID of the parent system to query by, or `None`.
+        """
+
+        self._parent_id_filter = parent_id
+        self._fields = None
+
+        self._obtained_systems_out = list(self.system_repository.stream(parent_id, session=self.mock_session))
+
+    def check_stream_success(self):
+        """Checks that a prior call to `call_stream` worked as expected."""
+
+        self.mock_utils.list_query.assert_called_once_with({"parent_id": self._parent_id_filter}, "systems")
+        self.mock_utils.create_projection.assert_called_once_with(self._fields)
+        self.systems_collection.find.assert_called_once_with(
+            self.mock_utils.list_query.return_value,
+            session=self.mock_session,
+            batch_size=STREAM_BATCH_SIZE,
+            **self.mock_utils.create_projection.return_value,
+        )
+
+        assert self._obtained_systems_out == self._expected_systems_out
+
+
+class TestStream(StreamDSL):
+    """Tests for streaming systems."""
+
+    def test_stream(self):
+        """Test streaming all systems."""
+
+        self.mock_list([SYSTEM_IN_DATA_STORAGE_NO_PARENT_A, SYSTEM_IN_DATA_STORAGE_NO_PARENT_B])
+        self.call_stream(parent_id=None)
+        self.check_stream_success()
+
+    def test_stream_with_parent_id_filter(self):
+        """Test streaming all systems with a given `parent_id`."""
+
+        self.mock_list([SYSTEM_IN_DATA_STORAGE_NO_PARENT_A, SYSTEM_IN_DATA_STORAGE_NO_PARENT_B])
+        self.call_stream(parent_id=str(ObjectId()))
+        self.check_stream_success()
+
+
+class GetListVersionDSL(SystemRepoDSL):
+    """Base class for `get_list_version` tests."""
+
+    _parent_id_filter: Optional[str]
+    _expected_list_version: str
+    _obtained_list_version: str
+
+    def mock_get_list_version(self) -> None:
+        """Mocks database methods appropriately to test the `get_list_version` repo method."""
+
+        systems = [{"_id": ObjectId(), "modified_time": datetime.now(timezone.utc)} for _ in range(2)]
+        self._expected_list_version = compute_list_version(
+            (system["_id"], system["modified_time"]) for system in systems
+        )
+
+        self.mock_utils.create_projection.return_value = {"projection": {"_id": 1, "modified_time": 1}}
+        self.systems_collection.find.return_value = systems
+
+    def call_get_list_version(self, parent_id: Optional[str]) -> None:
+        """
+        Calls the `SystemRepo` `get_list_version` method.
+
+        :param parent_id: ID of the parent system to query by, or `None`.
+        """
+
+        self._parent_id_filter = parent_id
+        self._obtained_list_version = self.system_repository.get_list_version(parent_id, session=self.mock_session)
+
+    def check_get_list_version_success(self) -> None:
+        """Checks that a prior call to `call_get_list_version` worked as expected."""
+
+        self.mock_utils.list_query.assert_called_once_with({"parent_id": self._parent_id_filter}, "systems")
+        self.mock_utils.create_projection.assert_called_once_with(["id", "modified_time"])
+        self.systems_collection.find.assert_called_once_with(
+            self.mock_utils.list_query.return_value,
+            session=self.mock_session,
+            **self.mock_utils.create_projection.return_value,
+        )
+
+        assert self._obtained_list_version == self._expected_list_version
+
+
+class TestGetListVersion(GetListVersionDSL):
+    """Tests for getting the version of a list of systems."""
+
+    def test_get_list_version(self):
+        """Test getting the version of the list of all systems."""
+
+        self.mock_get_list_version()
+        self.call_get_list_version(parent_id=None)
+        self.check_get_list_version_success()
+
+    def test_get_list_version_with_parent_id_filter(self):
+        """Test getting the version of the list of all systems with a given `parent_id`."""
+
+        self.mock_get_list_version()
+        self.call_get_list_version(parent_id=str(ObjectId()))
+        self.check_get_list_version_success()
+
 
 class UpdateDSL(SystemRepoDSL):
     """Base class for `update` tests."""
@@ -459,10 +896,15 @@ class UpdateDSL(SystemRepoDSL):
     # pylint:disable=too-many-instance-attributes
     _system_in: SystemIn
     _stored_system_out: Optional[SystemOut]
+    _parent_ancestor_ids: Optional[list[str]]
+    _expected_update_data: dict
     _expected_system_out: SystemOut
     _updated_system_id: str
     _updated_system: SystemOut
     _moving_system: bool
+    _renaming_system: bool
+    _descendant_ids: list[CustomObjectId]
+    _unrelated_system_id: CustomObjectId
     _update_exception: pytest.ExceptionInfo
 
     def set_update_data(self, new_system_in_data: dict):
@@ -502,14 +944,24 @@ class UpdateDSL(SystemRepoDSL):
         """
         self.set_update_data(new_system_in_data)
 
+        self._parent_ancestor_ids = None
+
         # When a parent_id is given, need to mock the find_one for it too
         if new_system_in_data["parent_id"]:
+            parent_ancestor_ids = [CustomObjectId(str(ObjectId()))]
+            if new_parent_system_in_data:
+                self._parent_ancestor_ids = [str(ancestor_id) for ancestor_id in parent_ancestor_ids]
+
             # If new_parent_system_data is given as none, then it is intentionally supposed to be, otherwise
             # pass through SystemIn first to ensure it has creation and modified times
             RepositoryTestHelpers.mock_find_one(
                 self.systems_collection,
                 (
-                    {**SystemIn(**new_parent_system_in_data).model_dump(), "_id": new_system_in_data["parent_id"]}
+                    {
+                        **SystemIn(**new_parent_system_in_data).model_dump(),
+                        "_id": new_system_in_data["parent_id"],
+                        "ancestor_ids": parent_ancestor_ids,
+                    }
                     if new_parent_system_in_data
                     else None
                 ),
@@ -536,15 +988,23 @@ class UpdateDSL(SystemRepoDSL):
         self._moving_system = stored_system_in_data is not None and (
             new_system_in_data["parent_id"] != stored_system_in_data["parent_id"]
         )
+        self._renaming_system = stored_system_in_data is not None and (
+            new_system_in_data["name"] != stored_system_in_data["name"]
+        )
+        self._expected_update_data = self._system_in.model_dump(exclude={"ancestor_ids"})
         if self._moving_system:
-            mock_aggregation_pipeline = MagicMock()
-            self.mock_utils.create_move_check_aggregation_pipeline.return_value = mock_aggregation_pipeline
-            if valid_move_result:
-                self.mock_utils.is_valid_move_result.return_value = True
-                self.systems_collection.aggregate.return_value = MOCK_MOVE_QUERY_RESULT_VALID
-            else:
-                self.mock_utils.is_valid_move_result.return_value = False
-                self.systems_collection.aggregate.return_value = MOCK_MOVE_QUERY_RESULT_INVALID
+            self.mock_utils.is_valid_move.return_value = valid_move_result
+            self._expected_update_data["ancestor_ids"] = (
+                self.mock_utils.compute_ancestor_ids.return_value if self._parent_ancestor_ids is not None else []
+            )
+
+        # Descendants whose breadcrumbs may need to be discarded, along with cached breadcrumbs for them, the system
+        # itself and another unrelated system
+        self._descendant_ids = [CustomObjectId(str(ObjectId())), CustomObjectId(str(ObjectId()))]
+        self._unrelated_system_id = CustomObjectId(str(ObjectId()))
+        self.systems_collection.find.return_value = [{"_id": descendant_id} for descendant_id in self._descendant_ids]
+        for cached_system_id in [CustomObjectId(system_id), *self._descendant_ids, self._unrelated_system_id]:
+            self.system_breadcrumbs_cache.get_or_load(cached_system_id, lambda: "cached")
 
     def call_update(self, system_id: str) -> None:
         """
@@ -589,26 +1049,59 @@ class UpdateDSL(SystemRepoDSL):
         )
         self.systems_collection.find_one.assert_has_calls(expected_find_one_calls)
 
-        if self._moving_system:
-            self.mock_utils.create_move_check_aggregation_pipeline.assert_called_once_with(
-                entity_id=self._updated_system_id,
-                destination_id=str(self._system_in.parent_id),
-                collection_name="systems",
+        if self._moving_system and self._parent_ancestor_ids is not None:
+            self.mock_utils.is_valid_move.assert_called_once_with(
+                self._updated_system_id, str(self._system_in.parent_id), self._parent_ancestor_ids
             )
-            self.systems_collection.aggregate.assert_called_once_with(
-                self.mock_utils.create_move_check_aggregation_pipeline.return_value, session=self.mock_session
+            self.mock_utils.compute_ancestor_ids.assert_called_once_with(
+                str(self._system_in.parent_id), self._parent_ancestor_ids
             )
+        else:
+            self.mock_utils.is_valid_move.assert_not_called()
+            self.mock_utils.compute_ancestor_ids.assert_not_called()
 
         self.systems_collection.update_one.assert_called_once_with(
             {
                 "_id": CustomObjectId(self._updated_system_id),
             },
             {
-                "$set": self._system_in.model_dump(),
+                "$set": self._expected_update_data,
             },
             session=self.mock_session,
         )
 
+        if self._moving_system:
+            self.mock_utils.create_move_descendants_update.assert_called_once_with(
+                CustomObjectId(self._updated_system_id), self._expected_update_data["ancestor_ids"]
+            )
+            self.systems_collection.update_many.assert_called_once_with(
+                {"ancestor_ids": CustomObjectId(self._updated_system_id)},
+                self.mock_utils.create_move_descendants_update.return_value,
+                session=self.mock_session,
+            )
+        else:
+            self.systems_collection.update_many.assert_not_called()
+
+        # Breadcrumbs of the system and its descendants should only be discarded when they are affected
+        invalidating_breadcrumbs = self._moving_system or self._renaming_system
+        if invalidating_breadcrumbs:
+            # Nothing should be discarded before the transaction commits
+            assert self.system_breadcrumbs_cache.version == 0
+            self.check_run_after_commit()
+        else:
+            self.mock_run_after_commit.assert_not_called()
+        if invalidating_breadcrumbs:
+            self.systems_collection.find.assert_called_once_with(
+                {"ancestor_ids": CustomObjectId(self._updated_system_id)}, {"_id": 1}, session=self.mock_session
+            )
+        else:
+            self.systems_collection.find.assert_not_called()
+        for cached_system_id in [CustomObjectId(self._updated_system_id), *self._descendant_ids]:
+            assert self.system_breadcrumbs_cache.get_or_load(cached_system_id, lambda: "reloaded") == (
+                "reloaded" if invalidating_breadcrumbs else "cached"
+            )
+        assert self.system_breadcrumbs_cache.get_or_load(self._unrelated_system_id, lambda: "reloaded") == "cached"
+
         assert self._updated_system == self._expected_system_out
 
     def check_update_failed_with_exception(self, message: str, expecting_update_one_called: bool = False) -> None:
@@ -625,7 +1118,7 @@ class UpdateDSL(SystemRepoDSL):
                     "_id": CustomObjectId(self._updated_system_id),
                 },
                 {
-                    "$set": self._system_in.model_dump(),
+                    "$set": self._expected_update_data,
                 },
                 session=None,
             )
@@ -791,6 +1284,9 @@ class DeleteDSL(SystemRepoDSL):
         self.systems_collection.delete_one.assert_called_once_with(
             {"_id": CustomObjectId(self._delete_system_id)}, session=self.mock_session
         )
+        assert self.system_breadcrumbs_cache.version == 0
+        self.check_run_after_commit()
+        assert self.system_breadcrumbs_cache.version == 1
 
     def check_delete_failed_with_exception(self, message: str, expecting_delete_one_called: bool = False) -> None:
         """
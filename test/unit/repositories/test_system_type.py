@@ -8,11 +8,12 @@ Unit tests for the `SystemTypeRepo` repository.
 from test.mock_data import SYSTEM_TYPE_GET_DATA_STORAGE, SYSTEM_TYPE_OUT_DATA_STORAGE, SYSTEM_TYPES_OUT_DATA
 from test.unit.repositories.conftest import RepositoryTestHelpers
 from typing import Optional
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from bson import ObjectId
 
+from inventory_management_system_api.core.cache import VersionedCache
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.exceptions import InvalidObjectIdError
 from inventory_management_system_api.models.system_type import SystemTypeOut
@@ -26,6 +27,8 @@ class SystemTypeRepoDSL:
     system_type_repository: SystemTypeRepo
     system_types_collection: Mock
 
+    system_types_cache: VersionedCache
+
     mock_session = MagicMock()
 
     @pytest.fixture(autouse=True)
@@ -36,11 +39,19 @@ class SystemTypeRepoDSL:
         self.system_type_repository = SystemTypeRepo(database_mock)
         self.system_types_collection = database_mock.system_types
 
+        # Use a separate cache for each test
+        self.system_types_cache = VersionedCache()
+        with patch(
+            "inventory_management_system_api.repositories.system_type.system_types_cache", self.system_types_cache
+        ):
+            yield
+
 
 class GetDSL(SystemTypeRepoDSL):
     """Base class for `get` tests."""
 
     _obtained_system_type_id: str
+    _obtained_session: Optional[MagicMock]
     _expected_system_type_out: Optional[SystemTypeOut]
     _obtained_system_type: Optional[SystemTypeOut]
     _get_exception: pytest.ExceptionInfo
@@ -57,15 +68,17 @@ class GetDSL(SystemTypeRepoDSL):
 
         RepositoryTestHelpers.mock_find_one(self.system_types_collection, system_type_out_data)
 
-    def call_get(self, system_type_id: str) -> None:
+    def call_get(self, system_type_id: str, use_session: bool = True) -> None:
         """
         Calls the `SystemTypeRepo` `get` method with the appropriate data from a prior call to `mock_get`.
 
         :param system_type_id: ID of the system type to be obtained.
+        :param use_session: Whether to pass a session to the `get` method (those without use the cache).
         """
 
         self._obtained_system_type_id = system_type_id
-        self._obtained_system_type = self.system_type_repository.get(system_type_id, session=self.mock_session)
+        self._obtained_session = self.mock_session if use_session else None
+        self._obtained_system_type = self.system_type_repository.get(system_type_id, session=self._obtained_session)
 
     def call_get_expecting_error(self, system_id: str, error_type: type[BaseException]) -> None:
         """
@@ -85,7 +98,7 @@ class GetDSL(SystemTypeRepoDSL):
         """Checks that a prior call to `call_get` worked as expected."""
 
         self.system_types_collection.find_one.assert_called_once_with(
-            {"_id": CustomObjectId(self._obtained_system_type_id)}, session=self.mock_session
+            {"_id": CustomObjectId(self._obtained_system_type_id)}, session=self._obtained_session
         )
         assert self._obtained_system_type == self._expected_system_type_out
 
@@ -138,6 +151,126 @@ class TestGet(GetDSL):
         self.call_get_expecting_error(system_type_id, InvalidObjectIdError)
         self.check_get_failed_with_exception("Invalid ObjectId value 'invalid-id'")
 
+    def test_get_without_session_uses_cache(self):
+        """Test getting a system type without a session only queries the database the first time."""
+
+        system_type_id = str(SYSTEM_TYPE_GET_DATA_STORAGE["id"])
+
+        self.mock_get(SYSTEM_TYPE_OUT_DATA_STORAGE)
+        self.call_get(system_type_id, use_session=False)
+        self.call_get(system_type_id, use_session=False)
+        self.check_get_success()
+
+
+class GetManyDSL(SystemTypeRepoDSL):
+    """Base class for `get_many` tests."""
+
+    _system_type_ids: list[str]
+    _expected_system_types_out: dict[str, SystemTypeOut]
+    _obtained_system_types_out: dict[str, SystemTypeOut]
+    _get_many_session: Optional[MagicMock]
+    _get_many_exception: pytest.ExceptionInfo
+
+    def mock_get_many(self, system_types_out_data: list[dict], number_of_non_existent_ids: int = 0) -> None:
+        """
+        Mocks database methods appropriately to test the `get_many` repo method.
+
+        :param system_types_out_data: List of dictionaries containing the system type data as would be required for a
+                                      `SystemTypeOut` database model for each of the system types that exist.
+        :param number_of_non_existent_ids: Number of additional IDs to request that don't belong to any system type.
+        """
+        expected_system_types_out = [
+            SystemTypeOut(**system_type_out_data) for system_type_out_data in system_types_out_data
+        ]
+        self._expected_system_types_out = {
+            system_type_out.id: system_type_out for system_type_out in expected_system_types_out
+        }
+        self._system_type_ids = [system_type_out.id for system_type_out in expected_system_types_out] + [
+            str(ObjectId()) for _ in range(number_of_non_existent_ids)
+        ]
+
+        RepositoryTestHelpers.mock_find(self.system_types_collection, system_types_out_data)
+
+    def call_get_many(self, use_session: bool = True) -> None:
+        """
+        Calls the `SystemTypeRepo` `get_many` method with the appropriate data from a prior call to `mock_get_many`.
+
+        :param use_session: Whether to pass a session to the `get_many` method (those without use the cache).
+        """
+        self._get_many_session = self.mock_session if use_session else None
+        self._obtained_system_types_out = self.system_type_repository.get_many(
+            self._system_type_ids, session=self._get_many_session
+        )
+
+    def call_get_many_expecting_error(self, system_type_ids: list[str], error_type: type[BaseException]) -> None:
+        """
+        Calls the `SystemTypeRepo` `get_many` method while expecting an error to be raised.
+
+        :param system_type_ids: IDs of the system types to be obtained.
+        :param error_type: Expected exception to be raised.
+        """
+        with pytest.raises(error_type) as exc:
+            self.system_type_repository.get_many(system_type_ids, session=self.mock_session)
+        self._get_many_exception = exc
+
+    def check_get_many_success(self) -> None:
+        """Checks that a prior call to `call_get_many` worked as expected."""
+        self.system_types_collection.find.assert_called_once_with(
+            {"_id": {"$in": [CustomObjectId(system_type_id) for system_type_id in self._system_type_ids]}},
+            session=self._get_many_session,
+        )
+        assert self._obtained_system_types_out == self._expected_system_types_out
+
+    def check_get_many_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_get_many_expecting_error` worked as expected, raising an exception with the
+        correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+        self.system_types_collection.find.assert_not_called()
+        assert str(self._get_many_exception.value) == message
+
+
+class TestGetMany(GetManyDSL):
+    """Tests for getting multiple system types."""
+
+    def test_get_many(self):
+        """Test getting multiple system types."""
+
+        self.mock_get_many(SYSTEM_TYPES_OUT_DATA)
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_non_existent_ids(self):
+        """Test getting multiple system types when some of the IDs don't exist."""
+
+        self.mock_get_many([SYSTEM_TYPE_OUT_DATA_STORAGE], number_of_non_existent_ids=2)
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_no_ids(self):
+        """Test getting multiple system types when no IDs are given."""
+
+        self.mock_get_many([])
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_without_session_uses_cache(self):
+        """Test getting multiple system types without a session only queries the database the first time."""
+
+        self.mock_get_many([SYSTEM_TYPE_OUT_DATA_STORAGE], number_of_non_existent_ids=1)
+        self.call_get_many(use_session=False)
+        self.call_get_many(use_session=False)
+        self.check_get_many_success()
+
+    def test_get_many_with_invalid_id(self):
+        """Test getting multiple system types when one of the IDs is invalid."""
+        system_type_id = "invalid-id"
+
+        self.call_get_many_expecting_error([str(ObjectId()), system_type_id], InvalidObjectIdError)
+        self.check_get_many_failed_with_exception(f"Invalid ObjectId value '{system_type_id}'")
+
 
 class ListDSL(SystemTypeRepoDSL):
     """Base class for `list` tests."""
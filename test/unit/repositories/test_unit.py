@@ -10,11 +10,12 @@ from test.mock_data import (
 )
 from test.unit.repositories.conftest import RepositoryTestHelpers
 from typing import Optional
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from bson import ObjectId
 
+from inventory_management_system_api.core.cache import VersionedCache
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.exceptions import (
     DuplicateRecordError,
@@ -34,6 +35,9 @@ class UnitRepoDSL:
     units_collection: Mock
     catalogue_categories_collection: Mock
 
+    units_cache: VersionedCache
+    mock_run_after_commit: Mock
+
     mock_session = MagicMock()
 
     @pytest.fixture(autouse=True)
@@ -44,7 +48,13 @@ class UnitRepoDSL:
         self.units_collection = database_mock.units
         self.catalogue_categories_collection = database_mock.catalogue_categories
 
-        yield
+        # Use a separate cache for each test
+        self.units_cache = VersionedCache()
+        with patch("inventory_management_system_api.repositories.unit.units_cache", self.units_cache):
+            with patch(
+                "inventory_management_system_api.repositories.unit.run_after_commit"
+            ) as self.mock_run_after_commit:
+                yield
 
 
 class CreateDSL(UnitRepoDSL):
@@ -104,6 +114,7 @@ class CreateDSL(UnitRepoDSL):
         )
 
         assert self._created_unit == self._expected_unit_out
+        self.mock_run_after_commit.assert_called_once_with(self.mock_session, self.units_cache.invalidate)
 
     def check_create_failed_with_exception(self, message: str) -> None:
         """
@@ -136,6 +147,7 @@ class GetDSL(UnitRepoDSL):
     """Base class for `get` tests."""
 
     _obtained_unit_id: str
+    _obtained_session: Optional[MagicMock]
     _expected_unit_out: Optional[UnitOut]
     _obtained_unit_out: UnitOut
     _get_exception: pytest.ExceptionInfo
@@ -157,14 +169,16 @@ class GetDSL(UnitRepoDSL):
             self._expected_unit_out.model_dump() if self._expected_unit_out else None,
         )
 
-    def call_get(self, unit_id: str) -> None:
+    def call_get(self, unit_id: str, use_session: bool = True) -> None:
         """
         Calls the `UnitRepo` `get` method with the appropriate data from a prior call to `mock_get`.
 
         :param unit_id: ID of the unit to be obtained.
+        :param use_session: Whether to pass a session to the `get` method (those without use the cache).
         """
         self._obtained_unit_id = unit_id
-        self._obtained_unit_out = self.unit_repository.get(unit_id, session=self.mock_session)
+        self._obtained_session = self.mock_session if use_session else None
+        self._obtained_unit_out = self.unit_repository.get(unit_id, session=self._obtained_session)
 
     def call_get_expecting_error(self, unit_id: str, error_type: type[BaseException]) -> None:
         """
@@ -181,7 +195,7 @@ class GetDSL(UnitRepoDSL):
     def check_get_success(self) -> None:
         """Checks that a prior call to `call_get` worked as expected."""
         self.units_collection.find_one.assert_called_once_with(
-            {"_id": CustomObjectId(self._obtained_unit_id)}, session=self.mock_session
+            {"_id": CustomObjectId(self._obtained_unit_id)}, session=self._obtained_session
         )
         assert self._obtained_unit_out == self._expected_unit_out
 
@@ -222,6 +236,127 @@ class TestGet(GetDSL):
         self.call_get_expecting_error(unit_id, InvalidObjectIdError)
         self.check_get_failed_with_exception(f"Invalid ObjectId value '{unit_id}'")
 
+    def test_get_without_session_uses_cache(self):
+        """Test getting a unit without a session only queries the database the first time."""
+        unit_id = str(ObjectId())
+
+        self.mock_get(unit_id, UNIT_IN_DATA_MM)
+        self.call_get(unit_id, use_session=False)
+        self.call_get(unit_id, use_session=False)
+        self.check_get_success()
+
+
+class GetManyDSL(UnitRepoDSL):
+    """Base class for `get_many` tests."""
+
+    _unit_ids: list[str]
+    _expected_units_out: dict[str, UnitOut]
+    _obtained_units_out: dict[str, UnitOut]
+    _get_many_session: Optional[MagicMock]
+    _get_many_exception: pytest.ExceptionInfo
+
+    def mock_get_many(self, units_in_data: list[dict], number_of_non_existent_ids: int = 0) -> None:
+        """
+        Mocks database methods appropriately to test the `get_many` repo method.
+
+        :param units_in_data: List of dictionaries containing the unit data as would be required for a `UnitIn` database
+                              model (i.e. no ID or created and modified times required) for each of the units that
+                              exist.
+        :param number_of_non_existent_ids: Number of additional IDs to request that don't belong to any unit.
+        """
+        expected_units_out = [
+            UnitOut(**UnitIn(**unit_in_data).model_dump(), id=ObjectId()) for unit_in_data in units_in_data
+        ]
+        self._expected_units_out = {unit_out.id: unit_out for unit_out in expected_units_out}
+        self._unit_ids = [unit_out.id for unit_out in expected_units_out] + [
+            str(ObjectId()) for _ in range(number_of_non_existent_ids)
+        ]
+
+        RepositoryTestHelpers.mock_find(
+            self.units_collection,
+            [
+                {**unit_out.model_dump(by_alias=True), "_id": CustomObjectId(unit_out.id)}
+                for unit_out in expected_units_out
+            ],
+        )
+
+    def call_get_many(self, use_session: bool = True) -> None:
+        """
+        Calls the `UnitRepo` `get_many` method with the appropriate data from a prior call to `mock_get_many`.
+
+        :param use_session: Whether to pass a session to the `get_many` method (those without use the cache).
+        """
+        self._get_many_session = self.mock_session if use_session else None
+        self._obtained_units_out = self.unit_repository.get_many(self._unit_ids, session=self._get_many_session)
+
+    def call_get_many_expecting_error(self, unit_ids: list[str], error_type: type[BaseException]) -> None:
+        """
+        Calls the `UnitRepo` `get_many` method while expecting an error to be raised.
+
+        :param unit_ids: IDs of the units to be obtained.
+        :param error_type: Expected exception to be raised.
+        """
+        with pytest.raises(error_type) as exc:
+            self.unit_repository.get_many(unit_ids, session=self.mock_session)
+        self._get_many_exception = exc
+
+    def check_get_many_success(self) -> None:
+        """Checks that a prior call to `call_get_many` worked as expected."""
+        self.units_collection.find.assert_called_once_with(
+            {"_id": {"$in": [CustomObjectId(unit_id) for unit_id in self._unit_ids]}}, session=self._get_many_session
+        )
+        assert self._obtained_units_out == self._expected_units_out
+
+    def check_get_many_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_get_many_expecting_error` worked as expected, raising an exception with the
+        correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+        self.units_collection.find.assert_not_called()
+        assert str(self._get_many_exception.value) == message
+
+
+class TestGetMany(GetManyDSL):
+    """Tests for getting multiple units."""
+
+    def test_get_many(self):
+        """Test getting multiple units."""
+
+        self.mock_get_many([UNIT_IN_DATA_MM, UNIT_IN_DATA_CM])
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_non_existent_ids(self):
+        """Test getting multiple units when some of the IDs don't exist."""
+
+        self.mock_get_many([UNIT_IN_DATA_MM], number_of_non_existent_ids=2)
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_no_ids(self):
+        """Test getting multiple units when no IDs are given."""
+
+        self.mock_get_many([])
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_without_session_uses_cache(self):
+        """Test getting multiple units without a session only queries the database the first time."""
+
+        self.mock_get_many([UNIT_IN_DATA_MM], number_of_non_existent_ids=1)
+        self.call_get_many(use_session=False)
+        self.call_get_many(use_session=False)
+        self.check_get_many_success()
+
+    def test_get_many_with_invalid_id(self):
+        """Test getting multiple units when one of the IDs is invalid."""
+        unit_id = "invalid-id"
+
+        self.call_get_many_expecting_error([str(ObjectId()), unit_id], InvalidObjectIdError)
+        self.check_get_many_failed_with_exception(f"Invalid ObjectId value '{unit_id}'")
+
 
 class ListDSL(UnitRepoDSL):
     """Base class for `list` tests."""
@@ -316,6 +451,7 @@ class DeleteDSL(UnitRepoDSL):
         self.units_collection.delete_one.assert_called_once_with(
             {"_id": CustomObjectId(self._delete_unit_id)}, session=self.mock_session
         )
+        self.mock_run_after_commit.assert_called_once_with(self.mock_session, self.units_cache.invalidate)
 
     def check_delete_failed_with_exception(self, message: str, expecting_delete_one_called: bool = False) -> None:
         """
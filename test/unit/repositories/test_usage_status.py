@@ -8,11 +8,12 @@ Unit tests for the `UsageStatusRepo` repository.
 from test.mock_data import ITEM_DATA_NEW_REQUIRED_VALUES_ONLY, USAGE_STATUS_IN_DATA_NEW, USAGE_STATUS_IN_DATA_USED
 from test.unit.repositories.conftest import RepositoryTestHelpers
 from typing import Optional
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from bson import ObjectId
 
+from inventory_management_system_api.core.cache import VersionedCache
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.exceptions import (
     DuplicateRecordError,
@@ -34,6 +35,9 @@ class UsageStatusRepoDSL:
     items_collection: Mock
     rules_collection: Mock
 
+    usage_statuses_cache: VersionedCache
+    mock_run_after_commit: Mock
+
     mock_session = MagicMock()
 
     @pytest.fixture(autouse=True)
@@ -45,7 +49,15 @@ class UsageStatusRepoDSL:
         self.items_collection = database_mock.items
         self.rules_collection = database_mock.rules
 
-        yield
+        # Use a separate cache for each test
+        self.usage_statuses_cache = VersionedCache()
+        with patch(
+            "inventory_management_system_api.repositories.usage_status.usage_statuses_cache", self.usage_statuses_cache
+        ):
+            with patch(
+                "inventory_management_system_api.repositories.usage_status.run_after_commit"
+            ) as self.mock_run_after_commit:
+                yield
 
 
 class CreateDSL(UsageStatusRepoDSL):
@@ -119,6 +131,7 @@ class CreateDSL(UsageStatusRepoDSL):
         )
 
         assert self._created_usage_status == self._expected_usage_status_out
+        self.mock_run_after_commit.assert_called_once_with(self.mock_session, self.usage_statuses_cache.invalidate)
 
     def check_create_failed_with_exception(self, message: str) -> None:
         """
@@ -153,6 +166,7 @@ class GetDSL(UsageStatusRepoDSL):
     """Base class for `get` tests."""
 
     _obtained_usage_status_id: str
+    _obtained_session: Optional[MagicMock]
     _expected_usage_status_out: Optional[UsageStatusOut]
     _obtained_usage_status_out: UsageStatusOut
     _get_exception: pytest.ExceptionInfo
@@ -176,14 +190,18 @@ class GetDSL(UsageStatusRepoDSL):
             self._expected_usage_status_out.model_dump() if self._expected_usage_status_out else None,
         )
 
-    def call_get(self, usage_status_id: str) -> None:
+    def call_get(self, usage_status_id: str, use_session: bool = True) -> None:
         """
         Calls the `UsageStatusRepo` `get` method with the appropriate data from a prior call to `mock_get`.
 
         :param usage_status_id: ID of the usage status to be obtained.
+        :param use_session: Whether to pass a session to the `get` method (those without use the cache).
         """
         self._obtained_usage_status_id = usage_status_id
-        self._obtained_usage_status_out = self.usage_status_repository.get(usage_status_id, session=self.mock_session)
+        self._obtained_session = self.mock_session if use_session else None
+        self._obtained_usage_status_out = self.usage_status_repository.get(
+            usage_status_id, session=self._obtained_session
+        )
 
     def call_get_expecting_error(self, usage_status_id: str, error_type: type[BaseException]) -> None:
         """
@@ -200,7 +218,7 @@ class GetDSL(UsageStatusRepoDSL):
     def check_get_success(self) -> None:
         """Checks that a prior call to `call_get` worked as expected."""
         self.usage_statuses_collection.find_one.assert_called_once_with(
-            {"_id": CustomObjectId(self._obtained_usage_status_id)}, session=self.mock_session
+            {"_id": CustomObjectId(self._obtained_usage_status_id)}, session=self._obtained_session
         )
         assert self._obtained_usage_status_out == self._expected_usage_status_out
 
@@ -241,6 +259,133 @@ class TestGet(GetDSL):
         self.call_get_expecting_error(usage_status_id, InvalidObjectIdError)
         self.check_get_failed_with_exception(f"Invalid ObjectId value '{usage_status_id}'")
 
+    def test_get_without_session_uses_cache(self):
+        """Test getting a usage status without a session only queries the database the first time."""
+        usage_status_id = str(ObjectId())
+
+        self.mock_get(usage_status_id, USAGE_STATUS_IN_DATA_NEW)
+        self.call_get(usage_status_id, use_session=False)
+        self.call_get(usage_status_id, use_session=False)
+        self.check_get_success()
+
+
+class GetManyDSL(UsageStatusRepoDSL):
+    """Base class for `get_many` tests."""
+
+    _usage_status_ids: list[str]
+    _expected_usage_statuses_out: dict[str, UsageStatusOut]
+    _obtained_usage_statuses_out: dict[str, UsageStatusOut]
+    _get_many_session: Optional[MagicMock]
+    _get_many_exception: pytest.ExceptionInfo
+
+    def mock_get_many(self, usage_statuses_in_data: list[dict], number_of_non_existent_ids: int = 0) -> None:
+        """
+        Mocks database methods appropriately to test the `get_many` repo method.
+
+        :param usage_statuses_in_data: List of dictionaries containing the usage status data as would be required for a
+                                       `UsageStatusIn` database model (i.e. no ID or created and modified times
+                                       required) for each of the usage statuses that exist.
+        :param number_of_non_existent_ids: Number of additional IDs to request that don't belong to any usage status.
+        """
+        expected_usage_statuses_out = [
+            UsageStatusOut(**UsageStatusIn(**usage_status_in_data).model_dump(), id=ObjectId())
+            for usage_status_in_data in usage_statuses_in_data
+        ]
+        self._expected_usage_statuses_out = {
+            usage_status_out.id: usage_status_out for usage_status_out in expected_usage_statuses_out
+        }
+        self._usage_status_ids = [usage_status_out.id for usage_status_out in expected_usage_statuses_out] + [
+            str(ObjectId()) for _ in range(number_of_non_existent_ids)
+        ]
+
+        RepositoryTestHelpers.mock_find(
+            self.usage_statuses_collection,
+            [
+                {**usage_status_out.model_dump(by_alias=True), "_id": CustomObjectId(usage_status_out.id)}
+                for usage_status_out in expected_usage_statuses_out
+            ],
+        )
+
+    def call_get_many(self, use_session: bool = True) -> None:
+        """
+        Calls the `UsageStatusRepo` `get_many` method with the appropriate data from a prior call to `mock_get_many`.
+
+        :param use_session: Whether to pass a session to the `get_many` method (those without use the cache).
+        """
+        self._get_many_session = self.mock_session if use_session else None
+        self._obtained_usage_statuses_out = self.usage_status_repository.get_many(
+            self._usage_status_ids, session=self._get_many_session
+        )
+
+    def call_get_many_expecting_error(self, usage_status_ids: list[str], error_type: type[BaseException]) -> None:
+        """
+        Calls the `UsageStatusRepo` `get_many` method while expecting an error to be raised.
+
+        :param usage_status_ids: IDs of the usage statuses to be obtained.
+        :param error_type: Expected exception to be raised.
+        """
+        with pytest.raises(error_type) as exc:
+            self.usage_status_repository.get_many(usage_status_ids, session=self.mock_session)
+        self._get_many_exception = exc
+
+    def check_get_many_success(self) -> None:
+        """Checks that a prior call to `call_get_many` worked as expected."""
+        self.usage_statuses_collection.find.assert_called_once_with(
+            {"_id": {"$in": [CustomObjectId(usage_status_id) for usage_status_id in self._usage_status_ids]}},
+            session=self._get_many_session,
+        )
+        assert self._obtained_usage_statuses_out == self._expected_usage_statuses_out
+
+    def check_get_many_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_get_many_expecting_error` worked as expected, raising an exception with the
+        correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+        self.usage_statuses_collection.find.assert_not_called()
+        assert str(self._get_many_exception.value) == message
+
+
+class TestGetMany(GetManyDSL):
+    """Tests for getting multiple usage statuses."""
+
+    def test_get_many(self):
+        """Test getting multiple usage statuses."""
+
+        self.mock_get_many([USAGE_STATUS_IN_DATA_NEW, USAGE_STATUS_IN_DATA_USED])
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_non_existent_ids(self):
+        """Test getting multiple usage statuses when some of the IDs don't exist."""
+
+        self.mock_get_many([USAGE_STATUS_IN_DATA_NEW], number_of_non_existent_ids=2)
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_with_no_ids(self):
+        """Test getting multiple usage statuses when no IDs are given."""
+
+        self.mock_get_many([])
+        self.call_get_many()
+        self.check_get_many_success()
+
+    def test_get_many_without_session_uses_cache(self):
+        """Test getting multiple usage statuses without a session only queries the database the first time."""
+
+        self.mock_get_many([USAGE_STATUS_IN_DATA_NEW], number_of_non_existent_ids=1)
+        self.call_get_many(use_session=False)
+        self.call_get_many(use_session=False)
+        self.check_get_many_success()
+
+    def test_get_many_with_invalid_id(self):
+        """Test getting multiple usage statuses when one of the IDs is invalid."""
+        usage_status_id = "invalid-id"
+
+        self.call_get_many_expecting_error([str(ObjectId()), usage_status_id], InvalidObjectIdError)
+        self.check_get_many_failed_with_exception(f"Invalid ObjectId value '{usage_status_id}'")
+
 
 class ListDSL(UsageStatusRepoDSL):
     """Base class for `list` tests."""
@@ -342,6 +487,7 @@ class DeleteDSL(UsageStatusRepoDSL):
         self.usage_statuses_collection.delete_one.assert_called_once_with(
             {"_id": CustomObjectId(self._delete_usage_status_id)}, session=self.mock_session
         )
+        self.mock_run_after_commit.assert_called_once_with(self.mock_session, self.usage_statuses_cache.invalidate)
 
     def check_delete_failed_with_exception(self, message: str, expecting_delete_one_called: bool = False) -> None:
         """
@@ -2,55 +2,89 @@
 Unit tests for the `utils` in /repositories
 """
 
+from typing import Optional
 from unittest.mock import MagicMock
 
 import pytest
 from bson import ObjectId
 
+from inventory_management_system_api.core.cache import VersionedCache
 from inventory_management_system_api.core.consts import BREADCRUMBS_TRAIL_MAX_LENGTH
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.exceptions import (
     DatabaseIntegrityError,
+    InvalidCursorError,
     InvalidObjectIdError,
     MissingRecordError,
 )
+from inventory_management_system_api.core.filtering import Filter, FilterOperator, Sort
+from inventory_management_system_api.core.pagination import encode_cursor
 from inventory_management_system_api.repositories import utils
-
-MOCK_BREADCRUMBS_QUERY_RESULT_LESS_THAN_MAX_LENGTH = [
-    {
-        "result": [
-            {"_id": f"entity-id-{i}", "name": f"entity-name-{i}", "parent_id": None if i == 0 else f"entity-id-{i-1}"}
-            for i in range(0, BREADCRUMBS_TRAIL_MAX_LENGTH)
-        ]
-    }
-]
-MOCK_BREADCRUMBS_QUERY_RESULT_GREATER_THAN_MAX_LENGTH = [
-    {
-        "result": [
-            {"_id": f"entity-id-{i}", "name": f"entity-name-{i}", "parent_id": f"entity-id-{i-1}"}
-            for i in range(10, 10 + BREADCRUMBS_TRAIL_MAX_LENGTH)
-        ]
-    }
-]
-MOCK_BREADCRUMBS_QUERY_RESULT_NON_EXISTENT_ID = [{"result": []}]
-MOCK_BREADCRUMBS_QUERY_RESULT_INVALID_PARENT_IN_DB = [
-    {
-        "result": [
-            {"_id": f"entity-id-{i}", "name": f"entity-name-{i}", "parent_id": f"entity-id-{i-1}"}
-            for i in range(10, 8 + BREADCRUMBS_TRAIL_MAX_LENGTH)
-        ]
-    }
-]
-
-MOCK_MOVE_QUERY_RESULT_VALID = [
-    {"result": [{"_id": f"entity-id-{i}", "parent_id": None if i == 0 else f"entity-id-{i-1}"} for i in range(0, 5)]}
-]
-
-MOCK_MOVE_QUERY_RESULT_INVALID = [
-    {"result": [{"_id": f"entity-id-{i}", "parent_id": f"entity-id-{i-1}"} for i in range(10, 15)]}
-]
-
-MOCK_MOVE_QUERY_RESULT_NON_EXISTENT_ID = [{"result": []}]
+from inventory_management_system_api.schemas.breadcrumbs import BreadcrumbsGetSchema
+
+
+def _create_mock_breadcrumbs_query_result(entity_numbers: range, top_level: bool, missing_ancestors: int = 0) -> list:
+    """
+    Creates a mock result of running the query returned by `create_breadcrumbs_aggregation_pipeline`.
+
+    :param entity_numbers: Numbers of the entities in the trail in order from the top level down, the last being the
+                           entity the breadcrumbs are for.
+    :param top_level: Whether the first entity in the trail is at the top level (i.e. has no parent).
+    :param missing_ancestors: Number of ancestors to omit from the looked up ancestors as if they don't exist.
+    :return: The mock query result.
+    """
+    elements = [
+        {
+            "_id": f"entity-id-{i}",
+            "name": f"entity-name-{i}",
+            "parent_id": None if top_level and i == entity_numbers[0] else f"entity-id-{i-1}",
+        }
+        for i in entity_numbers
+    ]
+    return [
+        {
+            **elements[-1],
+            "ancestor_ids": [element["_id"] for element in elements[:-1]],
+            # Lookups don't preserve order so reverse them to ensure they are reordered
+            "ancestors": list(reversed(elements[missing_ancestors:-1])),
+        }
+    ]
+
+
+def _create_mock_many_breadcrumbs_query_result(*breadcrumbs_query_results: list) -> list:
+    """
+    Creates a mock result of running the query returned by `create_many_breadcrumbs_aggregation_pipeline` by combining
+    mock results of running the query returned by `create_breadcrumbs_aggregation_pipeline`.
+
+    :param breadcrumbs_query_results: Mock results for each of the entities to combine.
+    :return: The mock query result.
+    """
+    entities = [result[0] for result in breadcrumbs_query_results]
+    return [
+        {
+            "_id": None,
+            "entities": [{key: value for key, value in entity.items() if key != "ancestors"} for entity in entities],
+            # Each ancestor is only looked up once
+            "ancestors": list(
+                {ancestor["_id"]: ancestor for entity in entities for ancestor in entity["ancestors"]}.values()
+            ),
+        }
+    ]
+
+
+MOCK_BREADCRUMBS_QUERY_RESULT_LESS_THAN_MAX_LENGTH = _create_mock_breadcrumbs_query_result(
+    range(0, BREADCRUMBS_TRAIL_MAX_LENGTH), top_level=True
+)
+MOCK_BREADCRUMBS_QUERY_RESULT_GREATER_THAN_MAX_LENGTH = _create_mock_breadcrumbs_query_result(
+    range(10, 10 + BREADCRUMBS_TRAIL_MAX_LENGTH), top_level=False
+)
+MOCK_BREADCRUMBS_QUERY_RESULT_NON_EXISTENT_ID = []
+MOCK_BREADCRUMBS_QUERY_RESULT_INVALID_PARENT_IN_DB = _create_mock_breadcrumbs_query_result(
+    range(10, 8 + BREADCRUMBS_TRAIL_MAX_LENGTH), top_level=False
+)
+MOCK_BREADCRUMBS_QUERY_RESULT_MISSING_ANCESTOR_IN_DB = _create_mock_breadcrumbs_query_result(
+    range(0, BREADCRUMBS_TRAIL_MAX_LENGTH), top_level=True, missing_ancestors=1
+)
 
 
 class TestListQuery:
@@ -75,6 +109,187 @@ class TestListQuery:
         assert str(exc.value) == f"Invalid ObjectId value '{id_fields["id1"]}'"
 
 
+class TestIdsQuery:
+    """Test `ids_query` functions correctly."""
+
+    def test_ids_query(self):
+        """Tests that `ids_query` functions correctly when given valid ID values."""
+
+        entity_ids = [str(ObjectId()), str(ObjectId())]
+        result = utils.ids_query(entity_ids, entity_type="test")
+
+        assert result == {"_id": {"$in": [CustomObjectId(entity_id) for entity_id in entity_ids]}}
+
+    def test_ids_query_with_invalid_id(self):
+        """Tests that `ids_query` raises an error when a given ID is invalid."""
+
+        entity_ids = [str(ObjectId()), "invalid_id"]
+
+        with pytest.raises(InvalidObjectIdError) as exc:
+            utils.ids_query(entity_ids, entity_type="test")
+
+        assert str(exc.value) == f"Invalid ObjectId value '{entity_ids[1]}'"
+
+
+class TestPaginateQuery:
+    """Test `paginate_query` functions correctly."""
+
+    def test_paginate_query_without_limit_or_cursor(self):
+        """Tests that `paginate_query` leaves the query unmodified when neither a limit or cursor are given."""
+
+        query = {"id1": ObjectId()}
+
+        assert utils.paginate_query(query, None, None) == (query, {})
+
+    def test_paginate_query_with_limit(self):
+        """Tests that `paginate_query` sorts and limits the query when given a limit."""
+
+        query = {"id1": ObjectId()}
+
+        assert utils.paginate_query(query, 10, None) == (query, {"sort": [("_id", 1)], "limit": 10})
+
+    def test_paginate_query_with_limit_and_cursor(self):
+        """Tests that `paginate_query` only returns documents after the cursor when given one."""
+
+        query = {"id1": ObjectId()}
+        last_id = ObjectId()
+
+        assert utils.paginate_query(query, 10, encode_cursor(str(last_id))) == (
+            {**query, "_id": {"$gt": last_id}},
+            {"sort": [("_id", 1)], "limit": 10},
+        )
+
+    def test_paginate_query_with_invalid_cursor(self):
+        """Tests that `paginate_query` raises an error when the given cursor is invalid."""
+
+        with pytest.raises(InvalidCursorError) as exc:
+            utils.paginate_query({}, 10, "invalid-cursor")
+
+        assert str(exc.value) == "Invalid cursor 'invalid-cursor'"
+
+    def test_paginate_query_with_sort(self):
+        """Tests that `paginate_query` sorts by the sort field followed by `_id` when given a sort order."""
+
+        query = {"id1": ObjectId()}
+
+        assert utils.paginate_query(query, None, None, Sort("name")) == (
+            query,
+            {"sort": [("name", 1), ("_id", 1)]},
+        )
+
+    def test_paginate_query_with_descending_sort_limit_and_cursor(self):
+        """Tests that `paginate_query` only returns documents after the cursor when sorting in descending order."""
+
+        query = {"id1": ObjectId()}
+        last_id = ObjectId()
+
+        assert utils.paginate_query(
+            query,
+            10,
+            encode_cursor(str(last_id), Sort("name", descending=True), "Name B"),
+            Sort("name", descending=True),
+        ) == (
+            {
+                **query,
+                "$or": [{"name": {"$lt": "Name B"}}, {"name": "Name B", "_id": {"$lt": last_id}}, {"name": None}],
+            },
+            {"sort": [("name", -1), ("_id", -1)], "limit": 10},
+        )
+
+    def test_paginate_query_with_ascending_sort_and_cursor_with_none_value(self):
+        """Tests that `paginate_query` handles a cursor without a sort value when sorting in ascending order."""
+
+        last_id = ObjectId()
+
+        assert utils.paginate_query(
+            {}, 10, encode_cursor(str(last_id), Sort("delivered_date"), None), Sort("delivered_date")
+        ) == (
+            {"$or": [{"delivered_date": {"$ne": None}}, {"delivered_date": None, "_id": {"$gt": last_id}}]},
+            {"sort": [("delivered_date", 1), ("_id", 1)], "limit": 10},
+        )
+
+    def test_paginate_query_with_descending_sort_and_cursor_with_none_value(self):
+        """Tests that `paginate_query` handles a cursor without a sort value when sorting in descending order."""
+
+        last_id = ObjectId()
+
+        assert utils.paginate_query(
+            {},
+            10,
+            encode_cursor(str(last_id), Sort("delivered_date", descending=True), None),
+            Sort("delivered_date", descending=True),
+        ) == (
+            {"delivered_date": None, "_id": {"$lt": last_id}},
+            {"sort": [("delivered_date", -1), ("_id", -1)], "limit": 10},
+        )
+
+    def test_paginate_query_with_sort_and_cursor_for_opposite_direction(self):
+        """Tests that `paginate_query` raises an error when the given cursor was created for the opposite direction."""
+
+        cursor = encode_cursor(str(ObjectId()), Sort("name"), "Name B")
+
+        with pytest.raises(InvalidCursorError) as exc:
+            utils.paginate_query({}, 10, cursor, Sort("name", descending=True))
+
+        assert str(exc.value) == f"Invalid cursor '{cursor}'"
+
+    def test_paginate_query_with_sort_and_cursor_for_different_sort(self):
+        """Tests that `paginate_query` raises an error when the given cursor was created for a different sort order."""
+
+        cursor = encode_cursor(str(ObjectId()))
+
+        with pytest.raises(InvalidCursorError) as exc:
+            utils.paginate_query({}, 10, cursor, Sort("name"))
+
+        assert str(exc.value) == f"Invalid cursor '{cursor}'"
+
+
+class TestCreateFilterQuery:
+    """Test `create_filter_query` functions correctly."""
+
+    def test_create_filter_query(self):
+        """Tests that `create_filter_query` returns the expected query, combining filters on the same field."""
+
+        usage_status_id = CustomObjectId(str(ObjectId()))
+        catalogue_item_ids = [CustomObjectId(str(ObjectId())), CustomObjectId(str(ObjectId()))]
+
+        assert utils.create_filter_query(
+            [
+                Filter("usage_status_id", FilterOperator.NE, usage_status_id),
+                Filter("catalogue_item_id", FilterOperator.IN, catalogue_item_ids),
+                Filter("is_defective", FilterOperator.EQ, True),
+                Filter("delivered_date", FilterOperator.GTE, "2024-01-01"),
+                Filter("delivered_date", FilterOperator.LT, "2024-02-01"),
+            ]
+        ) == {
+            "usage_status_id": {"$ne": usage_status_id},
+            "catalogue_item_id": {"$in": catalogue_item_ids},
+            "is_defective": {"$eq": True},
+            "delivered_date": {"$gte": "2024-01-01", "$lt": "2024-02-01"},
+        }
+
+    def test_create_filter_query_without_filters(self):
+        """Tests that `create_filter_query` returns an empty query when there are no filters."""
+
+        assert not utils.create_filter_query([])
+
+
+class TestCreateProjection:
+    """Test `create_projection` functions correctly."""
+
+    def test_create_projection_without_fields(self):
+        """Tests that `create_projection` returns no projection when all fields are requested."""
+
+        assert not utils.create_projection(None)
+
+    def test_create_projection_with_fields(self):
+        """Tests that `create_projection` returns a projection of the requested fields, mapping `id` to `_id`."""
+
+        assert utils.create_projection(["id", "name", "parent_id"]) == {
+            "projection": {"_id": 1, "name": 1, "parent_id": 1}
+        }
+
+
 class TestCreateBreadcrumbsAggregationPipeline:
     """Test `create_breadcrumbs_aggregation_pipeline` functions correctly."""
 
@@ -112,10 +327,7 @@ class TestComputeBreadcrumbs:
         """Test `compute_breadcrumbs` functions correctly."""
         self._test_compute_breadcrumbs(
             breadcrumb_query_result=MOCK_BREADCRUMBS_QUERY_RESULT_LESS_THAN_MAX_LENGTH,
-            expected_trail=[
-                (entity["_id"], entity["name"])
-                for entity in MOCK_BREADCRUMBS_QUERY_RESULT_LESS_THAN_MAX_LENGTH[0]["result"]
-            ],
+            expected_trail=[(f"entity-id-{i}", f"entity-name-{i}") for i in range(0, BREADCRUMBS_TRAIL_MAX_LENGTH)],
             expected_full_trail=True,
         )
 
@@ -124,8 +336,7 @@ class TestComputeBreadcrumbs:
         self._test_compute_breadcrumbs(
             breadcrumb_query_result=MOCK_BREADCRUMBS_QUERY_RESULT_GREATER_THAN_MAX_LENGTH,
             expected_trail=[
-                (entity["_id"], entity["name"])
-                for entity in MOCK_BREADCRUMBS_QUERY_RESULT_GREATER_THAN_MAX_LENGTH[0]["result"]
+                (f"entity-id-{i}", f"entity-name-{i}") for i in range(10, 10 + BREADCRUMBS_TRAIL_MAX_LENGTH)
             ],
             expected_full_trail=False,
         )
@@ -161,51 +372,238 @@ class TestComputeBreadcrumbs:
             f"'{collection_name}'"
         )
 
+    def test_compute_breadcrumbs_when_missing_ancestor_in_db(self):
+        """Test `compute_breadcrumbs` functions correctly when one of the ancestors is missing from the database."""
+        entity_id = str(ObjectId())
+        collection_name = MagicMock()
 
-class TestCreateMoveCheckAggregationPipeline:
-    """Test `create_move_check_aggregation_pipeline` functions correctly"""
+        with pytest.raises(DatabaseIntegrityError) as exc:
+            utils.compute_breadcrumbs(
+                entity_id=entity_id,
+                breadcrumb_query_result=MOCK_BREADCRUMBS_QUERY_RESULT_MISSING_ANCESTOR_IN_DB,
+                collection_name=collection_name,
+            )
 
-    # Only test errors here - exact query tested in e2e test
-    def test_create_move_check_aggregation_pipeline_when_entity_id_is_invalid(self):
-        """Tests that `create_move_check_aggregation_pipeline` raises an error when the given entity id is invalid."""
+        assert str(exc.value) == (
+            f"Unable to locate full trail for entity with id '{entity_id}' from the database collection "
+            f"'{collection_name}'"
+        )
+
+
+class TestCreateManyBreadcrumbsAggregationPipeline:
+    """Test `create_many_breadcrumbs_aggregation_pipeline` functions correctly."""
+
+    # Only test error here - exact query tested in e2e test
+    def test_create_many_breadcrumbs_aggregation_pipeline_when_entity_id_is_invalid(self):
+        """Tests that `create_many_breadcrumbs_aggregation_pipeline` raises an error when any of the given entity ids
+        are invalid."""
         entity_id = "invalid"
-        destination_id = str(ObjectId())
         collection_name = MagicMock()
 
         with pytest.raises(InvalidObjectIdError) as exc:
-            utils.create_move_check_aggregation_pipeline(
-                entity_id=entity_id, destination_id=destination_id, collection_name=collection_name
+            utils.create_many_breadcrumbs_aggregation_pipeline(
+                entity_ids=[str(ObjectId()), entity_id], collection_name=collection_name
             )
 
         assert str(exc.value) == f"Invalid ObjectId value '{entity_id}'"
 
-    def test_create_move_check_aggregation_pipeline_when_destination_id_is_invalid(self):
-        """Tests that `create_move_check_aggregation_pipeline` raises an error when the given destination id is
-        invalid."""
-        entity_id = str(ObjectId())
-        destination_id = "invalid"
+
+class TestComputeManyBreadcrumbs:
+    """Test `compute_many_breadcrumbs` functions correctly."""
+
+    def test_compute_many_breadcrumbs(self):
+        """Test `compute_many_breadcrumbs` functions correctly when the trails share ancestors."""
         collection_name = MagicMock()
 
-        with pytest.raises(InvalidObjectIdError) as exc:
-            utils.create_move_check_aggregation_pipeline(
-                entity_id=entity_id, destination_id=destination_id, collection_name=collection_name
+        result = utils.compute_many_breadcrumbs(
+            _create_mock_many_breadcrumbs_query_result(
+                _create_mock_breadcrumbs_query_result(range(0, 3), top_level=True),
+                _create_mock_breadcrumbs_query_result(range(0, 2), top_level=True),
+                MOCK_BREADCRUMBS_QUERY_RESULT_GREATER_THAN_MAX_LENGTH,
+            ),
+            collection_name=collection_name,
+        )
+
+        assert {
+            entity_id: (breadcrumbs.trail, breadcrumbs.full_trail) for entity_id, breadcrumbs in result.items()
+        } == {
+            "entity-id-2": ([(f"entity-id-{i}", f"entity-name-{i}") for i in range(0, 3)], True),
+            "entity-id-1": ([(f"entity-id-{i}", f"entity-name-{i}") for i in range(0, 2)], True),
+            f"entity-id-{9 + BREADCRUMBS_TRAIL_MAX_LENGTH}": (
+                [(f"entity-id-{i}", f"entity-name-{i}") for i in range(10, 10 + BREADCRUMBS_TRAIL_MAX_LENGTH)],
+                False,
+            ),
+        }
+
+    def test_compute_many_breadcrumbs_when_no_entities_found(self):
+        """Test `compute_many_breadcrumbs` functions correctly when none of the entities are found in the database."""
+        assert utils.compute_many_breadcrumbs([], collection_name=MagicMock()) == {}
+
+    def test_compute_many_breadcrumbs_when_missing_ancestor_in_db(self):
+        """Test `compute_many_breadcrumbs` functions correctly when one of the ancestors is missing from the
+        database."""
+        collection_name = MagicMock()
+
+        with pytest.raises(DatabaseIntegrityError) as exc:
+            utils.compute_many_breadcrumbs(
+                _create_mock_many_breadcrumbs_query_result(MOCK_BREADCRUMBS_QUERY_RESULT_MISSING_ANCESTOR_IN_DB),
+                collection_name=collection_name,
+            )
+
+        assert str(exc.value) == (
+            f"Unable to locate full trail for entity with id 'entity-id-{BREADCRUMBS_TRAIL_MAX_LENGTH - 1}' from the "
+            f"database collection '{collection_name}'"
+        )
+
+
+class TestInvalidateBreadcrumbsForChange:
+    """Test `invalidate_breadcrumbs_for_change` functions correctly."""
+
+    # Cached breadcrumbs of a top level entity, a child of it and an unrelated entity
+    parent_id = CustomObjectId(str(ObjectId()))
+    child_id = CustomObjectId(str(ObjectId()))
+    unrelated_id = CustomObjectId(str(ObjectId()))
+    breadcrumbs = {
+        parent_id: BreadcrumbsGetSchema(trail=[(str(parent_id), "parent")], full_trail=True),
+        child_id: BreadcrumbsGetSchema(trail=[(str(parent_id), "parent"), (str(child_id), "child")], full_trail=True),
+        unrelated_id: BreadcrumbsGetSchema(trail=[(str(unrelated_id), "unrelated")], full_trail=True),
+    }
+
+    def _test_invalidate_breadcrumbs_for_change(self, change: Optional[dict], expected_invalidated_ids: list) -> None:
+        """Utility function to test `invalidate_breadcrumbs_for_change` discards the expected cached breadcrumbs
+        given a change."""
+        breadcrumbs_cache = VersionedCache()
+        for entity_id, breadcrumbs in self.breadcrumbs.items():
+            breadcrumbs_cache.get_or_load(entity_id, lambda breadcrumbs=breadcrumbs: breadcrumbs)
+
+        utils.invalidate_breadcrumbs_for_change(breadcrumbs_cache, change)
+
+        for entity_id, breadcrumbs in self.breadcrumbs.items():
+            assert breadcrumbs_cache.get_or_load(entity_id, lambda: "reloaded") == (
+                "reloaded" if entity_id in expected_invalidated_ids else breadcrumbs
             )
 
-        assert str(exc.value) == f"Invalid ObjectId value '{destination_id}'"
+    def test_invalidate_breadcrumbs_for_change_when_renamed(self):
+        """Test `invalidate_breadcrumbs_for_change` discards the breadcrumbs of an entity and any containing it in
+        their trail when it is renamed."""
+        self._test_invalidate_breadcrumbs_for_change(
+            {
+                "operationType": "update",
+                "documentKey": {"_id": ObjectId(self.parent_id)},
+                "updateDescription": {"updatedFields": {"name": "new name", "code": "new-name"}, "removedFields": []},
+            },
+            [self.parent_id, self.child_id],
+        )
+
+    def test_invalidate_breadcrumbs_for_change_when_moved(self):
+        """Test `invalidate_breadcrumbs_for_change` discards the breadcrumbs of an entity when its ancestors are
+        modified."""
+        self._test_invalidate_breadcrumbs_for_change(
+            {
+                "operationType": "update",
+                "documentKey": {"_id": ObjectId(self.child_id)},
+                "updateDescription": {"updatedFields": {"ancestor_ids.0": ObjectId()}, "removedFields": []},
+            },
+            [self.child_id],
+        )
+
+    def test_invalidate_breadcrumbs_for_change_when_other_fields_updated(self):
+        """Test `invalidate_breadcrumbs_for_change` doesn't discard anything when the fields that were updated don't
+        affect any breadcrumbs."""
+        self._test_invalidate_breadcrumbs_for_change(
+            {
+                "operationType": "update",
+                "documentKey": {"_id": ObjectId(self.parent_id)},
+                "updateDescription": {"updatedFields": {"description": "new description"}, "removedFields": []},
+            },
+            [],
+        )
+
+    def test_invalidate_breadcrumbs_for_change_when_deleted(self):
+        """Test `invalidate_breadcrumbs_for_change` discards the breadcrumbs of an entity when it is deleted."""
+        self._test_invalidate_breadcrumbs_for_change(
+            {"operationType": "delete", "documentKey": {"_id": ObjectId(self.unrelated_id)}}, [self.unrelated_id]
+        )
+
+    def test_invalidate_breadcrumbs_for_change_without_document(self):
+        """Test `invalidate_breadcrumbs_for_change` discards all breadcrumbs when the change isn't for a specific
+        document e.g. when the collection is dropped."""
+        self._test_invalidate_breadcrumbs_for_change(
+            {"operationType": "drop"}, [self.parent_id, self.child_id, self.unrelated_id]
+        )
 
+    def test_invalidate_breadcrumbs_for_change_when_change_unknown(self):
+        """Test `invalidate_breadcrumbs_for_change` discards all breadcrumbs when no change is given."""
+        self._test_invalidate_breadcrumbs_for_change(None, [self.parent_id, self.child_id, self.unrelated_id])
 
-class TestIsValidMoveResult:
-    """Test `is_valid_move_result` functions correctly."""
 
-    def test_is_valid_move_result_when_valid(self):
-        """Test `is_valid_move_result` functions correctly when the result is valid."""
-        assert utils.is_valid_move_result(MOCK_MOVE_QUERY_RESULT_VALID) is True
+class TestCreateSubtreeQuery:
+    """Test `create_subtree_query` functions correctly."""
+
+    def test_create_subtree_query(self):
+        """Test `create_subtree_query` matches the entity and all of its descendants."""
+        entity_id = str(ObjectId())
+
+        assert utils.create_subtree_query(entity_id, None) == {
+            "$or": [{"_id": CustomObjectId(entity_id)}, {"ancestor_ids": CustomObjectId(entity_id)}]
+        }
+
+    def test_create_subtree_query_with_max_depth(self):
+        """Test `create_subtree_query` only matches descendants up to the given depth when a maximum is given."""
+        entity_id = str(ObjectId())
+
+        query = utils.create_subtree_query(entity_id, 2)
+
+        assert query["$or"][0] == {"_id": CustomObjectId(entity_id)}
+        assert query["$or"][1]["ancestor_ids"] == CustomObjectId(entity_id)
+        assert query["$or"][1]["$expr"]["$lte"][1] == 2
+
+    def test_create_subtree_query_when_entity_id_is_invalid(self):
+        """Test `create_subtree_query` raises an error when the given entity id is invalid."""
+        entity_id = "invalid"
 
-    def test_is_valid_move_result_when_invalid(self):
-        """Test `is_valid_move_result` functions correctly when the result is invalid."""
-        assert utils.is_valid_move_result(MOCK_MOVE_QUERY_RESULT_INVALID) is False
+        with pytest.raises(InvalidObjectIdError) as exc:
+            utils.create_subtree_query(entity_id, None)
+
+        assert str(exc.value) == f"Invalid ObjectId value '{entity_id}'"
+
+
+class TestComputeAncestorIds:
+    """Test `compute_ancestor_ids` functions correctly."""
+
+    def test_compute_ancestor_ids(self):
+        """Test `compute_ancestor_ids` appends the parent to its own ancestors."""
+        parent_ancestor_ids = [str(ObjectId()), str(ObjectId())]
+        parent_id = str(ObjectId())
+
+        assert utils.compute_ancestor_ids(parent_id, parent_ancestor_ids) == [
+            CustomObjectId(parent_ancestor_ids[0]),
+            CustomObjectId(parent_ancestor_ids[1]),
+            CustomObjectId(parent_id),
+        ]
+
+    def test_compute_ancestor_ids_with_top_level_parent(self):
+        """Test `compute_ancestor_ids` functions correctly when the parent is at the top level."""
+        parent_id = str(ObjectId())
+
+        assert utils.compute_ancestor_ids(parent_id, []) == [CustomObjectId(parent_id)]
+
+
+class TestIsValidMove:
+    """Test `is_valid_move` functions correctly."""
+
+    def test_is_valid_move_when_valid(self):
+        """Test `is_valid_move` functions correctly when the destination is unrelated to the entity."""
+        assert utils.is_valid_move(str(ObjectId()), str(ObjectId()), [str(ObjectId()), str(ObjectId())]) is True
+
+    def test_is_valid_move_when_destination_is_child(self):
+        """Test `is_valid_move` functions correctly when the destination is a child of the entity."""
+        entity_id = str(ObjectId())
+
+        assert utils.is_valid_move(entity_id, str(ObjectId()), [str(ObjectId()), entity_id]) is False
+
+    def test_is_valid_move_when_destination_is_entity(self):
+        """Test `is_valid_move` functions correctly when the destination is the entity itself."""
+        entity_id = str(ObjectId())
 
-    def test_is_valid_move_result_when_entity_not_found(self):
-        """Test `is_valid_move_result` functions correctly when the entity ID doesn't exist in the database to begin
-        with."""
-        assert utils.is_valid_move_result(MOCK_MOVE_QUERY_RESULT_NON_EXISTENT_ID) is False
+        assert utils.is_valid_move(entity_id, entity_id, []) is False
@@ -271,19 +271,15 @@ def fixture_system_type_service(system_type_repository_mock: Mock) -> SystemType
 
 
 @pytest.fixture(name="system_service")
-def fixture_system_service(
-    system_repository_mock: Mock, system_type_repository_mock: Mock, setting_repository_mock: Mock
-) -> SystemService:
+def fixture_system_service(system_repository_mock: Mock, system_type_repository_mock: Mock) -> SystemService:
     """
-    Fixture to create a `SystemService` instance with mocked `SystemRepo`, `SystemTypeRepo` and `SettingRepo`
-    dependencies.
+    Fixture to create a `SystemService` instance with mocked `SystemRepo` and `SystemTypeRepo` dependencies.
 
     :param system_repository_mock: Mocked `SystemRepo` instance.
     :param system_type_repository_mock: Mocked `SystemTypeRepo` instance.
-    :param setting_repository_mock: Mocked `SettingRepo` instance.
     :return: `SystemService` instance with the mocked dependencies.
     """
-    return SystemService(system_repository_mock, system_type_repository_mock, setting_repository_mock)
+    return SystemService(system_repository_mock, system_type_repository_mock)
 
 
 @pytest.fixture(name="unit_service")
@@ -392,6 +388,37 @@ class ServiceTestHelpers:
             repo_objs.append(repo_obj)
             repository_mock.get.side_effect = repo_objs
 
+    @staticmethod
+    def mock_get_many(
+        repository_mock: Mock,
+        repo_objs: dict[
+            str,
+            Union[
+                CatalogueCategoryOut,
+                CatalogueItemOut,
+                ItemOut,
+                ManufacturerOut,
+                SystemTypeOut,
+                SystemOut,
+                UnitOut,
+                UsageStatusOut,
+            ],
+        ],
+    ) -> None:
+        """
+        Mock the `get_many` method of the repository mock to return a specific dictionary of repository objects.
+
+        :param repository_mock: Mocked repository instance.
+        :param repo_objs: The dictionary of repository objects with their IDs as keys to be returned by the `get_many`
+                          method.
+        """
+        if repository_mock.get_many.side_effect is None:
+            repository_mock.get_many.side_effect = [repo_objs]
+        else:
+            repo_objs_list = list(repository_mock.get_many.side_effect)
+            repo_objs_list.append(repo_objs)
+            repository_mock.get_many.side_effect = repo_objs_list
+
     @staticmethod
     def mock_get_breadcrumbs(repository_mock: Mock, breadcrumbs_obj: Union[BreadcrumbsGetSchema, None]) -> None:
         """
@@ -47,6 +47,7 @@ class CatalogueCategoryServiceDSL(BaseCatalogueServiceDSL):
     wrapped_utils: Mock
     mock_catalogue_category_repository: Mock
     mock_unit_repository: Mock
+    mock_start_session_transaction: Mock
     catalogue_category_service: CatalogueCategoryService
 
     @pytest.fixture(autouse=True)
@@ -66,8 +67,12 @@ class CatalogueCategoryServiceDSL(BaseCatalogueServiceDSL):
         self.catalogue_category_service = catalogue_category_service
 
         with patch("inventory_management_system_api.services.catalogue_category.utils", wraps=utils) as wrapped_utils:
-            self.wrapped_utils = wrapped_utils
-            yield
+            with patch(
+                "inventory_management_system_api.services.catalogue_category.start_session_transaction"
+            ) as mocked_start_session_transaction:
+                self.wrapped_utils = wrapped_utils
+                self.mock_start_session_transaction = mocked_start_session_transaction
+                yield
 
     def mock_add_property_unit_values(
         self, units_in_data: list[Optional[dict]], unit_value_id_dict: dict[str, str]
@@ -83,13 +88,14 @@ class CatalogueCategoryServiceDSL(BaseCatalogueServiceDSL):
         :param unit_value_id_dict: List of unit value and id pairs for lookups.
         """
 
+        units_out = {}
         for unit_in_data in units_in_data:
-            unit_in = UnitIn(**unit_in_data) if unit_in_data else None
-            unit_id = unit_value_id_dict[unit_in.value] if unit_in_data else None
+            if unit_in_data:
+                unit_in = UnitIn(**unit_in_data)
+                unit_id = unit_value_id_dict[unit_in.value]
+                units_out[unit_id] = UnitOut(**unit_in.model_dump(), id=unit_id)
 
-            ServiceTestHelpers.mock_get(
-                self.mock_unit_repository, UnitOut(**unit_in.model_dump(), id=unit_id) if unit_in else None
-            )
+        ServiceTestHelpers.mock_get_many(self.mock_unit_repository, units_out)
 
     def check_add_property_unit_values_performed_expected_calls(
         self, expected_properties: list[CatalogueCategoryPostPropertySchema]
@@ -99,12 +105,9 @@ class CatalogueCategoryServiceDSL(BaseCatalogueServiceDSL):
         :param expected_properties: Expected properties the function would have been called with.
         """
 
-        expected_unit_repo_calls = []
-        for prop in expected_properties:
-            if prop.unit_id:
-                expected_unit_repo_calls.append(call(prop.unit_id))
-
-        self.mock_unit_repository.get.assert_has_calls(expected_unit_repo_calls)
+        self.mock_unit_repository.get_many.assert_called_once_with(
+            [prop.unit_id for prop in expected_properties if prop.unit_id]
+        )
 
 
 class CreateDSL(CatalogueCategoryServiceDSL):
@@ -256,6 +259,16 @@ class TestCreate(CreateDSL):
         self.call_create()
         self.check_create_success()
 
+    def test_create_with_properties_with_uppercase_unit_id(self):
+        """Test creating a catalogue category with properties when the given unit IDs are uppercase."""
+
+        self.mock_create(CATALOGUE_CATEGORY_DATA_LEAF_NO_PARENT_WITH_PROPERTIES_MM, units_in_data=[UNIT_IN_DATA_MM])
+        for prop in self._catalogue_category_post.properties:
+            if prop.unit_id:
+                prop.unit_id = prop.unit_id.upper()
+        self.call_create()
+        self.check_create_success()
+
     def test_create_with_properties_with_non_existent_unit_id(self):
         """Test creating a catalogue category with properties with a non-existent unit ID."""
 
@@ -370,6 +383,115 @@ class TestGetBreadcrumbs(GetBreadcrumbsDSL):
         self.check_get_breadcrumbs_success()
 
 
+class GetManyBreadcrumbsDSL(CatalogueCategoryServiceDSL):
+    """Base class for `get_many_breadcrumbs` tests."""
+
+    _expected_breadcrumbs: MagicMock
+    _obtained_breadcrumbs: MagicMock
+    _obtained_catalogue_category_ids: list[str]
+
+    def mock_get_many_breadcrumbs(self) -> None:
+        """Mocks repo methods appropriately to test the `get_many_breadcrumbs` service method."""
+
+        # Simply a return currently, so no need to use actual data
+        self._expected_breadcrumbs = MagicMock()
+        self.mock_catalogue_category_repository.get_many_breadcrumbs.return_value = self._expected_breadcrumbs
+
+    def call_get_many_breadcrumbs(self, catalogue_category_ids: list[str]) -> None:
+        """
+        Calls the `CatalogueCategoryService` `get_many_breadcrumbs` method.
+
+        :param catalogue_category_ids: IDs of the catalogue categories to obtain the breadcrumbs of.
+        """
+
+        self._obtained_catalogue_category_ids = catalogue_category_ids
+        self._obtained_breadcrumbs = self.catalogue_category_service.get_many_breadcrumbs(catalogue_category_ids)
+
+    def check_get_many_breadcrumbs_success(self, expected_catalogue_category_ids: list[str]) -> None:
+        """
+        Checks that a prior call to `call_get_many_breadcrumbs` worked as expected.
+
+        :param expected_catalogue_category_ids: IDs the breadcrumbs are expected to have been obtained for from the
+                                                repo.
+        """
+
+        self.mock_catalogue_category_repository.get_many_breadcrumbs.assert_called_once_with(
+            expected_catalogue_category_ids
+        )
+        assert self._obtained_breadcrumbs == self._expected_breadcrumbs
+
+
+class TestGetManyBreadcrumbs(GetManyBreadcrumbsDSL):
+    """Tests for getting the breadcrumbs of multiple catalogue categories."""
+
+    def test_get_many_breadcrumbs(self):
+        """Test getting the breadcrumbs of multiple catalogue categories."""
+
+        catalogue_category_ids = [str(ObjectId()), str(ObjectId())]
+
+        self.mock_get_many_breadcrumbs()
+        self.call_get_many_breadcrumbs(catalogue_category_ids)
+        self.check_get_many_breadcrumbs_success(catalogue_category_ids)
+
+    def test_get_many_breadcrumbs_with_invalid_and_duplicate_ids(self):
+        """Test getting the breadcrumbs of multiple catalogue categories ignores any invalid or duplicate IDs."""
+
+        catalogue_category_id = str(ObjectId())
+
+        self.mock_get_many_breadcrumbs()
+        self.call_get_many_breadcrumbs([catalogue_category_id, "invalid_id", catalogue_category_id])
+        self.check_get_many_breadcrumbs_success([catalogue_category_id])
+
+
+class GetTreeDSL(CatalogueCategoryServiceDSL):
+    """Base class for `get_tree` tests"""
+
+    _expected_catalogue_categories: MagicMock
+    _obtained_catalogue_categories: MagicMock
+    _obtained_catalogue_category_id: str
+    _max_depth: Optional[int]
+
+    def mock_get_tree(self) -> None:
+        """Mocks repo methods appropriately to test the `get_tree` service method."""
+
+        # Simply a return currently, so no need to use actual data
+        self._expected_catalogue_categories = MagicMock()
+        self.mock_catalogue_category_repository.get_tree.return_value = self._expected_catalogue_categories
+
+    def call_get_tree(self, catalogue_category_id: str, max_depth: Optional[int] = None) -> None:
+        """
+        Calls the `CatalogueCategoryService` `get_tree` method.
+
+        :param catalogue_category_id: ID of the catalogue category to obtain the tree of.
+        :param max_depth: Maximum depth to pass to `get_tree`.
+        """
+
+        self._obtained_catalogue_category_id = catalogue_category_id
+        self._max_depth = max_depth
+        self._obtained_catalogue_categories = self.catalogue_category_service.get_tree(
+            catalogue_category_id, max_depth=max_depth
+        )
+
+    def check_get_tree_success(self) -> None:
+        """Checks that a prior call to `call_get_tree` worked as expected."""
+
+        self.mock_catalogue_category_repository.get_tree.assert_called_once_with(
+            self._obtained_catalogue_category_id, max_depth=self._max_depth
+        )
+        assert self._obtained_catalogue_categories == self._expected_catalogue_categories
+
+
+class TestGetTree(GetTreeDSL):
+    """Tests for getting a catalogue category along with all of its descendants."""
+
+    def test_get_tree(self):
+        """Test getting a catalogue category along with all of its descendants."""
+
+        self.mock_get_tree()
+        self.call_get_tree(str(ObjectId()), max_depth=2)
+        self.check_get_tree_success()
+
+
 class ListDSL(CatalogueCategoryServiceDSL):
     """Base class for `list` tests"""
 
@@ -413,6 +535,49 @@ class TestList(ListDSL):
         self.check_list_success()
 
 
+class GetListVersionDSL(CatalogueCategoryServiceDSL):
+    """Base class for `get_list_version` tests."""
+
+    _parent_id_filter: Optional[str]
+    _expected_list_version: MagicMock
+    _obtained_list_version: MagicMock
+
+    def mock_get_list_version(self) -> None:
+        """Mocks repo methods appropriately to test the `get_list_version` service method."""
+
+        # Simply a return currently, so no need to use actual data
+        self._expected_list_version = MagicMock()
+        self.mock_catalogue_category_repository.get_list_version.return_value = self._expected_list_version
+
+    def call_get_list_version(self, parent_id: Optional[str]) -> None:
+        """
+        Calls the `CatalogueCategoryService` `get_list_version` method.
+
+        :param parent_id: ID of the parent catalogue category to query by, or `None`.
+        """
+
+        self._parent_id_filter = parent_id
+        self._obtained_list_version = self.catalogue_category_service.get_list_version(parent_id)
+
+    def check_get_list_version_success(self) -> None:
+        """Checks that a prior call to `call_get_list_version` worked as expected."""
+
+        self.mock_catalogue_category_repository.get_list_version.assert_called_once_with(self._parent_id_filter)
+
+        assert self._obtained_list_version == self._expected_list_version
+
+
+class TestGetListVersion(GetListVersionDSL):
+    """Tests for getting the version of a list of catalogue categories."""
+
+    def test_get_list_version(self):
+        """Test getting the version of a list of catalogue categories."""
+
+        self.mock_get_list_version()
+        self.call_get_list_version(str(ObjectId()))
+        self.check_get_list_version_success()
+
+
 # pylint:disable=too-many-instance-attributes
 class UpdateDSL(CatalogueCategoryServiceDSL):
     """Base class for `update` tests."""
@@ -483,7 +648,9 @@ class UpdateDSL(CatalogueCategoryServiceDSL):
 
         # When moving i.e. changing the parent id, the data for the new parent needs to be mocked
         self._moving_catalogue_category = (
-            "parent_id" in catalogue_category_update_data and stored_catalogue_category_post_data is not None
+            "parent_id" in catalogue_category_update_data
+            and stored_catalogue_category_post_data is not None
+            and catalogue_category_update_data["parent_id"] != stored_catalogue_category_post_data.get("parent_id")
         )
 
         if self._moving_catalogue_category and catalogue_category_update_data["parent_id"]:
@@ -585,6 +752,14 @@ class UpdateDSL(CatalogueCategoryServiceDSL):
 
         self.mock_catalogue_category_repository.get.assert_has_calls(expected_catalogue_category_get_calls)
 
+        # Ensure a transaction was started if moving
+        expected_update_kwargs = {}
+        if self._moving_catalogue_category:
+            self.mock_start_session_transaction.assert_called_once_with("updating catalogue category")
+            expected_update_kwargs["session"] = self.mock_start_session_transaction.return_value.__enter__.return_value
+        else:
+            self.mock_start_session_transaction.assert_not_called()
+
         # Ensure updated with expected data
         if self._catalogue_category_patch.properties:
             self.wrapped_utils.check_duplicate_property_names.assert_called_with(
@@ -606,7 +781,7 @@ class UpdateDSL(CatalogueCategoryServiceDSL):
             }
         else:
             self.mock_catalogue_category_repository.update.assert_called_once_with(
-                self._updated_catalogue_category_id, self._expected_catalogue_category_in
+                self._updated_catalogue_category_id, self._expected_catalogue_category_in, **expected_update_kwargs
             )
 
         assert self._updated_catalogue_category == self._expected_catalogue_category_out
@@ -27,6 +27,7 @@ from test.mock_data import (
     MANUFACTURER_OUT_DATA_A,
     PROPERTY_DATA_BOOLEAN_MANDATORY_TRUE,
     PROPERTY_DATA_NUMBER_NON_MANDATORY_WITH_MM_UNIT_42,
+    SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE,
 )
 from test.unit.services.conftest import BaseCatalogueServiceDSL, ServiceTestHelpers
 from typing import Optional
@@ -39,11 +40,14 @@ from pydantic import ValidationError
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.exceptions import (
     ChildElementsExistError,
+    DatabaseIntegrityError,
     InvalidActionError,
     MissingRecordError,
     NonLeafCatalogueCategoryError,
     ReplacementForObsoleteCatalogueItemError,
 )
+from inventory_management_system_api.core.filtering import Filter, FilterOperator, Sort
+from inventory_management_system_api.core.pagination import encode_cursor
 from inventory_management_system_api.models.catalogue_category import CatalogueCategoryIn, CatalogueCategoryOut
 from inventory_management_system_api.models.catalogue_item import CatalogueItemIn, CatalogueItemOut
 from inventory_management_system_api.models.manufacturer import ManufacturerIn, ManufacturerOut
@@ -60,7 +64,7 @@ from inventory_management_system_api.schemas.validation import (
     ValidationResultSchema,
 )
 from inventory_management_system_api.services import utils
-from inventory_management_system_api.services.catalogue_item import CatalogueItemService
+from inventory_management_system_api.services.catalogue_item import CatalogueItemReferences, CatalogueItemService
 
 
 class CatalogueItemServiceDSL(BaseCatalogueServiceDSL):
@@ -160,28 +164,28 @@ class CreateDSL(CatalogueItemServiceDSL):
             if catalogue_category_in
             else None
         )
-        ServiceTestHelpers.mock_get(self.mock_catalogue_category_repository, self._catalogue_category_out)
+        self.mock_catalogue_category_repository.get_many.return_value = (
+            {catalogue_category_id: self._catalogue_category_out} if self._catalogue_category_out else {}
+        )
 
         # Manufacturer
-        ServiceTestHelpers.mock_get(
-            self.mock_manufacturer_repository,
-            (
-                ManufacturerOut(
+        self.mock_manufacturer_repository.get_many.return_value = (
+            {
+                manufacturer_id: ManufacturerOut(
                     **{
                         **ManufacturerIn(**manufacturer_in_data).model_dump(),
                         "_id": manufacturer_id,
                     },
                 )
-                if manufacturer_in_data
-                else None
-            ),
+            }
+            if manufacturer_in_data
+            else {}
         )
 
         # Obsolete replacement catalogue item (Use the same mandatory IDs as the item for simplicity)
-        ServiceTestHelpers.mock_get(
-            self.mock_catalogue_item_repository,
-            (
-                CatalogueItemOut(
+        self.mock_catalogue_item_repository.get_many.return_value = (
+            {
+                catalogue_item_data["obsolete_replacement_catalogue_item_id"]: CatalogueItemOut(
                     **{
                         **CatalogueItemIn(
                             **obsolete_replacement_catalogue_item_data, **ids_to_insert, number_of_spares=None
@@ -189,9 +193,9 @@ class CreateDSL(CatalogueItemServiceDSL):
                         "_id": catalogue_item_data["obsolete_replacement_catalogue_item_id"],
                     },
                 )
-                if obsolete_replacement_catalogue_item_data
-                else None
-            ),
+            }
+            if obsolete_replacement_catalogue_item_data
+            else {}
         )
 
         # When properties are given need to add any property `id`s and ensure the expected data inserts them as well
@@ -251,24 +255,25 @@ class CreateDSL(CatalogueItemServiceDSL):
     def check_create_success(self) -> None:
         """Checks that a prior call to `call_create` worked as expected."""
 
-        # This is the get for the catalogue category
-        self.mock_catalogue_category_repository.get.assert_called_once_with(
-            self._catalogue_item_post.catalogue_category_id
+        # References should each have been obtained in a single call
+        self.mock_catalogue_category_repository.get_many.assert_called_once_with(
+            [utils.normalise_object_id(self._catalogue_item_post.catalogue_category_id)]
         )
-
-        # This is the get for the manufacturer
-        self.mock_manufacturer_repository.get.assert_called_once_with(self._catalogue_item_post.manufacturer_id)
-
-        # This is the get for the obsolete replacement catalogue item
-        if self._catalogue_item_post.obsolete_replacement_catalogue_item_id:
-            self.mock_catalogue_item_repository.get.assert_called_once_with(
-                self._catalogue_item_post.obsolete_replacement_catalogue_item_id
-            )
+        self.mock_manufacturer_repository.get_many.assert_called_once_with(
+            [utils.normalise_object_id(self._catalogue_item_post.manufacturer_id)]
+        )
+        self.mock_catalogue_item_repository.get_many.assert_called_once_with(
+            [utils.normalise_object_id(self._catalogue_item_post.obsolete_replacement_catalogue_item_id)]
+            if self._catalogue_item_post.obsolete_replacement_catalogue_item_id
+            else []
+        )
+        self.mock_catalogue_item_repository.get_duplicate_names.assert_not_called()
 
         self.wrapped_utils.process_properties.assert_called_once_with(
             self._catalogue_category_out.properties, self._catalogue_item_post.properties
         )
 
+        self.mock_setting_repository.get.assert_called_once_with(SparesDefinitionOut, session=self.mock_session)
         self.mock_catalogue_item_repository.create.assert_called_once_with(
             self._expected_catalogue_item_in, session=self.mock_session
         )
@@ -366,6 +371,23 @@ class TestCreate(CreateDSL):
         self.call_create()
         self.check_create_success()
 
+    def test_create_with_uppercase_ids(self):
+        """Test creating a catalogue item when the given IDs are uppercase."""
+
+        self.mock_create(
+            {
+                **CATALOGUE_ITEM_DATA_OBSOLETE_NO_PROPERTIES,
+                "obsolete_replacement_catalogue_item_id": str(ObjectId()),
+            },
+            catalogue_category_in_data=CATALOGUE_CATEGORY_IN_DATA_LEAF_NO_PARENT_NO_PROPERTIES,
+            manufacturer_in_data=MANUFACTURER_IN_DATA_A,
+            obsolete_replacement_catalogue_item_data=CATALOGUE_ITEM_DATA_NOT_OBSOLETE_NO_PROPERTIES,
+        )
+        for field_name in ["catalogue_category_id", "manufacturer_id", "obsolete_replacement_catalogue_item_id"]:
+            setattr(self._catalogue_item_post, field_name, getattr(self._catalogue_item_post, field_name).upper())
+        self.call_create()
+        self.check_create_success()
+
     def test_create_with_non_existent_obsolete_replacement_catalogue_item_id(self):
         """Test creating a catalogue item with a non-existent obsolete replacement catalogue item ID."""
 
@@ -385,35 +407,231 @@ class TestCreate(CreateDSL):
         )
 
 
-class TestBulkCreate(CatalogueItemServiceDSL):
-    """Tests for bulk creating catalogue items."""
+class BulkCreateDSL(CatalogueItemServiceDSL):
+    """Base class for `bulk_create` tests."""
 
-    def test_bulk_create(self):
-        """Test bulk create correctly creates a list of catalogue items."""
-        mock_session = MagicMock()
-        context_manager = MagicMock()
-        context_manager.__enter__.return_value = mock_session
-        mock_catalogue_items = [MagicMock(), MagicMock()]
-        mock_created_item_outs = [MagicMock() for _ in range(0, len(mock_catalogue_items))]
-        self.catalogue_item_service.create = MagicMock(side_effect=mock_created_item_outs)
+    _catalogue_items_post: list[CatalogueItemPostSchema]
+    _expected_catalogue_items_in: list[CatalogueItemIn]
+    _expected_catalogue_items_out: list[CatalogueItemOut]
+    _created_catalogue_items: list[CatalogueItemOut]
+    _expected_session: MagicMock
+    _bulk_create_exception: pytest.ExceptionInfo
+
+    def mock_bulk_create(
+        self,
+        catalogue_items_data: list[dict],
+        catalogue_category_in_data: Optional[dict] = None,
+        manufacturer_in_data: Optional[dict] = None,
+        spares_definition_out_data: Optional[dict] = None,
+    ) -> None:
+        """
+        Mocks repo methods appropriately to test the `bulk_create` service method.
+
+        :param catalogue_items_data: List of dictionaries containing the basic catalogue item data as would be required
+                                     for a `CatalogueItemPostSchema` but without any properties and with any mandatory
+                                     IDs missing as they will be added automatically.
+        :param catalogue_category_in_data: Either `None` or a dictionary containing the catalogue category data as would
+                                           be required for a `CatalogueCategoryIn` database model. This is used for all
+                                           of the catalogue items.
+        :param manufacturer_in_data: Either `None` or a dictionary containing the manufacturer data as would be required
+                                     for a `ManufacturerIn` database model. This is used for all of the catalogue items.
+        :param spares_definition_out_data: Either `None` or a dictionary containing the spares definition data as would
+                                           be required for a `SparesDefinitionOut` database model.
+        """
+
+        # Generate mandatory IDs to be inserted where needed
+        ids_to_insert = {"catalogue_category_id": str(ObjectId()), "manufacturer_id": str(ObjectId())}
+
+        # References
+        self.mock_catalogue_category_repository.get_many.return_value = (
+            {
+                ids_to_insert["catalogue_category_id"]: CatalogueCategoryOut(
+                    **CatalogueCategoryIn(**catalogue_category_in_data).model_dump(by_alias=True),
+                    id=ids_to_insert["catalogue_category_id"],
+                )
+            }
+            if catalogue_category_in_data
+            else {}
+        )
+        self.mock_manufacturer_repository.get_many.return_value = (
+            {
+                ids_to_insert["manufacturer_id"]: ManufacturerOut(
+                    **ManufacturerIn(**manufacturer_in_data).model_dump(), id=ids_to_insert["manufacturer_id"]
+                )
+            }
+            if manufacturer_in_data
+            else {}
+        )
+        self.mock_catalogue_item_repository.get_many.return_value = {}
+
+        spares_definition_out = (
+            SparesDefinitionOut(**spares_definition_out_data) if spares_definition_out_data else None
+        )
+        ServiceTestHelpers.mock_get(self.mock_setting_repository, spares_definition_out)
+
+        self._catalogue_items_post = [
+            CatalogueItemPostSchema(**catalogue_item_data, **ids_to_insert)
+            for catalogue_item_data in catalogue_items_data
+        ]
+        self._expected_catalogue_items_in = [
+            CatalogueItemIn(
+                **catalogue_item_data, **ids_to_insert, number_of_spares=0 if spares_definition_out else None
+            )
+            for catalogue_item_data in catalogue_items_data
+        ]
+        self._expected_catalogue_items_out = [
+            CatalogueItemOut(**catalogue_item_in.model_dump(), id=ObjectId())
+            for catalogue_item_in in self._expected_catalogue_items_in
+        ]
+        self.mock_catalogue_item_repository.create_many.return_value = self._expected_catalogue_items_out
+
+    def call_bulk_create(self) -> None:
+        """Calls the `CatalogueItemService` `bulk_create` method with the appropriate data from a prior call to
+        `mock_bulk_create`."""
 
         with patch(
-            "inventory_management_system_api.services.catalogue_item.start_session_transaction",
-            return_value=context_manager,
+            "inventory_management_system_api.services.catalogue_item.start_session_transaction"
         ) as mock_start_session_transaction:
-            created_catalogue_items = self.catalogue_item_service.bulk_create(mock_catalogue_items)
-
+            self._created_catalogue_items = self.catalogue_item_service.bulk_create(self._catalogue_items_post)
+        self._expected_session = mock_start_session_transaction.return_value.__enter__.return_value
         mock_start_session_transaction.assert_called_once_with("creating bulk catalogue items")
-        assert self.catalogue_item_service.create.call_args_list == [
-            call(catalogue_item, session=mock_session) for catalogue_item in mock_catalogue_items
-        ]
-        assert created_catalogue_items == mock_created_item_outs
+
+    def call_bulk_create_expecting_error(self, error_type: type[BaseException]) -> None:
+        """
+        Calls the `CatalogueItemService` `bulk_create` method with the appropriate data from a prior call to
+        `mock_bulk_create` while expecting an error to be raised.
+
+        :param error_type: Expected exception to be raised.
+        """
+
+        with patch("inventory_management_system_api.services.catalogue_item.start_session_transaction"):
+            with pytest.raises(error_type) as exc:
+                self.catalogue_item_service.bulk_create(self._catalogue_items_post)
+        self._bulk_create_exception = exc
+
+    def check_bulk_create_success(self) -> None:
+        """Checks that a prior call to `call_bulk_create` worked as expected."""
+
+        # References should each have been obtained in a single call
+        self.mock_catalogue_category_repository.get_many.assert_called_once_with(
+            [self._catalogue_items_post[0].catalogue_category_id]
+        )
+        self.mock_manufacturer_repository.get_many.assert_called_once_with(
+            [self._catalogue_items_post[0].manufacturer_id]
+        )
+        self.mock_catalogue_item_repository.get_many.assert_called_once_with([])
+        self.mock_catalogue_item_repository.get_duplicate_names.assert_not_called()
+
+        self.mock_setting_repository.get.assert_called_once_with(SparesDefinitionOut, session=self._expected_session)
+        self.mock_catalogue_item_repository.create_many.assert_called_once_with(
+            self._expected_catalogue_items_in, session=self._expected_session
+        )
+        self.mock_catalogue_item_repository.create.assert_not_called()
+        self.mock_catalogue_item_repository.get.assert_not_called()
+
+        assert self._created_catalogue_items == self._expected_catalogue_items_out
+
+    def check_bulk_create_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_bulk_create_expecting_error` worked as expected, raising an exception with
+        the correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+
+        self.mock_catalogue_item_repository.create_many.assert_not_called()
+        assert str(self._bulk_create_exception.value) == message
+
+
+class TestBulkCreate(BulkCreateDSL):
+    """Tests for bulk creating catalogue items."""
+
+    def test_bulk_create(self):
+        """Test bulk creating catalogue items."""
+
+        self.mock_bulk_create(
+            [CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY, CATALOGUE_ITEM_DATA_NOT_OBSOLETE_NO_PROPERTIES],
+            catalogue_category_in_data=CATALOGUE_CATEGORY_IN_DATA_LEAF_NO_PARENT_NO_PROPERTIES,
+            manufacturer_in_data=MANUFACTURER_IN_DATA_A,
+        )
+        self.call_bulk_create()
+        self.check_bulk_create_success()
+
+    def test_bulk_create_with_spares_definition(self):
+        """Test bulk creating catalogue items when there is a spares definition defined."""
+
+        self.mock_bulk_create(
+            [CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY, CATALOGUE_ITEM_DATA_NOT_OBSOLETE_NO_PROPERTIES],
+            catalogue_category_in_data=CATALOGUE_CATEGORY_IN_DATA_LEAF_NO_PARENT_NO_PROPERTIES,
+            manufacturer_in_data=MANUFACTURER_IN_DATA_A,
+            spares_definition_out_data=SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE,
+        )
+        self.call_bulk_create()
+        self.check_bulk_create_success()
+
+    def test_bulk_create_with_non_existent_catalogue_category_id(self):
+        """Test bulk creating catalogue items with a non-existent catalogue category ID."""
+
+        self.mock_bulk_create(
+            [CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY, CATALOGUE_ITEM_DATA_NOT_OBSOLETE_NO_PROPERTIES],
+            catalogue_category_in_data=None,
+            manufacturer_in_data=MANUFACTURER_IN_DATA_A,
+        )
+        self.call_bulk_create_expecting_error(MissingRecordError)
+        self.check_bulk_create_failed_with_exception(
+            f"No catalogue category found with ID '{self._catalogue_items_post[0].catalogue_category_id}'"
+        )
+
+    def test_bulk_create_with_non_leaf_catalogue_category(self):
+        """Test bulk creating catalogue items with a non-leaf catalogue category."""
+
+        self.mock_bulk_create(
+            [CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY],
+            catalogue_category_in_data=CATALOGUE_CATEGORY_IN_DATA_NON_LEAF_NO_PARENT_NO_PROPERTIES_A,
+            manufacturer_in_data=MANUFACTURER_IN_DATA_A,
+        )
+        self.call_bulk_create_expecting_error(NonLeafCatalogueCategoryError)
+        self.check_bulk_create_failed_with_exception("Cannot add catalogue item to a non-leaf catalogue category")
+
+    def test_bulk_create_with_non_existent_manufacturer_id(self):
+        """Test bulk creating catalogue items with a non-existent manufacturer ID."""
+
+        self.mock_bulk_create(
+            [CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY],
+            catalogue_category_in_data=CATALOGUE_CATEGORY_IN_DATA_LEAF_NO_PARENT_NO_PROPERTIES,
+            manufacturer_in_data=None,
+        )
+        self.call_bulk_create_expecting_error(MissingRecordError)
+        self.check_bulk_create_failed_with_exception(
+            f"No manufacturer found with ID '{self._catalogue_items_post[0].manufacturer_id}'"
+        )
+
+    def test_bulk_create_with_non_existent_obsolete_replacement_catalogue_item_id(self):
+        """Test bulk creating catalogue items with a non-existent obsolete replacement catalogue item ID."""
+
+        obsolete_replacement_catalogue_item_id = str(ObjectId())
+        self.mock_bulk_create(
+            [
+                CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY,
+                {
+                    **CATALOGUE_ITEM_DATA_OBSOLETE_NO_PROPERTIES,
+                    "obsolete_replacement_catalogue_item_id": obsolete_replacement_catalogue_item_id,
+                },
+            ],
+            catalogue_category_in_data=CATALOGUE_CATEGORY_IN_DATA_LEAF_NO_PARENT_NO_PROPERTIES,
+            manufacturer_in_data=MANUFACTURER_IN_DATA_A,
+        )
+        self.call_bulk_create_expecting_error(MissingRecordError)
+        self.check_bulk_create_failed_with_exception(
+            f"No catalogue item found with ID '{obsolete_replacement_catalogue_item_id}'"
+        )
 
 
 class GetDSL(CatalogueItemServiceDSL):
     """Base class for `get` tests."""
 
     _obtained_catalogue_item_id: str
+    _fields: Optional[list[str]]
     _expected_catalogue_item: MagicMock
     _obtained_catalogue_item: MagicMock
 
@@ -424,20 +642,24 @@ class GetDSL(CatalogueItemServiceDSL):
         self._expected_catalogue_item = MagicMock()
         ServiceTestHelpers.mock_get(self.mock_catalogue_item_repository, self._expected_catalogue_item)
 
-    def call_get(self, catalogue_item_id: str) -> None:
+    def call_get(self, catalogue_item_id: str, fields: Optional[list[str]] = None) -> None:
         """
         Calls the `CatalogueItemService` `get` method.
 
         :param catalogue_item_id: ID of the catalogue item to be obtained.
+        :param fields: List of the fields to retrieve, or `None`.
         """
 
         self._obtained_catalogue_item_id = catalogue_item_id
-        self._obtained_catalogue_item = self.catalogue_item_service.get(catalogue_item_id)
+        self._fields = fields
+        self._obtained_catalogue_item = self.catalogue_item_service.get(catalogue_item_id, fields=fields)
 
     def check_get_success(self) -> None:
         """Checks that a prior call to `call_get` worked as expected."""
 
-        self.mock_catalogue_item_repository.get.assert_called_once_with(self._obtained_catalogue_item_id)
+        self.mock_catalogue_item_repository.get.assert_called_once_with(
+            self._obtained_catalogue_item_id, fields=self._fields
+        )
         assert self._obtained_catalogue_item == self._expected_catalogue_item
 
 
@@ -451,11 +673,24 @@ class TestGet(GetDSL):
         self.call_get(str(ObjectId()))
         self.check_get_success()
 
+    def test_get_with_fields(self):
+        """Test getting only specific fields of a catalogue item."""
+
+        self.mock_get()
+        self.call_get(str(ObjectId()), fields=["id", "name"])
+        self.check_get_success()
+
 
 class ListDSL(CatalogueItemServiceDSL):
     """Base class for `list` tests"""
 
+    # pylint:disable=too-many-instance-attributes
     _catalogue_category_id_filter: Optional[str]
+    _limit: Optional[int]
+    _cursor: Optional[str]
+    _fields: Optional[list[str]]
+    _filters: Optional[list[Filter]]
+    _sort: Optional[Sort]
     _expected_catalogue_items: MagicMock
     _obtained_catalogue_items: MagicMock
 
@@ -466,20 +701,47 @@ class ListDSL(CatalogueItemServiceDSL):
         self._expected_catalogue_items = MagicMock()
         ServiceTestHelpers.mock_list(self.mock_catalogue_item_repository, self._expected_catalogue_items)
 
-    def call_list(self, catalogue_category_id: Optional[str]) -> None:
+    def call_list(
+        self,
+        catalogue_category_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        filters: Optional[list[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> None:
         """
         Calls the `CatalogueItemService` `list` method.
 
         :param catalogue_category_id: ID of the catalogue category to query by, or `None`.
+        :param limit: Maximum number of catalogue items to return, or `None`.
+        :param cursor: Cursor of the page to return, or `None`.
+        :param fields: List of the fields to retrieve, or `None`.
+        :param filters: List of the filters to apply, or `None`.
+        :param sort: Sort to apply, or `None`.
         """
 
         self._catalogue_category_id_filter = catalogue_category_id
-        self._obtained_catalogue_items = self.catalogue_item_service.list(catalogue_category_id)
+        self._limit = limit
+        self._cursor = cursor
+        self._fields = fields
+        self._filters = filters
+        self._sort = sort
+        self._obtained_catalogue_items = self.catalogue_item_service.list(
+            catalogue_category_id, limit=limit, cursor=cursor, fields=fields, filters=filters, sort=sort
+        )
 
     def check_list_success(self) -> None:
         """Checks that a prior call to `call_list` worked as expected."""
 
-        self.mock_catalogue_item_repository.list.assert_called_once_with(self._catalogue_category_id_filter)
+        self.mock_catalogue_item_repository.list.assert_called_once_with(
+            self._catalogue_category_id_filter,
+            limit=self._limit,
+            cursor=self._cursor,
+            fields=self._fields,
+            filters=self._filters,
+            sort=self._sort,
+        )
 
         assert self._obtained_catalogue_items == self._expected_catalogue_items
 
@@ -494,6 +756,195 @@ class TestList(ListDSL):
         self.call_list(str(ObjectId()))
         self.check_list_success()
 
+    def test_list_with_limit_and_cursor(self):
+        """Test listing catalogue items with a limit and cursor."""
+
+        self.mock_list()
+        self.call_list(str(ObjectId()), limit=10, cursor=encode_cursor(str(ObjectId())))
+        self.check_list_success()
+
+    def test_list_with_fields(self):
+        """Test listing only specific fields of catalogue items."""
+
+        self.mock_list()
+        self.call_list(str(ObjectId()), fields=["id", "name"])
+        self.check_list_success()
+
+    def test_list_with_filters_and_sort(self):
+        """Test listing catalogue items with filters and a sort."""
+
+        self.mock_list()
+        self.call_list(
+            None,
+            filters=[Filter("manufacturer_id", FilterOperator.EQ, str(ObjectId()))],
+            sort=Sort("name", descending=True),
+        )
+        self.check_list_success()
+
+
+class StreamDSL(CatalogueItemServiceDSL):
+    """Base class for `stream` tests."""
+
+    # pylint:disable=too-many-instance-attributes
+    _catalogue_category_id_filter: Optional[str]
+    _limit: Optional[int]
+    _cursor: Optional[str]
+    _fields: Optional[list[str]]
+    _filters: Optional[list[Filter]]
+    _sort: Optional[Sort]
+    _expected_catalogue_items: MagicMock
+    _obtained_catalogue_items: MagicMock
+
+    def mock_stream(self) -> None:
+        """Mocks repo methods appropriately to test the `stream` service method."""
+
+        # Simply a return currently, so no need to use actual data
+        self._expected_catalogue_items = MagicMock()
+        self.mock_catalogue_item_repository.stream.return_value = self._expected_catalogue_items
+
+    def call_stream(
+        self,
+        catalogue_category_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        filters: Optional[list[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> None:
+        """
+        Calls the `CatalogueItemService` `stream` method.
+
+        :param catalogue_category_id: ID of the catalogue category to query by, or `None`.
+        :param limit: Maximum number of catalogue items to return, or `None`.
+        :param cursor: Cursor of the page to return, or `None`.
+        :param fields: List of the fields to retrieve, or `None`.
+        :param filters: List of the filters to apply, or `None`.
+        :param sort: Sort to apply, or `None`.
+        """
+
+        self._catalogue_category_id_filter = catalogue_category_id
+        self._limit = limit
+        self._cursor = cursor
+        self._fields = fields
+        self._filters = filters
+        self._sort = sort
+        self._obtained_catalogue_items = self.catalogue_item_service.stream(
+            catalogue_category_id, limit=limit, cursor=cursor, fields=fields, filters=filters, sort=sort
+        )
+
+    def check_stream_success(self) -> None:
+        """Checks that a prior call to `call_stream` worked as expected."""
+
+        self.mock_catalogue_item_repository.stream.assert_called_once_with(
+            self._catalogue_category_id_filter,
+            limit=self._limit,
+            cursor=self._cursor,
+            fields=self._fields,
+            filters=self._filters,
+            sort=self._sort,
+        )
+
+        assert self._obtained_catalogue_items == self._expected_catalogue_items
+
+
+class TestStream(StreamDSL):
+    """Tests for streaming catalogue items."""
+
+    def test_stream(self):
+        """Test streaming catalogue items."""
+
+        self.mock_stream()
+        self.call_stream(
+            str(ObjectId()),
+            limit=10,
+            cursor=encode_cursor(str(ObjectId())),
+            fields=["id", "name"],
+            filters=[Filter("manufacturer_id", FilterOperator.IN, [str(ObjectId()), str(ObjectId())])],
+            sort=Sort("name"),
+        )
+        self.check_stream_success()
+
+
+class GetListVersionDSL(CatalogueItemServiceDSL):
+    """Base class for `get_list_version` tests."""
+
+    _catalogue_category_id_filter: Optional[str]
+    _limit: Optional[int]
+    _cursor: Optional[str]
+    _filters: Optional[list[Filter]]
+    _sort: Optional[Sort]
+    _expected_list_version: MagicMock
+    _obtained_list_version: MagicMock
+
+    def mock_get_list_version(self) -> None:
+        """Mocks repo methods appropriately to test the `get_list_version` service method."""
+
+        # Simply a return currently, so no need to use actual data
+        self._expected_list_version = MagicMock()
+        self.mock_catalogue_item_repository.get_list_version.return_value = self._expected_list_version
+
+    # pylint:disable=too-many-arguments
+    # pylint:disable=too-many-positional-arguments
+    def call_get_list_version(
+        self,
+        catalogue_category_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        filters: Optional[list[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> None:
+        """
+        Calls the `CatalogueItemService` `get_list_version` method.
+
+        :param catalogue_category_id: ID of the catalogue category to query by, or `None`.
+        :param limit: Maximum number of catalogue items in the list, or `None`.
+        :param cursor: Cursor of the page of the list, or `None`.
+        :param filters: List of the filters applied to the list, or `None`.
+        :param sort: Sort applied to the list, or `None`.
+        """
+
+        self._catalogue_category_id_filter = catalogue_category_id
+        self._limit = limit
+        self._cursor = cursor
+        self._filters = filters
+        self._sort = sort
+        self._obtained_list_version = self.catalogue_item_service.get_list_version(
+            catalogue_category_id, limit=limit, cursor=cursor, filters=filters, sort=sort
+        )
+
+    # pylint:enable=too-many-arguments
+    # pylint:enable=too-many-positional-arguments
+
+    def check_get_list_version_success(self) -> None:
+        """Checks that a prior call to `call_get_list_version` worked as expected."""
+
+        self.mock_catalogue_item_repository.get_list_version.assert_called_once_with(
+            self._catalogue_category_id_filter,
+            limit=self._limit,
+            cursor=self._cursor,
+            filters=self._filters,
+            sort=self._sort,
+        )
+
+        assert self._obtained_list_version == self._expected_list_version
+
+
+class TestGetListVersion(GetListVersionDSL):
+    """Tests for getting the version of a list of catalogue items."""
+
+    def test_get_list_version(self):
+        """Test getting the version of a list of catalogue items."""
+
+        self.mock_get_list_version()
+        self.call_get_list_version(
+            str(ObjectId()),
+            limit=10,
+            cursor=encode_cursor(str(ObjectId())),
+            filters=[Filter("manufacturer_id", FilterOperator.IN, [str(ObjectId()), str(ObjectId())])],
+            sort=Sort("name"),
+        )
+        self.check_get_list_version_success()
+
 
 # pylint:disable=too-many-instance-attributes
 class UpdateDSL(CatalogueItemServiceDSL):
@@ -625,25 +1076,22 @@ class UpdateDSL(CatalogueItemServiceDSL):
                 else None
             )
 
-            ServiceTestHelpers.mock_get(self.mock_catalogue_category_repository, self._new_catalogue_category_out)
+            catalogue_categories_out = {}
+            if self._new_catalogue_category_out:
+                catalogue_categories_out[self._new_catalogue_category_out.id] = self._new_catalogue_category_out
 
             # Existing category is needed only if the new properties are not given
-            if not self._updating_properties:
-                ServiceTestHelpers.mock_get(
-                    self.mock_catalogue_category_repository,
-                    (
-                        CatalogueCategoryOut(
-                            **{
-                                **self._stored_catalogue_category_in.model_dump(by_alias=True),
-                                "_id": self._stored_catalogue_item.catalogue_category_id,
-                            }
-                        )
-                        # Should not be None here, if properties is not given, then expect test to assign this too
-                        if self._stored_catalogue_category_in
-                        else None
-                    ),
+            # (Should not be None here, if properties is not given, then expect test to assign this too)
+            if not self._updating_properties and self._stored_catalogue_category_in:
+                catalogue_categories_out[self._stored_catalogue_item.catalogue_category_id] = CatalogueCategoryOut(
+                    **{
+                        **self._stored_catalogue_category_in.model_dump(by_alias=True),
+                        "_id": self._stored_catalogue_item.catalogue_category_id,
+                    }
                 )
 
+            ServiceTestHelpers.mock_get_many(self.mock_catalogue_category_repository, catalogue_categories_out)
+
         self._updating_manufacturer = (
             "manufacturer_id" in catalogue_item_update_data
             and catalogue_item_update_data["manufacturer_id"] != self._stored_catalogue_item.manufacturer_id
@@ -776,16 +1224,15 @@ class UpdateDSL(CatalogueItemServiceDSL):
             )
 
         # Ensure obtained new catalogue category if moving
-        expected_catalogue_category_get_calls = []
         if self._moving_catalogue_item and self._catalogue_item_patch.catalogue_category_id:
-            expected_catalogue_category_get_calls.append(call(self._catalogue_item_patch.catalogue_category_id))
+            expected_catalogue_category_ids = [self._catalogue_item_patch.catalogue_category_id]
 
-            # Expect additional call from existing catalogue category to compare properties if new properties aren't
+            # Expect existing catalogue category to also be obtained to compare properties if new properties aren't
             # given
             if self._catalogue_item_patch.properties is None:
-                expected_catalogue_category_get_calls.append(call(self._stored_catalogue_item.catalogue_category_id))
+                expected_catalogue_category_ids.append(self._stored_catalogue_item.catalogue_category_id)
 
-            self.mock_catalogue_category_repository.get.assert_has_calls(expected_catalogue_category_get_calls)
+            self.mock_catalogue_category_repository.get_many.assert_called_once_with(expected_catalogue_category_ids)
 
         # Ensure obtained new manufacturer if needed
         if self._updating_manufacturer and self._catalogue_item_patch.manufacturer_id:
@@ -794,8 +1241,10 @@ class UpdateDSL(CatalogueItemServiceDSL):
         self.mock_catalogue_item_repository.get.assert_has_calls(expected_catalogue_item_get_calls)
 
         if self._updating_properties:
-            if self._moving_catalogue_item:
-                expected_catalogue_category_get_calls.append(call(self._stored_catalogue_item.catalogue_category_id))
+            if not self._moving_catalogue_item:
+                self.mock_catalogue_category_repository.get.assert_called_once_with(
+                    self._stored_catalogue_item.catalogue_category_id
+                )
 
             self.wrapped_utils.process_properties.assert_called_once_with(
                 (
@@ -1065,6 +1514,23 @@ class TestUpdate(UpdateDSL):
         self.call_update_expecting_error(catalogue_item_id, MissingRecordError)
         self.check_update_failed_with_exception(f"No catalogue category found with ID '{catalogue_category_id}'")
 
+    def test_update_catalogue_category_id_with_non_existent_stored_catalogue_category(self):
+        """Test updating the catalogue item's `catalogue_category_id` when the catalogue category it is currently in
+        doesn't exist."""
+
+        catalogue_item_id = str(ObjectId())
+
+        self.mock_update(
+            catalogue_item_id,
+            catalogue_item_update_data={"catalogue_category_id": str(ObjectId())},
+            stored_catalogue_item_data=CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY,
+            new_catalogue_category_in_data=CATALOGUE_CATEGORY_IN_DATA_LEAF_NO_PARENT_NO_PROPERTIES,
+        )
+        self.call_update_expecting_error(catalogue_item_id, DatabaseIntegrityError)
+        self.check_update_failed_with_exception(
+            f"No catalogue category found with ID '{self._stored_catalogue_item.catalogue_category_id}'"
+        )
+
     def test_update_manufacturer_id_with_no_children(self):
         """Test updating the catalogue item's `manufacturer_id` when it has no children."""
 
@@ -1288,6 +1754,7 @@ class ValidateCreateDSL(CatalogueItemServiceDSL):
 
     _catalogue_category_out: Optional[CatalogueCategoryOut]
     _catalogue_item_data: dict
+    _references: CatalogueItemReferences
     _validate_create_result: ValidationResultSchema
 
     def mock_validate_create(
@@ -1311,28 +1778,31 @@ class ValidateCreateDSL(CatalogueItemServiceDSL):
         :param has_duplicate_name: Whether the catalogue item should have a duplicate name as one existing
         """
 
-        # Catalogue category
-        if catalogue_category_out_data:
-            self._catalogue_category_out = CatalogueCategoryOut(**catalogue_category_out_data)
-        ServiceTestHelpers.mock_get(
-            self.mock_catalogue_category_repository,
-            self._catalogue_category_out if catalogue_category_out_data else None,
-        )
-
-        # Manufacturer
-        ServiceTestHelpers.mock_get(
-            self.mock_manufacturer_repository,
-            (ManufacturerOut(**manufacturer_out_data) if manufacturer_out_data else None),
+        # Existing records referenced by the data (obtained up front by `bulk_validate_create`)
+        self._catalogue_category_out = (
+            CatalogueCategoryOut(**catalogue_category_out_data) if catalogue_category_out_data else None
         )
-
-        # Obsolete replacement catalogue item
-        ServiceTestHelpers.mock_get(
-            self.mock_catalogue_item_repository,
-            (
-                CatalogueItemOut(**obsolete_replacement_catalogue_item_out_data)
+        self._references = CatalogueItemReferences(
+            catalogue_categories=(
+                {catalogue_item_data["catalogue_category_id"]: self._catalogue_category_out}
+                if catalogue_category_out_data
+                else {}
+            ),
+            manufacturers=(
+                {catalogue_item_data["manufacturer_id"]: ManufacturerOut(**manufacturer_out_data)}
+                if manufacturer_out_data
+                else {}
+            ),
+            catalogue_items=(
+                {
+                    catalogue_item_data["obsolete_replacement_catalogue_item_id"]: CatalogueItemOut(
+                        **obsolete_replacement_catalogue_item_out_data
+                    )
+                }
                 if obsolete_replacement_catalogue_item_out_data
-                else None
+                else {}
             ),
+            duplicate_names={catalogue_item_data["name"]} if has_duplicate_name else set(),
         )
 
         # Add any property ids automatically from the category (unit tests here should not retest logic tested in
@@ -1345,8 +1815,6 @@ class ValidateCreateDSL(CatalogueItemServiceDSL):
                 if name in property_name_id_map:
                     prop["id"] = str(property_name_id_map[name])
 
-        self.mock_catalogue_item_repository.is_duplicate_name.return_value = has_duplicate_name
-
     def call_validate_create(self) -> None:
         """Calls the `CatalogueItemService` `validate_create` method with the appropriate data from a prior call to
         `mock_validate_create`."""
@@ -1354,7 +1822,7 @@ class ValidateCreateDSL(CatalogueItemServiceDSL):
         # Easier to mock a single validation than a whole list, so do proper testing with single, then have a test
         # for multiple
         self._validate_create_result = self.catalogue_item_service._validate_create(  # pylint:disable=protected-access
-            index=0, catalogue_item_data=self._catalogue_item_data
+            index=0, catalogue_item_data=self._catalogue_item_data, references=self._references
         )
 
     def check_validate_create_success(
@@ -1366,24 +1834,6 @@ class ValidateCreateDSL(CatalogueItemServiceDSL):
         :param expected_errors: Expected validation errors.
         """
 
-        if "catalogue_category_id" in self._catalogue_item_data:
-            self.mock_catalogue_category_repository.get.assert_called_once_with(
-                self._catalogue_item_data["catalogue_category_id"]
-            )
-
-        if "obsolete_replacement_catalogue_item_id" in self._catalogue_item_data:
-            self.mock_catalogue_item_repository.get.assert_called_once_with(
-                self._catalogue_item_data["obsolete_replacement_catalogue_item_id"]
-            )
-
-        if "manufacturer_id" in self._catalogue_item_data:
-            self.mock_manufacturer_repository.get.assert_called_once_with(self._catalogue_item_data["manufacturer_id"])
-
-        if "name" in self._catalogue_item_data:
-            self.mock_catalogue_item_repository.is_duplicate_name.assert_called_once_with(
-                self._catalogue_item_data["name"]
-            )
-
         if "properties" in self._catalogue_item_data:
             property_schemas = []
 
@@ -1393,13 +1843,16 @@ class ValidateCreateDSL(CatalogueItemServiceDSL):
                 except ValidationError:
                     pass
 
-            if self._catalogue_category_out:
+            # Can only validate the properties when the catalogue category was found
+            if self._references.get_catalogue_category(self._catalogue_item_data.get("catalogue_category_id")):
                 self.wrapped_utils.process_properties.assert_called_once_with(
                     # Use ANY for errors as its mutable and changes after running to include the actual errors
                     self._catalogue_category_out.properties,
                     property_schemas,
                     ANY,
                 )
+            else:
+                self.wrapped_utils.process_properties.assert_not_called()
 
         assert self._validate_create_result == ValidationResultSchema(
             index=0, warnings=expected_warnings, errors=expected_errors
@@ -1498,6 +1951,16 @@ class TestValidateCreate(ValidateCreateDSL):
                     msg="Field required",
                     input={"name": "unknown"},
                 ),
+                # IDs that are not strings are treated as missing
+                ValidationErrorSchema(
+                    type="missing_record",
+                    loc=["catalogue_category_id"],
+                    msg="No catalogue category found with ID 'False'",
+                    input=False,
+                ),
+                ValidationErrorSchema(
+                    type="missing_record", loc=["manufacturer_id"], msg="No manufacturer found with ID '26'", input=26
+                ),
             ],
         )
 
@@ -1627,20 +2090,186 @@ class TestValidateCreate(ValidateCreateDSL):
         )
 
 
+class GetCreateReferencesDSL(CatalogueItemServiceDSL):
+    """Base class for `_get_create_references` tests."""
+
+    _catalogue_items_data: list[dict]
+    _check_duplicate_names: bool
+    _references: CatalogueItemReferences
+
+    def mock_get_create_references(self, catalogue_items_data: list[dict], check_duplicate_names: bool) -> None:
+        """
+        Mocks repo methods appropriately to test the `_get_create_references` service method.
+
+        :param catalogue_items_data: List of dictionaries containing the catalogue items data to obtain the references
+                                     of.
+        :param check_duplicate_names: Whether to also check for duplicate names.
+        """
+        self._catalogue_items_data = catalogue_items_data
+        self._check_duplicate_names = check_duplicate_names
+
+        self.mock_catalogue_category_repository.get_many.return_value = {}
+        self.mock_manufacturer_repository.get_many.return_value = {}
+        self.mock_catalogue_item_repository.get_many.return_value = {}
+        self.mock_catalogue_item_repository.get_duplicate_names.return_value = set()
+
+    def call_get_create_references(self) -> None:
+        """Calls the `CatalogueItemService` `_get_create_references` method with the appropriate data from a prior call
+        to `mock_get_create_references`."""
+
+        self._references = self.catalogue_item_service._get_create_references(  # pylint:disable=protected-access
+            self._catalogue_items_data, check_duplicate_names=self._check_duplicate_names
+        )
+
+    def check_get_create_references_success(
+        self,
+        expected_catalogue_category_ids: list[str],
+        expected_manufacturer_ids: list[str],
+        expected_obsolete_replacement_catalogue_item_ids: list[str],
+        expected_names: list[str],
+    ) -> None:
+        """
+        Checks that a prior call to `call_get_create_references` worked as expected.
+
+        :param expected_catalogue_category_ids: Expected catalogue category IDs to be obtained.
+        :param expected_manufacturer_ids: Expected manufacturer IDs to be obtained.
+        :param expected_obsolete_replacement_catalogue_item_ids: Expected obsolete replacement catalogue item IDs to be
+                                                                 obtained.
+        :param expected_names: Expected names to be checked for duplicates (if checking them).
+        """
+        self.mock_catalogue_category_repository.get_many.assert_called_once_with(expected_catalogue_category_ids)
+        self.mock_manufacturer_repository.get_many.assert_called_once_with(expected_manufacturer_ids)
+        self.mock_catalogue_item_repository.get_many.assert_called_once_with(
+            expected_obsolete_replacement_catalogue_item_ids
+        )
+        if self._check_duplicate_names:
+            self.mock_catalogue_item_repository.get_duplicate_names.assert_called_once_with(expected_names)
+        else:
+            self.mock_catalogue_item_repository.get_duplicate_names.assert_not_called()
+
+        assert isinstance(self._references, CatalogueItemReferences)
+
+
+class TestGetCreateReferences(GetCreateReferencesDSL):
+    """Tests for obtaining the existing records referenced by catalogue items data for creation."""
+
+    def test_get_create_references(self):
+        """Test obtaining the existing records referenced by catalogue items data for creation."""
+
+        catalogue_category_id = str(ObjectId())
+        manufacturer_id = str(ObjectId())
+        obsolete_replacement_catalogue_item_id = str(ObjectId())
+
+        self.mock_get_create_references(
+            [
+                {
+                    "name": "Catalogue Item A",
+                    "catalogue_category_id": catalogue_category_id,
+                    "manufacturer_id": manufacturer_id,
+                    "obsolete_replacement_catalogue_item_id": obsolete_replacement_catalogue_item_id,
+                },
+                {
+                    "name": "Catalogue Item A",
+                    "catalogue_category_id": catalogue_category_id,
+                    "manufacturer_id": manufacturer_id,
+                },
+            ],
+            check_duplicate_names=False,
+        )
+        self.call_get_create_references()
+        self.check_get_create_references_success(
+            expected_catalogue_category_ids=[catalogue_category_id],
+            expected_manufacturer_ids=[manufacturer_id],
+            expected_obsolete_replacement_catalogue_item_ids=[obsolete_replacement_catalogue_item_id],
+            expected_names=[],
+        )
+
+    def test_get_create_references_with_invalid_values_and_duplicate_names(self):
+        """Test obtaining the existing records referenced by catalogue items data for creation when some of the values
+        are invalid, while also checking for duplicate names."""
+
+        catalogue_category_id = str(ObjectId())
+        manufacturer_id = str(ObjectId())
+
+        self.mock_get_create_references(
+            [
+                {"name": "Catalogue Item A", "catalogue_category_id": catalogue_category_id},
+                {"name": "Catalogue Item A", "manufacturer_id": manufacturer_id},
+                {"name": "Catalogue Item B", "catalogue_category_id": "invalid-id", "manufacturer_id": 26},
+                {"name": 42},
+                {"name": ""},
+                {},
+            ],
+            check_duplicate_names=True,
+        )
+        self.call_get_create_references()
+        self.check_get_create_references_success(
+            expected_catalogue_category_ids=[catalogue_category_id],
+            expected_manufacturer_ids=[manufacturer_id],
+            expected_obsolete_replacement_catalogue_item_ids=[],
+            expected_names=["Catalogue Item A", "Catalogue Item B"],
+        )
+
+
+class TestCatalogueItemReferences:
+    """Tests for looking up existing records referenced by catalogue items data for creation."""
+
+    catalogue_category_out = CatalogueCategoryOut(**CATALOGUE_CATEGORY_OUT_DATA_LEAF_NO_PARENT_NO_PROPERTIES)
+    manufacturer_out = ManufacturerOut(**MANUFACTURER_OUT_DATA_A)
+    catalogue_item_out = CatalogueItemOut(**CATALOGUE_ITEM_OUT_DATA_NOT_OBSOLETE_NO_PROPERTIES)
+    references = CatalogueItemReferences(
+        catalogue_categories={catalogue_category_out.id: catalogue_category_out},
+        manufacturers={manufacturer_out.id: manufacturer_out},
+        catalogue_items={catalogue_item_out.id: catalogue_item_out},
+        duplicate_names={"Catalogue Item A"},
+    )
+
+    def test_lookups(self):
+        """Test looking up references that exist."""
+
+        assert self.references.get_catalogue_category(self.catalogue_category_out.id) == self.catalogue_category_out
+        assert self.references.get_manufacturer(self.manufacturer_out.id) == self.manufacturer_out
+        assert self.references.get_catalogue_item(self.catalogue_item_out.id) == self.catalogue_item_out
+        assert self.references.is_duplicate_name("Catalogue Item A") is True
+
+    def test_lookups_with_non_existent_values(self):
+        """Test looking up references that don't exist."""
+
+        assert self.references.get_catalogue_category(str(ObjectId())) is None
+        assert self.references.get_manufacturer(str(ObjectId())) is None
+        assert self.references.get_catalogue_item(str(ObjectId())) is None
+        assert self.references.is_duplicate_name("Catalogue Item B") is False
+
+    def test_lookups_with_invalid_types(self):
+        """Test looking up references using values that are not strings (including unhashable ones)."""
+
+        assert self.references.get_catalogue_category(False) is None
+        assert self.references.get_manufacturer(["invalid"]) is None
+        assert self.references.get_catalogue_item({"invalid": "id"}) is None
+        assert self.references.is_duplicate_name(["Catalogue Item A"]) is False
+
+
 class TestBulkValidateCreate(CatalogueItemServiceDSL):
     """Tests for bulk validating catalogue items data for creation."""
 
     def test_bulk_validate_create(self):
         """Test bulk validate correctly returns a list of validation results for the individual catalogue items."""
         mock_catalogue_items = [{"name": "1"}, {"name": "2"}, {"name": "3"}]
+        mock_references = MagicMock()
         mock_results = [
             ValidationResultSchema(index=index, warnings=[], errors=[]) for index in range(0, len(mock_catalogue_items))
         ]
+        mock_get_create_references = MagicMock(return_value=mock_references)
         mock_validate_create = MagicMock(side_effect=mock_results)
 
-        with patch.object(self.catalogue_item_service, "_validate_create", mock_validate_create):
+        with (
+            patch.object(self.catalogue_item_service, "_get_create_references", mock_get_create_references),
+            patch.object(self.catalogue_item_service, "_validate_create", mock_validate_create),
+        ):
             result = self.catalogue_item_service.bulk_validate_create(mock_catalogue_items)
+        mock_get_create_references.assert_called_once_with(mock_catalogue_items, check_duplicate_names=True)
         assert mock_validate_create.call_args_list == [
-            call(index, mock_catalogue_item) for index, mock_catalogue_item in enumerate(mock_catalogue_items)
+            call(index, mock_catalogue_item, mock_references)
+            for index, mock_catalogue_item in enumerate(mock_catalogue_items)
         ]
         assert result == BulkValidationResultSchema(results=mock_results)
@@ -37,6 +37,8 @@ from inventory_management_system_api.core.exceptions import (
     MissingRecordError,
     WriteConflictError,
 )
+from inventory_management_system_api.core.filtering import Filter, FilterOperator, Sort
+from inventory_management_system_api.core.pagination import encode_cursor
 from inventory_management_system_api.models.catalogue_category import CatalogueCategoryIn, CatalogueCategoryOut
 from inventory_management_system_api.models.catalogue_item import CatalogueItemIn, CatalogueItemOut
 from inventory_management_system_api.models.item import ItemIn, ItemOut
@@ -104,22 +106,21 @@ class ItemServiceDSL(BaseCatalogueServiceDSL):
                 self.mock_start_session_transaction = mocked_start_session_transaction
                 yield
 
-    def _mock_start_transaction_impacting_number_of_spares(
+    def _mock_start_transaction_impacting_item_counts(
         self, spares_definition_out_data: Optional[dict], raise_write_conflict_once: bool
     ) -> None:
         """
-        Mocks methods appropriately for when the `_start_transaction_impacting_number_of_spares` repo method will be
-        called.
+        Mocks methods appropriately for when the `_start_transaction_impacting_item_counts` repo method will be called.
 
         :param spares_definition_out_data: Either `None` or a dictionary containing the spares definition data as would
                                            be required for a `SparesDefinitionOut` database model.
-        :param raise_write_conflict_once: Whether to raise a write conflict during the number of spares update to
-                                          test the retrying functionality.
+        :param raise_write_conflict_once: Whether to raise a write conflict during the item counts update to test the
+                                          retrying functionality.
         """
 
         # Mock the transaction session itself - this will be the value ultimately returned by
-        # _start_transaction_impacting_number_of_spares
-        self.mock_transaction_session = MagicMock() if spares_definition_out_data else None
+        # _start_transaction_impacting_item_counts
+        self.mock_transaction_session = MagicMock()
         self.mock_start_session_transaction.return_value.__enter__.return_value = self.mock_transaction_session
 
         # Mock the spares definition get
@@ -134,95 +135,79 @@ class ItemServiceDSL(BaseCatalogueServiceDSL):
             # Strictly speaking this error is not right, it would give an OperationFailure that
             # start_session_transaction will turn into a write conflict, but as that's mocked we just raise it directly
             # here instead
-            self.mock_catalogue_item_repository.update_number_of_spares.side_effect = [
+            self.mock_start_session_transaction.return_value.__enter__.side_effect = [
                 WriteConflictError("Test"),
-                None,
-                None,
+                self.mock_transaction_session,
             ]
 
-    def _check_start_transition_impacting_number_of_spares_performed_expected_calls(
+    def _check_start_transaction_impacting_item_counts_performed_expected_calls(
         self,
         expected_action_description: str,
-        expected_catalogue_item_id: str,
+        expected_changes: list[tuple[str, Optional[str], Optional[str]]],
         expected_dest_system_id: Optional[str] = None,
     ) -> None:
         """
-        Checks that a call to `_start_transaction_impacting_number_of_spares` performed the expected function calls.
+        Checks that a call to `_start_transaction_impacting_item_counts` performed the expected function calls.
 
         :param expected_action_description: Expected `action_description` the function should have been called with.
-        :param expected_catalogue_item_id: Expected `catalogue_item_id` the function should have been called with.
-        :param expected_dest_system_id: Expected `dest_system_id` the function should have been called with.
+        :param expected_changes: Expected `changes` the function should have been called with i.e. a list of tuples
+                                 containing the catalogue item ID, source system type ID and destination system type ID
+                                 of each item.
+        :param expected_dest_system_id: Expected ID of the system that should have been write locked.
         """
 
-        expected_catalogue_item_id = CustomObjectId(expected_catalogue_item_id)
-
-        self.mock_setting_repository.get.assert_called_once_with(SparesDefinitionOut)
+        self.mock_setting_repository.get.assert_called_once_with(
+            SparesDefinitionOut, session=self.mock_transaction_session
+        )
 
-        # The rest of the calls only occur if there is a spares definition
-        if self._expected_spares_definition_out:
-            if self._raise_write_conflict_once:
-                assert self.mock_start_session_transaction.call_args_list == [
-                    call(expected_action_description),
-                    call(expected_action_description),
-                ]
-                self.mock_start_session_transaction.return_value.__enter__.assert_has_calls([call(), call()])
+        expected_number_of_attempts = 2 if self._raise_write_conflict_once else 1
+        assert (
+            self.mock_start_session_transaction.call_args_list
+            == [call(expected_action_description)] * expected_number_of_attempts
+        )
+        assert self.mock_start_session_transaction.return_value.__enter__.call_count == expected_number_of_attempts
 
-                if expected_dest_system_id:
-                    self.mock_system_repository.write_lock.assert_called_once_with(
-                        expected_dest_system_id, self.mock_transaction_session
+        if expected_dest_system_id:
+            self.mock_system_repository.write_lock.assert_called_once_with(
+                expected_dest_system_id, self.mock_transaction_session
+            )
+        else:
+            self.mock_system_repository.write_lock.assert_not_called()
+
+        # The item counts should be changed by the overall difference, and only when there is one
+        expected_item_counts_changes = {}
+        for catalogue_item_id, src_system_type_id, dst_system_type_id in expected_changes:
+            catalogue_item_changes = expected_item_counts_changes.setdefault(catalogue_item_id, {})
+            if src_system_type_id is not None:
+                catalogue_item_changes[src_system_type_id] = catalogue_item_changes.get(src_system_type_id, 0) - 1
+            if dst_system_type_id is not None:
+                catalogue_item_changes[dst_system_type_id] = catalogue_item_changes.get(dst_system_type_id, 0) + 1
+        expected_calls = []
+        for catalogue_item_id, catalogue_item_changes in expected_item_counts_changes.items():
+            catalogue_item_changes = {
+                system_type_id: change for system_type_id, change in catalogue_item_changes.items() if change != 0
+            }
+            if catalogue_item_changes:
+                # The number of spares should also be changed, but only if there is a spares definition
+                expected_number_of_spares_change = (
+                    sum(
+                        change
+                        for system_type_id, change in catalogue_item_changes.items()
+                        if system_type_id
+                        in [system_type.id for system_type in self._expected_spares_definition_out.system_types]
                     )
-                else:
-                    self.mock_system_repository.write_lock.assert_not_called()
-
-                self.mock_item_repository.count_in_catalogue_item_with_system_type_one_of.assert_called_once_with(
-                    expected_catalogue_item_id,
-                    [
-                        CustomObjectId(system_type.id)
-                        for system_type in self._expected_spares_definition_out.system_types
-                    ],
-                    session=self.mock_transaction_session,
-                )
-
-                self.mock_catalogue_item_repository.update_number_of_spares.assert_has_calls(
-                    [
-                        call(expected_catalogue_item_id, None, session=self.mock_transaction_session),
-                        call(expected_catalogue_item_id, None, session=self.mock_transaction_session),
-                        call(
-                            expected_catalogue_item_id,
-                            self.mock_item_repository.count_in_catalogue_item_with_system_type_one_of.return_value,
-                            session=self.mock_transaction_session,
-                        ),
-                    ]
+                    if self._expected_spares_definition_out
+                    else None
                 )
-            else:
-                self.mock_start_session_transaction.assert_called_once_with(expected_action_description)
-                self.mock_start_session_transaction.return_value.__enter__.assert_called_once()
-
-                if expected_dest_system_id:
-                    self.mock_system_repository.write_lock.assert_called_once_with(
-                        expected_dest_system_id, self.mock_transaction_session
+                expected_calls.append(
+                    call(
+                        CustomObjectId(catalogue_item_id),
+                        catalogue_item_changes,
+                        expected_number_of_spares_change,
+                        session=self.mock_transaction_session,
                     )
-                else:
-                    self.mock_system_repository.write_lock.assert_not_called()
-
-                self.mock_item_repository.count_in_catalogue_item_with_system_type_one_of.assert_called_once_with(
-                    expected_catalogue_item_id,
-                    [
-                        CustomObjectId(system_type.id)
-                        for system_type in self._expected_spares_definition_out.system_types
-                    ],
-                    session=self.mock_transaction_session,
-                )
-                self.mock_catalogue_item_repository.update_number_of_spares.assert_has_calls(
-                    [
-                        call(expected_catalogue_item_id, None, session=self.mock_transaction_session),
-                        call(
-                            expected_catalogue_item_id,
-                            self.mock_item_repository.count_in_catalogue_item_with_system_type_one_of.return_value,
-                            session=self.mock_transaction_session,
-                        ),
-                    ]
                 )
+        assert self.mock_catalogue_item_repository.increment_item_counts.call_args_list == expected_calls
 
 
 class CreateDSL(ItemServiceDSL):
@@ -393,14 +378,13 @@ class CreateDSL(ItemServiceDSL):
                 self._catalogue_category_out.properties, self._expected_merged_properties
             )
 
-        self._mock_start_transaction_impacting_number_of_spares(
-            stored_spares_definition_out_data, raise_write_conflict_once
-        )
+        self._mock_start_transaction_impacting_item_counts(stored_spares_definition_out_data, raise_write_conflict_once)
 
         self._expected_item_in = ItemIn(
             **{
                 **item_data,
                 **ids_to_insert,
+                "system_type_id": self._system_out.type_id if self._system_out else str(ObjectId()),
                 "usage_status": self._usage_status_out.value if self._usage_status_out else "unknown",
                 "properties": expected_properties_in,
             }
@@ -456,8 +440,10 @@ class CreateDSL(ItemServiceDSL):
             self._catalogue_category_out.properties, self._expected_merged_properties
         )
 
-        self._check_start_transition_impacting_number_of_spares_performed_expected_calls(
-            "creating item", str(self._expected_item_in.catalogue_item_id), str(self._expected_item_in.system_id)
+        self._check_start_transaction_impacting_item_counts_performed_expected_calls(
+            "creating item",
+            [(str(self._expected_item_in.catalogue_item_id), None, self._system_out.type_id)],
+            str(self._expected_item_in.system_id),
         )
 
         self.mock_item_repository.create.assert_called_once_with(
@@ -641,10 +627,273 @@ class TestCreate(CreateDSL):
         self.check_create_success()
 
 
+class BulkCreateDSL(ItemServiceDSL):
+    """Base class for `bulk_create` tests."""
+
+    # pylint:disable=too-many-instance-attributes
+    _catalogue_item_out: CatalogueItemOut
+    _system_out: SystemOut
+    _items_post: list[ItemPostSchema]
+    _expected_items_in: list[ItemIn]
+    _expected_items_out: list[ItemOut]
+    _created_items: list[ItemOut]
+    _bulk_create_exception: pytest.ExceptionInfo
+    _user_authorised: bool
+
+    # pylint:disable=too-many-arguments
+    # pylint:disable=too-many-positional-arguments
+    def mock_bulk_create(
+        self,
+        items_data: list[dict],
+        catalogue_category_exists: bool = True,
+        system_exists: bool = True,
+        usage_status_exists: bool = True,
+        stored_spares_definition_out_data: Optional[dict] = None,
+        stored_rule_exists: bool = True,
+        user_is_authorised: bool = False,
+    ) -> None:
+        """
+        Mocks repo methods appropriately to test the `bulk_create` service method.
+
+        All of the items are created in the same catalogue item and system with the same usage status.
+
+        :param items_data: List of dictionaries containing the basic item data as would be required for an
+                           `ItemPostSchema` but without any properties and with any mandatory IDs missing as they will
+                           be added automatically.
+        :param catalogue_category_exists: Whether the catalogue category of the catalogue item exists.
+        :param system_exists: Whether the system exists.
+        :param usage_status_exists: Whether the usage status exists.
+        :param stored_spares_definition_out_data: Either `None` or a dictionary containing the spares definition data as
+                                                  would be required for a `SparesDefinitionOut` database model.
+        :param stored_rule_exists: Whether a stored rule exists for the create operation.
+        :param user_is_authorised: Whether the request is authorised to bypass functionality such as checking rules.
+        """
+
+        self._user_authorised = user_is_authorised
+
+        # Generate mandatory IDs to be inserted where needed
+        catalogue_category_id = str(ObjectId())
+        ids_to_insert = {"catalogue_item_id": str(ObjectId()), "system_id": str(ObjectId())}
+
+        # References
+        self._catalogue_item_out = CatalogueItemOut(
+            **CatalogueItemIn(
+                **CATALOGUE_ITEM_DATA_REQUIRED_VALUES_ONLY,
+                catalogue_category_id=catalogue_category_id,
+                manufacturer_id=str(ObjectId()),
+            ).model_dump(),
+            id=ids_to_insert["catalogue_item_id"],
+        )
+        self.mock_catalogue_item_repository.get_many.return_value = {
+            self._catalogue_item_out.id: self._catalogue_item_out
+        }
+        self.mock_catalogue_category_repository.get_many.return_value = (
+            {
+                catalogue_category_id: CatalogueCategoryOut(
+                    **CatalogueCategoryIn(**CATALOGUE_CATEGORY_IN_DATA_LEAF_NO_PARENT_NO_PROPERTIES).model_dump(
+                        by_alias=True
+                    ),
+                    id=catalogue_category_id,
+                )
+            }
+            if catalogue_category_exists
+            else {}
+        )
+        self._system_out = SystemOut(
+            **SystemIn(**SYSTEM_IN_DATA_STORAGE_NO_PARENT_A).model_dump(), id=ids_to_insert["system_id"]
+        )
+        self.mock_system_repository.get_many.return_value = (
+            {self._system_out.id: self._system_out} if system_exists else {}
+        )
+        usage_status_out = UsageStatusOut(
+            **UsageStatusIn(**USAGE_STATUS_IN_DATA_NEW).model_dump(), id=items_data[0]["usage_status_id"]
+        )
+        self.mock_usage_status_repository.get_many.return_value = (
+            {usage_status_out.id: usage_status_out} if usage_status_exists else {}
+        )
+
+        # Rule
+        self.mock_rule_repository.check_exists.return_value = stored_rule_exists
+
+        self._mock_start_transaction_impacting_item_counts(stored_spares_definition_out_data, False)
+
+        # Items
+        self._items_post = [ItemPostSchema(**item_data, **ids_to_insert) for item_data in items_data]
+        self._expected_items_in = [
+            ItemIn(
+                **item_data,
+                **ids_to_insert,
+                system_type_id=self._system_out.type_id,
+                usage_status=usage_status_out.value,
+                properties=[],
+            )
+            for item_data in items_data
+        ]
+        self._expected_items_out = [
+            ItemOut(**item_in.model_dump(), id=ObjectId()) for item_in in self._expected_items_in
+        ]
+        self.mock_item_repository.create_many.return_value = self._expected_items_out
+
+    def call_bulk_create(self) -> None:
+        """Calls the `ItemService` `bulk_create` method with the appropriate data from a prior call to
+        `mock_bulk_create`."""
+
+        self._created_items = self.item_service.bulk_create(self._items_post, self._user_authorised)
+
+    def call_bulk_create_expecting_error(self, error_type: type[BaseException]) -> None:
+        """
+        Calls the `ItemService` `bulk_create` method with the appropriate data from a prior call to `mock_bulk_create`
+        while expecting an error to be raised.
+
+        :param error_type: Expected exception to be raised.
+        """
+
+        with pytest.raises(error_type) as exc:
+            self.item_service.bulk_create(self._items_post, self._user_authorised)
+        self._bulk_create_exception = exc
+
+    def check_bulk_create_success(self) -> None:
+        """Checks that a prior call to `call_bulk_create` worked as expected."""
+
+        # References should each have been obtained in a single call
+        self.mock_catalogue_item_repository.get_many.assert_called_once_with([self._catalogue_item_out.id])
+        self.mock_catalogue_category_repository.get_many.assert_called_once_with(
+            [self._catalogue_item_out.catalogue_category_id]
+        )
+        self.mock_system_repository.get_many.assert_called_once_with([self._system_out.id])
+        self.mock_usage_status_repository.get_many.assert_called_once_with(
+            [utils.normalise_object_id(self._items_post[0].usage_status_id)]
+        )
+
+        # The rule should only be checked once as all of the items are created in the same system with the same usage
+        # status
+        if self._user_authorised:
+            self.mock_rule_repository.check_exists.assert_not_called()
+        else:
+            self.mock_rule_repository.check_exists.assert_called_once_with(
+                src_system_type_id=None,
+                dst_system_type_id=self._system_out.type_id,
+                dst_usage_status_id=self._items_post[0].usage_status_id,
+            )
+
+        # The system should only be write locked, and the item counts of the catalogue item changed, once
+        self._check_start_transaction_impacting_item_counts_performed_expected_calls(
+            "creating bulk items",
+            [(self._catalogue_item_out.id, None, self._system_out.type_id)] * len(self._items_post),
+            self._system_out.id,
+        )
+
+        self.mock_item_repository.create_many.assert_called_once_with(
+            self._expected_items_in, session=self.mock_transaction_session
+        )
+        self.mock_item_repository.create.assert_not_called()
+
+        assert self._created_items == self._expected_items_out
+
+    def check_bulk_create_failed_with_exception(self, message: str) -> None:
+        """
+        Checks that a prior call to `call_bulk_create_expecting_error` worked as expected, raising an exception with
+        the correct message.
+
+        :param message: Expected message of the raised exception.
+        """
+
+        self.mock_item_repository.create_many.assert_not_called()
+        assert str(self._bulk_create_exception.value) == message
+
+
+class TestBulkCreate(BulkCreateDSL):
+    """Tests for bulk creating items."""
+
+    def test_bulk_create(self):
+        """Test bulk creating items."""
+
+        self.mock_bulk_create([ITEM_DATA_NEW_REQUIRED_VALUES_ONLY, ITEM_DATA_NEW_ALL_VALUES_NO_PROPERTIES])
+        self.call_bulk_create()
+        self.check_bulk_create_success()
+
+    def test_bulk_create_with_spares_definition_defined(self):
+        """Test bulk creating items when there is a spares definition defined."""
+
+        self.mock_bulk_create(
+            [ITEM_DATA_NEW_REQUIRED_VALUES_ONLY, ITEM_DATA_NEW_ALL_VALUES_NO_PROPERTIES],
+            stored_spares_definition_out_data=SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE,
+        )
+        self.call_bulk_create()
+        self.check_bulk_create_success()
+
+    def test_bulk_create_with_uppercase_ids(self):
+        """Test bulk creating items when the given IDs are uppercase."""
+
+        self.mock_bulk_create([ITEM_DATA_NEW_REQUIRED_VALUES_ONLY, ITEM_DATA_NEW_ALL_VALUES_NO_PROPERTIES])
+        for item_post in self._items_post:
+            for field_name in ["catalogue_item_id", "system_id", "usage_status_id"]:
+                setattr(item_post, field_name, getattr(item_post, field_name).upper())
+        self.call_bulk_create()
+        self.check_bulk_create_success()
+
+    def test_bulk_create_with_non_existent_catalogue_item_id(self):
+        """Test bulk creating items with a non-existent catalogue item ID."""
+
+        self.mock_bulk_create([ITEM_DATA_NEW_REQUIRED_VALUES_ONLY])
+        self.mock_catalogue_item_repository.get_many.return_value = {}
+        self.call_bulk_create_expecting_error(MissingRecordError)
+        self.check_bulk_create_failed_with_exception(
+            f"No catalogue item found with ID '{self._items_post[0].catalogue_item_id}'"
+        )
+
+    def test_bulk_create_with_catalogue_item_with_non_existent_catalogue_category_id(self):
+        """Test bulk creating items in a catalogue item that has a non-existent catalogue category ID."""
+
+        self.mock_bulk_create([ITEM_DATA_NEW_REQUIRED_VALUES_ONLY], catalogue_category_exists=False)
+        self.call_bulk_create_expecting_error(DatabaseIntegrityError)
+        self.check_bulk_create_failed_with_exception(
+            f"No catalogue category found with ID '{self._catalogue_item_out.catalogue_category_id}'"
+        )
+
+    def test_bulk_create_with_non_existent_system_id(self):
+        """Test bulk creating items with a non-existent system ID."""
+
+        self.mock_bulk_create([ITEM_DATA_NEW_REQUIRED_VALUES_ONLY], system_exists=False)
+        self.call_bulk_create_expecting_error(MissingRecordError)
+        self.check_bulk_create_failed_with_exception(f"No system found with ID '{self._items_post[0].system_id}'")
+
+    def test_bulk_create_with_non_existent_usage_status_id(self):
+        """Test bulk creating items with a non-existent usage status ID."""
+
+        self.mock_bulk_create([ITEM_DATA_NEW_REQUIRED_VALUES_ONLY], usage_status_exists=False)
+        self.call_bulk_create_expecting_error(MissingRecordError)
+        self.check_bulk_create_failed_with_exception(
+            f"No usage status found with ID '{self._items_post[0].usage_status_id}'"
+        )
+
+    def test_bulk_create_with_non_existent_rule(self):
+        """Test bulk creating items in a system with a usage status for which no creation rule exists."""
+
+        self.mock_bulk_create([ITEM_DATA_NEW_REQUIRED_VALUES_ONLY], stored_rule_exists=False)
+        self.call_bulk_create_expecting_error(InvalidActionError)
+        self.check_bulk_create_failed_with_exception(
+            "No rule found for creating items in the specified system with the specified usage status"
+        )
+
+    def test_bulk_create_with_non_existent_rule_when_authorised(self):
+        """Test bulk creating items in a system with a usage status for which no creation rule exists when the user
+        is authorised."""
+
+        self.mock_bulk_create(
+            [ITEM_DATA_NEW_REQUIRED_VALUES_ONLY, ITEM_DATA_NEW_ALL_VALUES_NO_PROPERTIES],
+            stored_rule_exists=False,
+            user_is_authorised=True,
+        )
+        self.call_bulk_create()
+        self.check_bulk_create_success()
+
+
 class GetDSL(ItemServiceDSL):
     """Base class for `get` tests."""
 
     _obtained_item_id: str
+    _fields: Optional[list[str]]
     _expected_item: MagicMock
     _obtained_item: MagicMock
 
@@ -655,20 +904,22 @@ class GetDSL(ItemServiceDSL):
         self._expected_item = MagicMock()
         ServiceTestHelpers.mock_get(self.mock_item_repository, self._expected_item)
 
-    def call_get(self, item_id: str) -> None:
+    def call_get(self, item_id: str, fields: Optional[list[str]] = None) -> None:
         """
         Calls the `ItemService` `get` method.
 
         :param item_id: ID of the item to be obtained.
+        :param fields: List of the fields to retrieve, or `None`.
         """
 
         self._obtained_item_id = item_id
-        self._obtained_item = self.item_service.get(item_id)
+        self._fields = fields
+        self._obtained_item = self.item_service.get(item_id, fields=fields)
 
     def check_get_success(self) -> None:
         """Checks that a prior call to `call_get` worked as expected."""
 
-        self.mock_item_repository.get.assert_called_once_with(self._obtained_item_id)
+        self.mock_item_repository.get.assert_called_once_with(self._obtained_item_id, fields=self._fields)
         assert self._obtained_item == self._expected_item
 
 
@@ -682,12 +933,25 @@ class TestGet(GetDSL):
         self.call_get(str(ObjectId()))
         self.check_get_success()
 
+    def test_get_with_fields(self):
+        """Test getting only specific fields of an item."""
+
+        self.mock_get()
+        self.call_get(str(ObjectId()), fields=["id", "serial_number"])
+        self.check_get_success()
+
 
 class ListDSL(ItemServiceDSL):
     """Base class for `list` tests"""
 
+    # pylint:disable=too-many-instance-attributes
     _system_id_filter: Optional[str]
     _catalogue_item_id_filter: Optional[str]
+    _limit: Optional[int]
+    _cursor: Optional[str]
+    _fields: Optional[list[str]]
+    _filters: Optional[list[Filter]]
+    _sort: Optional[Sort]
     _expected_items: MagicMock
     _obtained_items: MagicMock
 
@@ -698,22 +962,53 @@ class ListDSL(ItemServiceDSL):
         self._expected_items = MagicMock()
         ServiceTestHelpers.mock_list(self.mock_item_repository, self._expected_items)
 
-    def call_list(self, system_id: Optional[str], catalogue_item_id: Optional[str]) -> None:
+    # pylint:disable=too-many-arguments
+    # pylint:disable=too-many-positional-arguments
+    def call_list(
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        filters: Optional[list[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> None:
         """
-        Calls the `CatalogueItemService` `list` method.
+        Calls the `ItemService` `list` method.
 
         :param system_id: ID of the system to query by, or `None`.
         :param catalogue_item_id: ID of the catalogue item to query by, or `None`.
+        :param limit: Maximum number of items to return, or `None`.
+        :param cursor: Cursor of the page to return, or `None`.
+        :param fields: List of the fields to retrieve, or `None`.
+        :param filters: List of the filters to apply, or `None`.
+        :param sort: Sort to apply, or `None`.
         """
 
         self._system_id_filter = system_id
         self._catalogue_item_id_filter = catalogue_item_id
-        self._obtained_items = self.item_service.list(system_id, catalogue_item_id)
+        self._limit = limit
+        self._cursor = cursor
+        self._fields = fields
+        self._filters = filters
+        self._sort = sort
+        self._obtained_items = self.item_service.list(
+            system_id, catalogue_item_id, limit=limit, cursor=cursor, fields=fields, filters=filters, sort=sort
+        )
 
     def check_list_success(self) -> None:
         """Checks that a prior call to `call_list` worked as expected."""
 
-        self.mock_item_repository.list.assert_called_once_with(self._system_id_filter, self._catalogue_item_id_filter)
+        self.mock_item_repository.list.assert_called_once_with(
+            self._system_id_filter,
+            self._catalogue_item_id_filter,
+            limit=self._limit,
+            cursor=self._cursor,
+            fields=self._fields,
+            filters=self._filters,
+            sort=self._sort,
+        )
 
         assert self._obtained_items == self._expected_items
 
@@ -728,12 +1023,223 @@ class TestList(ListDSL):
         self.call_list(str(ObjectId()), str(ObjectId()))
         self.check_list_success()
 
+    def test_list_with_limit_and_cursor(self):
+        """Test listing items with a limit and cursor."""
+
+        self.mock_list()
+        self.call_list(str(ObjectId()), str(ObjectId()), limit=10, cursor=encode_cursor(str(ObjectId())))
+        self.check_list_success()
+
+    def test_list_with_fields(self):
+        """Test listing only specific fields of items."""
+
+        self.mock_list()
+        self.call_list(str(ObjectId()), str(ObjectId()), fields=["id", "serial_number"])
+        self.check_list_success()
+
+    def test_list_with_filters_and_sort(self):
+        """Test listing items with filters and a sort."""
+
+        self.mock_list()
+        self.call_list(
+            None,
+            None,
+            filters=[
+                Filter("usage_status_id", FilterOperator.EQ, str(ObjectId())),
+                Filter("is_defective", FilterOperator.EQ, False),
+            ],
+            sort=Sort("warranty_end_date"),
+        )
+        self.check_list_success()
+
+
+class StreamDSL(ItemServiceDSL):
+    """Base class for `stream` tests"""
+
+    # pylint:disable=too-many-instance-attributes
+    _system_id_filter: Optional[str]
+    _catalogue_item_id_filter: Optional[str]
+    _limit: Optional[int]
+    _cursor: Optional[str]
+    _fields: Optional[list[str]]
+    _filters: Optional[list[Filter]]
+    _sort: Optional[Sort]
+    _expected_items: MagicMock
+    _obtained_items: MagicMock
+
+    def mock_stream(self) -> None:
+        """Mocks repo methods appropriately to test the `stream` service method."""
+
+        # Simply a return currently, so no need to use actual data
+        self._expected_items = MagicMock()
+        self.mock_item_repository.stream.return_value = self._expected_items
+
+    # pylint:disable=too-many-arguments
+    # pylint:disable=too-many-positional-arguments
+    def call_stream(
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        filters: Optional[list[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> None:
+        """
+        Calls the `ItemService` `stream` method.
+
+        :param system_id: ID of the system to query by, or `None`.
+        :param catalogue_item_id: ID of the catalogue item to query by, or `None`.
+        :param limit: Maximum number of items to return, or `None`.
+        :param cursor: Cursor of the page to return, or `None`.
+        :param fields: List of the fields to retrieve, or `None`.
+        :param filters: List of the filters to apply, or `None`.
+        :param sort: Sort to apply, or `None`.
+        """
+
+        self._system_id_filter = system_id
+        self._catalogue_item_id_filter = catalogue_item_id
+        self._limit = limit
+        self._cursor = cursor
+        self._fields = fields
+        self._filters = filters
+        self._sort = sort
+        self._obtained_items = self.item_service.stream(
+            system_id, catalogue_item_id, limit=limit, cursor=cursor, fields=fields, filters=filters, sort=sort
+        )
+
+    def check_stream_success(self) -> None:
+        """Checks that a prior call to `call_stream` worked as expected."""
+
+        self.mock_item_repository.stream.assert_called_once_with(
+            self._system_id_filter,
+            self._catalogue_item_id_filter,
+            limit=self._limit,
+            cursor=self._cursor,
+            fields=self._fields,
+            filters=self._filters,
+            sort=self._sort,
+        )
+
+        assert self._obtained_items == self._expected_items
+
+
+class TestStream(StreamDSL):
+    """Tests for streaming items."""
+
+    def test_stream(self):
+        """Test streaming items."""
+
+        self.mock_stream()
+        self.call_stream(
+            str(ObjectId()),
+            str(ObjectId()),
+            limit=10,
+            cursor=encode_cursor(str(ObjectId())),
+            fields=["id", "serial_number"],
+            filters=[Filter("is_defective", FilterOperator.EQ, True)],
+            sort=Sort("delivered_date", descending=True),
+        )
+        self.check_stream_success()
+
+
+class GetListVersionDSL(ItemServiceDSL):
+    """Base class for `get_list_version` tests"""
+
+    # pylint:disable=too-many-instance-attributes
+    _system_id_filter: Optional[str]
+    _catalogue_item_id_filter: Optional[str]
+    _limit: Optional[int]
+    _cursor: Optional[str]
+    _filters: Optional[list[Filter]]
+    _sort: Optional[Sort]
+    _expected_list_version: MagicMock
+    _obtained_list_version: MagicMock
+
+    def mock_get_list_version(self) -> None:
+        """Mocks repo methods appropriately to test the `get_list_version` service method."""
+
+        # Simply a return currently, so no need to use actual data
+        self._expected_list_version = MagicMock()
+        self.mock_item_repository.get_list_version.return_value = self._expected_list_version
+
+    # pylint:disable=too-many-arguments
+    # pylint:disable=too-many-positional-arguments
+    def call_get_list_version(
+        self,
+        system_id: Optional[str],
+        catalogue_item_id: Optional[str],
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        filters: Optional[list[Filter]] = None,
+        sort: Optional[Sort] = None,
+    ) -> None:
+        """
+        Calls the `ItemService` `get_list_version` method.
+
+        :param system_id: ID of the system to query by, or `None`.
+        :param catalogue_item_id: ID of the catalogue item to query by, or `None`.
+        :param limit: Maximum number of items in the list, or `None`.
+        :param cursor: Cursor of the page of the list, or `None`.
+        :param filters: List of the filters applied to the list, or `None`.
+        :param sort: Sort applied to the list, or `None`.
+        """
+
+        self._system_id_filter = system_id
+        self._catalogue_item_id_filter = catalogue_item_id
+        self._limit = limit
+        self._cursor = cursor
+        self._filters = filters
+        self._sort = sort
+        self._obtained_list_version = self.item_service.get_list_version(
+            system_id, catalogue_item_id, limit=limit, cursor=cursor, filters=filters, sort=sort
+        )
+
+    def check_get_list_version_success(self) -> None:
+        """Checks that a prior call to `call_get_list_version` worked as expected."""
+
+        self.mock_item_repository.get_list_version.assert_called_once_with(
+            self._system_id_filter,
+            self._catalogue_item_id_filter,
+            limit=self._limit,
+            cursor=self._cursor,
+            filters=self._filters,
+            sort=self._sort,
+        )
+
+        assert self._obtained_list_version == self._expected_list_version
+
+
+class TestGetListVersion(GetListVersionDSL):
+    """Tests for getting the version of a list of items."""
+
+    def test_get_list_version(self):
+        """Test getting the version of a list of items."""
+
+        self.mock_get_list_version()
+        self.call_get_list_version(str(ObjectId()), str(ObjectId()), limit=10, cursor=encode_cursor(str(ObjectId())))
+        self.check_get_list_version_success()
+
+    def test_get_list_version_with_filters_and_sort(self):
+        """Test getting the version of a filtered and sorted list of items."""
+
+        self.mock_get_list_version()
+        self.call_get_list_version(
+            None,
+            None,
+            filters=[Filter("is_defective", FilterOperator.EQ, True)],
+            sort=Sort("delivered_date", descending=True),
+        )
+        self.check_get_list_version_success()
+
 
 # pylint:disable=too-many-instance-attributes
 class UpdateDSL(ItemServiceDSL):
     """Base class for `update` tests."""
 
     _stored_item: Optional[ItemOut]
+    _transaction_stored_item: Optional[ItemOut]
     _stored_system_out: Optional[SystemOut]
     _stored_catalogue_item_out: Optional[CatalogueItemOut]
     _stored_catalogue_category_out: Optional[CatalogueCategoryOut]
@@ -769,6 +1275,7 @@ class UpdateDSL(ItemServiceDSL):
         new_system_in_data: Optional[dict] = None,
         raise_write_conflict_once: bool = False,
         user_is_authorised=False,
+        moved_concurrently_system_in_data: Optional[dict] = None,
     ) -> None:
         """
         Mocks repository methods appropriately to test the `update` service method.
@@ -800,6 +1307,10 @@ class UpdateDSL(ItemServiceDSL):
         :param raise_write_conflict_once: Whether to raise a write conflict during the number of spares update to
                                           test the retrying functionality.
         :param user_is_authorised: Whether the request is authorised to bypass functionality such as checking rules.
+        :param moved_concurrently_system_in_data: Either `None` or a dictionary containing the system data as would be
+                                                  required for a `SystemIn` database model for a system the item should
+                                                  have been moved into by the time the transaction starts, as if moved
+                                                  by another request.
         """
 
         self._user_authorised = user_is_authorised
@@ -852,6 +1363,7 @@ class UpdateDSL(ItemServiceDSL):
         stored_ids_to_insert = {
             "catalogue_item_id": catalogue_category_id,
             "system_id": str(ObjectId()),
+            "system_type_id": stored_system_in_data["type_id"] if stored_system_in_data else str(ObjectId()),
         }
 
         # Stored item
@@ -870,7 +1382,13 @@ class UpdateDSL(ItemServiceDSL):
             if stored_item_data
             else None
         )
-        ServiceTestHelpers.mock_get(self.mock_item_repository, self._stored_item)
+        # Item as stored when the transaction starts
+        self._transaction_stored_item = self._stored_item
+        if moved_concurrently_system_in_data:
+            self._transaction_stored_item = self._stored_item.model_copy(
+                update={"system_id": str(ObjectId()), "system_type_id": moved_concurrently_system_in_data["type_id"]}
+            )
+        self.mock_item_repository.get.side_effect = [self._stored_item, self._transaction_stored_item]
 
         self._moving_system = (
             "system_id" in item_update_data
@@ -892,9 +1410,7 @@ class UpdateDSL(ItemServiceDSL):
         if self._updating_properties:
             expected_properties_in = self._mock_handle_properties_update(item_update_data, stored_catalogue_category_in)
 
-        self._mock_start_transaction_impacting_number_of_spares(
-            stored_spares_definition_out_data, raise_write_conflict_once
-        )
+        self._mock_start_transaction_impacting_item_counts(stored_spares_definition_out_data, raise_write_conflict_once)
 
         # Updated item
         self._expected_item_out = MagicMock()
@@ -909,6 +1425,10 @@ class UpdateDSL(ItemServiceDSL):
             **stored_ids_to_insert,
             "usage_status": stored_usage_status_in_data["value"],
             **item_update_data,
+            # The system type should also change when moving system
+            **(
+                {"system_type_id": self._new_system_out.type_id} if self._moving_system and self._new_system_out else {}
+            ),
         }
         self._expected_item_in = ItemIn(**{**merged_item_data, "properties": expected_properties_in})
 
@@ -938,22 +1458,34 @@ class UpdateDSL(ItemServiceDSL):
     def check_update_success(self) -> None:
         """Checks that a prior call to `call_update` worked as expected."""
 
-        self.mock_item_repository.get.assert_called_once_with(self._updated_item_id)
-
         self._check_handle_system_and_usage_status_id_update_success()
         self._check_handle_properties_update_success()
 
         if self._moving_system:
-            self._check_start_transition_impacting_number_of_spares_performed_expected_calls(
+            # The second get is within the transaction to find the current system type of the item
+            assert self.mock_item_repository.get.call_args_list == [
+                call(self._updated_item_id),
+                call(self._updated_item_id, session=self.mock_transaction_session),
+            ]
+            self._check_start_transaction_impacting_item_counts_performed_expected_calls(
                 "updating item",
-                self._stored_item.catalogue_item_id,
+                [
+                    (
+                        self._stored_item.catalogue_item_id,
+                        self._transaction_stored_item.system_type_id,
+                        self._new_system_out.type_id,
+                    )
+                ],
                 str(self._expected_item_in.system_id),
             )
             self.mock_item_repository.update.assert_called_once_with(
                 self._updated_item_id, self._expected_item_in, session=self.mock_transaction_session
             )
         else:
-            self.mock_item_repository.update.assert_called_once_with(self._updated_item_id, self._expected_item_in)
+            self.mock_item_repository.get.assert_called_once_with(self._updated_item_id)
+            self.mock_item_repository.update.assert_called_once_with(
+                self._updated_item_id, self._expected_item_in, update_system=False
+            )
 
         assert self._updated_item == self._expected_item_out
 
@@ -1006,14 +1538,13 @@ class UpdateDSL(ItemServiceDSL):
                 SystemOut(
                     **{
                         **SystemIn(**new_system_in_data).model_dump(),
-                        "_id": item_update_data["system_id"],
+                        # As would be returned from the database
+                        "_id": CustomObjectId(item_update_data["system_id"]),
                     },
                 )
                 if new_system_in_data
                 else None
             )
-            ServiceTestHelpers.mock_get(self.mock_system_repository, self._new_system_out)
-
             self._stored_system_out = (
                 SystemOut(
                     **{
@@ -1024,9 +1555,13 @@ class UpdateDSL(ItemServiceDSL):
                 if stored_system_in_data
                 else None
             )
-            ServiceTestHelpers.mock_get(
+            ServiceTestHelpers.mock_get_many(
                 self.mock_system_repository,
-                self._stored_system_out,
+                {
+                    system_out.id: system_out
+                    for system_out in [self._new_system_out, self._stored_system_out]
+                    if system_out is not None
+                },
             )
 
             if (
@@ -1119,8 +1654,8 @@ class UpdateDSL(ItemServiceDSL):
         """Checks that a call to `_handle_system_and_usage_status_id_update` worked as expected."""
 
         if self._moving_system:
-            self.mock_system_repository.get.assert_has_calls(
-                [call(self._item_patch.system_id), call(self._stored_item.system_id)]
+            self.mock_system_repository.get_many.assert_called_once_with(
+                [self._item_patch.system_id, self._stored_item.system_id]
             )
 
             if self._stored_system_out.type_id != self._new_system_out.type_id and not self._user_authorised:
@@ -1159,6 +1694,7 @@ class UpdateDSL(ItemServiceDSL):
             self.wrapped_utils.process_properties.assert_not_called()
 
 
+# pylint: disable=too-many-public-methods
 class TestUpdate(UpdateDSL):
     """Tests for updating an item."""
 
@@ -1242,6 +1778,22 @@ class TestUpdate(UpdateDSL):
         self.call_update(item_id)
         self.check_update_success()
 
+    def test_update_system_id_with_uppercase_id(self):
+        """Test updating an item's `system_id` when the given ID is uppercase."""
+
+        item_id = str(ObjectId())
+
+        self.mock_update(
+            item_id,
+            item_update_data={"system_id": str(ObjectId()).upper()},
+            stored_item_data=ITEM_DATA_NEW_REQUIRED_VALUES_ONLY,
+            stored_usage_status_in_data=USAGE_STATUS_IN_DATA_IN_USE,
+            stored_system_in_data=SYSTEM_IN_DATA_STORAGE_NO_PARENT_A,
+            new_system_in_data=SYSTEM_IN_DATA_STORAGE_NO_PARENT_B,
+        )
+        self.call_update(item_id)
+        self.check_update_success()
+
     def test_update_system_id_with_spares_definition_defined(self):
         """Test updating an item's `system_id` when there is a spares definition defined."""
 
@@ -1278,6 +1830,71 @@ class TestUpdate(UpdateDSL):
         self.call_update(item_id)
         self.check_update_success()
 
+    def test_update_system_id_when_moved_concurrently(self):
+        """Test updating an item's `system_id` when it is moved into a system of another type by another request before
+        the transaction starts."""
+
+        item_id = str(ObjectId())
+
+        self.mock_update(
+            item_id,
+            item_update_data={"system_id": str(ObjectId())},
+            stored_item_data=ITEM_DATA_NEW_REQUIRED_VALUES_ONLY,
+            stored_usage_status_in_data=USAGE_STATUS_IN_DATA_IN_USE,
+            stored_system_in_data=SYSTEM_IN_DATA_STORAGE_NO_PARENT_A,
+            stored_spares_definition_out_data=SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE,
+            new_system_in_data=SYSTEM_IN_DATA_STORAGE_NO_PARENT_B,
+            moved_concurrently_system_in_data={**SYSTEM_IN_DATA_STORAGE_NO_PARENT_A, "type_id": str(ObjectId())},
+        )
+        self.call_update(item_id)
+        self.check_update_success()
+
+    def test_update_system_id_when_moved_concurrently_without_spares_definition(self):
+        """Test updating an item's `system_id` when it is moved into a system of another type by another request before
+        the transaction starts and there is no spares definition, so that only the per system type item counts of the
+        catalogue item change."""
+
+        item_id = str(ObjectId())
+
+        self.mock_update(
+            item_id,
+            item_update_data={"system_id": str(ObjectId())},
+            stored_item_data=ITEM_DATA_NEW_REQUIRED_VALUES_ONLY,
+            stored_usage_status_in_data=USAGE_STATUS_IN_DATA_IN_USE,
+            stored_system_in_data=SYSTEM_IN_DATA_STORAGE_NO_PARENT_A,
+            new_system_in_data=SYSTEM_IN_DATA_STORAGE_NO_PARENT_B,
+            moved_concurrently_system_in_data={**SYSTEM_IN_DATA_STORAGE_NO_PARENT_A, "type_id": str(ObjectId())},
+        )
+        self.call_update(item_id)
+        self.check_update_success()
+
+    def test_update_system_id_when_moved_concurrently_into_new_system_type(self):
+        """Test updating an item's `system_id` when it is moved into a system of the new system's type by another
+        request before the transaction starts, so that the item counts of the catalogue item don't change."""
+
+        item_id = str(ObjectId())
+
+        self.mock_update(
+            item_id,
+            item_update_data={"system_id": str(ObjectId())},
+            stored_item_data=ITEM_DATA_NEW_REQUIRED_VALUES_ONLY,
+            stored_usage_status_in_data=USAGE_STATUS_IN_DATA_IN_USE,
+            stored_system_in_data=SYSTEM_IN_DATA_STORAGE_NO_PARENT_A,
+            stored_spares_definition_out_data=SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE,
+            new_system_in_data={
+                **SYSTEM_IN_DATA_STORAGE_NO_PARENT_B,
+                "type_id": SYSTEM_TYPE_GET_DATA_OPERATIONAL["id"],
+            },
+            stored_rule_exists=True,
+            moved_concurrently_system_in_data={
+                **SYSTEM_IN_DATA_STORAGE_NO_PARENT_A,
+                "type_id": SYSTEM_TYPE_GET_DATA_OPERATIONAL["id"],
+            },
+        )
+        self.call_update(item_id)
+        self.check_update_success()
+        self.mock_catalogue_item_repository.increment_item_counts.assert_not_called()
+
     def test_update_with_non_existent_system_id(self):
         """Test updating an item's `system_id` to a non-existent system."""
 
@@ -1294,6 +1911,22 @@ class TestUpdate(UpdateDSL):
         self.call_update_expecting_error(item_id, MissingRecordError)
         self.check_update_failed_with_exception(f"No system found with ID '{system_id}'")
 
+    def test_update_system_id_with_non_existent_stored_system(self):
+        """Test updating an item's `system_id` when the system it is currently in doesn't exist."""
+
+        item_id = str(ObjectId())
+
+        self.mock_update(
+            item_id,
+            item_update_data={"system_id": str(ObjectId())},
+            stored_item_data=ITEM_DATA_NEW_REQUIRED_VALUES_ONLY,
+            stored_usage_status_in_data=USAGE_STATUS_IN_DATA_IN_USE,
+            stored_system_in_data=None,
+            new_system_in_data=SYSTEM_IN_DATA_STORAGE_NO_PARENT_B,
+        )
+        self.call_update_expecting_error(item_id, DatabaseIntegrityError)
+        self.check_update_failed_with_exception(f"No system found with ID '{self._stored_item.system_id}'")
+
     def test_update_system_and_usage_status_ids(self):
         """Test updating an item's `system_id` and `usage_status_id`."""
 
@@ -1315,6 +1948,29 @@ class TestUpdate(UpdateDSL):
         self.call_update(item_id)
         self.check_update_success()
 
+    def test_update_system_and_usage_status_ids_with_spares_definition_defined(self):
+        """Test updating an item's `system_id` and `usage_status_id` to move it out of a spares system when there is a
+        spares definition defined."""
+
+        item_id = str(ObjectId())
+
+        self.mock_update(
+            item_id,
+            item_update_data={"system_id": str(ObjectId()), "usage_status_id": USAGE_STATUS_GET_DATA_IN_USE["id"]},
+            stored_item_data=ITEM_DATA_NEW_REQUIRED_VALUES_ONLY,
+            stored_usage_status_in_data=USAGE_STATUS_IN_DATA_IN_USE,
+            stored_system_in_data=SYSTEM_IN_DATA_STORAGE_NO_PARENT_A,
+            stored_rule_exists=True,
+            stored_spares_definition_out_data=SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE,
+            new_usage_status_in_data=USAGE_STATUS_IN_DATA_IN_USE,
+            new_system_in_data={
+                **SYSTEM_IN_DATA_STORAGE_NO_PARENT_B,
+                "type_id": SYSTEM_TYPE_GET_DATA_OPERATIONAL["id"],
+            },
+        )
+        self.call_update(item_id)
+        self.check_update_success()
+
     def test_update_system_and_usage_status_ids_when_authorised(self):
         """Test updating an item's `system_id` and `usage_status_id` when the user is authorised."""
 
@@ -1473,6 +2129,7 @@ class DeleteDSL(ItemServiceDSL):
     _delete_item_id: str
     _delete_exception: pytest.ExceptionInfo
     _user_authorised: bool
+    _deleted_concurrently: bool
 
     # pylint:disable=too-many-arguments
     # pylint:disable=too-many-positional-arguments
@@ -1484,6 +2141,7 @@ class DeleteDSL(ItemServiceDSL):
         stored_rule_exists: bool = True,
         raise_write_conflict_once: bool = False,
         user_is_authorised: bool = False,
+        deleted_concurrently: bool = False,
     ) -> None:
         """
         Mocks repository methods appropriately to test the `delete` service method.
@@ -1500,9 +2158,12 @@ class DeleteDSL(ItemServiceDSL):
                                           test the retrying functionality.
 
         :param user_is_authorised: Whether the request is authorised to bypass functionality such as checking rules.
+        :param deleted_concurrently: Whether the item should no longer exist by the time the transaction starts, as if
+                                     deleted by another request.
         """
 
         self._user_authorised = user_is_authorised
+        self._deleted_concurrently = deleted_concurrently
 
         # Generate mandatory IDs to be inserted where needed
         system_id = str(ObjectId())
@@ -1514,6 +2175,7 @@ class DeleteDSL(ItemServiceDSL):
                     **stored_item_data,
                     catalogue_item_id=str(ObjectId()),
                     system_id=system_id,
+                    system_type_id=system_in_data["type_id"] if system_in_data else str(ObjectId()),
                     # Need a value here but doesn't matter if it matches the usage status or not
                     usage_status="test",
                 ).model_dump(),
@@ -1522,7 +2184,11 @@ class DeleteDSL(ItemServiceDSL):
             if stored_item_data
             else None
         )
-        ServiceTestHelpers.mock_get(self.mock_item_repository, self._stored_item)
+        # The item is obtained a second time when the transaction starts
+        self.mock_item_repository.get.side_effect = [
+            self._stored_item,
+            None if deleted_concurrently else self._stored_item,
+        ]
 
         # System
         system_in = None
@@ -1535,9 +2201,7 @@ class DeleteDSL(ItemServiceDSL):
         # Rule
         self.mock_rule_repository.check_exists.return_value = stored_rule_exists
 
-        self._mock_start_transaction_impacting_number_of_spares(
-            stored_spares_definition_out_data, raise_write_conflict_once
-        )
+        self._mock_start_transaction_impacting_item_counts(stored_spares_definition_out_data, raise_write_conflict_once)
 
     def call_delete(self, item_id: str) -> None:
         """
@@ -1565,8 +2229,11 @@ class DeleteDSL(ItemServiceDSL):
     def check_delete_success(self) -> None:
         """Checks that a prior call to `call_delete` worked as expected."""
 
-        # This is the get for the item
-        self.mock_item_repository.get.assert_called_once_with(self._delete_item_id)
+        # These are the gets for the item, the second being within the transaction to find its current system type
+        assert self.mock_item_repository.get.call_args_list == [
+            call(self._delete_item_id),
+            call(self._delete_item_id, session=self.mock_transaction_session),
+        ]
 
         # This is the get for the system
         self.mock_system_repository.get.assert_called_once_with(self._stored_item.system_id)
@@ -1580,8 +2247,8 @@ class DeleteDSL(ItemServiceDSL):
                 dst_usage_status_id=None,
             )
 
-        self._check_start_transition_impacting_number_of_spares_performed_expected_calls(
-            "deleting item", self._stored_item.catalogue_item_id
+        self._check_start_transaction_impacting_item_counts_performed_expected_calls(
+            "deleting item", [(self._stored_item.catalogue_item_id, self._stored_item.system_type_id, None)]
         )
         self.mock_item_repository.delete.assert_called_once_with(
             self._delete_item_id, session=self.mock_transaction_session
@@ -1595,7 +2262,14 @@ class DeleteDSL(ItemServiceDSL):
         :param message: Expected message of the raised exception.
         """
 
-        self.mock_item_repository.get.assert_called_once_with(self._delete_item_id)
+        if self._deleted_concurrently:
+            assert self.mock_item_repository.get.call_args_list == [
+                call(self._delete_item_id),
+                call(self._delete_item_id, session=self.mock_transaction_session),
+            ]
+            self.mock_catalogue_item_repository.increment_item_counts.assert_not_called()
+        else:
+            self.mock_item_repository.get.assert_called_once_with(self._delete_item_id)
         self.mock_item_repository.delete.assert_not_called()
 
         assert str(self._delete_exception.value) == message
@@ -1635,6 +2309,20 @@ class TestDelete(DeleteDSL):
         self.call_delete(str(ObjectId()))
         self.check_delete_success()
 
+    def test_delete_when_deleted_concurrently(self):
+        """Test deleting an item when it is deleted by another request before the transaction starts."""
+
+        item_id = str(ObjectId())
+
+        self.mock_delete(
+            ITEM_DATA_NEW_REQUIRED_VALUES_ONLY,
+            system_in_data=SYSTEM_IN_DATA_STORAGE_NO_PARENT_A,
+            stored_spares_definition_out_data=SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE,
+            deleted_concurrently=True,
+        )
+        self.call_delete_expecting_error(item_id, MissingRecordError)
+        self.check_delete_failed_with_exception(f"No item found with ID '{item_id}'")
+
     def test_delete_non_existent_id(self):
         """Test deleting an item with a non-existent ID."""
 
@@ -18,6 +18,7 @@ from unittest.mock import MagicMock, Mock, call, patch
 import pytest
 from bson import ObjectId
 
+from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.exceptions import InvalidActionError, MissingRecordError
 from inventory_management_system_api.models.setting import (
     InUseDefinitionIn,
@@ -73,7 +74,6 @@ class SetSparesDefinitionDSL(SettingServiceDSL):
 
     _spares_definition_in: SparesDefinitionIn
     _expected_spares_definition_out: MagicMock
-    _expected_catalogue_item_ids = list[ObjectId]
     _updated_spares_definition: MagicMock
     _set_spares_definition_exception: pytest.ExceptionInfo
 
@@ -99,12 +99,17 @@ class SetSparesDefinitionDSL(SettingServiceDSL):
             InUseDefinitionOut(**in_use_definition_out_data) if in_use_definition_out_data else None
         )
 
-        # Stored usage statuses
-        for i in range(0, len(spares_definition_in_data["system_type_ids"])):
-            ServiceTestHelpers.mock_get(
-                self.mock_system_type_repository,
-                SystemTypeOut(**system_types_out_data[i]) if system_types_out_data[i] else None,
-            )
+        # Stored system types
+        ServiceTestHelpers.mock_get_many(
+            self.mock_system_type_repository,
+            {
+                str(system_type_id): SystemTypeOut(**system_type_out_data)
+                for system_type_id, system_type_out_data in zip(
+                    spares_definition_in_data["system_type_ids"], system_types_out_data
+                )
+                if system_type_out_data
+            },
+        )
 
         self._spares_definition_in = SparesDefinitionIn(**spares_definition_in_data)
 
@@ -112,10 +117,6 @@ class SetSparesDefinitionDSL(SettingServiceDSL):
         self._expected_spares_definition_out = MagicMock()
         self.mock_setting_repository.upsert.return_value = self._expected_spares_definition_out
 
-        # Expected list of catalogue item IDs that need to be updated (actual values don't matter here)
-        self._expected_catalogue_item_ids = [ObjectId(), ObjectId()]
-        self.mock_catalogue_item_repository.list_ids.return_value = self._expected_catalogue_item_ids
-
     def call_set_spares_definition(self) -> None:
         """Calls the `SettingService` `set_spares_definition` method with the appropriate data from a prior call to
         `mock_set_spares_definition`."""
@@ -141,8 +142,8 @@ class SetSparesDefinitionDSL(SettingServiceDSL):
         self.mock_setting_repository.get.assert_called_once_with(InUseDefinitionOut)
 
         # Ensure checked all of the system types
-        self.mock_system_type_repository.get.assert_has_calls(
-            [call(str(system_type_id)) for system_type_id in self._spares_definition_in.system_type_ids]
+        self.mock_system_type_repository.get_many.assert_called_once_with(
+            [str(system_type_id) for system_type_id in self._spares_definition_in.system_type_ids]
         )
 
         # Ensure started a transaction
@@ -154,22 +155,11 @@ class SetSparesDefinitionDSL(SettingServiceDSL):
             self._spares_definition_in, SparesDefinitionOut, session=expected_session
         )
 
-        # Ensure obtained list of all catalogue item ids recalculated the number of spares for each
-        self.mock_catalogue_item_repository.list_ids.assert_called_once_with()
-
-        expected_count_in_catalogue_item_with_system_type_one_of_calls = []
-        expected_update_number_of_spares_calls = []
-        for catalogue_item_id in self._expected_catalogue_item_ids:
-            expected_count_in_catalogue_item_with_system_type_one_of_calls.append(
-                call(catalogue_item_id, self._spares_definition_in.system_type_ids, session=expected_session)
-            )
-            expected_update_number_of_spares_calls.append(
-                call(
-                    catalogue_item_id,
-                    self.mock_item_repository.count_in_catalogue_item_with_system_type_one_of.return_value,
-                    session=expected_session,
-                )
-            )
+        # Ensure derived the number of spares of all catalogue items from their item counts without counting any items
+        self.mock_catalogue_item_repository.update_all_number_of_spares_from_item_counts.assert_called_once_with(
+            self._spares_definition_in.system_type_ids, session=expected_session
+        )
+        self.mock_item_repository.count_by_catalogue_item_and_system_type.assert_not_called()
 
         assert self._updated_spares_definition == self._expected_spares_definition_out
 
@@ -229,6 +219,113 @@ class TestSetSparesDefinition(SetSparesDefinitionDSL):
         )
 
 
+class RecalculateItemCountsDSL(SettingServiceDSL):
+    """Base class for `recalculate_item_counts` tests."""
+
+    _spares_definition_out: Optional[SparesDefinitionOut]
+
+    def mock_recalculate_item_counts(
+        self, spares_definition_out_data: Optional[dict], item_counts: dict[ObjectId, dict[str, int]]
+    ) -> None:
+        """
+        Mocks repository methods appropriately to test the `recalculate_item_counts` service method.
+
+        :param spares_definition_out_data: Either `None` or a dictionary containing the current spares definition data
+                                           as would be required for a `SparesDefinitionOut` database model.
+        :param item_counts: Dictionary of the counted items (themselves keyed by the system type IDs) with the
+                            catalogue item IDs as keys.
+        """
+
+        self._spares_definition_out = (
+            SparesDefinitionOut(**spares_definition_out_data) if spares_definition_out_data else None
+        )
+        ServiceTestHelpers.mock_get(self.mock_setting_repository, self._spares_definition_out)
+
+        self.mock_item_repository.count_by_catalogue_item_and_system_type.return_value = item_counts
+
+    def call_recalculate_item_counts(self) -> None:
+        """Calls the `SettingService` `recalculate_item_counts` method."""
+
+        self.setting_service.recalculate_item_counts()
+
+    def check_recalculate_item_counts_success(self, expected_batches: list[dict[ObjectId, dict[str, int]]]) -> None:
+        """
+        Checks that a prior call to `call_recalculate_item_counts` worked as expected.
+
+        :param expected_batches: List of the batches of item counts that are expected to be updated.
+        """
+
+        self.mock_start_session_transaction.assert_called_once_with("recalculating item counts")
+        expected_session = self.mock_start_session_transaction.return_value.__enter__.return_value
+
+        self.mock_setting_repository.get.assert_called_once_with(SparesDefinitionOut, session=expected_session)
+
+        self.mock_item_repository.count_by_catalogue_item_and_system_type.assert_called_once_with(
+            session=expected_session
+        )
+        self.mock_catalogue_item_repository.update_all_item_counts.assert_called_once_with({}, session=expected_session)
+        assert self.mock_catalogue_item_repository.update_many_item_counts.call_args_list == [
+            call(expected_batch, session=expected_session) for expected_batch in expected_batches
+        ]
+
+        if self._spares_definition_out is None:
+            self.mock_catalogue_item_repository.update_all_number_of_spares_from_item_counts.assert_not_called()
+        else:
+            self.mock_catalogue_item_repository.update_all_number_of_spares_from_item_counts.assert_called_once_with(
+                [CustomObjectId(system_type.id) for system_type in self._spares_definition_out.system_types],
+                session=expected_session,
+            )
+
+
+class TestRecalculateItemCounts(RecalculateItemCountsDSL):
+    """Tests for recalculating the item counts of all catalogue items."""
+
+    def test_recalculate_item_counts(self):
+        """Test recalculating the item counts."""
+
+        item_counts = {ObjectId(): {str(ObjectId()): 42}, ObjectId(): {str(ObjectId()): 1, str(ObjectId()): 2}}
+
+        self.mock_recalculate_item_counts(SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE, item_counts)
+        self.call_recalculate_item_counts()
+        self.check_recalculate_item_counts_success([item_counts])
+
+    def test_recalculate_item_counts_in_multiple_batches(self):
+        """Test recalculating the item counts when the updates need to be split into multiple batches."""
+
+        catalogue_item_ids = [ObjectId(), ObjectId(), ObjectId()]
+        system_type_id = str(ObjectId())
+
+        self.mock_recalculate_item_counts(
+            SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE,
+            {catalogue_item_id: {system_type_id: 1} for catalogue_item_id in catalogue_item_ids},
+        )
+        with patch("inventory_management_system_api.services.setting.BULK_WRITE_BATCH_SIZE", 2):
+            self.call_recalculate_item_counts()
+        self.check_recalculate_item_counts_success(
+            [
+                {catalogue_item_ids[0]: {system_type_id: 1}, catalogue_item_ids[1]: {system_type_id: 1}},
+                {catalogue_item_ids[2]: {system_type_id: 1}},
+            ]
+        )
+
+    def test_recalculate_item_counts_with_no_items(self):
+        """Test recalculating the item counts when there are no items."""
+
+        self.mock_recalculate_item_counts(SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE, {})
+        self.call_recalculate_item_counts()
+        self.check_recalculate_item_counts_success([])
+
+    def test_recalculate_item_counts_with_no_spares_definition(self):
+        """Test recalculating the item counts when there is no spares definition (so there is no number of spares to
+        update)."""
+
+        item_counts = {ObjectId(): {str(ObjectId()): 42}}
+
+        self.mock_recalculate_item_counts(None, item_counts)
+        self.call_recalculate_item_counts()
+        self.check_recalculate_item_counts_success([item_counts])
+
+
 class GetSparesDefinitionDSL(SettingServiceDSL):
     """Base class for 'get' spares definition tests."""
 
@@ -292,12 +389,17 @@ class SetInUseDefinitionDSL(SettingServiceDSL):
             SparesDefinitionOut(**spares_definition_out_data) if spares_definition_out_data else None
         )
 
-        # Stored usage statuses
-        for i in range(0, len(in_use_definition_in_data["system_type_ids"])):
-            ServiceTestHelpers.mock_get(
-                self.mock_system_type_repository,
-                SystemTypeOut(**system_types_out_data[i]) if system_types_out_data[i] else None,
-            )
+        # Stored system types
+        ServiceTestHelpers.mock_get_many(
+            self.mock_system_type_repository,
+            {
+                str(system_type_id): SystemTypeOut(**system_type_out_data)
+                for system_type_id, system_type_out_data in zip(
+                    in_use_definition_in_data["system_type_ids"], system_types_out_data
+                )
+                if system_type_out_data
+            },
+        )
 
         self._in_use_definition_in = InUseDefinitionIn(**in_use_definition_in_data)
 
@@ -330,8 +432,8 @@ class SetInUseDefinitionDSL(SettingServiceDSL):
         self.mock_setting_repository.get.assert_called_once_with(SparesDefinitionOut)
 
         # Ensure checked all of the system types
-        self.mock_system_type_repository.get.assert_has_calls(
-            [call(str(system_type_id)) for system_type_id in self._in_use_definition_in.system_type_ids]
+        self.mock_system_type_repository.get_many.assert_called_once_with(
+            [str(system_type_id) for system_type_id in self._in_use_definition_in.system_type_ids]
         )
 
         # Ensure upserted with expected data
@@ -10,7 +10,6 @@ Unit tests for the `SystemService` service.
 # pylint: disable=too-many-lines
 
 from test.mock_data import (
-    SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE,
     SYSTEM_POST_DATA_STORAGE_NO_PARENT_A,
     SYSTEM_POST_DATA_STORAGE_NO_PARENT_B,
     SYSTEM_TYPE_GET_DATA_OPERATIONAL,
@@ -26,7 +25,6 @@ from bson import ObjectId
 
 from inventory_management_system_api.core.custom_object_id import CustomObjectId
 from inventory_management_system_api.core.exceptions import ChildElementsExistError, MissingRecordError
-from inventory_management_system_api.models.setting import SparesDefinitionOut
 from inventory_management_system_api.models.system import SystemIn, SystemOut
 from inventory_management_system_api.models.system_type import SystemTypeOut
 from inventory_management_system_api.schemas.system import SystemPatchSchema, SystemPostSchema
@@ -40,20 +38,18 @@ class SystemServiceDSL:
     wrapped_utils: Mock
     mock_system_repository: Mock
     mock_system_type_repository: Mock
-    mock_setting_repository: Mock
     mock_start_session_transaction: Mock
     system_service: SystemService
 
     mock_transaction_session: Mock
-    _expected_spares_definition_out: Optional[SparesDefinitionOut]
     _expect_transaction: bool
+    _expect_write_lock: bool
 
     @pytest.fixture(autouse=True)
     def setup(
         self,
         system_repository_mock,
         system_type_repository_mock,
-        setting_repository_mock,
         system_service,
         # Ensures all created and modified times are mocked throughout
         # pylint: disable=unused-argument
@@ -63,7 +59,6 @@ class SystemServiceDSL:
 
         self.mock_system_repository = system_repository_mock
         self.mock_system_type_repository = system_type_repository_mock
-        self.mock_setting_repository = setting_repository_mock
         self.system_service = system_service
 
         with patch("inventory_management_system_api.services.system.utils", wraps=utils) as wrapped_utils:
@@ -74,69 +69,58 @@ class SystemServiceDSL:
                 self.mock_start_session_transaction = mocked_start_session_transaction
                 yield
 
-    def _mock_start_transaction_effected_by_spares_calculation(
-        self,
-        spares_definition_out_data: Optional[dict],
-        system: SystemPatchSchema,
-        stored_system: SystemOut,
-        update_data: dict,
+    def _mock_start_update_transaction(
+        self, system: SystemPatchSchema, stored_system: SystemOut, update_data: dict
     ) -> None:
         """
-        Mocks methods appropriately for when the `_start_transaction_effected_by_spares_calculation` service method
-        will be called.
+        Mocks methods appropriately for when the `_start_update_transaction` service method will be
+        called.
 
-        :param spares_definition_out_data: Either `None` or a dictionary containing the spares definition data as would
-                                           be required for a `SparesDefinitionOut` database model.
         :param system: System containing the fields to be updated.
         :param stored_system: Current stored system from the database.
         :param update_data: Dictionary containing the update data.
         """
 
-        # Only require the transaction there is a spares definition, the `type_id` is being changed, and the
-        # current/new `parent_system_id` is None
-        self._expect_transaction = (
-            spares_definition_out_data
-            and ("type_id" in update_data and system.type_id != stored_system.type_id)
-            and (system.parent_id is None if "parent_id" in update_data else stored_system.parent_id is None)
+        # Only require the transaction when the system is being moved or the `type_id` is being changed, and only
+        # write lock in the latter case
+        self._expect_write_lock = (
+            stored_system is not None and "type_id" in update_data and system.type_id != stored_system.type_id
+        )
+        self._expect_transaction = self._expect_write_lock or (
+            stored_system is not None and "parent_id" in update_data and system.parent_id != stored_system.parent_id
         )
 
         # Mock the transaction session itself - this will be the value ultimately returned by
-        # _start_transaction_effected_by_spares_calculation
+        # _start_update_transaction
         self.mock_transaction_session = MagicMock() if self._expect_transaction else None
         self.mock_start_session_transaction.return_value.__enter__.return_value = self.mock_transaction_session
 
-        # Mock the spares definition get
-        self._expected_spares_definition_out = (
-            SparesDefinitionOut(**spares_definition_out_data)
-            if spares_definition_out_data
-            and (system.type_id and system.type_id != stored_system.type_id)
-            and (system.parent_id is None if system.parent_id else stored_system.parent_id is None)
-            else None
-        )
-        ServiceTestHelpers.mock_get(self.mock_setting_repository, self._expected_spares_definition_out)
-
-    def _check_start_transaction_effected_by_spares_calculation_performed_expected_calls(
+    def _check_start_update_transaction_performed_expected_calls(
         self,
         expected_action_description: str,
         expected_system_id: str,
     ) -> None:
         """
-        Checks that a call to `_start_transaction_effected_by_spares_calculation` performed the expected function
+        Checks that a call to `_start_update_transaction` performed the expected function
         calls.
 
         :param expected_action_description: Expected `action_description` the function should have been called with.
         :param expected_system_id: Expected `system_id` the function should have been called with.
         """
 
-        self.mock_setting_repository.get.assert_called_once_with(SparesDefinitionOut)
-
         if self._expect_transaction:
             self.mock_start_session_transaction.assert_called_once_with(expected_action_description)
             self.mock_start_session_transaction.return_value.__enter__.assert_called_once()
 
+        else:
+            self.mock_start_session_transaction.assert_not_called()
+
+        if self._expect_write_lock:
             self.mock_system_repository.write_lock.assert_called_once_with(
                 expected_system_id, self.mock_transaction_session
             )
+        else:
+            self.mock_system_repository.write_lock.assert_not_called()
 
 
 class CreateDSL(SystemServiceDSL):
@@ -244,6 +228,7 @@ class GetDSL(SystemServiceDSL):
     """Base class for `get` tests."""
 
     _obtained_system_id: str
+    _fields: Optional[list[str]]
     _expected_system: MagicMock
     _obtained_system: MagicMock
 
@@ -254,20 +239,22 @@ class GetDSL(SystemServiceDSL):
         self._expected_system = MagicMock()
         ServiceTestHelpers.mock_get(self.mock_system_repository, self._expected_system)
 
-    def call_get(self, system_id: str) -> None:
+    def call_get(self, system_id: str, fields: Optional[list[str]] = None) -> None:
         """
         Calls the `SystemService` `get` method.
 
         :param system_id: ID of the system to be obtained.
+        :param fields: List of the fields to retrieve, or `None`.
         """
 
         self._obtained_system_id = system_id
-        self._obtained_system = self.system_service.get(system_id)
+        self._fields = fields
+        self._obtained_system = self.system_service.get(system_id, fields=fields)
 
     def check_get_success(self) -> None:
         """Checks that a prior call to `call_get` worked as expected."""
 
-        self.mock_system_repository.get.assert_called_once_with(self._obtained_system_id)
+        self.mock_system_repository.get.assert_called_once_with(self._obtained_system_id, fields=self._fields)
         assert self._obtained_system == self._expected_system
 
 
@@ -281,6 +268,13 @@ class TestGet(GetDSL):
         self.call_get(str(ObjectId()))
         self.check_get_success()
 
+    def test_get_with_fields(self):
+        """Test getting only specific fields of a system."""
+
+        self.mock_get()
+        self.call_get(str(ObjectId()), fields=["id", "name"])
+        self.check_get_success()
+
 
 class GetBreadcrumbsDSL(SystemServiceDSL):
     """Base class for `get_breadcrumbs` tests."""
@@ -324,10 +318,115 @@ class TestGetBreadcrumbs(GetBreadcrumbsDSL):
         self.check_get_breadcrumbs_success()
 
 
+class GetManyBreadcrumbsDSL(SystemServiceDSL):
+    """Base class for `get_many_breadcrumbs` tests."""
+
+    _expected_breadcrumbs: MagicMock
+    _obtained_breadcrumbs: MagicMock
+    _obtained_system_ids: list[str]
+
+    def mock_get_many_breadcrumbs(self) -> None:
+        """Mocks repo methods appropriately to test the `get_many_breadcrumbs` service method."""
+
+        # Simply a return currently, so no need to use actual data
+        self._expected_breadcrumbs = MagicMock()
+        self.mock_system_repository.get_many_breadcrumbs.return_value = self._expected_breadcrumbs
+
+    def call_get_many_breadcrumbs(self, system_ids: list[str]) -> None:
+        """
+        Calls the `SystemService` `get_many_breadcrumbs` method.
+
+        :param system_ids: IDs of the systems to obtain the breadcrumbs of.
+        """
+
+        self._obtained_system_ids = system_ids
+        self._obtained_breadcrumbs = self.system_service.get_many_breadcrumbs(system_ids)
+
+    def check_get_many_breadcrumbs_success(self, expected_system_ids: list[str]) -> None:
+        """
+        Checks that a prior call to `call_get_many_breadcrumbs` worked as expected.
+
+        :param expected_system_ids: IDs the breadcrumbs are expected to have been obtained for from the repo.
+        """
+
+        self.mock_system_repository.get_many_breadcrumbs.assert_called_once_with(expected_system_ids)
+        assert self._obtained_breadcrumbs == self._expected_breadcrumbs
+
+
+class TestGetManyBreadcrumbs(GetManyBreadcrumbsDSL):
+    """Tests for getting the breadcrumbs of multiple systems."""
+
+    def test_get_many_breadcrumbs(self):
+        """Test getting the breadcrumbs of multiple systems."""
+
+        system_ids = [str(ObjectId()), str(ObjectId())]
+
+        self.mock_get_many_breadcrumbs()
+        self.call_get_many_breadcrumbs(system_ids)
+        self.check_get_many_breadcrumbs_success(system_ids)
+
+    def test_get_many_breadcrumbs_with_invalid_and_duplicate_ids(self):
+        """Test getting the breadcrumbs of multiple systems ignores any invalid or duplicate IDs."""
+
+        system_id = str(ObjectId())
+
+        self.mock_get_many_breadcrumbs()
+        self.call_get_many_breadcrumbs([system_id, "invalid_id", system_id])
+        self.check_get_many_breadcrumbs_success([system_id])
+
+
+class GetTreeDSL(SystemServiceDSL):
+    """Base class for `get_tree` tests."""
+
+    _expected_systems: MagicMock
+    _obtained_systems: MagicMock
+    _obtained_system_id: str
+    _max_depth: Optional[int]
+
+    def mock_get_tree(self) -> None:
+        """Mocks repo methods appropriately to test the `get_tree` service method."""
+
+        # Simply a return currently, so no need to use actual data
+        self._expected_systems = MagicMock()
+        self.mock_system_repository.get_tree.return_value = self._expected_systems
+
+    def call_get_tree(self, system_id: str, max_depth: Optional[int] = None) -> None:
+        """
+        Calls the `SystemService` `get_tree` method.
+
+        :param system_id: ID of the system to obtain the tree of.
+        :param max_depth: Maximum depth to pass to `get_tree`.
+        """
+
+        self._obtained_system_id = system_id
+        self._max_depth = max_depth
+        self._obtained_systems = self.system_service.get_tree(system_id, max_depth=max_depth)
+
+    def check_get_tree_success(self) -> None:
+        """Checks that a prior call to `call_get_tree` worked as expected."""
+
+        self.mock_system_repository.get_tree.assert_called_once_with(
+            self._obtained_system_id, max_depth=self._max_depth
+        )
+        assert self._obtained_systems == self._expected_systems
+
+
+class TestGetTree(GetTreeDSL):
+    """Tests for getting a system along with all of its descendants."""
+
+    def test_get_tree(self):
+        """Test getting a system along with all of its descendants."""
+
+        self.mock_get_tree()
+        self.call_get_tree(str(ObjectId()), max_depth=2)
+        self.check_get_tree_success()
+
+
 class ListDSL(SystemServiceDSL):
     """Base class for `list` tests."""
 
     _parent_id_filter: Optional[str]
+    _fields: Optional[list[str]]
     _expected_systems: MagicMock
     _obtained_systems: MagicMock
 
@@ -338,20 +437,22 @@ class ListDSL(SystemServiceDSL):
         self._expected_systems = MagicMock()
         ServiceTestHelpers.mock_list(self.mock_system_repository, self._expected_systems)
 
-    def call_list(self, parent_id: Optional[str]) -> None:
+    def call_list(self, parent_id: Optional[str], fields: Optional[list[str]] = None) -> None:
         """
         Calls the `SystemService` `list` method.
 
         :param parent_id: ID of the parent system to query by, or `None`.
+        :param fields: List of the fields to retrieve, or `None`.
         """
 
         self._parent_id_filter = parent_id
-        self._obtained_systems = self.system_service.list(parent_id)
+        self._fields = fields
+        self._obtained_systems = self.system_service.list(parent_id, fields=fields)
 
     def check_list_success(self) -> None:
         """Checks that a prior call to `call_list` worked as expected."""
 
-        self.mock_system_repository.list.assert_called_once_with(self._parent_id_filter)
+        self.mock_system_repository.list.assert_called_once_with(self._parent_id_filter, fields=self._fields)
         assert self._obtained_systems == self._expected_systems
 
 
@@ -365,6 +466,101 @@ class TestList(ListDSL):
         self.call_list(str(ObjectId()))
         self.check_list_success()
 
+    def test_list_with_fields(self):
+        """Test listing only specific fields of systems."""
+
+        self.mock_list()
+        self.call_list(str(ObjectId()), fields=["id", "name"])
+        self.check_list_success()
+
+
+class StreamDSL(SystemServiceDSL):
+    """Base class for `stream` tests."""
+
+    _parent_id_filter: Optional[str]
+    _fields: Optional[list[str]]
+    _expected_systems: MagicMock
+    _obtained_systems: MagicMock
+
+    def mock_stream(self) -> None:
+        """Mocks repo methods appropriately to test the `stream` service method."""
+
+        # Simply a return currently, so no need to use actual data
+        self._expected_systems = MagicMock()
+        self.mock_system_repository.stream.return_value = self._expected_systems
+
+    def call_stream(self, parent_id: Optional[str], fields: Optional[list[str]] = None) -> None:
+        """
+        Calls the `SystemService` `stream` method.
+
+        :param parent_id: ID of the parent system to query by, or `None`.
+        :param fields: List of the fields to retrieve, or `None`.
+        """
+
+        self._parent_id_filter = parent_id
+        self._fields = fields
+        self._obtained_systems = self.system_service.stream(parent_id, fields=fields)
+
+    def check_stream_success(self) -> None:
+        """Checks that a prior call to `call_stream` worked as expected."""
+
+        self.mock_system_repository.stream.assert_called_once_with(self._parent_id_filter, fields=self._fields)
+        assert self._obtained_systems == self._expected_systems
+
+
+class TestStream(StreamDSL):
+    """Tests for streaming systems."""
+
+    def test_stream(self):
+        """Test streaming systems."""
+
+        self.mock_stream()
+        self.call_stream(str(ObjectId()), fields=["id", "name"])
+        self.check_stream_success()
+
+
+class GetListVersionDSL(SystemServiceDSL):
+    """Base class for `get_list_version` tests."""
+
+    _parent_id_filter: Optional[str]
+    _expected_list_version: MagicMock
+    _obtained_list_version: MagicMock
+
+    def mock_get_list_version(self) -> None:
+        """Mocks repo methods appropriately to test the `get_list_version` service method."""
+
+        # Simply a return currently, so no need to use actual data
+        self._expected_list_version = MagicMock()
+        self.mock_system_repository.get_list_version.return_value = self._expected_list_version
+
+    def call_get_list_version(self, parent_id: Optional[str]) -> None:
+        """
+        Calls the `SystemService` `get_list_version` method.
+
+        :param parent_id: ID of the parent system to query by, or `None`.
+        """
+
+        self._parent_id_filter = parent_id
+        self._obtained_list_version = self.system_service.get_list_version(parent_id)
+
+    def check_get_list_version_success(self) -> None:
+        """Checks that a prior call to `call_get_list_version` worked as expected."""
+
+        self.mock_system_repository.get_list_version.assert_called_once_with(self._parent_id_filter)
+
+        assert self._obtained_list_version == self._expected_list_version
+
+
+class TestGetListVersion(GetListVersionDSL):
+    """Tests for getting the version of a list of systems."""
+
+    def test_get_list_version(self):
+        """Test getting the version of a list of systems."""
+
+        self.mock_get_list_version()
+        self.call_get_list_version(str(ObjectId()))
+        self.check_get_list_version_success()
+
 
 class UpdateDSL(SystemServiceDSL):
     """Base class for `update` tests"""
@@ -384,7 +580,6 @@ class UpdateDSL(SystemServiceDSL):
         system_id: str,
         system_patch_data: dict,
         stored_system_post_data: Optional[dict],
-        stored_spares_definition_out_data: Optional[dict] = None,
         new_system_type_out_data: Optional[dict] = None,
         has_child_elements: bool = False,
     ) -> None:
@@ -397,8 +592,6 @@ class UpdateDSL(SystemServiceDSL):
         :param stored_system_post_data: Dictionary containing the system data for the existing stored system.
                                         as would be required for a `SystemPostSchema` (i.e. no ID, code or created and
                                         modified times required).
-        :param stored_spares_definition_out_data: Either `None` or a dictionary containing the spares definition data as
-                                                  would be required for `SparesDefinitionOut` database model.
         :param new_system_type_out_data: Either `None` or a dictionary containing the new system type data as would be
                                          required for a `SystemTypeOut` database model.
         :param has_child_elements: Boolean of whether the system being updated has child elements or not.
@@ -433,9 +626,7 @@ class UpdateDSL(SystemServiceDSL):
         # Patch schema
         self._system_patch = SystemPatchSchema(**system_patch_data)
 
-        self._mock_start_transaction_effected_by_spares_calculation(
-            stored_spares_definition_out_data, self._system_patch, self._stored_system, system_patch_data
-        )
+        self._mock_start_update_transaction(self._system_patch, self._stored_system, system_patch_data)
 
         # Updated system
         self._expected_system_out = MagicMock()
@@ -477,9 +668,7 @@ class UpdateDSL(SystemServiceDSL):
         # Ensure obtained old system
         self.mock_system_repository.get.assert_called_once_with(self._updated_system_id)
 
-        self._check_start_transaction_effected_by_spares_calculation_performed_expected_calls(
-            "updating system", self._updated_system_id
-        )
+        self._check_start_update_transaction_performed_expected_calls("updating system", self._updated_system_id)
 
         # Ensure checking children and obtained type id if needed
         if self._type_id_changing:
@@ -542,21 +731,6 @@ class TestUpdate(UpdateDSL):
         self.call_update(system_id)
         self.check_update_success()
 
-    def test_update_type_id_with_spares_definition_defined(self):
-        """Test updating the type ID of a system when there is a spares definition defined."""
-
-        system_id = str(ObjectId())
-
-        self.mock_update(
-            system_id,
-            system_patch_data={"type_id": SYSTEM_TYPE_GET_DATA_OPERATIONAL["id"]},
-            stored_system_post_data=SYSTEM_POST_DATA_STORAGE_NO_PARENT_A,
-            stored_spares_definition_out_data=SETTING_SPARES_DEFINITION_OUT_DATA_STORAGE,
-            new_system_type_out_data=SYSTEM_TYPE_OUT_DATA_OPERATIONAL,
-        )
-        self.call_update(system_id)
-        self.check_update_success()
-
     def test_update_with_non_existent_type_id(self):
         """Test updating a system's `type_id` to a non-existent type."""
 
@@ -82,6 +82,46 @@ EXPECTED_PROCESSED_PROPERTIES = [
 ]
 
 
+class TestGetValidObjectIds:
+    """Tests for the `get_valid_object_ids` method"""
+
+    def test_get_valid_object_ids(self):
+        """Test `get_valid_object_ids` returns only the unique valid IDs in order"""
+
+        object_id_a = str(ObjectId())
+        object_id_b = str(ObjectId())
+
+        result = utils.get_valid_object_ids(
+            [object_id_a, None, "invalid-id", object_id_b, 42, ObjectId(), ["list"], object_id_a]
+        )
+        assert result == [object_id_a, object_id_b]
+
+    def test_get_valid_object_ids_with_uppercase_ids(self):
+        """Test `get_valid_object_ids` normalises uppercase IDs before removing duplicates"""
+
+        object_id = str(ObjectId())
+
+        result = utils.get_valid_object_ids([object_id.upper(), object_id])
+        assert result == [object_id]
+
+
+class TestNormaliseObjectId:
+    """Tests for the `normalise_object_id` method"""
+
+    def test_normalise_object_id(self):
+        """Test `normalise_object_id` converts a valid uppercase ID into lowercase"""
+
+        object_id = str(ObjectId())
+
+        assert utils.normalise_object_id(object_id.upper()) == object_id
+
+    def test_normalise_object_id_with_invalid_values(self):
+        """Test `normalise_object_id` leaves values that are not valid IDs unchanged"""
+
+        for value in [None, "invalid-id", 42]:
+            assert utils.normalise_object_id(value) == value
+
+
 class TestGenerateCode:
     """Tests for the `generate_code` method"""
 